@@ -0,0 +1,479 @@
+"""Batch execution of one template and schema over many inputs.
+
+A batch run validates the template, schema and model once, then renders and
+sends one request per manifest item. The OpenAI client, Jinja environment,
+output model and upload cache are shared by all items, and items run with
+bounded concurrency.
+
+The manifest is a JSONL file with one object per line::
+
+    {"id": "doc-1", "vars": {"lang": "en"}, "files": {"doc": "docs/a.md"}}
+
+``vars`` are added to the template context and ``files`` are attached for
+template access under the given alias, on top of the variables and files
+given on the command line. ``id`` defaults to the line number.
+
+Results are appended to a JSONL file as items finish, one record per item
+with its ``status`` (``ok`` or ``error``). The results file doubles as the
+checkpoint: a resumed run skips every item already recorded as ``ok``.
+"""
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from .errors import CLIError
+from .exit_codes import ExitCode
+from .types import CLIParams
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_CONCURRENCY = 4
+
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+
+# Tools need per-run uploads and cleanup, which batch mode does not manage
+_UNSUPPORTED_TOOLS = {"code-interpreter", "file-search", "mcp", "web-search"}
+
+# Context keys derived from attachments rather than variables
+_ATTACHMENT_CONTEXT_KEYS = {"files", "file_count", "has_files", "_attachments"}
+
+
+@dataclass
+class BatchItem:
+    """One input of a batch run."""
+
+    id: str
+    vars: Dict[str, Any] = field(default_factory=dict)
+    files: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class BatchSummary:
+    """Outcome of a batch run."""
+
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0
+
+    @property
+    def exit_code(self) -> ExitCode:
+        """Exit code for the run: success only if no item failed."""
+        return (
+            ExitCode.SUCCESS if self.failed == 0 else ExitCode.INTERNAL_ERROR
+        )
+
+
+def _manifest_error(path: Path, line_no: int, message: str) -> CLIError:
+    return CLIError(
+        f"Invalid batch manifest {path} (line {line_no}): {message}",
+        exit_code=ExitCode.USAGE_ERROR,
+    )
+
+
+def load_manifest(path: Union[str, Path]) -> List[BatchItem]:
+    """Load batch items from a JSONL manifest.
+
+    Args:
+        path: Path to the manifest file
+
+    Returns:
+        Items in manifest order
+
+    Raises:
+        CLIError: If the manifest cannot be read or an entry is invalid
+    """
+    manifest_path = Path(path)
+    try:
+        lines = manifest_path.read_text(encoding="utf-8").splitlines()
+    except OSError as e:
+        raise CLIError(
+            f"Cannot read batch manifest {manifest_path}: {e}",
+            exit_code=ExitCode.FILE_ERROR,
+        )
+
+    items: List[BatchItem] = []
+    seen: Set[str] = set()
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise _manifest_error(manifest_path, line_no, str(e))
+        if not isinstance(entry, dict):
+            raise _manifest_error(
+                manifest_path, line_no, "each line must be a JSON object"
+            )
+
+        unknown = set(entry) - {"id", "vars", "files"}
+        if unknown:
+            raise _manifest_error(
+                manifest_path,
+                line_no,
+                f"unknown keys: {', '.join(sorted(unknown))}",
+            )
+
+        item_vars = entry.get("vars", {})
+        item_files = entry.get("files", {})
+        if not isinstance(item_vars, dict):
+            raise _manifest_error(
+                manifest_path, line_no, "'vars' must be an object"
+            )
+        if not isinstance(item_files, dict) or not all(
+            isinstance(p, str) for p in item_files.values()
+        ):
+            raise _manifest_error(
+                manifest_path,
+                line_no,
+                "'files' must map aliases to file paths",
+            )
+        invalid = [
+            name
+            for name in [*item_vars, *item_files]
+            if not name.isidentifier()
+        ]
+        if invalid:
+            raise _manifest_error(
+                manifest_path,
+                line_no,
+                f"invalid variable names: {', '.join(invalid)}",
+            )
+
+        item_id = str(entry.get("id", line_no))
+        if item_id in seen:
+            raise _manifest_error(
+                manifest_path, line_no, f"duplicate id '{item_id}'"
+            )
+        seen.add(item_id)
+        items.append(BatchItem(item_id, item_vars, item_files))
+
+    return items
+
+
+def load_checkpoint(output_path: Union[str, Path]) -> Set[str]:
+    """Read the ids of items already completed successfully.
+
+    A truncated last line (from an interrupted run) is ignored.
+
+    Args:
+        output_path: Results file of a previous run
+
+    Returns:
+        Ids of items recorded with status ``ok``
+    """
+    completed: Set[str] = set()
+    try:
+        with open(output_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if (
+                    isinstance(record, dict)
+                    and record.get("status") == STATUS_OK
+                ):
+                    completed.add(str(record.get("id")))
+    except FileNotFoundError:
+        pass
+    return completed
+
+
+class BatchResultWriter:
+    """Append per-item result records to a JSONL file."""
+
+    def __init__(self, output_path: Union[str, Path], resume: bool) -> None:
+        """Open the results file.
+
+        Args:
+            output_path: Results file path
+            resume: Append to an existing file instead of replacing it
+        """
+        self.output_path = Path(output_path)
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: IO[str] = open(
+            self.output_path, "a" if resume else "w", encoding="utf-8"
+        )
+        # Start on a fresh line if a previous run died mid-record
+        if resume and self._file.tell() > 0:
+            with open(self.output_path, "rb") as f:
+                f.seek(-1, 2)
+                if f.read(1) != b"\n":
+                    self._file.write("\n")
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Write one record and flush it so it survives a crash."""
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _check_batch_support(args: CLIParams) -> None:
+    """Reject options that need per-run tool setup."""
+    enabled_tools: Set[str] = set(args.get("_enabled_tools", set()))  # type: ignore[call-overload]
+    routing_result = args.get("_routing_result")
+    if routing_result is not None:
+        enabled_tools |= set(getattr(routing_result, "enabled_tools", ()))
+    if args.get("mcp_servers"):
+        enabled_tools.add("mcp")
+
+    unsupported = enabled_tools & _UNSUPPORTED_TOOLS
+    if unsupported:
+        raise CLIError(
+            "Batch mode supports template attachments only; "
+            f"remove tools: {', '.join(sorted(unsupported))}",
+            exit_code=ExitCode.USAGE_ERROR,
+        )
+
+
+class BatchExecutor:
+    """Run prepared template and schema over batch items."""
+
+    def __init__(self, args: CLIParams) -> None:
+        """Initialize the executor.
+
+        Args:
+            args: CLI parameters shared by every item
+        """
+        self.args = args
+        self._client: Any = None
+
+    async def prepare(self) -> None:
+        """Validate inputs and build everything the items share."""
+        from .attachment_processor import (
+            AttachmentProcessor,
+            _extract_attachments_from_args,
+        )
+        from .model_creation import create_dynamic_model
+        from .model_validation import validate_model_params
+        from .utils.client_utils import create_openai_client
+        from .validators import validate_inputs
+
+        await validate_model_params(self.args)
+        (
+            self.security_manager,
+            self.task_template,
+            self.schema,
+            self.base_context,
+            self.env,
+            self.template_path,
+            self.upload_cache,
+        ) = await validate_inputs(self.args)
+        _check_batch_support(self.args)
+
+        self.base_attachments = _extract_attachments_from_args(self.args)
+        base_aliases = set(
+            AttachmentProcessor(self.security_manager)
+            .process_attachments(self.base_attachments)
+            .alias_map
+        )
+        self.base_variables = {
+            k: v
+            for k, v in self.base_context.items()
+            if k not in base_aliases and k not in _ATTACHMENT_CONTEXT_KEYS
+        }
+        self.base_aliases = base_aliases
+
+        # Fail before any item runs if the schema cannot be compiled
+        create_dynamic_model(self.schema)
+        self._client = create_openai_client(
+            api_key=self.args.get("api_key"),
+            timeout=float(self.args.get("timeout", 60.0)),
+        )
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+        upload_cache = getattr(self, "upload_cache", None)
+        if upload_cache is not None:
+            upload_cache.close()
+
+    def _build_context(self, item: BatchItem) -> Dict[str, Any]:
+        """Build the template context of one item."""
+        if not item.files:
+            context = dict(self.base_context)
+            context.update(item.vars)
+            return context
+
+        from .attachment_processor import AttachmentProcessor
+        from .attachment_template_bridge import (
+            build_template_context_from_attachments,
+        )
+
+        clashes = set(item.files) & self.base_aliases
+        if clashes:
+            raise ValueError(
+                f"File aliases already used by global attachments: "
+                f"{', '.join(sorted(clashes))}"
+            )
+
+        item_attachments = [
+            {
+                "alias": alias,
+                "path": path,
+                "targets": ["prompt"],
+                "attachment_type": "file",
+                "ignore_gitignore": self.args.get("ignore_gitignore", False),
+                "gitignore_file": self.args.get("gitignore_file"),
+            }
+            for alias, path in item.files.items()
+        ]
+        processed = AttachmentProcessor(
+            self.security_manager
+        ).process_attachments(self.base_attachments + item_attachments)
+        missing = set(item.files) - set(processed.alias_map)
+        if missing:
+            raise ValueError(
+                f"Cannot attach files: "
+                f"{', '.join(item.files[a] for a in sorted(missing))}"
+            )
+
+        base = dict(self.base_variables)
+        base.update(item.vars)
+        return build_template_context_from_attachments(
+            processed,
+            self.security_manager,
+            base,
+            max_file_size=self.args.get("max_file_size"),
+        )
+
+    async def run_item(self, item: BatchItem) -> BaseModel:
+        """Render and execute one item.
+
+        Args:
+            item: Batch item
+
+        Returns:
+            Validated model output
+        """
+        from .model_validation import validate_model_and_schema
+        from .runner import create_structured_output
+        from .template_processor import process_templates
+
+        context = self._build_context(item)
+        system_prompt, user_prompt = await process_templates(
+            self.args,
+            self.task_template,
+            context,
+            self.env,
+            self.template_path,
+        )
+        output_model, _, _, _ = await validate_model_and_schema(
+            self.args, self.schema, system_prompt, user_prompt, context
+        )
+        return await create_structured_output(
+            client=self._client,
+            model=self.args["model"],
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            output_schema=output_model,
+            tool_choice=None,
+        )
+
+
+def _iter_pending(
+    items: Iterable[BatchItem], completed: Set[str], summary: BatchSummary
+) -> Iterator[BatchItem]:
+    for item in items:
+        summary.total += 1
+        if item.id in completed:
+            summary.skipped += 1
+            continue
+        yield item
+
+
+async def run_batch(
+    args: CLIParams,
+    items: Iterable[BatchItem],
+    output_path: Union[str, Path],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    resume: bool = True,
+) -> BatchSummary:
+    """Run one template and schema over many items.
+
+    Args:
+        args: CLI parameters shared by every item
+        items: Items to process
+        output_path: JSONL file receiving one result record per item
+        concurrency: Maximum number of items in flight
+        resume: Skip items already recorded as ``ok`` in output_path and
+            append to it; otherwise the file is replaced
+
+    Returns:
+        Counts of processed, failed and skipped items
+
+    Raises:
+        CLIError: If shared validation fails before any item runs
+    """
+    if concurrency < 1:
+        raise CLIError(
+            "Batch concurrency must be at least 1",
+            exit_code=ExitCode.USAGE_ERROR,
+        )
+
+    completed = load_checkpoint(output_path) if resume else set()
+    executor = BatchExecutor(args)
+    await executor.prepare()
+
+    summary = BatchSummary()
+    pending = _iter_pending(items, completed, summary)
+    writer = BatchResultWriter(output_path, resume=resume)
+
+    async def worker() -> None:
+        for item in pending:
+            try:
+                result = await executor.run_item(item)
+            except Exception as e:
+                logger.error("Batch item %s failed: %s", item.id, e)
+                summary.failed += 1
+                writer.write(
+                    {
+                        "id": item.id,
+                        "status": STATUS_ERROR,
+                        "error": str(e),
+                        "error_type": type(e).__name__,
+                    }
+                )
+            else:
+                summary.succeeded += 1
+                writer.write(
+                    {
+                        "id": item.id,
+                        "status": STATUS_OK,
+                        "result": result.model_dump(mode="json"),
+                    }
+                )
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    finally:
+        writer.close()
+        await executor.close()
+
+    logger.info(
+        "Batch finished: %d succeeded, %d failed, %d skipped",
+        summary.succeeded,
+        summary.failed,
+        summary.skipped,
+    )
+    return summary
@@ -5,8 +5,12 @@
 """
 
 import logging
+import os
+import sys
+import threading
+import time
 from dataclasses import dataclass
-from typing import Any, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from cachetools import LRUCache
 from cachetools.keys import hashkey
@@ -16,6 +20,14 @@
 # Type alias for cache keys
 CacheKey = Tuple[Any, ...]
 
+# Default byte budget for cached file content
+DEFAULT_CACHE_SIZE = 50 * 1024 * 1024
+
+# Files modified this recently are read but not cached by load(): a rewrite
+# within the filesystem's timestamp granularity could keep the same
+# (mtime_ns, size) and would otherwise be served stale.
+RACY_MTIME_WINDOW_NS = 2 * 1_000_000_000
+
 
 @dataclass(frozen=True)
 class CacheEntry:
@@ -32,24 +44,79 @@ class CacheEntry:
     size: int  # Actual file size from stat
 
 
+def _decode(raw: bytes, encoding: Optional[str] = None) -> Tuple[str, str]:
+    """Decode file bytes as UTF-8, falling back to the system encoding.
+
+    Args:
+        raw: File bytes
+        encoding: Known encoding label from a previous decode, if any
+
+    Returns:
+        Tuple of (content, encoding label)
+    """
+    if encoding != "system":
+        try:
+            return str(raw, "utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            pass
+    return raw.decode(), "system"
+
+
 class FileCache:
     """Thread-safe LRU cache for file content with size limit."""
 
-    def __init__(self, max_size_bytes: int = 50 * 1024 * 1024):  # 50MB default
+    def __init__(self, max_size_bytes: int = DEFAULT_CACHE_SIZE):
         """Initialize cache with maximum size in bytes.
 
         Args:
-            max_size_bytes: Maximum cache size in bytes
+            max_size_bytes: Maximum cache size in bytes (0 disables caching)
         """
         self._max_size = max_size_bytes
         self._current_size = 0
-        self._cache: LRUCache[CacheKey, CacheEntry] = LRUCache(maxsize=1024)
+        # Eviction is driven by the byte budget below, not an entry count
+        self._cache: LRUCache[CacheKey, CacheEntry] = LRUCache(
+            maxsize=sys.maxsize
+        )
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
         logger.debug(
-            "Initialized FileCache with max_size=%d bytes, maxsize=%d entries",
-            max_size_bytes,
-            1024,
+            "Initialized FileCache with max_size=%d bytes", max_size_bytes
         )
 
+    @property
+    def max_size(self) -> int:
+        """Byte budget for in-memory content."""
+        return self._max_size
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache counters and current usage.
+
+        Returns:
+            Dictionary with hits, misses, evictions, invalidations, entries,
+            size_bytes and max_size_bytes
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "entries": len(self._cache),
+                "size_bytes": self._current_size,
+                "max_size_bytes": self._max_size,
+            }
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self._cache.clear()
+            self._current_size = 0
+            self._hits = self._misses = 0
+            self._evictions = self._invalidations = 0
+
     def _remove_entry(self, key: CacheKey) -> None:
         """Remove entry from cache and update size.
 
@@ -80,11 +147,19 @@ def get(
         Returns:
             CacheEntry if valid cache exists, None otherwise
         """
+        with self._lock:
+            return self._get(path, current_mtime_ns, current_size)
+
+    def _get(
+        self, path: str, current_mtime_ns: int, current_size: int
+    ) -> Optional[CacheEntry]:
+        """Look up an entry; the caller holds the lock."""
         key = hashkey(path)
         entry = self._cache.get(key)
 
         if entry is None:
             logger.debug("Cache miss for %s: no entry found", path)
+            self._misses += 1
             return None
 
         # Check if file has been modified using both mtime and size
@@ -100,6 +175,8 @@ def get(
                 "changed" if entry.size != current_size else "same",
             )
             self._remove_entry(key)
+            self._invalidations += 1
+            self._misses += 1
             return None
 
         logger.debug(
@@ -108,6 +185,7 @@ def get(
             entry.mtime_ns,
             entry.size,
         )
+        self._hits += 1
         return entry
 
     def put(
@@ -130,7 +208,7 @@ def put(
             size: File size in bytes from stat
         """
         if size > self._max_size:
-            logger.warning(
+            logger.debug(
                 "File %s size (%d bytes) exceeds cache max size (%d bytes)",
                 path,
                 size,
@@ -138,6 +216,19 @@ def put(
             )
             return
 
+        with self._lock:
+            self._put(path, content, encoding, hash_value, mtime_ns, size)
+
+    def _put(
+        self,
+        path: str,
+        content: str,
+        encoding: Optional[str],
+        hash_value: Optional[str],
+        mtime_ns: int,
+        size: int,
+    ) -> None:
+        """Store an in-memory entry; the caller holds the lock."""
         key = hashkey(path)
         self._remove_entry(key)
 
@@ -149,6 +240,7 @@ def put(
             evicted_key, evicted = self._cache.popitem()
             self._current_size -= evicted.size
             evicted_count += 1
+            self._evictions += 1
             logger.debug(
                 "Evicted cache entry: key=%s, size=%d, new_total_size=%d",
                 evicted_key,
@@ -173,3 +265,76 @@ def put(
             self._current_size,
             self._max_size,
         )
+
+    def load(self, path: str) -> CacheEntry:
+        """Return the content of a file, reading it only on a cache miss.
+
+        The file is stat'ed to validate any cached entry. On a miss it is
+        read, decoded as UTF-8
+        with a fallback to the system encoding, and cached.
+
+        Args:
+            path: Absolute path to the file
+
+        Returns:
+            CacheEntry with the decoded content
+
+        Raises:
+            OSError: If the file cannot be stat'ed or read
+            UnicodeDecodeError: If the content cannot be decoded
+        """
+        stats = os.stat(path)
+        mtime_ns, size = stats.st_mtime_ns, stats.st_size
+
+        with self._lock:
+            cached = self._get(path, mtime_ns, size)
+        if cached is not None:
+            return cached
+
+        with open(path, "rb") as f:
+            raw = f.read()
+
+        cacheable = time.time_ns() - mtime_ns >= RACY_MTIME_WINDOW_NS
+        content, encoding = _decode(raw)
+        if cacheable and 0 < size <= self._max_size:
+            with self._lock:
+                self._put(path, content, encoding, None, mtime_ns, size)
+        return CacheEntry(content, encoding, None, mtime_ns, size)
+
+
+# Process-wide cache shared by FileInfo and template_io
+_shared_cache: Optional[FileCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_file_cache() -> FileCache:
+    """Get the process-wide file content cache.
+
+    The cache is created on first use with the byte budget from the
+    ``template`` section of the configuration.
+
+    Returns:
+        Shared FileCache instance
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                max_size: int = DEFAULT_CACHE_SIZE
+                try:
+                    from .config import get_config
+
+                    max_size = get_config().template.content_cache_size
+                except Exception as e:
+                    logger.debug(f"Using default file cache settings: {e}")
+                _shared_cache = FileCache(max_size)
+    return _shared_cache
+
+
+def reset_file_cache() -> None:
+    """Discard the shared cache; the next access rebuilds it from config."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is not None:
+            _shared_cache.clear()
+        _shared_cache = None
@@ -366,6 +366,14 @@ def output_options(f: Union[Command, Callable[..., Any]]) -> Command:
             help="""Validate and render but skip API call. Useful for testing
             template rendering and validation.""",
         ),
+        click.option(
+            "--stream",
+            is_flag=True,
+            help="""Stream the response and write completed top-level fields
+            and array items to stdout as JSONL as soon as they validate.
+            The full validated result follows as the last record
+            (or goes to --output-file).""",
+        ),
         click.option(
             "--output-file",
             type=click.Path(dir_okay=False),
@@ -561,6 +569,8 @@ def file_search_config_options(
             is_flag=True,
             default=True,
             help="""📁 [FILE SEARCH] Clean up uploaded files and vector stores after use.
+            Vector stores kept for reuse (uploads.reuse_vector_stores in
+            ostruct.yaml) are retained and still billed.
             Disable with --no-fs-cleanup to keep files for debugging.""",
         ),
         click.option(
@@ -981,6 +991,14 @@ def validate_attachment_collect(
 'alpha' generates labels like FILE A, FILE B, FILE C.
 'filename' uses the basename like config.yaml, data.txt.
 Example: --files-label-style filename""",
+        ),
+        click.option(
+            "--upload-concurrency",
+            type=click.IntRange(min=1),
+            default=None,  # Let config decide
+            help="""Maximum number of file uploads to run concurrently.
+Default: 8 (set in config via uploads.max_concurrent_uploads
+or OSTRUCT_UPLOAD_CONCURRENCY)""",
         ),
         click.option(
             "--cache-path",
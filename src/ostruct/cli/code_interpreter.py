@@ -23,6 +23,7 @@
     DownloadNetworkError,
     DownloadPermissionError,
 )
+from .rate_limiter import rate_limited
 
 if TYPE_CHECKING:
     from .upload_manager import SharedUploadManager
@@ -75,7 +76,8 @@ async def _download_file_content(
             await downloader.close()
     else:
         # Use SDK for regular uploaded files
-        result = await client.files.content(file_id)
+        async with rate_limited("files"):
+            result = await client.files.content(file_id)
         return result.read()
 
 
@@ -137,10 +139,11 @@ async def upload_files_for_code_interpreter(
 
                 # Upload with correct purpose for Code Interpreter
                 with open(file_path, "rb") as f:
-                    file_obj = await self.client.files.create(
-                        file=f,
-                        purpose="assistants",  # Validated correct purpose
-                    )
+                    async with rate_limited("files"):
+                        file_obj = await self.client.files.create(
+                            file=f,
+                            purpose="assistants",  # Validated correct purpose
+                        )
                     file_ids.append(file_obj.id)
                     logger.debug(
                         f"Successfully uploaded {file_path} with ID: {file_obj.id}"
@@ -563,7 +566,8 @@ async def _cleanup_uploaded_files(self, file_ids: List[str]) -> None:
 
                 # Delete the file
                 logger.debug(f"[ci] Deleting file: {file_id}")
-                await self.client.files.delete(file_id)
+                async with rate_limited("files"):
+                    await self.client.files.delete(file_id)
                 logger.debug(f"[ci] Successfully deleted file: {file_id}")
 
             except Exception as e:
@@ -2,6 +2,7 @@
 
 import click
 
+from .batch import batch
 from .files import files
 from .list_models import list_models
 from .models import models
@@ -19,6 +20,7 @@ def create_command_group() -> click.Group:
 
     # Add all commands to the group
     group.add_command(run)
+    group.add_command(batch)
     group.add_command(runx)
     group.add_command(scaffold)
     group.add_command(setup)
@@ -37,6 +39,7 @@ def create_command_group() -> click.Group:
 # Export commands for easy importing
 __all__ = [
     "run",
+    "batch",
     "runx",
     "scaffold",
     "setup",
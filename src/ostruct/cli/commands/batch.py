@@ -0,0 +1,169 @@
+"""Batch command for ostruct CLI."""
+
+import asyncio
+import logging
+import sys
+from typing import Any
+
+import rich_click as click
+
+from ..batch import DEFAULT_BATCH_CONCURRENCY, load_manifest, run_batch
+from ..click_options import (
+    api_options,
+    debug_progress_options,
+    file_options,
+    model_options,
+    security_options,
+    system_prompt_options,
+    template_options,
+    variable_options,
+)
+from ..config import OstructConfig
+from ..errors import CLIError, InvalidJSONError, SchemaFileError, handle_error
+from ..exit_codes import ExitCode
+from ..types import CLIParams
+
+logger = logging.getLogger(__name__)
+
+
+@click.command(
+    cls=click.RichCommand,
+    context_settings={
+        "help_option_names": ["-h", "--help"],
+    },
+)
+@click.argument("task_template", type=click.Path(exists=True))
+@click.argument("schema_file", type=click.Path(exists=True))
+@click.argument("manifest", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "-o",
+    "--output",
+    "batch_output",
+    required=True,
+    type=click.Path(dir_okay=False),
+    help="JSONL file receiving one result record per manifest item.",
+)
+@click.option(
+    "-j",
+    "--concurrency",
+    type=click.IntRange(1, None),
+    default=DEFAULT_BATCH_CONCURRENCY,
+    show_default=True,
+    help="Maximum number of items processed at the same time.",
+)
+@click.option(
+    "--resume/--no-resume",
+    default=True,
+    show_default=True,
+    help="Skip items already completed in the output file and append to "
+    "it. With --no-resume the output file is replaced.",
+)
+@debug_progress_options
+@security_options
+@template_options
+@api_options
+@system_prompt_options
+@file_options
+@model_options
+@variable_options
+@click.pass_context
+def batch(
+    ctx: click.Context,
+    task_template: str,
+    schema_file: str,
+    manifest: str,
+    batch_output: str,
+    concurrency: int,
+    resume: bool,
+    **kwargs: Any,
+) -> None:
+    """Run one template and schema over every item of a JSONL manifest.
+
+    Each manifest line is a JSON object with optional "id", "vars" and
+    "files" keys. Variables and files given on the command line apply to
+    every item.
+
+    🚀 QUICK START
+
+    ostruct batch template.j2 schema.json items.jsonl -o results.jsonl
+
+    📄 MANIFEST LINE
+
+    {"id": "doc-1", "vars": {"lang": "en"}, "files": {"doc": "a.md"}}
+
+    Results are written as items finish. Re-running the same command
+    resumes after a crash, skipping items that already succeeded.
+    """
+    try:
+        from ..template_debug import configure_debug_logging
+
+        configure_debug_logging(
+            verbose=bool(kwargs.get("verbose", False)),
+            debug=bool(kwargs.get("debug", False)),
+        )
+
+        params: CLIParams = {
+            "task_file": task_template,
+            "task": None,
+            "schema_file": schema_file,
+        }
+        for k, v in kwargs.items():
+            params[k] = v  # type: ignore[literal-required]
+
+        # Apply configuration defaults like the run command
+        command_config = kwargs.get("config")
+        if command_config:
+            config = OstructConfig.load(command_config)
+        else:
+            config = ctx.obj.get("config") if ctx.obj else OstructConfig()
+
+        if params.get("model") is None:
+            params["model"] = config.get_model_default()
+
+        file_collection_config = config.get_file_collection_config()
+        if params.get("ignore_gitignore") is None:
+            params["ignore_gitignore"] = (
+                file_collection_config.ignore_gitignore
+            )
+        if params.get("gitignore_file") is None:
+            params["gitignore_file"] = file_collection_config.gitignore_file
+
+        template_config = config.get_template_config()
+        if params.get("max_file_size") is None:
+            params["max_file_size"] = template_config.max_file_size
+
+        items = load_manifest(manifest)
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            summary = loop.run_until_complete(
+                run_batch(
+                    params,
+                    items,
+                    batch_output,
+                    concurrency=concurrency,
+                    resume=resume,
+                )
+            )
+        finally:
+            loop.close()
+
+        click.echo(
+            f"Batch complete: {summary.succeeded} succeeded, "
+            f"{summary.failed} failed, {summary.skipped} skipped "
+            f"(results: {batch_output})",
+            err=True,
+        )
+        sys.exit(int(summary.exit_code))
+    except (CLIError, InvalidJSONError, SchemaFileError) as e:
+        handle_error(e)
+        sys.exit(
+            e.exit_code if hasattr(e, "exit_code") else ExitCode.INTERNAL_ERROR
+        )
+    except click.UsageError as e:
+        handle_error(e)
+        sys.exit(ExitCode.USAGE_ERROR)
+    except KeyboardInterrupt:
+        logger.info("Batch cancelled by user")
+        raise
@@ -1,12 +1,14 @@
 """File management commands for ostruct."""
 
 import asyncio
+import contextlib
 import logging
 import shutil
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Literal, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
 
 import click
 import questionary
@@ -15,6 +17,8 @@
 from tabulate import tabulate
 
 from ..cache_utils import get_default_cache_path
+from ..config import get_config
+from ..constants import DefaultConfig
 from ..exit_codes import ExitCode
 from ..file_search import FileSearchManager
 from ..upload_cache import UploadCache
@@ -29,6 +33,22 @@
 logger = logging.getLogger(__name__)
 
 
+def _open_upload_cache(**kwargs: Any) -> UploadCache:
+    """Open the upload cache for the running command.
+
+    The cache's pooled connections are closed when the command's click
+    context is torn down.
+
+    Args:
+        **kwargs: Additional arguments passed to UploadCache
+    """
+    cache = UploadCache(get_default_cache_path(), **kwargs)
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None:
+        ctx.call_on_close(cache.close)
+    return cache
+
+
 def format_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
     if size_bytes < 1024:
@@ -336,6 +356,12 @@ def files() -> None:
     show_default=True,
     help="Control progress display. 'none' disables progress indicators, 'basic' shows key steps, 'detailed' shows all operations.",
 )
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of files to upload in parallel (default: uploads.max_concurrent_uploads, 8)",
+)
 @click.option(
     "--json", "output_json", is_flag=True, help="Emit machine-readable JSON"
 )
@@ -351,6 +377,7 @@ def upload(
     vector_store: str,
     dry_run: bool,
     progress: str,
+    jobs: int | None,
     output_json: bool,
 ) -> None:
     """Upload files with batch support and interactive mode.
@@ -368,6 +395,9 @@ def upload(
         # Collection with multiple tools
         ostruct files upload --collect @filelist.txt --tools file-search,code-interpreter
 
+        # Seed a vector store with 16 uploads in flight
+        ostruct files upload --dir ./pdfs --tools file-search --jobs 16
+
         # Interactive mode (no arguments)
         ostruct files upload
     """
@@ -620,6 +650,7 @@ def upload(
                 progress,
                 output_json,
                 handler,
+                jobs,
             )
         )
 
@@ -754,14 +785,23 @@ async def _batch_upload(
     progress: str,
     output_json: bool,
     handler: ProgressHandler,
+    jobs: Optional[int] = None,
 ) -> None:
-    """Perform the actual batch upload operation."""
+    """Perform the actual batch upload operation.
+
+    Up to ``jobs`` files are uploaded concurrently; file-search bindings are
+    then attached to the vector store in ``file_batches`` chunks.
+    """
     try:
         # Create OpenAI client
         from ..utils.client_utils import create_openai_client
 
         client = create_openai_client(timeout=60.0)
-        cache = UploadCache(get_default_cache_path())
+        up_cfg = get_config().get_upload_config()
+        cache = _open_upload_cache(
+            hash_algo=up_cfg.hash_algorithm,
+            paranoid=up_cfg.paranoid_hashing,
+        )
         upload_manager = SharedUploadManager(client, cache=cache)
 
         # Parse tags
@@ -858,74 +898,99 @@ async def _batch_upload(
             return
 
         # Process files with progress tracking
-        results: List[UploadResult] = []
+        jobs = jobs or up_cfg.max_concurrent_uploads
+        semaphore = asyncio.Semaphore(jobs)
+        outcomes: Dict[int, Tuple[UploadResult, Dict[str, Any], str]] = {}
+        # Sizes are taken before uploading so the summary does not stat
+        # files that were moved or deleted in the meantime
+        sizes: Dict[int, int] = {}
+        started = time.perf_counter()
+
+        async def upload_one(index: int, file_path: Path) -> Tuple[
+            int,
+            Path,
+            Optional[Tuple[UploadResult, Dict[str, Any], str]],
+            Optional[Exception],
+        ]:
+            async with semaphore:
+                try:
+                    sizes[index] = file_path.stat().st_size
+                    outcome = await _upload_single_file(
+                        file_path,
+                        effective_tools,
+                        tags,
+                        cache,
+                        upload_manager,
+                    )
+                    return index, file_path, outcome, None
+                except Exception as e:
+                    return index, file_path, None, e
 
         # Disable progress bars in JSON mode to avoid corrupting output
         show_progress = progress != "none" and not output_json
 
         # Use progress handler for batch processing
-        if show_progress:
-            with handler.batch_phase(
-                "Uploading files", "📤", len(all_files)
-            ) as phase:
-                for file_path in all_files:
-                    try:
-                        result = await _upload_single_file(
-                            file_path,
-                            effective_tools,
-                            tags,
-                            vector_store,
-                            client,
-                            cache,
-                            upload_manager,
-                        )
-                        results.append(result)
-
-                        # Update progress
-                        filename = Path(file_path).name
-                        msg = (
-                            f"Uploaded {filename}"
-                            if progress == "detailed"
-                            else None
-                        )
-                        phase.advance(advance=1, msg=msg)
+        phase_cm: Any = (
+            handler.batch_phase("Uploading files", "📤", len(all_files))
+            if show_progress
+            else contextlib.nullcontext()
+        )
+        with phase_cm as phase:
+            tasks = [
+                asyncio.create_task(upload_one(i, file_path))
+                for i, file_path in enumerate(all_files)
+            ]
+            for next_done in asyncio.as_completed(tasks):
+                index, file_path, outcome, upload_error = await next_done
+                filename = Path(file_path).name
 
-                    except Exception as e:
-                        # Use error collector for standardized formatting
-                        error_collector.add_error(str(file_path), e)
-                        error_msg = error_collector.format_error(
-                            str(file_path), e
+                if outcome is not None:
+                    outcomes[index] = outcome
+                    msg = f"Uploaded {filename}"
+                else:
+                    if upload_error is None:
+                        raise RuntimeError(
+                            f"Upload of {file_path} returned no result"
                         )
-                        logger.error(error_msg)
-
-                        # Update progress even on error
-                        filename = Path(file_path).name
-                        msg = (
-                            f"Error with {filename}"
-                            if progress == "detailed"
-                            else None
+                    # Use error collector for standardized formatting
+                    error_collector.add_error(str(file_path), upload_error)
+                    logger.error(
+                        error_collector.format_error(
+                            str(file_path), upload_error
                         )
-                        phase.advance(advance=1, msg=msg)
-        else:
-            # No progress tracking - process files without progress bars
-            for file_path in all_files:
-                try:
-                    result = await _upload_single_file(
-                        file_path,
-                        effective_tools,
-                        tags,
-                        vector_store,
-                        client,
-                        cache,
-                        upload_manager,
                     )
-                    results.append(result)
+                    msg = f"Error with {filename}"
 
-                except Exception as e:
-                    # Use error collector for standardized formatting
-                    error_collector.add_error(str(file_path), e)
-                    error_msg = error_collector.format_error(str(file_path), e)
-                    logger.error(error_msg)
+                # Update progress, even on error
+                if phase is not None:
+                    phase.advance(
+                        advance=1,
+                        msg=msg if progress == "detailed" else None,
+                    )
+
+        # Write cache records in batches now that all uploads are done;
+        # vector store mappings reference them
+        await upload_manager.flush_cache_writes()
+
+        # Attach file-search files to the vector store in batches
+        if "file-search" in effective_tools and outcomes:
+            await _attach_to_vector_store(
+                outcomes, vector_store, client, cache, error_collector
+            )
+
+        # Keep results in input order regardless of completion order
+        results: List[UploadResult] = []
+        result_metadata: List[Tuple[str, Dict[str, Any]]] = []
+        for index in sorted(outcomes):
+            result, metadata, _ = outcomes[index]
+            results.append(result)
+            result_metadata.append((result.file_id, metadata))
+
+        elapsed = time.perf_counter() - started
+
+        cache.touch_many([r.file_id for r in results if r.cached])
+        for file_id, metadata in result_metadata:
+            cache.update_metadata(file_id, metadata)
 
         # Output results
         formatted_errors = error_collector.get_formatted_errors()
@@ -936,11 +1001,15 @@ async def _batch_upload(
             uploaded_count = len([r for r in results if not r.cached])
             cached_count = len([r for r in results if r.cached])
 
+            total_bytes = sum(sizes[index] for index in outcomes)
             summary = joh.format_summary(
                 total=len(all_files),
                 uploaded=uploaded_count,
                 cached=cached_count,
                 errors=error_collector.get_error_count(),
+                jobs=jobs,
+                elapsed_seconds=round(elapsed, 3),
+                throughput=_throughput(len(results), total_bytes, elapsed),
             )
 
             json_result = joh.format_results(
@@ -1001,15 +1070,17 @@ async def _upload_single_file(
     file_path: Path,
     tools: tuple[str, ...],
     tags: dict[str, str],
-    vector_store: str,
-    client: AsyncOpenAI,
     cache: UploadCache,
     upload_manager: SharedUploadManager,
-) -> UploadResult:
-    """Upload a single file and return result."""
+) -> Tuple[UploadResult, Dict[str, Any], str]:
+    """Upload a single file and return result, cache metadata and hash.
+
+    New uploads are queued on ``upload_manager`` rather than written to the
+    cache directly; the caller flushes them, attaches file-search files to
+    the vector store and applies the metadata once the whole batch is done.
+    """
     # Check cache
-    file_hash = cache.compute_file_hash(file_path)
-    cached_file_id = cache.lookup_with_validation(file_path, file_hash)
+    file_hash, cached_file_id = await cache.lookup_file_async(file_path)
 
     if cached_file_id:
         file_id = cached_file_id
@@ -1026,21 +1097,10 @@ async def _upload_single_file(
             file_path, purpose=purpose
         )
 
-        # Store in cache
-        file_stat = file_path.stat()
-        cache.store(
-            file_hash,
-            file_id,
-            int(file_stat.st_size),
-            int(file_stat.st_mtime),
-            {"purpose": purpose},
-            file_path=str(file_path),
-        )
-
         logger.info(f"Uploaded: {file_path} → {file_id}")
         cached = False
 
-    # Update metadata with tags and bindings
+    # Metadata with tags and bindings; file-search is bound later
     metadata: Dict[str, Any] = {
         "tags": tags,
         "bindings": {
@@ -1052,47 +1112,95 @@ async def _upload_single_file(
         "files_cmd_version": "1.0",
     }
 
-    # Handle file-search binding
-    if "file-search" in tools:
-        fs_manager = FileSearchManager(client)
-
-        vector_store_name = f"ostruct_{vector_store}"
-        existing_vs_id = cache.get_vector_store_by_name(vector_store_name)
-
-        if existing_vs_id:
-            vector_store_id = existing_vs_id
-        else:
-            vector_store_id = await fs_manager.create_vector_store_with_retry(
-                name=vector_store_name
-            )
-            cache.register_vector_store(vector_store_id, vector_store_name)
-
-        await fs_manager._add_files_to_vector_store_with_retry(
-            vector_store_id, [file_id], max_retries=3, retry_delay=1.0
-        )
-        cache.add_file_to_vector_store(file_hash, vector_store_id)
-
-        metadata["bindings"]["file_search"] = True
-        metadata["bindings"]["vector_store_ids"] = [vector_store_id]
-
-    # Update cache with metadata
-    cache.update_metadata(file_id, metadata)
-
     # Build result
     bindings = FileBindings(
         user_data=metadata["bindings"]["user_data"],
         code_interpreter=metadata["bindings"]["code_interpreter"],
-        file_search=metadata["bindings"]["file_search"],
-        vector_store_ids=metadata["bindings"]["vector_store_ids"],
     )
 
-    return UploadResult(
+    result = UploadResult(
         file_id=file_id,
         path=str(file_path),
         cached=cached,
         bindings=bindings,
         tags=tags,
     )
+    return result, metadata, file_hash
+
+
+async def _attach_to_vector_store(
+    outcomes: Dict[int, Tuple[UploadResult, Dict[str, Any], str]],
+    vector_store: str,
+    client: AsyncOpenAI,
+    cache: UploadCache,
+    error_collector: ErrorCollector,
+) -> None:
+    """Bind uploaded files to the named vector store in batches.
+
+    Files are added with one ``file_batches`` call per
+    ``VECTOR_STORE_FILE_BATCH_SIZE`` files. Files in a failed batch stay
+    uploaded with their file-search binding unset, and the failure is
+    reported to ``error_collector``.
+    """
+    fs_manager = FileSearchManager(client)
+
+    vector_store_name = f"ostruct_{vector_store}"
+    existing_vs_id = cache.get_vector_store_by_name(vector_store_name)
+
+    if existing_vs_id:
+        vector_store_id = existing_vs_id
+    else:
+        vector_store_id = await fs_manager.create_vector_store_with_retry(
+            name=vector_store_name
+        )
+        cache.register_vector_store(vector_store_id, vector_store_name)
+
+    indexes = sorted(outcomes)
+    batch_size = DefaultConfig.VECTOR_STORE_FILE_BATCH_SIZE
+    for start in range(0, len(indexes), batch_size):
+        chunk = indexes[start : start + batch_size]
+        try:
+            await fs_manager._add_files_to_vector_store_with_retry(
+                vector_store_id,
+                [outcomes[i][0].file_id for i in chunk],
+                max_retries=3,
+                retry_delay=1.0,
+            )
+        except Exception as e:
+            for i in chunk:
+                result = outcomes[i][0]
+                error_collector.add_error(
+                    result.path,
+                    e,
+                    context={
+                        "file_id": result.file_id,
+                        "vector_store_id": vector_store_id,
+                    },
+                )
+                logger.error(error_collector.format_error(result.path, e))
+            continue
+
+        for i in chunk:
+            result, metadata, file_hash = outcomes[i]
+            cache.add_file_to_vector_store(
+                file_hash, vector_store_id, result.file_id
+            )
+            metadata["bindings"]["file_search"] = True
+            metadata["bindings"]["vector_store_ids"] = [vector_store_id]
+            result.bindings.file_search = True
+            result.bindings.vector_store_ids = [vector_store_id]
+
+
+def _throughput(
+    file_count: int, total_bytes: int, elapsed: float
+) -> Dict[str, float]:
+    """Compute files/s and MB/s for an upload batch."""
+    if elapsed <= 0:
+        return {"files_per_second": 0.0, "mb_per_second": 0.0}
+    return {
+        "files_per_second": round(file_count / elapsed, 2),
+        "mb_per_second": round(total_bytes / (1024 * 1024) / elapsed, 2),
+    }
 
 
 @files.command()
@@ -1155,7 +1263,7 @@ def list(
         ostruct files list --no-truncate
     """
     try:
-        cache = UploadCache(get_default_cache_path())
+        cache = _open_upload_cache()
         files = cache.list_all()
 
         # Apply filters
@@ -1327,7 +1435,7 @@ def gc(older_than: str, output_json: bool) -> None:
         cutoff_date = datetime.now() - timedelta(days=days)
         cutoff_timestamp = int(cutoff_date.timestamp())
 
-        cache = UploadCache(get_default_cache_path())
+        cache = _open_upload_cache()
 
         # Get all files and filter by age
         all_files = cache.list_all()
@@ -1405,7 +1513,7 @@ def bind(file_id: str, tools: tuple[str, ...], output_json: bool) -> None:
         ostruct files bind file_abc123 --tools file-search --tools code-interpreter
     """
     try:
-        cache = UploadCache(get_default_cache_path())
+        cache = _open_upload_cache()
 
         # Step 1: Validate file exists in cache
         files = cache.list_all()
@@ -1482,8 +1590,6 @@ def rm(file_id: str, output_json: bool) -> None:
     """
     import asyncio
 
-    from ..cache_utils import get_default_cache_path
-    from ..upload_cache import UploadCache
     from ..utils.client_utils import create_openai_client
     from ..utils.json_output import JSONOutputHandler
 
@@ -1503,7 +1609,7 @@ async def _rm_async() -> None:
             logger.warning(f"Failed to remove from cache: {e}")
 
     try:
-        cache = UploadCache(get_default_cache_path())
+        cache = _open_upload_cache()
 
         # Run the async operations
         asyncio.run(_rm_async())
@@ -1560,7 +1666,7 @@ async def _diagnose_async() -> tuple[dict[str, Any], int]:
         # Probe 2: Vector search (test file_search tool with actual vector stores)
         try:
             # Get file metadata to check vector store bindings
-            cache = UploadCache(get_default_cache_path())
+            cache = _open_upload_cache()
             files = cache.list_all()
             file_info = None
             for f in files:
@@ -1701,7 +1807,7 @@ def vector_stores(output_json: bool) -> None:
         ostruct files vector-stores --json
     """
     try:
-        cache = UploadCache(get_default_cache_path())
+        cache = _open_upload_cache()
 
         # Get vector store information from cache
         vector_stores_list = cache.list_vector_stores()
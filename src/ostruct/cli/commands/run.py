@@ -4,9 +4,10 @@
 import logging
 import sys
 from pathlib import Path
-from typing import Any, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import rich_click as click
+from click.exceptions import Exit
 
 from ..click_options import all_options
 from ..config import OstructConfig
@@ -87,6 +88,33 @@ def run(
 
     See organized option groups below for complete functionality.
     """
+    _execute_run(ctx, kwargs, task_file=task_template, schema_file=schema_file)
+
+
+def _execute_run(
+    ctx: click.Context,
+    kwargs: Dict[str, Any],
+    *,
+    task_file: Optional[str] = None,
+    task: Optional[str] = None,
+    schema_file: Optional[str] = None,
+    schema: Optional[Dict[str, Any]] = None,
+    display_path: Optional[str] = None,
+) -> None:
+    """Run (or dry-run) a task from parsed run options.
+
+    The template comes from ``task_file`` or ``task`` and the schema from
+    ``schema_file`` or ``schema``.
+
+    Args:
+        ctx: Click context; ``ctx.obj`` may hold the loaded configuration
+        kwargs: Parsed run command options
+        task_file: Path to the task template
+        task: Task template content
+        schema_file: Path to the schema file
+        schema: Schema loaded in memory
+        display_path: Path shown in plans when the template is in memory
+    """
     try:
         # Configure logging as early as possible
         from ..template_debug import configure_debug_logging
@@ -98,10 +126,12 @@ def run(
 
         # Convert Click parameters to typed dict
         params: CLIParams = {
-            "task_file": task_template,
-            "task": None,
+            "task_file": task_file,
+            "task": task,
             "schema_file": schema_file,
         }
+        if schema is not None:
+            params["schema"] = schema
         # Add all kwargs to params (type ignore for dynamic key assignment)
         for k, v in kwargs.items():
             params[k] = v  # type: ignore[literal-required]
@@ -186,7 +216,7 @@ def run(
             # Variables to track validation state
             validation_passed = True
             template_warning = None
-            original_template_path = task_template
+            original_template_path = display_path or task_file or ""
 
             # Process attachments for the dry-run plan
             processed_attachments = ProcessedAttachments()
@@ -358,6 +388,11 @@ def run(
 
                 finally:
                     loop.close()
+                    from ..upload_cache import UploadCache
+
+                    dry_run_cache = params.get("_upload_cache")
+                    if isinstance(dry_run_cache, UploadCache):
+                        dry_run_cache.close()
 
             except Exception as e:
                 validation_passed = False
@@ -416,7 +451,7 @@ def run(
             plan = PlanAssembler.build_execution_plan(
                 processed_attachments=processed_attachments,
                 template_path=original_template_path,  # Use original path, not template content
-                schema_path=schema_file,
+                schema_path=schema_file or original_template_path,
                 variables=ctx.obj.get("vars", {}) if ctx.obj else {},
                 security_mode=kwargs.get("path_security", "permissive"),
                 model=params.get("model", "gpt-4o"),
@@ -525,3 +560,64 @@ def run(
     except KeyboardInterrupt:
         logger.info("Operation cancelled by user")
         raise
+
+
+def run_inline(
+    task: str,
+    schema: Dict[str, Any],
+    args: List[str],
+    *,
+    template_path: Optional[str] = None,
+) -> int:
+    """Run a template and schema held in memory, as ``ostruct run`` would.
+
+    Used by runx to execute ``.ost`` templates in the current process
+    instead of starting a second ``ostruct`` interpreter. ``args`` are
+    parsed with the run command's own options, so they behave exactly as
+    on the command line.
+
+    Args:
+        task: Task template content
+        schema: Output schema
+        args: Run command options (no positional arguments)
+        template_path: Path of the file the template came from
+
+    Returns:
+        Exit code
+    """
+    options = click.Command(
+        "run",
+        params=[p for p in run.params if not isinstance(p, click.Argument)],
+        context_settings={"help_option_names": ["-h", "--help"]},
+    )
+    try:
+        try:
+            with options.make_context("ostruct run", list(args)) as ctx:
+                try:
+                    config = OstructConfig.load()
+                except Exception as e:
+                    click.secho(
+                        f"Warning: Failed to load configuration: {e}",
+                        fg="yellow",
+                        err=True,
+                    )
+                    config = OstructConfig()
+                ctx.obj = {"config": config}
+                _execute_run(
+                    ctx,
+                    dict(ctx.params),
+                    task=task,
+                    schema=schema,
+                    display_path=template_path,
+                )
+        except Exit as e:
+            return int(e.exit_code)
+        except Exception as e:
+            # Reported as by ostruct's main(); handle_error exits
+            handle_error(e)
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return int(e.code or 0)
+        click.echo(e.code, err=True)
+        return int(ExitCode.INTERNAL_ERROR)
+    return int(ExitCode.SUCCESS)
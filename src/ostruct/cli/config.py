@@ -2,8 +2,9 @@
 
 import logging
 import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 import yaml
 from pydantic import BaseModel, Field, field_validator, model_validator
@@ -44,6 +45,8 @@ class FileCollectionConfig(BaseModel):
     ignore_gitignore: bool = False
     gitignore_file: Optional[str] = None
     gitignore_patterns: list[str] = Field(default_factory=list)
+    scan_index: bool = False
+    scan_index_path: Optional[str] = None
 
     @field_validator("gitignore_file")
     @classmethod
@@ -68,6 +71,18 @@ class TemplateConfig(BaseModel):
         default=4096,
         description="Maximum characters shown in template debugging previews",
     )
+    content_cache_size: int = Field(
+        default=50 * 1024 * 1024,  # 50MB shared file content cache
+        description="Byte budget of the in-process file content cache. 0 disables caching.",
+    )
+    bytecode_cache: bool = Field(
+        default=True,
+        description="Keep compiled templates in the cache directory so unchanged templates are not recompiled.",
+    )
+    bytecode_cache_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for compiled templates. Defaults to 'templates' in the ostruct cache directory.",
+    )
 
     @field_validator("max_file_size")
     @classmethod
@@ -90,6 +105,13 @@ def validate_preview_limit(cls, v: int) -> int:
             raise ValueError("preview_limit must be non-negative")
         return v
 
+    @field_validator("content_cache_size")
+    @classmethod
+    def validate_content_cache_size(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("content_cache_size must be non-negative")
+        return v
+
 
 class ToolsConfig(BaseModel):
     """Configuration for tool-specific settings."""
@@ -137,6 +159,9 @@ class UploadConfig(BaseModel):
     cache_path: Optional[str] = None
     hash_algorithm: str = "sha256"
     label_style: str = "alpha"
+    max_concurrent_uploads: int = DefaultConfig.UPLOAD_MAX_CONCURRENCY
+    paranoid_hashing: bool = False
+    reuse_vector_stores: bool = False
 
     @field_validator("cache_max_age_days")
     @classmethod
@@ -146,11 +171,19 @@ def validate_cache_max_age_days(cls, v: int) -> int:
             raise ValueError("cache_max_age_days must be non-negative")
         return v
 
+    @field_validator("max_concurrent_uploads")
+    @classmethod
+    def validate_max_concurrent_uploads(cls, v: int) -> int:
+        """Validate max_concurrent_uploads is at least one."""
+        if v < 1:
+            raise ValueError("max_concurrent_uploads must be at least 1")
+        return v
+
     @field_validator("hash_algorithm")
     @classmethod
     def validate_hash_algorithm(cls, v: str) -> str:
         """Validate hash_algorithm is supported."""
-        supported = {"sha256", "sha1", "md5"}
+        supported = {"sha256", "sha1", "md5", "blake2b", "blake2s"}
         if v not in supported:
             raise ValueError(f"hash_algorithm must be one of: {supported}")
         return v
@@ -174,6 +207,32 @@ class LimitsConfig(BaseModel):
     )
 
 
+class RateLimitConfig(BaseModel):
+    """Configuration for client-side OpenAI rate limiting."""
+
+    enabled: bool = True
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+    max_concurrency: int = DefaultConfig.RATE_LIMIT_MAX_CONCURRENCY
+    min_concurrency: int = 1
+
+    @field_validator("requests_per_minute", "tokens_per_minute")
+    @classmethod
+    def validate_budget(cls, v: Optional[int]) -> Optional[int]:
+        """Validate budgets are positive when set."""
+        if v is not None and v < 1:
+            raise ValueError("rate limit budgets must be at least 1")
+        return v
+
+    @field_validator("max_concurrency", "min_concurrency")
+    @classmethod
+    def validate_concurrency(cls, v: int) -> int:
+        """Validate concurrency bounds are at least one."""
+        if v < 1:
+            raise ValueError("rate limit concurrency must be at least 1")
+        return v
+
+
 class OstructConfig(BaseModel):
     """Main configuration class for ostruct."""
 
@@ -187,6 +246,7 @@ class OstructConfig(BaseModel):
     mcp: Dict[str, str] = Field(default_factory=dict)
     operation: OperationConfig = Field(default_factory=OperationConfig)
     limits: LimitsConfig = Field(default_factory=LimitsConfig)
+    rate_limits: RateLimitConfig = Field(default_factory=RateLimitConfig)
     json_parsing_strategy: str = Field(
         default=DefaultConfig.JSON_PARSING_STRATEGY,
         description="Strategy for JSON parsing: 'strict' (fail on malformed JSON) or 'robust' (handle OpenAI API duplication bugs)",
@@ -239,18 +299,11 @@ def load(
 
         # Determine config file path
         if config_path is None:
-            # Look for ostruct.yaml in current directory first
-            current_config = Path("ostruct.yaml")
-            home_config = Path.home() / ".ostruct" / "config.yaml"
-
-            if current_config.exists():
-                config_path = current_config
-            elif home_config.exists():
-                config_path = home_config
-            else:
-                # No config file found, use defaults
+            config_path = cls._default_config_path()
+            if config_path is None:
+                # No config file found, use defaults plus environment overrides
                 logger.info("No configuration file found, using defaults")
-                return cls()
+                return cls(**cls._apply_env_overrides({}))
         else:
             config_path = Path(config_path)
 
@@ -272,6 +325,23 @@ def load(
 
         return cls(**config_data)
 
+    @staticmethod
+    def _default_config_path() -> Optional[Path]:
+        """Locate the configuration file used when no path is given.
+
+        Looks for ostruct.yaml in the current directory first, then
+        ~/.ostruct/config.yaml.
+        """
+        current_config = Path("ostruct.yaml")
+        if current_config.exists():
+            return current_config
+
+        home_config = Path.home() / ".ostruct" / "config.yaml"
+        if home_config.exists():
+            return home_config
+
+        return None
+
     @staticmethod
     def _apply_env_overrides(config_data: Dict[str, Any]) -> Dict[str, Any]:
         """Apply environment variable overrides for sensitive settings."""
@@ -308,9 +378,27 @@ def _apply_env_overrides(config_data: Dict[str, Any]) -> Dict[str, Any]:
         if gitignore_file_env:
             file_collection_config["gitignore_file"] = gitignore_file_env
 
+        # OSTRUCT_SCAN_INDEX environment variable
+        scan_index_env = os.getenv("OSTRUCT_SCAN_INDEX")
+        if scan_index_env is not None:
+            file_collection_config["scan_index"] = scan_index_env.lower() in (
+                "true",
+                "1",
+                "yes",
+            )
+
         # Template processing environment variables
         template_config = config_data.setdefault("template", {})
 
+        # OSTRUCT_TEMPLATE_CACHE environment variable
+        template_cache_env = os.getenv("OSTRUCT_TEMPLATE_CACHE")
+        if template_cache_env is not None:
+            template_config["bytecode_cache"] = template_cache_env.lower() in (
+                "true",
+                "1",
+                "yes",
+            )
+
         # OSTRUCT_MAX_FILE_SIZE environment variable (new)
         max_file_size_env = os.getenv("OSTRUCT_MAX_FILE_SIZE")
         if max_file_size_env is not None:
@@ -396,6 +484,52 @@ def _apply_env_overrides(config_data: Dict[str, Any]) -> Dict[str, Any]:
         if cache_path_env:
             upload_config["cache_path"] = cache_path_env
 
+        # OSTRUCT_CACHE_PARANOID environment variable
+        cache_paranoid_env = os.getenv("OSTRUCT_CACHE_PARANOID")
+        if cache_paranoid_env is not None:
+            upload_config["paranoid_hashing"] = cache_paranoid_env.lower() in (
+                "true",
+                "1",
+                "yes",
+            )
+
+        # OSTRUCT_UPLOAD_CONCURRENCY environment variable
+        upload_concurrency_env = os.getenv("OSTRUCT_UPLOAD_CONCURRENCY")
+        if upload_concurrency_env is not None:
+            try:
+                upload_config["max_concurrent_uploads"] = int(
+                    upload_concurrency_env
+                )
+            except ValueError:
+                logger.warning(
+                    f"Invalid OSTRUCT_UPLOAD_CONCURRENCY value '{upload_concurrency_env}', ignoring"
+                )
+
+        # Rate limit environment variables
+        rate_limit_config = config_data.setdefault("rate_limits", {})
+
+        rate_limit_env = os.getenv("OSTRUCT_RATE_LIMIT")
+        if rate_limit_env is not None:
+            rate_limit_config["enabled"] = rate_limit_env.lower() in (
+                "true",
+                "1",
+                "yes",
+            )
+
+        for env_name, key in (
+            ("OSTRUCT_RATE_LIMIT_RPM", "requests_per_minute"),
+            ("OSTRUCT_RATE_LIMIT_TPM", "tokens_per_minute"),
+            ("OSTRUCT_RATE_LIMIT_CONCURRENCY", "max_concurrency"),
+        ):
+            env_value = os.getenv(env_name)
+            if env_value is not None:
+                try:
+                    rate_limit_config[key] = int(env_value)
+                except ValueError:
+                    logger.warning(
+                        f"Invalid {env_name} value '{env_value}', ignoring"
+                    )
+
         # JSON parsing strategy environment variable
         json_parsing_env = os.getenv("OSTRUCT_JSON_PARSING_STRATEGY")
         if json_parsing_env is not None:
@@ -467,6 +601,10 @@ def get_upload_config(self) -> UploadConfig:
         """Get upload and cache configuration."""
         return self.uploads
 
+    def get_rate_limit_config(self) -> RateLimitConfig:
+        """Get client-side rate limit configuration."""
+        return self.rate_limits
+
     def should_require_approval(self, cost_estimate: float = 0.0) -> bool:
         """Determine if approval should be required for an operation."""
         if self.operation.require_approval == "always":
@@ -519,9 +657,47 @@ def create_example_config() -> str:
   # cache_path: ~/.cache/ostruct/uploads.db
 
   # Hash algorithm for deduplication (default: sha256)
-  # Options: sha256, sha1, md5
+  # Options: sha256, sha1, md5, blake2b, blake2s
+  # (blake2b is usually the fastest on 64-bit machines)
   hash_algorithm: sha256
 
+  # Always hash file content instead of trusting unchanged
+  # path/inode/size/mtime to identify cached files (default: false)
+  paranoid_hashing: false
+
+  # Maximum number of concurrent uploads per tool (default: 8)
+  # Override per run with --upload-concurrency
+  max_concurrent_uploads: 8
+
+  # Keep File Search vector stores between runs and reuse the one built
+  # from the same (or nearly the same) set of files. Reused stores are
+  # not removed by --fs-cleanup and stay billed (default: false)
+  reuse_vector_stores: false
+
+# Directory collection (--dir, --collect, --recursive)
+file_collection:
+  # Remember directory listings between runs and only rescan directories
+  # whose modification time changed (default: false)
+  scan_index: false
+
+  # Custom scan index path (optional)
+  # Default: scan_index.sqlite in the platform-specific cache directory
+  # scan_index_path: ~/.cache/ostruct/scan_index.sqlite
+
+# Template processing
+template:
+  # Byte budget for file content shared by prompt rendering, validation
+  # and token counting within a run (default: 52428800 = 50MB, 0 disables)
+  content_cache_size: 52428800
+
+  # Keep compiled templates between runs so unchanged templates are not
+  # recompiled (default: true)
+  bytecode_cache: true
+
+  # Custom directory for compiled templates (optional)
+  # Default: templates/ in the platform-specific cache directory
+  # bytecode_cache_dir: ~/.cache/ostruct/templates
+
 # Tool-specific settings
 tools:
   code_interpreter:
@@ -560,12 +736,121 @@ def create_example_config() -> str:
   max_cost_per_run: 10.00
   warn_expensive_operations: true
 
+# Client-side rate limiting of OpenAI requests, per endpoint and model
+rate_limits:
+  # Pace requests and adapt concurrency to 429s and x-ratelimit-*
+  # response headers (default: true)
+  enabled: true
+
+  # Budgets per endpoint and model (optional)
+  # Default: learned from the x-ratelimit-limit-* response headers
+  # requests_per_minute: 500
+  # tokens_per_minute: 30000
+
+  # Concurrency starts here and halves after each burst of 429s
+  # (default: 16)
+  max_concurrency: 16
+  min_concurrency: 1
+
 # Environment Variables for Secrets:
 # OPENAI_API_KEY - Your OpenAI API key
 # OSTRUCT_MCP_URL_<name> - URL for custom MCP servers (e.g., OSTRUCT_MCP_URL_stripe)
 """
 
 
-def get_config() -> OstructConfig:
-    """Get the global configuration instance."""
-    return OstructConfig.load()
+# Process-wide cache of loaded configurations, keyed by the requested
+# path. Each entry stores the fingerprint it was loaded under.
+_config_cache: Dict[Optional[str], Tuple[Tuple[Any, ...], OstructConfig]] = {}
+_config_cache_lock = threading.Lock()
+
+
+def _config_fingerprint(
+    config_path: Optional[Union[str, Path]],
+) -> Tuple[Any, ...]:
+    """Build the cache key that decides whether a cached config is stale.
+
+    Covers the resolved config file (path, mtime and size), the working
+    directory and home directory used to find it, and every environment
+    variable that ``_apply_env_overrides`` reads.
+    """
+    if config_path is None:
+        path = OstructConfig._default_config_path()
+    else:
+        path = Path(config_path)
+
+    file_key: Optional[Tuple[str, int, int]] = None
+    if path is not None:
+        try:
+            st = path.stat()
+            file_key = (str(path.absolute()), st.st_mtime_ns, st.st_size)
+        except OSError:
+            file_key = None
+
+    env_key = tuple(
+        sorted(
+            (key, value)
+            for key, value in os.environ.items()
+            if key.startswith("OSTRUCT_")
+        )
+    )
+    try:
+        cwd: Optional[str] = os.getcwd()
+    except OSError:
+        cwd = None
+    return (cwd, str(Path.home()), file_key, env_key)
+
+
+def get_config(
+    config_path: Optional[Union[str, Path]] = None,
+) -> OstructConfig:
+    """Get the configuration instance, loading it at most once per change.
+
+    The loaded configuration is cached for the process and reused until
+    the config file's mtime or size, the working directory or any
+    ``OSTRUCT_*`` environment variable changes. The returned instance is
+    shared between callers and must not be mutated.
+
+    Args:
+        config_path: Explicit configuration file. If None, the default
+            lookup of ``OstructConfig.load`` is used.
+
+    Returns:
+        OstructConfig instance
+    """
+    cache_key = None if config_path is None else str(config_path)
+    fingerprint = _config_fingerprint(config_path)
+
+    cached = _config_cache.get(cache_key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    with _config_cache_lock:
+        cached = _config_cache.get(cache_key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        config = OstructConfig.load(config_path)
+        _config_cache[cache_key] = (fingerprint, config)
+        return config
+
+
+def clear_config_cache() -> None:
+    """Drop all cached configurations so the next access reloads them."""
+    with _config_cache_lock:
+        _config_cache.clear()
+
+
+def reload_config(
+    config_path: Optional[Union[str, Path]] = None,
+) -> OstructConfig:
+    """Force a fresh load of the configuration, bypassing the cache.
+
+    Args:
+        config_path: Explicit configuration file, as for ``get_config``.
+
+    Returns:
+        Newly loaded OstructConfig instance
+    """
+    cache_key = None if config_path is None else str(config_path)
+    with _config_cache_lock:
+        _config_cache.pop(cache_key, None)
+    return get_config(config_path)
@@ -64,6 +64,20 @@ class DefaultConfig:
         DefaultPaths.USER_DATA_LARGE_WARNING_BYTES
     )
 
+    # Maximum number of file uploads in flight at once per tool
+    UPLOAD_MAX_CONCURRENCY: int = 8
+
+    # Starting and highest number of OpenAI requests in flight per
+    # endpoint and model under the client-side rate limiter
+    RATE_LIMIT_MAX_CONCURRENCY: int = 16
+
+    # Maximum file IDs per vector store file_batches.create call
+    VECTOR_STORE_FILE_BATCH_SIZE: int = 500
+
+    # Minimum overlap (shared / all files) for patching a cached vector
+    # store instead of building a new one
+    VECTOR_STORE_REUSE_MIN_OVERLAP: float = 0.8
+
     # Template processing defaults
     TEMPLATE: Dict[str, Any] = {
         "system_prompt": "You are a helpful assistant.",
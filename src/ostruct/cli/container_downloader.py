@@ -10,6 +10,7 @@
 
 from .errors import ContainerExpiredError, DownloadError
 from .progress_reporting import get_progress_reporter
+from .rate_limiter import rate_limit_event_hooks, rate_limited
 from .security.credential_sanitizer import CredentialSanitizer
 
 logger = logging.getLogger(__name__)
@@ -27,6 +28,7 @@ def __init__(self, api_key: str):
         self.client = httpx.AsyncClient(
             timeout=httpx.Timeout(30.0),
             headers={"Authorization": f"Bearer {api_key}"},
+            event_hooks=rate_limit_event_hooks(),
         )
 
     async def download_container_file(
@@ -44,7 +46,8 @@ async def download_container_file(
 
         try:
             # First, check file size to prevent memory exhaustion
-            head_response = await self.client.head(url)
+            async with rate_limited("containers"):
+                head_response = await self.client.head(url)
             if head_response.status_code == 429:
                 raise httpx.HTTPStatusError(
                     "Rate limited",
@@ -68,7 +71,8 @@ async def download_container_file(
             )
 
             # Now download the actual content
-            response = await self.client.get(url)
+            async with rate_limited("containers"):
+                response = await self.client.get(url)
 
             if response.status_code == 404:
                 raise ContainerExpiredError(
@@ -4,10 +4,13 @@
 before making them, helping users plan their usage and budget.
 """
 
-from typing import Optional
+from typing import Dict, Optional
 
 from openai_model_registry import ModelRegistry
 
+# Number of template files listed in the dry-run token breakdown
+MAX_FILES_IN_BREAKDOWN = 5
+
 # Static pricing mapping for major models (per 1K tokens)
 # These should be updated periodically or fetched from an external source
 MODEL_PRICING = {
@@ -84,6 +87,7 @@ def format_cost_breakdown(
     output_tokens: int,
     total_cost: float,
     context_window: int,
+    file_tokens: Optional[Dict[str, int]] = None,
 ) -> str:
     """Format cost breakdown for display.
 
@@ -93,6 +97,7 @@ def format_cost_breakdown(
         output_tokens: Number of output tokens
         total_cost: Total estimated cost
         context_window: Model's context window
+        file_tokens: Optional tokens contributed by each template file
 
     Returns:
         Formatted cost breakdown string
@@ -110,6 +115,21 @@ def format_cost_breakdown(
     utilization = (total_tokens / context_window) * 100
     lines.append(f"   • Context utilization: {utilization:.1f}%")
 
+    # Largest template files by their share of the input tokens
+    top_files = sorted(
+        (
+            (path, tokens)
+            for path, tokens in (file_tokens or {}).items()
+            if tokens > 0
+        ),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:MAX_FILES_IN_BREAKDOWN]
+    if top_files:
+        lines.append("   • Largest template files:")
+        for path, tokens in top_files:
+            lines.append(f"     - {path}: {tokens:,} tokens")
+
     return "\n".join(lines)
 
 
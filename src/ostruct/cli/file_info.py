@@ -7,6 +7,7 @@
 from pathlib import Path
 from typing import Any, Iterator, Optional
 
+from .cache_manager import get_file_cache
 from .errors import FileReadError, OstructFileNotFoundError, PathSecurityError
 from .security import SecurityManager
 
@@ -57,6 +58,34 @@ class FileInfo:
         routing_type: How the file was routed (e.g., 'template', 'code-interpreter')
     """
 
+    # Fixed attribute layout: no per-instance __dict__, and assignment to
+    # any other name fails. Private state uses name-mangled slots, so only
+    # methods of this class can write it; read-only public attributes are
+    # properties without working setters.
+    __slots__ = (
+        "__path",
+        "__security_manager",
+        "__content",
+        "__encoding",
+        "__hash",
+        "__size",
+        "__mtime",
+        "__routing_type",
+        "__routing_intent",
+        "__max_size",
+        "__strict_mode",
+        "__lazy_loading",
+        "__size_checked",
+        "__actual_size",
+        "__loaded",
+        "parent_alias",
+        "relative_path",
+        "base_path",
+        "from_collection",
+        "attachment_type",
+        "_is_url",
+    )
+
     def __init__(
         self,
         path: str,
@@ -96,8 +125,8 @@ def __init__(
         self.__hash = hash_value
         self.__size: Optional[int] = None
         self.__mtime: Optional[float] = None
-        self.routing_type = routing_type
-        self.routing_intent = routing_intent
+        self.__routing_type = routing_type
+        self.__routing_intent = routing_intent
 
         # LazyFileContent integration
         self.__max_size = (
@@ -298,6 +327,26 @@ def path(self, value: str) -> None:
         """Prevent setting path directly."""
         raise AttributeError("Cannot modify path directly")
 
+    @property
+    def routing_type(self) -> Optional[str]:
+        """Get how the file was routed (e.g., 'template', 'code-interpreter')."""
+        return self.__routing_type
+
+    @routing_type.setter
+    def routing_type(self, value: Optional[str]) -> None:
+        """Prevent setting routing_type directly."""
+        raise AttributeError("Cannot modify routing_type directly")
+
+    @property
+    def routing_intent(self) -> Optional[FileRoutingIntent]:
+        """Get the intended use of the file in the pipeline."""
+        return self.__routing_intent
+
+    @routing_intent.setter
+    def routing_intent(self, value: Optional[FileRoutingIntent]) -> None:
+        """Prevent setting routing_intent directly."""
+        raise AttributeError("Cannot modify routing_intent directly")
+
     @property
     def abs_path(self) -> str:
         """Get the absolute path of the file.
@@ -450,6 +499,18 @@ def content(self, value: str) -> None:
         """Prevent setting content directly."""
         raise AttributeError("Cannot modify content directly")
 
+    @property
+    def loaded_content(self) -> Optional[str]:
+        """Get the content only if it has already been loaded.
+
+        Unlike ``content`` this never reads the file, so it reflects what a
+        rendered template actually embedded.
+
+        Returns:
+            The cached content, or None if the file has not been read
+        """
+        return self.__content
+
     @property
     def encoding(self) -> str:
         """Get the encoding of the file.
@@ -565,7 +626,7 @@ def is_dir(self) -> bool:
 
     @staticmethod
     def _get_default_max_size() -> Optional[int]:
-        """Get default max size from config or environment.
+        """Get default max size from environment or config.
 
         Returns:
             Default maximum file size in bytes, or None for no limit
@@ -599,6 +660,14 @@ def _get_default_max_size() -> Optional[int]:
                 )
                 # Fall through to default
 
+        # Configured template.max_file_size (cached by get_config)
+        try:
+            from .config import get_config
+
+            return get_config().template.max_file_size
+        except Exception as e:
+            logger.debug(f"Could not read max_file_size from config: {e}")
+
         # Default: 100MB limit for DoS protection
         try:
             from .constants import DefaultConfig
@@ -739,21 +808,13 @@ def _read_file(self) -> None:
         """Read and decode file content.
 
         Implementation detail: Attempts UTF-8 first, falls back to system encoding.
-        All exceptions will be caught and wrapped by the content property.
+        Content comes from the shared FileCache, so every FileInfo for the same
+        unchanged file reuses a single read. All exceptions will be caught and
+        wrapped by the content property.
         """
-        try:
-            with open(self.abs_path, "rb") as f:
-                raw_content = f.read()
-            try:
-                self.__content = raw_content.decode("utf-8")
-                self.__encoding = "utf-8"
-            except UnicodeDecodeError:
-                # Fall back to system encoding
-                self.__content = raw_content.decode()
-                self.__encoding = "system"
-        except Exception:
-            # Let content property handle all errors
-            raise
+        entry = get_file_cache().load(self.abs_path)
+        self.__content = entry.content
+        self.__encoding = entry.encoding
 
     def update_cache(
         self,
@@ -848,64 +909,6 @@ def __repr__(self) -> str:
             f"hash={self.hash!r})"
         )
 
-    def __setattr__(self, name: str, value: Any) -> None:
-        """Control attribute modification.
-
-        Internal methods can modify private attributes, but external access is prevented.
-        """
-        # Allow setting routing_type and routing_intent if they're not already set (i.e., during __init__)
-        if name in ("routing_type", "routing_intent") and not hasattr(
-            self, name
-        ):
-            object.__setattr__(self, name, value)
-            return
-
-        # Allow setting TSES fields
-        if name in (
-            "parent_alias",
-            "relative_path",
-            "base_path",
-            "from_collection",
-            "attachment_type",
-        ):
-            object.__setattr__(self, name, value)
-            return
-
-        # Allow setting _is_url at any time (idempotent)
-        if name == "_is_url":
-            object.__setattr__(self, name, value)
-            return
-
-        # Allow setting private attributes from internal methods or during initialization
-        if name.startswith("_FileInfo__") and (
-            self._is_internal_call() or not hasattr(self, "_FileInfo__path")
-        ):
-            object.__setattr__(self, name, value)
-            return
-
-        # Prevent setting other attributes
-        raise AttributeError(f"Cannot modify {name} directly")
-
-    def _is_internal_call(self) -> bool:
-        """Check if the call is from an internal method."""
-        import inspect
-
-        frame = inspect.currentframe()
-        try:
-            # Get the caller's frame (2 frames up: _is_internal_call -> __setattr__ -> caller)
-            caller = frame.f_back.f_back if frame and frame.f_back else None
-            if not caller:
-                return False
-
-            # Check if the caller is a method of this class
-            return (
-                caller.f_code.co_name in type(self).__dict__
-                and "self" in caller.f_locals
-                and caller.f_locals["self"] is self
-            )
-        finally:
-            del frame  # Avoid reference cycles
-
     def enable_lazy_loading(
         self, max_size: Optional[int] = None, strict_mode: bool = False
     ) -> "FileInfo":
@@ -6,20 +6,47 @@
 """
 
 import asyncio
+import hashlib
 import logging
 import os
 import time
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from openai import AsyncOpenAI
 
+from .constants import DefaultConfig
+from .rate_limiter import rate_limited
+
 if TYPE_CHECKING:
+    from .upload_cache import UploadCache
     from .upload_manager import SharedUploadManager
 
 logger = logging.getLogger(__name__)
 
 
+def vector_store_fingerprint(file_hashes: Iterable[str]) -> str:
+    """Derive a deterministic fingerprint from a set of file content hashes.
+
+    Args:
+        file_hashes: Content hashes of the files in the vector store
+
+    Returns:
+        Hex digest identifying the set of files, independent of order
+    """
+    joined = "\n".join(sorted(set(file_hashes)))
+    return hashlib.sha256(joined.encode()).hexdigest()
+
+
 class FileSearchManager:
     """Manager for File Search vector store operations with retry logic."""
 
@@ -27,17 +54,33 @@ def __init__(
         self,
         client: AsyncOpenAI,
         upload_manager: Optional["SharedUploadManager"] = None,
+        reuse_vector_stores: bool = False,
     ) -> None:
         """Initialize File Search manager.
 
         Args:
             client: AsyncOpenAI client instance
             upload_manager: Optional shared upload manager for deduplication
+            reuse_vector_stores: Reuse vector stores from earlier runs that
+                hold the same files (requires the upload cache)
         """
         self.client = client
         self.uploaded_file_ids: List[str] = []
         self.created_vector_stores: List[str] = []
         self.upload_manager = upload_manager
+        self.reuse_vector_stores = reuse_vector_stores
+
+        # How the vector store was obtained: "exact", "patched" or "new"
+        self._vector_store_reuse: Optional[str] = None
+
+        # File batch IDs per vector store, used to track indexing progress
+        self._file_batches: Dict[str, List[str]] = {}
+        # Batches seen completed, by ID; readiness polls do not re-fetch them
+        self._completed_batches: Dict[str, Any] = {}
+
+        # Readiness polling statistics
+        self._readiness_polls: int = 0
+        self._time_to_ready: Optional[float] = None
 
     async def create_vector_store_with_retry(
         self,
@@ -66,13 +109,14 @@ async def create_vector_store_with_retry(
                     f"Creating vector store '{name}' (attempt {attempt + 1}/{max_retries + 1})"
                 )
 
-                vector_store = await self.client.vector_stores.create(
-                    name=name,
-                    expires_after={
-                        "anchor": "last_active_at",
-                        "days": 7,  # Automatically expire after 7 days of inactivity
-                    },
-                )
+                async with rate_limited("vector_stores"):
+                    vector_store = await self.client.vector_stores.create(
+                        name=name,
+                        expires_after={
+                            "anchor": "last_active_at",
+                            "days": 7,  # Automatically expire after 7 days of inactivity
+                        },
+                    )
 
                 self.created_vector_stores.append(vector_store.id)
                 logger.debug(
@@ -180,10 +224,11 @@ async def _upload_single_file_with_retry(
                 )
 
                 with open(file_path, "rb") as f:
-                    file_obj = await self.client.files.create(
-                        file=f,
-                        purpose="assistants",  # Required for File Search
-                    )
+                    async with rate_limited("files"):
+                        file_obj = await self.client.files.create(
+                            file=f,
+                            purpose="assistants",  # Required for File Search
+                        )
 
                 logger.debug(
                     f"Successfully uploaded {file_path} with ID: {file_obj.id}"
@@ -235,9 +280,17 @@ async def _add_files_to_vector_store_with_retry(
                     f"Adding {len(file_ids)} files to vector store - attempt {attempt + 1}/{max_retries + 1}"
                 )
 
-                await self.client.vector_stores.file_batches.create(
-                    vector_store_id=vector_store_id, file_ids=file_ids
-                )
+                async with rate_limited("vector_stores"):
+                    batch = (
+                        await self.client.vector_stores.file_batches.create(
+                            vector_store_id=vector_store_id, file_ids=file_ids
+                        )
+                    )
+                batch_id = getattr(batch, "id", None)
+                if isinstance(batch_id, str):
+                    self._file_batches.setdefault(vector_store_id, []).append(
+                        batch_id
+                    )
 
                 logger.debug(
                     f"Successfully added files to vector store: {vector_store_id}"
@@ -280,51 +333,152 @@ async def wait_for_vector_store_ready(
         vector_store_id: str,
         timeout: float = 60.0,
         poll_interval: float = 2.0,
+        initial_interval: float = 0.25,
     ) -> bool:
         """Wait for vector store to be ready for search.
 
-        Based on probe tests, indexing is typically instant (0.0s average),
-        but we include polling for reliability.
+        Indexing is often near-instant, so the first check happens
+        immediately. Later checks back off exponentially from
+        ``initial_interval`` up to ``poll_interval`` until the deadline.
+        When files were added through this manager, progress is read from
+        their file batches, so per-file counts can be reported and the wait
+        ends as soon as every batch completes.
 
         Args:
             vector_store_id: ID of the vector store
             timeout: Maximum time to wait in seconds
-            poll_interval: Time between status checks in seconds
+            poll_interval: Maximum time between status checks in seconds
+            initial_interval: Delay before the second status check
 
         Returns:
-            True if vector store is ready, False if timeout
+            True if vector store is ready, False if failed or timed out
         """
-        start_time = time.time()
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+        interval = initial_interval
+        last_counts: Optional[Tuple[int, int]] = None
 
-        while time.time() - start_time < timeout:
+        while True:
+            self._readiness_polls += 1
             try:
-                vector_store = await self.client.vector_stores.retrieve(
+                status, counts = await self._check_indexing_status(
                     vector_store_id
                 )
 
-                if vector_store.status == "completed":
-                    logger.debug(f"Vector store {vector_store_id} is ready")
+                if status == "completed":
+                    self._time_to_ready = time.monotonic() - start_time
+                    logger.debug(
+                        f"Vector store {vector_store_id} is ready after "
+                        f"{self._time_to_ready:.2f}s"
+                    )
                     return True
-                elif vector_store.status == "failed":
+                elif status in ("failed", "cancelled", "expired"):
                     logger.error(
-                        f"Vector store {vector_store_id} failed to index"
+                        f"Vector store {vector_store_id} failed to index "
+                        f"(status: {status})"
                     )
                     return False
 
-                logger.debug(
-                    f"Vector store {vector_store_id} status: {vector_store.status}"
-                )
-                await asyncio.sleep(poll_interval)
+                if counts is not None and counts != last_counts:
+                    last_counts = counts
+                    self._report_indexing_progress(vector_store_id, *counts)
+                else:
+                    logger.debug(
+                        f"Vector store {vector_store_id} status: {status}"
+                    )
 
             except Exception as e:
                 logger.warning(f"Error checking vector store status: {e}")
-                await asyncio.sleep(poll_interval)
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * 2, poll_interval)
 
         logger.warning(
             f"Vector store {vector_store_id} not ready after {timeout}s timeout"
         )
         return False
 
+    async def _check_indexing_status(
+        self, vector_store_id: str
+    ) -> Tuple[str, Optional[Tuple[int, int]]]:
+        """Get the indexing status of a vector store.
+
+        Returns:
+            Tuple of (status, (processed files, total files) or None when
+            no file batches are known for the store)
+        """
+        batch_ids = self._file_batches.get(vector_store_id)
+        if not batch_ids:
+            async with rate_limited("vector_stores"):
+                vector_store = await self.client.vector_stores.retrieve(
+                    vector_store_id
+                )
+            return vector_store.status, None
+
+        async def retrieve_batch(batch_id: str) -> Any:
+            completed = self._completed_batches.get(batch_id)
+            if completed is not None:
+                return completed
+            async with rate_limited("vector_stores"):
+                batch = await self.client.vector_stores.file_batches.retrieve(
+                    batch_id, vector_store_id=vector_store_id
+                )
+            if batch.status == "completed":
+                self._completed_batches[batch_id] = batch
+            return batch
+
+        batches = await asyncio.gather(
+            *(retrieve_batch(batch_id) for batch_id in batch_ids)
+        )
+
+        processed = 0
+        total = 0
+        failed = 0
+        statuses = set()
+        for batch in batches:
+            counts = batch.file_counts
+            processed += counts.completed + counts.failed + counts.cancelled
+            total += counts.total
+            failed += counts.failed
+            statuses.add(batch.status)
+
+        for status in ("failed", "cancelled"):
+            if status in statuses:
+                return status, (processed, total)
+        if statuses == {"completed"}:
+            if failed:
+                logger.warning(
+                    f"{failed} of {total} files failed to index in "
+                    f"vector store {vector_store_id}"
+                )
+            return "completed", (processed, total)
+        return "in_progress", (processed, total)
+
+    def _report_indexing_progress(
+        self, vector_store_id: str, processed: int, total: int
+    ) -> None:
+        """Report per-file indexing progress."""
+        logger.debug(
+            f"Vector store {vector_store_id}: {processed}/{total} files indexed"
+        )
+        try:
+            import click
+
+            from .progress_reporting import get_progress_reporter
+
+            reporter = get_progress_reporter()
+            if reporter.should_report and reporter.detailed:
+                click.echo(
+                    f"⏳ Indexing vector store: {processed}/{total} files",
+                    err=True,
+                )
+        except Exception:  # pragma: no cover
+            # Never fail indexing wait because of progress reporting
+            pass
+
     def build_tool_config(self, vector_store_id: str) -> Dict[str, Any]:
         """Build File Search tool configuration.
 
@@ -347,13 +501,19 @@ async def create_vector_store_from_shared_manager(
         vector_store_name: str = "ostruct_vector_store",
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        timeout: float = 60.0,
     ) -> str:
         """Create vector store and populate with files from shared upload manager.
 
+        Once files are attached, waits up to ``timeout`` seconds for the
+        store to finish indexing. A store that is not ready in time is still
+        returned, as with the per-tool File Search path.
+
         Args:
             vector_store_name: Name for the vector store
             max_retries: Maximum retry attempts
             retry_delay: Delay between retries
+            timeout: Maximum time to wait for indexing in seconds
 
         Returns:
             Vector store ID
@@ -380,25 +540,253 @@ async def create_vector_store_from_shared_manager(
                 vector_store_name, max_retries, retry_delay
             )
 
-        # Create vector store
-        vector_store_id = await self.create_vector_store_with_retry(
-            vector_store_name, max_retries, retry_delay
-        )
+        # Reuse a vector store built from the same files in an earlier run
+        cache = getattr(self.upload_manager, "_cache", None)
+        file_hashes: Dict[str, str] = {}
+        if self.reuse_vector_stores and cache:
+            file_hashes = self.upload_manager.get_file_hashes_for_tool(
+                "file-search"
+            )
 
-        # Add files to vector store
-        await self._add_files_to_vector_store_with_retry(
-            vector_store_id, file_ids, max_retries, retry_delay
-        )
+        if cache and file_hashes and len(file_hashes) == len(file_ids):
+            vector_store_id = await self._get_reusable_vector_store(
+                cache,
+                vector_store_name,
+                file_hashes,
+                max_retries,
+                retry_delay,
+            )
+        else:
+            # Create vector store
+            vector_store_id = await self.create_vector_store_with_retry(
+                vector_store_name, max_retries, retry_delay
+            )
+
+            # Add files to vector store
+            await self._add_files_to_vector_store_with_retry(
+                vector_store_id, file_ids, max_retries, retry_delay
+            )
+
+            logger.debug(
+                f"Created vector store {vector_store_id} with {len(file_ids)} files from shared manager"
+            )
 
         # Track uploaded files for cleanup
         self.uploaded_file_ids.extend(file_ids)
 
-        logger.debug(
-            f"Created vector store {vector_store_id} with {len(file_ids)} files from shared manager"
+        if not await self.wait_for_vector_store_ready(
+            vector_store_id, timeout=timeout
+        ):
+            logger.warning(
+                f"Vector store may not be fully indexed within {timeout}s timeout"
+            )
+
+        return vector_store_id
+
+    async def _get_reusable_vector_store(
+        self,
+        cache: "UploadCache",
+        base_name: str,
+        file_hashes: Dict[str, str],
+        max_retries: int,
+        retry_delay: float,
+    ) -> str:
+        """Find, patch or build a vector store kept across runs.
+
+        Stores are registered in the upload cache under a name derived from
+        the fingerprint of their file hashes. An exact match is reused as
+        is; a store sharing most of the files is patched by adding and
+        removing only the differing files; otherwise a new store is built.
+        Stores obtained here are not deleted by :meth:`cleanup_resources`
+        and expire server-side after 7 days of inactivity. Cached stores
+        that turn out unusable are handed to cleanup instead.
+
+        Args:
+            cache: Upload cache holding vector store registrations
+            base_name: Vector store base name
+            file_hashes: Mapping of OpenAI file ID to content hash
+            max_retries: Maximum retry attempts
+            retry_delay: Delay between retries
+
+        Returns:
+            Vector store ID
+        """
+        wanted = set(file_hashes.values())
+        fingerprint = vector_store_fingerprint(wanted)
+        store_name = f"{base_name}-{fingerprint[:16]}"
+        store_metadata = {"fingerprint": fingerprint}
+
+        # Exact match
+        vector_store_id = cache.get_vector_store_by_name(store_name)
+        if vector_store_id:
+            reusable = await self._is_vector_store_reusable(
+                vector_store_id, len(wanted)
+            )
+            if reusable:
+                logger.debug(
+                    f"[fs] Reusing vector store {vector_store_id} ({store_name})"
+                )
+                self._vector_store_reuse = "exact"
+                return vector_store_id
+            self._discard_vector_store(
+                cache, vector_store_id, delete=reusable is not None
+            )
+
+        # Near match: patch only the differing files
+        candidate = await self._find_similar_vector_store(
+            cache, base_name, wanted
         )
+        if candidate:
+            vector_store_id, existing = candidate
+            file_id_by_hash = {h: f for f, h in file_hashes.items()}
+            try:
+                attached = cache.get_vector_store_file_ids(vector_store_id)
+                for file_hash in existing - wanted:
+                    stale_file_id = attached.get(file_hash) or cache.lookup(
+                        file_hash
+                    )
+                    if not stale_file_id:
+                        raise ValueError(
+                            f"unknown file ID for stale file {file_hash[:8]}"
+                        )
+                    async with rate_limited("vector_stores"):
+                        await self.client.vector_stores.files.delete(
+                            stale_file_id, vector_store_id=vector_store_id
+                        )
+                    cache.remove_file_from_vector_store(
+                        file_hash, vector_store_id
+                    )
 
+                to_add = sorted(wanted - existing)
+                if to_add:
+                    await self._add_files_to_vector_store_with_retry(
+                        vector_store_id,
+                        [file_id_by_hash[h] for h in to_add],
+                        max_retries,
+                        retry_delay,
+                    )
+                    for file_hash in to_add:
+                        cache.add_file_to_vector_store(
+                            file_hash,
+                            vector_store_id,
+                            file_id_by_hash[file_hash],
+                        )
+
+                cache.register_vector_store(
+                    vector_store_id, store_name, store_metadata
+                )
+                logger.debug(
+                    f"[fs] Patched vector store {vector_store_id}: "
+                    f"+{len(to_add)} -{len(existing - wanted)} files"
+                )
+                self._vector_store_reuse = "patched"
+                return vector_store_id
+            except Exception as e:
+                logger.warning(
+                    f"[fs] Failed to patch vector store {vector_store_id}, "
+                    f"building a new one: {e}"
+                )
+                self._discard_vector_store(cache, vector_store_id)
+
+        # No usable store: build one and keep it for later runs
+        vector_store_id = await self.create_vector_store_with_retry(
+            store_name, max_retries, retry_delay
+        )
+        await self._add_files_to_vector_store_with_retry(
+            vector_store_id, list(file_hashes), max_retries, retry_delay
+        )
+        self.created_vector_stores.remove(vector_store_id)
+        cache.register_vector_store(
+            vector_store_id, store_name, store_metadata
+        )
+        for file_id, file_hash in file_hashes.items():
+            cache.add_file_to_vector_store(file_hash, vector_store_id, file_id)
+        self._vector_store_reuse = "new"
         return vector_store_id
 
+    def _discard_vector_store(
+        self, cache: "UploadCache", vector_store_id: str, delete: bool = True
+    ) -> None:
+        """Forget a cached vector store and delete it during cleanup.
+
+        Args:
+            cache: Upload cache holding vector store registrations
+            vector_store_id: Vector store to discard
+            delete: Whether the store still exists server-side
+        """
+        cache.unregister_vector_store(vector_store_id)
+        if delete and vector_store_id not in self.created_vector_stores:
+            self.created_vector_stores.append(vector_store_id)
+
+    async def _find_similar_vector_store(
+        self, cache: "UploadCache", base_name: str, wanted: Set[str]
+    ) -> Optional[Tuple[str, Set[str]]]:
+        """Find the cached vector store sharing the most files with ``wanted``.
+
+        Returns:
+            Tuple of (vector store ID, its file hashes), or None if no live
+            store overlaps by at least VECTOR_STORE_REUSE_MIN_OVERLAP
+        """
+        best: Optional[Tuple[str, Set[str]]] = None
+        best_overlap = 0.0
+        for store in cache.list_vector_stores():
+            if not store["name"].startswith(f"{base_name}-"):
+                continue
+            existing = set(
+                cache.get_files_in_vector_store(store["vector_store_id"])
+            )
+            union = wanted | existing
+            overlap = len(wanted & existing) / len(union) if union else 0.0
+            if overlap > best_overlap:
+                best = (store["vector_store_id"], existing)
+                best_overlap = overlap
+
+        if (
+            best is None
+            or best_overlap < DefaultConfig.VECTOR_STORE_REUSE_MIN_OVERLAP
+        ):
+            return None
+
+        vector_store_id, existing = best
+        reusable = await self._is_vector_store_reusable(
+            vector_store_id, len(existing)
+        )
+        if not reusable:
+            self._discard_vector_store(
+                cache, vector_store_id, delete=reusable is not None
+            )
+            return None
+        return best
+
+    async def _is_vector_store_reusable(
+        self, vector_store_id: str, expected_files: int
+    ) -> Optional[bool]:
+        """Check that a cached vector store is live and still complete.
+
+        Returns:
+            True if the store can be reused, False if it exists but cannot,
+            or None if it could not be retrieved
+        """
+        try:
+            async with rate_limited("vector_stores"):
+                vector_store = await self.client.vector_stores.retrieve(
+                    vector_store_id
+                )
+        except Exception as e:
+            logger.debug(
+                f"[fs] Cached vector store {vector_store_id} unavailable: {e}"
+            )
+            return None
+
+        if vector_store.status == "expired":
+            return False
+        counts = vector_store.file_counts
+        return bool(
+            counts.total == expected_files
+            and counts.failed == 0
+            and counts.cancelled == 0
+        )
+
     async def cleanup_resources(self) -> None:
         """Clean up uploaded files and created vector stores.
 
@@ -445,7 +833,8 @@ async def _cleanup_uploaded_files(self, file_ids: List[str]) -> None:
 
                 # Delete the file
                 logger.debug(f"[fs] Deleting file: {file_id}")
-                await self.client.files.delete(file_id)
+                async with rate_limited("files"):
+                    await self.client.files.delete(file_id)
                 logger.debug(f"[fs] Successfully deleted file: {file_id}")
 
             except Exception as e:
@@ -473,7 +862,8 @@ async def _cleanup_vector_stores(
         """
         for vs_id in vector_store_ids:
             try:
-                await self.client.vector_stores.delete(vs_id)
+                async with rate_limited("vector_stores"):
+                    await self.client.vector_stores.delete(vs_id)
                 logger.debug(f"Cleaned up vector store: {vs_id}")
             except Exception as e:
                 logger.warning(f"Failed to clean up vector store {vs_id}: {e}")
@@ -567,4 +957,11 @@ def get_performance_info(self) -> Dict[str, Any]:
             ],
             "vector_store_expiry": "7 days of inactivity",
             "retry_strategy": "exponential backoff with 3 retries by default",
+            "vector_store_reuse": self._vector_store_reuse,
+            "readiness_polls": self._readiness_polls,
+            "time_to_ready_seconds": (
+                round(self._time_to_ready, 3)
+                if self._time_to_ready is not None
+                else None
+            ),
         }
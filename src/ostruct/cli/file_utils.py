@@ -46,8 +46,9 @@
 import glob
 import logging
 import os
+import sqlite3
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
 
 import chardet
 
@@ -61,6 +62,7 @@
 from .file_info import FileInfo, FileRoutingIntent
 from .file_list import FileInfoList
 from .gitignore_support import GitignoreManager
+from .scan_index import DirectoryScan, ScanIndex, get_scan_index, walk_key
 from .security import SecurityManager
 from .security.types import SecurityManagerProtocol
 
@@ -175,6 +177,139 @@ def collect_files_from_pattern(
     return files
 
 
+def _scan_directory(
+    root: str,
+    rel_root: str,
+    recursive: bool,
+    gitignore_manager: Optional[GitignoreManager],
+) -> DirectoryScan:
+    """List one directory, applying gitignore filtering and pruning.
+
+    Classifies entries the same way os.walk does (symlinked directories are
+    neither files nor followed), using the os.scandir entry types so no
+    extra stat calls are made.
+
+    Args:
+        root: Directory to list
+        rel_root: Path of root relative to the walked directory
+        recursive: Whether subdirectories will be descended into
+        gitignore_manager: Optional gitignore matcher
+
+    Returns:
+        DirectoryScan with the kept file names and subdirectories
+
+    Raises:
+        OSError: If the directory cannot be listed
+    """
+    scan = DirectoryScan()
+    with os.scandir(root) as entries:
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+                scan.has_symlinks = scan.has_symlinks or entry.is_symlink()
+            except OSError:
+                is_dir = False
+            rel_path = os.path.join(rel_root, entry.name)
+            if not is_dir:
+                if gitignore_manager and gitignore_manager.should_ignore(
+                    rel_path
+                ):
+                    scan.excluded += 1
+                    logger.debug("Excluded by .gitignore: %s", rel_path)
+                    continue
+                scan.files.append(entry.name)
+                continue
+            if not recursive or entry.is_symlink():
+                continue
+            if (
+                gitignore_manager
+                and gitignore_manager.should_ignore_directory(rel_path)
+            ):
+                scan.skipped_dirs.append(rel_path)
+                continue
+            scan.subdirs.append(entry.name)
+    return scan
+
+
+def _walk_directory(
+    abs_dir: str,
+    recursive: bool,
+    gitignore_manager: Optional[GitignoreManager],
+    scan_index: Optional[ScanIndex] = None,
+) -> Iterator[Tuple[str, DirectoryScan]]:
+    """Walk a directory top-down, pruning as it goes.
+
+    Visits directories in the same order as os.walk. Subdirectories are
+    only entered when recursive is True, and directories ignored by
+    gitignore are never entered. With a scan index, directories whose
+    mtime matches the stored entry reuse the stored scan instead of being
+    listed again, and the index is updated once the walk completes.
+
+    Args:
+        abs_dir: Absolute directory to walk
+        recursive: Whether to descend into subdirectories
+        gitignore_manager: Optional gitignore matcher
+        scan_index: Optional persistent index of previous scans
+
+    Yields:
+        Tuples of (directory path, scan of that directory)
+    """
+    key = ""
+    stored: Dict[str, Tuple[int, DirectoryScan]] = {}
+    if scan_index is not None:
+        key = walk_key(
+            abs_dir,
+            recursive,
+            gitignore_manager.fingerprint if gitignore_manager else None,
+        )
+        stored = scan_index.load(key)
+    current: Dict[str, Tuple[int, DirectoryScan]] = {}
+    reused = 0
+
+    stack: List[Tuple[str, str]] = [(abs_dir, "")]
+    while stack:
+        root, rel_root = stack.pop()
+        try:
+            if scan_index is not None:
+                # Stat before listing so a change made mid-scan is caught
+                mtime_ns = os.stat(root).st_mtime_ns
+                cached = stored.get(rel_root)
+                if cached is not None and cached[0] == mtime_ns:
+                    scan = cached[1]
+                    reused += 1
+                else:
+                    scan = _scan_directory(
+                        root, rel_root, recursive, gitignore_manager
+                    )
+                current[rel_root] = (mtime_ns, scan)
+            else:
+                scan = _scan_directory(
+                    root, rel_root, recursive, gitignore_manager
+                )
+        except OSError as e:
+            logger.debug("Cannot scan directory %s: %s", root, e)
+            continue
+
+        yield root, scan
+        stack.extend(
+            (os.path.join(root, name), os.path.join(rel_root, name))
+            for name in reversed(scan.subdirs)
+        )
+
+    if scan_index is not None:
+        logger.debug(
+            "Scan index reused %d of %d directories under %s",
+            reused,
+            len(current),
+            abs_dir,
+        )
+        if reused != len(current) or len(stored) != len(current):
+            try:
+                scan_index.save(key, current)
+            except sqlite3.Error as e:
+                logger.warning("Failed to update scan index: %s", e)
+
+
 def collect_files_from_directory(
     directory: str,
     security_manager: SecurityManager,
@@ -239,12 +374,16 @@ def collect_files_from_directory(
             )
 
     files: List[FileInfo] = []
+    skipped_dirs: List[str] = []
 
     try:
-        for root, dirs, filenames in os.walk(abs_dir):
+        for root, scan in _walk_directory(
+            abs_dir, recursive, gitignore_manager, get_scan_index()
+        ):
             logger.debug("Walking directory: %s", root)
-            logger.debug("Found subdirectories: %s", dirs)
-            logger.debug("Found files: %s", filenames)
+            logger.debug("Found files: %s", scan.files)
+            excluded_count += scan.excluded
+            skipped_dirs.extend(scan.skipped_dirs)
 
             # Validate current directory
             try:
@@ -255,44 +394,11 @@ def collect_files_from_directory(
                 )
                 raise
 
-            if not recursive and root != abs_dir:
-                logger.debug(
-                    "Skipping subdirectory (non-recursive mode): %s", root
-                )
-                continue
-
             logger.debug("Scanning directory: %s", root)
             logger.debug("Current files collected: %d", len(files))
 
-            for filename in filenames:
-                # Get relative path from base directory
-                abs_path = os.path.join(root, filename)
-                try:
-                    rel_path = os.path.relpath(
-                        abs_path, security_manager.base_dir
-                    )
-                    logger.debug(
-                        "Processing file: %s -> %s", abs_path, rel_path
-                    )
-                except ValueError as e:
-                    logger.warning(
-                        "Skipping file that can't be made relative: %s (error: %s)",
-                        abs_path,
-                        str(e),
-                    )
-                    continue
-
-                # Apply gitignore filtering
-                if gitignore_manager:
-                    # Get path relative to the directory being scanned for gitignore matching
-                    gitignore_rel_path = os.path.relpath(abs_path, abs_dir)
-                    if gitignore_manager.should_ignore(gitignore_rel_path):
-                        excluded_count += 1
-                        logger.debug(
-                            "Excluded by .gitignore: %s", gitignore_rel_path
-                        )
-                        continue
-
+            candidates = []
+            for filename in scan.files:
                 # Check extension if filter is specified
                 if allowed_extensions is not None:
                     ext = os.path.splitext(filename)[1].lstrip(".")
@@ -302,8 +408,16 @@ def collect_files_from_directory(
                             filename,
                         )
                         continue
-
-                # Validate file path before creating FileInfo
+                candidates.append(os.path.join(root, filename))
+
+            # Symlinks get the full per-path checks, which apply the symlink
+            # rules before looking at the target; regular files are
+            # validated together against their already-checked directory
+            regular_files: List[Union[str, Path]] = []
+            for abs_path in candidates:
+                if not os.path.islink(abs_path):
+                    regular_files.append(abs_path)
+                    continue
                 try:
                     security_manager.validate_path(abs_path)
                 except PathSecurityError as e:
@@ -313,6 +427,26 @@ def collect_files_from_directory(
                         str(e),
                     )
                     raise
+            security_manager.validate_batch_access(
+                regular_files, context="directory scan"
+            )
+
+            for abs_path in candidates:
+                # Get relative path from base directory
+                try:
+                    rel_path = os.path.relpath(
+                        abs_path, security_manager.base_dir
+                    )
+                    logger.debug(
+                        "Processing file: %s -> %s", abs_path, rel_path
+                    )
+                except ValueError as e:
+                    logger.warning(
+                        "Skipping file that can't be made relative: %s (error: %s)",
+                        abs_path,
+                        str(e),
+                    )
+                    continue
 
                 try:
                     # Use absolute path when creating FileInfo
@@ -353,6 +487,13 @@ def collect_files_from_directory(
         logger.info(
             "Excluded %d files based on .gitignore patterns", excluded_count
         )
+    if skipped_dirs:
+        logger.info(
+            "Skipped %d directories based on .gitignore patterns",
+            len(skipped_dirs),
+        )
+        logger.debug("Skipped directories: %s", skipped_dirs)
+    if excluded_count > 0 or skipped_dirs:
         logger.info("Use --ignore-gitignore to include ignored files")
 
     logger.debug("Collected %d files from directory %s", len(files), directory)
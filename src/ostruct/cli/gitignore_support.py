@@ -4,6 +4,7 @@
 files from directories, helping to automatically exclude unwanted files.
 """
 
+import hashlib
 import logging
 from pathlib import Path
 from typing import Optional
@@ -36,6 +37,11 @@ def __init__(
         """
         self.spec = self._load_gitignore(gitignore_path, directory)
         self._patterns_loaded = self.spec is not None
+        # A negated pattern may re-include files below an ignored directory,
+        # so whole directories are only skipped when there are none.
+        self._has_negations = self.spec is not None and any(
+            pattern.include is False for pattern in self.spec.patterns
+        )
 
     def _load_gitignore(
         self, path: Optional[str], directory: Optional[str]
@@ -101,6 +107,42 @@ def should_ignore(self, file_path: str) -> bool:
             logger.debug("File ignored by gitignore: %s", file_path)
         return result
 
+    def should_ignore_directory(self, dir_path: str) -> bool:
+        """Check if a whole directory can be skipped without descending.
+
+        Args:
+            dir_path: Relative path of the directory to check
+
+        Returns:
+            True if the directory and everything below it is ignored,
+            False otherwise (including whenever negated patterns exist)
+
+        Example:
+            manager = GitignoreManager(directory="/project")
+            if manager.should_ignore_directory("node_modules"):
+                print("Directory will not be walked")
+        """
+        if not self.spec or self._has_negations:
+            return False
+        result = self.spec.match_file(dir_path.rstrip("/\\") + "/")
+        if result:
+            logger.debug("Directory ignored by gitignore: %s", dir_path)
+        return result
+
+    @property
+    def fingerprint(self) -> Optional[str]:
+        """Digest of the loaded patterns, or None if none are loaded.
+
+        Used to tell whether results computed under one set of patterns
+        are still valid for another.
+        """
+        if not self.spec:
+            return None
+        text = "\n".join(
+            str(getattr(p, "pattern", p)) for p in self.spec.patterns
+        )
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
     @property
     def has_patterns(self) -> bool:
         """Check if gitignore patterns are loaded.
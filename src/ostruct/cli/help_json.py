@@ -86,6 +86,13 @@ def generate_json_output_modes() -> Dict[str, Any]:
             "exit_behavior": "exits_after_output",
             "scope": "execution_plan",
         },
+        "stream": {
+            "description": "Stream completed top-level fields and array items as JSONL, followed by the validated result",
+            "output_destination": "stdout",
+            "format": "jsonl",
+            "exit_behavior": "continues_execution",
+            "scope": "model_output",
+        },
         "run_summary_json": {
             "description": "Output run summary as JSON to stderr after execution",
             "output_destination": "stderr",
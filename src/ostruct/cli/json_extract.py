@@ -1,16 +1,71 @@
+"""Extraction of fenced JSON blocks from model responses.
+
+Responses may wrap their JSON payload in a fenced ```json block or between
+sentinel markers, and the payload itself may contain the fence or marker
+text inside string values. The scanner here finds the closing delimiter in
+a single linear pass by skipping over JSON strings (honouring escapes), so
+no regex backtracking or timeout is involved and it is safe to call from
+any thread.
+"""
+
 import json
-import re
 from typing import Tuple
 
-from .safe_regex import (
-    SAFE_JSON_BLOCK_PATTERN,
-    RegexTimeoutError,
-    safe_regex_search,
-)
+from .json_limits import parse_json_secure
+
+JSON_FENCE_START = "```json"
+FENCE = "```"
+
+
+def _string_end(text: str, pos: int) -> int:
+    """Return the index just past the JSON string whose body starts at pos.
+
+    Args:
+        text: Text being scanned
+        pos: Index of the first character after the opening quote
+
+    Returns:
+        Index after the closing quote, or -1 if the string is unterminated
+    """
+    quote = text.find('"', pos)
+    while quote != -1:
+        backslashes = 0
+        i = quote - 1
+        while i >= pos and text[i] == "\\":
+            backslashes += 1
+            i -= 1
+        if backslashes % 2 == 0:
+            return quote + 1
+        quote = text.find('"', quote + 1)
+    return -1
+
 
-# Regex to match JSON fenced blocks, handling newlines and indentation flexibly
-# Uses ReDoS-safe pattern with limited nesting depth
-JSON_RE = SAFE_JSON_BLOCK_PATTERN
+def find_outside_json_strings(text: str, token: str, start: int = 0) -> int:
+    """Find the first occurrence of token that is not inside a JSON string.
+
+    Runs in O(len(text)): each character is visited a bounded number of
+    times regardless of how many strings precede the token.
+
+    Args:
+        text: Text to search, starting with (part of) a JSON document
+        token: Delimiter to find, e.g. a closing fence
+        start: Index to start searching from
+
+    Returns:
+        Index of the token, or -1 if it does not occur outside strings
+    """
+    pos = start
+    found = text.find(token, pos)
+    while found != -1:
+        quote = text.find('"', pos, found)
+        if quote == -1:
+            return found
+        pos = _string_end(text, quote + 1)
+        if pos == -1:
+            return -1
+        if pos > found:
+            found = text.find(token, pos)
+    return -1
 
 
 def split_json_and_text(raw: str) -> Tuple[dict, str]:
@@ -42,66 +97,24 @@ def split_json_and_text(raw: str) -> Tuple[dict, str]:
         >>> markdown.strip()
         '[Download file.txt](sandbox:/mnt/data/file.txt)'
     """
-    # Try safe regex pattern first (ReDoS protection)
-    try:
-        match = safe_regex_search(JSON_RE, raw, timeout=2.0)
-        if match:
-            # Extract JSON content and parse with security limits
-            from .json_limits import parse_json_secure
-
-            potential_json = match.group(1).strip()
-            data = parse_json_secure(potential_json)
-
-            # Find markdown content after the JSON block
-            json_end = match.end()
-            markdown_text = raw[json_end:].lstrip()
-
-            return data, markdown_text
-    except RegexTimeoutError:
-        # Potential ReDoS attack detected
-        raise ValueError("JSON extraction timed out - potential ReDoS attack")
-    except (json.JSONDecodeError, ValueError) as e:
-        # JSON parsing failed or security limits exceeded
-        if "JSON extraction timed out" in str(e):
-            raise  # Re-raise timeout errors
-        # Fall through to original logic for complex cases
-
-    # Fallback to original iterative approach for complex cases
-    # Find the start of the JSON block
-    start_pattern = re.compile(r"```json\s*", re.MULTILINE)
-    start_match = start_pattern.search(raw)
-    if not start_match:
+    start = raw.find(JSON_FENCE_START)
+    if start == -1:
         raise ValueError("No ```json ... ``` block found")
-
-    # Find the content after the opening ```json
-    content_start = start_match.end()
-
-    # Look for the closing ``` that's not inside a JSON string
-    # We'll try multiple potential end positions and validate the JSON
-    end_pattern = re.compile(r"```", re.MULTILINE)
-
-    for end_match in end_pattern.finditer(raw, content_start):
-        # Extract potential JSON content
-        potential_json = raw[content_start : end_match.start()].strip()
-
-        try:
-            # Try to parse as JSON with security limits
-            from .json_limits import parse_json_secure
-
-            data = parse_json_secure(potential_json)
-            # If successful, we found the right closing ```
-            markdown_text = raw[end_match.end() :].lstrip()
-            return data, markdown_text
-        except (json.JSONDecodeError, ValueError):
-            # This ``` might be inside a JSON string, continue looking
-            # But if this is the only ``` we found, it's likely invalid JSON
-            # ValueError includes JSONSizeError, JSONDepthError, JSONComplexityError
-            continue
-
-    # If we get here, check if we found any closing ``` at all
-    if not list(end_pattern.finditer(raw, content_start)):
-        # No closing ``` found
-        raise ValueError("No ```json ... ``` block found")
-    else:
-        # Found closing ``` but JSON was invalid
+    content_start = start + len(JSON_FENCE_START)
+
+    # The closing fence is the first ``` that is not inside a JSON string
+    end = find_outside_json_strings(raw, FENCE, content_start)
+    if end == -1:
+        if raw.find(FENCE, content_start) == -1:
+            raise ValueError("No ```json ... ``` block found")
+        # Only fences inside an unterminated string
         raise ValueError("Invalid JSON in fenced block")
+
+    try:
+        # ValueError includes JSONSizeError, JSONDepthError, JSONComplexityError
+        data = parse_json_secure(raw[content_start:end].strip())
+    except ValueError as e:
+        raise ValueError("Invalid JSON in fenced block") from e
+
+    markdown_text = raw[end + len(FENCE) :].lstrip()
+    return data, markdown_text
@@ -2,7 +2,8 @@
 
 import json
 import logging
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +32,11 @@ class JSONComplexityError(ValueError):
 
 
 class SecureJSONParser:
-    """Secure JSON parser with DoS protection."""
+    """Secure JSON parser with DoS protection.
+
+    Content is decoded with json.loads and then checked in a single walk
+    over its containers; scalars are never visited on their own.
+    """
 
     def __init__(
         self,
@@ -79,46 +84,71 @@ def parse(self, content: str) -> Any:
             raise
 
         # Check depth and complexity
-        self._validate_structure(parsed, depth=0)
+        if isinstance(parsed, (dict, list)):
+            self._validate_structure(parsed)
 
         return parsed
 
-    def _validate_structure(self, obj: Any, depth: int = 0) -> None:
-        """Validate JSON structure for depth and complexity.
+    def _validate_structure(self, obj: Any) -> None:
+        """Validate a decoded container for depth and complexity.
+
+        Only containers are pushed on the explicit stack: a scalar's depth
+        is its parent's plus one, so a non-empty container at the maximum
+        depth is rejected without visiting its items. The walk does not
+        depend on the interpreter recursion limit.
 
         Args:
-            obj: Object to validate
-            depth: Current nesting depth
+            obj: Decoded dict or list to validate
 
         Raises:
             JSONDepthError: If depth exceeds limits
             JSONComplexityError: If complexity exceeds limits
         """
-        if depth > self.max_depth:
-            raise JSONDepthError(
-                f"JSON nesting too deep: {depth} levels (max: {self.max_depth})"
-            )
-
-        if isinstance(obj, dict):
-            if len(obj) > self.max_keys:
-                raise JSONComplexityError(
-                    f"JSON object has too many keys: {len(obj)} (max: {self.max_keys})"
+        max_depth = self.max_depth
+        max_keys = self.max_keys
+        stack: List[Tuple[Any, int]] = [(obj, 0)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            value, depth = pop()
+            if type(value) is dict:
+                if len(value) > max_keys:
+                    raise JSONComplexityError(
+                        f"JSON object has too many keys: {len(value)} (max: {max_keys})"
+                    )
+                items: Iterable[Any] = value.values()
+            else:
+                if len(value) > max_keys:  # Reuse max_keys for array length
+                    raise JSONComplexityError(
+                        f"JSON array too long: {len(value)} items (max: {max_keys})"
+                    )
+                items = value
+            if not value:
+                continue
+            depth += 1
+            if depth > max_depth:
+                raise JSONDepthError(
+                    f"JSON nesting too deep: {depth} levels (max: {max_depth})"
                 )
-            for value in obj.values():
-                self._validate_structure(value, depth + 1)
-        elif isinstance(obj, list):
-            if len(obj) > self.max_keys:  # Reuse max_keys for array length
-                raise JSONComplexityError(
-                    f"JSON array too long: {len(obj)} items (max: {self.max_keys})"
-                )
-            for item in obj:
-                self._validate_structure(item, depth + 1)
+            for item in items:
+                if type(item) is dict or type(item) is list:
+                    push((item, depth))
 
 
 # Global parser instance with default limits
 _default_parser = SecureJSONParser()
 
 
+@lru_cache(maxsize=16)
+def _get_parser(
+    max_size: int, max_depth: int, max_keys: int
+) -> SecureJSONParser:
+    """Return a shared parser for a combination of custom limits."""
+    return SecureJSONParser(
+        max_size=max_size, max_depth=max_depth, max_keys=max_keys
+    )
+
+
 def parse_json_secure(
     content: str,
     max_size: Optional[int] = None,
@@ -146,11 +176,11 @@ def parse_json_secure(
         # Use default parser for efficiency
         return _default_parser.parse(content)
 
-    # Create custom parser with specified limits
-    parser = SecureJSONParser(
-        max_size=max_size or DEFAULT_MAX_JSON_SIZE,
-        max_depth=max_depth or DEFAULT_MAX_JSON_DEPTH,
-        max_keys=max_keys or DEFAULT_MAX_JSON_KEYS,
+    # Reuse one parser per combination of custom limits
+    parser = _get_parser(
+        max_size or DEFAULT_MAX_JSON_SIZE,
+        max_depth or DEFAULT_MAX_JSON_DEPTH,
+        max_keys or DEFAULT_MAX_JSON_KEYS,
     )
     return parser.parse(content)
 
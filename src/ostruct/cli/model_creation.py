@@ -1,5 +1,6 @@
 """Model creation utilities for the CLI."""
 
+import copy
 import json
 import logging
 import sys
@@ -42,6 +43,7 @@
     SchemaValidationError,
 )
 from .exit_codes import ExitCode
+from .schema_utils import cache_model, get_cached_model, schema_fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -261,7 +263,7 @@ def _get_type_with_constraints(
             isinstance(items_schema, dict)
             and items_schema.get("type") == "object"
         ):
-            array_item_model = create_dynamic_model(
+            array_item_model = _build_dynamic_model(
                 items_schema,
                 base_name=f"{base_name}_{field_name}_Item",
                 show_schema=False,
@@ -285,7 +287,7 @@ def _get_type_with_constraints(
     # Handle object type
     if field_type == "object":
         # Create nested model with explicit type annotation
-        object_model = create_dynamic_model(
+        object_model = _build_dynamic_model(
             field_schema,
             base_name=f"{base_name}_{field_name}",
             show_schema=False,
@@ -298,7 +300,7 @@ def _get_type_with_constraints(
         field_schema["additionalProperties"], dict
     ):
         # Create nested model with explicit type annotation
-        dict_value_model = create_dynamic_model(
+        dict_value_model = _build_dynamic_model(
             field_schema["additionalProperties"],
             base_name=f"{base_name}_{field_name}_Value",
             show_schema=False,
@@ -391,6 +393,11 @@ def create_dynamic_model(
 ) -> Type[BaseModel]:
     """Create a Pydantic model from a JSON Schema.
 
+    Models are cached per schema fingerprint and base name, so repeated
+    calls with the same schema return the same class and Pydantic builds
+    its validator only once. show_schema and debug_validation always build
+    a fresh model so their logging is emitted.
+
     Args:
         schema: JSON Schema to create model from
         base_name: Base name for the model class
@@ -404,6 +411,29 @@ def create_dynamic_model(
         SchemaValidationError: If schema validation fails
         ModelCreationError: If model creation fails
     """
+    if show_schema or debug_validation:
+        return _build_dynamic_model(
+            schema, base_name, show_schema, debug_validation
+        )
+
+    fingerprint = schema_fingerprint(schema)
+    model = get_cached_model(fingerprint, base_name)
+    if model is None:
+        model = _build_dynamic_model(schema, base_name)
+        cache_model(fingerprint, base_name, model)
+    return model
+
+
+def _build_dynamic_model(
+    schema: Dict[str, Any],
+    base_name: str = "DynamicModel",
+    show_schema: bool = False,
+    debug_validation: bool = False,
+) -> Type[BaseModel]:
+    """Build a Pydantic model from a JSON Schema without caching.
+
+    See create_dynamic_model() for arguments and errors.
+    """
     try:
         # Validate schema structure before model creation
         from .template_utils import validate_json_schema
@@ -420,6 +450,9 @@ def create_dynamic_model(
         root_definitions = schema.get("definitions")
 
         if root_definitions:
+            # Work on a copy so the caller's schema is left untouched
+            schema = copy.deepcopy(schema)
+            root_definitions = schema["definitions"]
             seen_ids: set[int] = set()
 
             def _inject_defs(
@@ -494,7 +527,7 @@ def _expand_refs(node: Any) -> Any:  # noqa: ANN401
             items_schema = schema.get("items", {})
             if items_schema.get("type") == "object":
                 # Create the item model first
-                item_model = create_dynamic_model(
+                item_model = _build_dynamic_model(
                     items_schema,
                     base_name=f"{base_name}Item",
                     show_schema=show_schema,
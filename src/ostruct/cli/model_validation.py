@@ -23,7 +23,7 @@
 from .file_info import FileRoutingIntent
 from .model_creation import create_dynamic_model
 from .schema_utils import supports_structured_output
-from .token_validation import validate_token_limits
+from .token_validation import TokenUsage, validate_token_limits
 from .types import CLIParams
 
 logger = logging.getLogger(__name__)
@@ -158,7 +158,7 @@ async def validate_model_and_schema(
     user_prompt: str,
     template_context: Dict[str, Any],
 ) -> Tuple[
-    Type[BaseModel], List[Dict[str, str]], int, Optional[ModelRegistry]
+    Type[BaseModel], List[Dict[str, str]], TokenUsage, Optional[ModelRegistry]
 ]:
     """Validate model compatibility and schema, and check token limits.
 
@@ -170,7 +170,7 @@ async def validate_model_and_schema(
         template_context: Template context with file information
 
     Returns:
-        Tuple of (output_model, messages, total_tokens, registry)
+        Tuple of (output_model, messages, token_usage, registry)
 
     Raises:
         CLIError: For validation errors
@@ -208,14 +208,20 @@ async def validate_model_and_schema(
 
     # Token validation - only count files with TEMPLATE_ONLY routing intent
     # Also check for user-data files to validate model compatibility
+    # Per-file attribution uses content the template already loaded, so
+    # files are neither re-read nor counted twice.
     files = template_context.get("files", [])
     template_files = []
+    file_contents: Dict[str, Optional[str]] = {}
     has_user_data_files = False
 
     for file_info in files:
         routing_intent = getattr(file_info, "routing_intent", None)
         if routing_intent == FileRoutingIntent.TEMPLATE_ONLY:
-            template_files.append(str(file_info.path))
+            path = str(file_info.path)
+            template_files.append(path)
+            content = getattr(file_info, "loaded_content", None)
+            file_contents[path] = content if isinstance(content, str) else None
         elif routing_intent == FileRoutingIntent.USER_DATA:
             has_user_data_files = True
         # Tool files (FILE_SEARCH, CODE_INTERPRETER) are ignored for token validation
@@ -224,15 +230,15 @@ async def validate_model_and_schema(
     validate_user_data_support(args["model"], has_user_data_files)
 
     combined_template_content = system_prompt + user_prompt
-    validate_token_limits(
-        combined_template_content, template_files, args["model"]
+    token_usage = validate_token_limits(
+        combined_template_content,
+        template_files,
+        args["model"],
+        file_contents=file_contents,
     )
-
-    # For now, simplified token counting - the full implementation needs more imports
-    total_tokens = len(system_prompt) + len(user_prompt)  # Rough estimate
     registry = ModelRegistry.get_instance()
 
-    return output_model, messages, total_tokens, registry
+    return output_model, messages, token_usage, registry
 
 
 def supports_web_search(model: str) -> bool:
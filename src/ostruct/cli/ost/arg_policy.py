@@ -114,6 +114,7 @@ class GlobalArgsPolicyEnforcer:
         "--version",
         "--dry-run",
         "--dry-run-json",
+        "--stream",
     }
 
     # Repeatable flags that can appear multiple times
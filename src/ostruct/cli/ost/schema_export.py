@@ -1,7 +1,8 @@
 """Schema export functionality for OST templates.
 
-This module handles exporting inline schemas from OST front-matter to
-temporary files for use with the ostruct run command.
+This module parses inline schemas from OST front-matter and, for the
+exec-based runx path, exports them to temporary files for use with the
+ostruct run command.
 """
 
 import atexit
@@ -9,7 +10,7 @@
 import os
 import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 
 class SchemaExportError(Exception):
@@ -18,6 +19,33 @@ class SchemaExportError(Exception):
     pass
 
 
+def parse_inline_schema(schema_content: str) -> Dict[str, Any]:
+    """Parse an inline schema from OST front-matter.
+
+    Args:
+        schema_content: JSON schema content as string
+
+    Returns:
+        Parsed schema object
+
+    Raises:
+        SchemaExportError: If the schema is empty, invalid JSON or not an object
+    """
+    if not schema_content or not schema_content.strip():
+        raise SchemaExportError("Schema content is empty or missing")
+
+    # Validate JSON format
+    try:
+        parsed_schema = json.loads(schema_content)
+    except json.JSONDecodeError as e:
+        raise SchemaExportError(f"Invalid JSON schema: {e}")
+
+    # Ensure it's a valid schema object
+    if not isinstance(parsed_schema, dict):
+        raise SchemaExportError("Schema must be a JSON object")
+    return parsed_schema
+
+
 class SchemaExporter:
     """Handles exporting inline schemas to temporary files."""
 
@@ -40,18 +68,7 @@ def export_inline_schema(self, schema_content: str) -> Path:
         Raises:
             SchemaExportError: If export fails
         """
-        if not schema_content or not schema_content.strip():
-            raise SchemaExportError("Schema content is empty or missing")
-
-        # Validate JSON format
-        try:
-            parsed_schema = json.loads(schema_content)
-        except json.JSONDecodeError as e:
-            raise SchemaExportError(f"Invalid JSON schema: {e}")
-
-        # Ensure it's a valid schema object
-        if not isinstance(parsed_schema, dict):
-            raise SchemaExportError("Schema must be a JSON object")
+        parsed_schema = parse_inline_schema(schema_content)
 
         # Create temporary file
         try:
@@ -309,6 +309,85 @@ def report_cache_summary(self, cache_summary: Dict[str, Any]) -> None:
                     err=True,
                 )
 
+    def report_content_cache_summary(self, stats: Dict[str, int]) -> None:
+        """Report file content cache activity in verbose mode.
+
+        Args:
+            stats: Counters from FileCache.stats()
+        """
+        if not self.verbose or not stats:
+            return
+
+        hits = stats.get("hits", 0)
+        misses = stats.get("misses", 0)
+        if hits == 0 and misses == 0:
+            return
+
+        size_mb = stats.get("size_bytes", 0) / (1024 * 1024)
+        max_mb = stats.get("max_size_bytes", 0) / (1024 * 1024)
+        click.echo(
+            f"📄 File cache: {hits} hits, {misses} misses, "
+            f"{stats.get('evictions', 0)} evictions "
+            f"({size_mb:.1f}/{max_mb:.0f}MB in {stats.get('entries', 0)} entries)",
+            err=True,
+        )
+
+    def report_rate_limit_summary(
+        self, stats: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """Report client-side rate limiting per endpoint in verbose mode.
+
+        Args:
+            stats: Per-key counters from RateLimiter.stats()
+        """
+        if not self.verbose:
+            return
+
+        for key, key_stats in sorted(stats.items()):
+            if not key_stats.get("requests"):
+                continue
+            line = (
+                f"🚦 Rate limit [{key}]: {key_stats['requests']} requests, "
+                f"~{key_stats.get('tokens', 0)} tokens, "
+                f"waited {key_stats.get('wait_seconds', 0):.1f}s, "
+                f"{key_stats.get('throttled', 0)} throttled, "
+                f"concurrency {key_stats.get('concurrency')}"
+            )
+            budgets = [
+                f"{key_stats[name]:.0f} {unit}/min"
+                for name, unit in (
+                    ("requests_per_minute", "req"),
+                    ("tokens_per_minute", "tok"),
+                )
+                if key_stats.get(name)
+            ]
+            if budgets:
+                line += f" (budget {', '.join(budgets)})"
+            click.echo(line, err=True)
+
+    def report_stream_summary(self, stats: Dict[str, Any]) -> None:
+        """Report streamed response timing in verbose mode.
+
+        Args:
+            stats: Counters from StreamStats.to_dict()
+        """
+        if not self.verbose:
+            return
+
+        ttft = stats.get("time_to_first_token")
+        line = "⚡ Streaming: "
+        line += (
+            f"first token after {ttft:.2f}s"
+            if ttft is not None
+            else "no output text received"
+        )
+        line += f", {stats.get('output_tokens', 0)} output tokens"
+        rate = stats.get("tokens_per_second")
+        if rate is not None:
+            line += f" at {rate:.1f} tok/s"
+        line += f", {stats.get('records_emitted', 0)} records emitted early"
+        click.echo(line, err=True)
+
     def report_validation_results(
         self,
         schema_valid: bool,
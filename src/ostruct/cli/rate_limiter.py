@@ -0,0 +1,485 @@
+"""Client-side rate limiting and adaptive concurrency for OpenAI calls.
+
+Every OpenAI request made by ostruct goes through a shared limiter keyed by
+endpoint and model (``responses:gpt-4o``, ``files``, ...). Each key has:
+
+- token buckets enforcing a requests-per-minute and tokens-per-minute
+  budget, charged up front with the request's prompt-token estimate;
+- an AIMD concurrency limit: it grows by one slot per limit's worth of
+  successful requests and halves when the API answers 429.
+
+Budgets come from the ``rate_limits`` configuration. Keys without a
+configured budget learn it from the ``x-ratelimit-limit-*`` response
+headers, and ``x-ratelimit-remaining-*`` keeps the buckets from running
+ahead of what the server still allows. Headers are read by an httpx
+response hook (see ``observe_rate_limit_headers``) that attributes each
+response to the limiter slot of the request that produced it.
+
+The buckets reserve capacity synchronously and sleep off any deficit, so
+the limiter holds no asyncio primitives and can be shared by event loops
+created one after another in the same process.
+"""
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio used to estimate prompt size without
+# running a tokenizer on every request
+CHARS_PER_TOKEN = 4
+
+# Remaining/limit ratio below which concurrency stops growing
+LOW_HEADROOM = 0.1
+
+# Throttles within this many seconds of a decrease count as one event
+DECREASE_COOLDOWN_SECONDS = 1.0
+
+
+def estimate_request_tokens(
+    *texts: str, max_output_tokens: Optional[int] = None
+) -> int:
+    """Estimate the tokens a request counts against a TPM budget.
+
+    Args:
+        texts: Prompt texts sent with the request
+        max_output_tokens: Output token cap, if one was requested
+
+    Returns:
+        Estimated token count
+    """
+    prompt_tokens = sum(len(text) for text in texts) // CHARS_PER_TOKEN
+    return prompt_tokens + (max_output_tokens or 0)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate.
+
+    The bucket holds at most one minute's budget. ``reserve`` always takes
+    the requested amount and may drive the level negative; the caller
+    then waits until the deficit has been refilled.
+    """
+
+    def __init__(self, per_minute: float) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            per_minute: Budget per minute
+        """
+        self._lock = threading.Lock()
+        self.per_minute = float(per_minute)
+        self._level = self.per_minute
+        self._updated = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        """Refill rate in units per second."""
+        return self.per_minute / 60.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._level = min(self.per_minute, self._level + elapsed * self.rate)
+
+    def reserve(self, amount: float) -> float:
+        """Take capacity from the bucket.
+
+        Amounts larger than the whole budget are capped to it, so a single
+        oversized request waits for a full bucket instead of forever.
+
+        Args:
+            amount: Units to take
+
+        Returns:
+            Seconds to wait before the reservation is covered
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._level -= min(amount, self.per_minute)
+            if self._level >= 0:
+                return 0.0
+            return -self._level / self.rate
+
+    def set_budget(self, per_minute: float) -> None:
+        """Change the per-minute budget, keeping the current level."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.per_minute = float(per_minute)
+            self._level = min(self._level, self.per_minute)
+
+    def sync_remaining(self, remaining: float) -> None:
+        """Lower the level to what the server reports as remaining."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._level = min(self._level, remaining)
+
+
+class AdaptiveConcurrency:
+    """AIMD limit on the number of requests in flight.
+
+    Waiters are plain futures completed under a thread lock, so the limit
+    works across event loops as long as each waiter is woken on its own
+    loop.
+    """
+
+    def __init__(self, maximum: int, minimum: int = 1) -> None:
+        """Initialize the limit at its maximum.
+
+        Args:
+            maximum: Upper bound and starting value of the limit
+            minimum: Lower bound of the limit
+        """
+        self._lock = threading.Lock()
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(self.maximum)
+        self.in_flight = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        self._last_decrease = 0.0
+
+    async def acquire(self) -> None:
+        """Wait for a free slot."""
+        with self._lock:
+            if self.in_flight < int(self.limit) and not self._waiters:
+                self.in_flight += 1
+                return
+            waiter: "asyncio.Future[None]" = (
+                asyncio.get_running_loop().create_future()
+            )
+            self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif waiter.done() and not waiter.cancelled():
+                    # Granted just before the cancellation landed
+                    self.in_flight -= 1
+                    self._wake_locked()
+            raise
+
+    def release(self) -> None:
+        """Free a slot taken by acquire()."""
+        with self._lock:
+            self.in_flight -= 1
+            self._wake_locked()
+
+    def on_success(self) -> None:
+        """Additive increase: one slot per limit's worth of successes."""
+        with self._lock:
+            self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+            self._wake_locked()
+
+    def on_throttle(self) -> None:
+        """Multiplicative decrease after a 429 response."""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_decrease < DECREASE_COOLDOWN_SECONDS:
+                return
+            self._last_decrease = now
+            self.limit = max(float(self.minimum), self.limit / 2)
+
+    def _wake_locked(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            loop = waiter.get_loop()
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if loop is running:
+                waiter.set_result(None)
+            else:
+                try:
+                    loop.call_soon_threadsafe(self._grant, waiter)
+                except RuntimeError:
+                    # The waiter's loop is closed; nobody is waiting
+                    self.in_flight -= 1
+
+    def _grant(self, waiter: "asyncio.Future[None]") -> None:
+        if waiter.done():
+            # Cancelled after the slot was handed over
+            self.release()
+        else:
+            waiter.set_result(None)
+
+
+@dataclass
+class _KeyState:
+    """Limiter state of one endpoint/model key."""
+
+    concurrency: AdaptiveConcurrency
+    requests: Optional[TokenBucket] = None
+    tokens: Optional[TokenBucket] = None
+    configured: Dict[str, bool] = field(default_factory=dict)
+    request_count: int = 0
+    token_count: int = 0
+    throttled: int = 0
+    wait_seconds: float = 0.0
+
+
+@dataclass
+class _Slot:
+    """One request in flight under a key."""
+
+    state: _KeyState
+    low_headroom: bool = False
+
+
+_current_slot: contextvars.ContextVar[Optional[_Slot]] = (
+    contextvars.ContextVar("ostruct_rate_limit_slot", default=None)
+)
+
+
+def _header_number(headers: Mapping[str, str], name: str) -> Optional[float]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """Shared per-endpoint and per-model rate limiter."""
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_concurrency: int = 16,
+        min_concurrency: int = 1,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Request budget of each key, or None to
+                learn it from response headers
+            tokens_per_minute: Token budget of each key, or None to learn
+                it from response headers
+            max_concurrency: Starting and highest concurrency per key
+            min_concurrency: Lowest concurrency per key after throttling
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self._states: Dict[str, _KeyState] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(endpoint: str, model: Optional[str] = None) -> str:
+        """Build the limiter key of an endpoint and model."""
+        return f"{endpoint}:{model}" if model else endpoint
+
+    def _state(self, key: str) -> _KeyState:
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = _KeyState(
+                    AdaptiveConcurrency(
+                        self.max_concurrency, self.min_concurrency
+                    )
+                )
+                if self.requests_per_minute:
+                    state.requests = TokenBucket(self.requests_per_minute)
+                    state.configured["requests"] = True
+                if self.tokens_per_minute:
+                    state.tokens = TokenBucket(self.tokens_per_minute)
+                    state.configured["tokens"] = True
+                self._states[key] = state
+            return state
+
+    @asynccontextmanager
+    async def limit(
+        self, endpoint: str, model: Optional[str] = None, tokens: int = 0
+    ) -> AsyncIterator[None]:
+        """Hold a request slot for one API call.
+
+        Args:
+            endpoint: API endpoint name, e.g. ``responses`` or ``files``
+            model: Model the request is for, if any
+            tokens: Estimated tokens the request counts against the TPM
+                budget
+        """
+        state = self._state(self.key(endpoint, model))
+        started = time.monotonic()
+        await state.concurrency.acquire()
+        try:
+            delay = 0.0
+            if state.requests is not None:
+                delay = state.requests.reserve(1)
+            if state.tokens is not None and tokens:
+                delay = max(delay, state.tokens.reserve(tokens))
+            if delay > 0:
+                logger.debug(
+                    "Rate limit: delaying %s request by %.2fs",
+                    self.key(endpoint, model),
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+            state.request_count += 1
+            state.token_count += tokens
+            state.wait_seconds += time.monotonic() - started
+            slot = _Slot(state)
+            context_token = _current_slot.set(slot)
+            try:
+                yield
+            finally:
+                _current_slot.reset(context_token)
+            if not slot.low_headroom:
+                state.concurrency.on_success()
+        finally:
+            state.concurrency.release()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-key counters for reporting.
+
+        Returns:
+            Mapping of key to requests, tokens, throttled responses, total
+            wait time, current concurrency limit and budgets in effect
+        """
+        with self._lock:
+            states = dict(self._states)
+        return {
+            key: {
+                "requests": state.request_count,
+                "tokens": state.token_count,
+                "throttled": state.throttled,
+                "wait_seconds": round(state.wait_seconds, 3),
+                "concurrency": int(state.concurrency.limit),
+                "requests_per_minute": (
+                    state.requests.per_minute if state.requests else None
+                ),
+                "tokens_per_minute": (
+                    state.tokens.per_minute if state.tokens else None
+                ),
+            }
+            for key, state in states.items()
+        }
+
+
+def observe_rate_limit_headers(
+    status_code: int, headers: Mapping[str, str]
+) -> None:
+    """Feed a response's status and rate-limit headers to the limiter.
+
+    Applies to the limiter slot held by the current task; responses of
+    requests made outside ``rate_limited`` are ignored.
+
+    Args:
+        status_code: HTTP status of the response
+        headers: Response headers
+    """
+    slot = _current_slot.get()
+    if slot is None:
+        return
+    state = slot.state
+
+    if status_code == 429:
+        state.throttled += 1
+        slot.low_headroom = True
+        state.concurrency.on_throttle()
+        return
+
+    headroom = 1.0
+    for kind in ("requests", "tokens"):
+        limit = _header_number(headers, f"x-ratelimit-limit-{kind}")
+        remaining = _header_number(headers, f"x-ratelimit-remaining-{kind}")
+        bucket: Optional[TokenBucket] = getattr(state, kind)
+        if limit and limit > 0:
+            if bucket is None:
+                bucket = TokenBucket(limit)
+                setattr(state, kind, bucket)
+            elif not state.configured.get(kind):
+                bucket.set_budget(limit)
+            if remaining is not None:
+                headroom = min(headroom, remaining / limit)
+        if bucket is not None and remaining is not None:
+            bucket.sync_remaining(remaining)
+
+    if headroom < LOW_HEADROOM:
+        slot.low_headroom = True
+
+
+async def _httpx_response_hook(response: Any) -> None:
+    observe_rate_limit_headers(response.status_code, response.headers)
+
+
+def rate_limit_event_hooks() -> Dict[str, list]:
+    """Event hooks that report responses of an httpx client to the limiter."""
+    return {"response": [_httpx_response_hook]}
+
+
+_shared_limiter: Optional[RateLimiter] = None
+_shared_limiter_loaded = False
+_shared_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """Get the process-wide limiter configured by ``rate_limits``.
+
+    Returns:
+        Shared RateLimiter, or None when rate limiting is disabled
+    """
+    global _shared_limiter, _shared_limiter_loaded
+    with _shared_limiter_lock:
+        if not _shared_limiter_loaded:
+            _shared_limiter_loaded = True
+            try:
+                from .config import get_config
+
+                rate_config = get_config().rate_limits
+            except Exception as e:
+                logger.debug(f"Using default rate limits: {e}")
+                from .config import RateLimitConfig
+
+                rate_config = RateLimitConfig()
+            if rate_config.enabled:
+                _shared_limiter = RateLimiter(
+                    requests_per_minute=rate_config.requests_per_minute,
+                    tokens_per_minute=rate_config.tokens_per_minute,
+                    max_concurrency=rate_config.max_concurrency,
+                    min_concurrency=rate_config.min_concurrency,
+                )
+        return _shared_limiter
+
+
+def reset_rate_limiter() -> None:
+    """Forget the shared limiter; the next access rebuilds it from config."""
+    global _shared_limiter, _shared_limiter_loaded
+    with _shared_limiter_lock:
+        _shared_limiter = None
+        _shared_limiter_loaded = False
+
+
+@asynccontextmanager
+async def rate_limited(
+    endpoint: str, model: Optional[str] = None, tokens: int = 0
+) -> AsyncIterator[None]:
+    """Run one API call under the shared limiter, if enabled.
+
+    Args:
+        endpoint: API endpoint name, e.g. ``responses`` or ``files``
+        model: Model the request is for, if any
+        tokens: Estimated tokens the request counts against the TPM budget
+    """
+    limiter = get_rate_limiter()
+    if limiter is None:
+        yield
+        return
+    async with limiter.limit(endpoint, model, tokens):
+        yield
@@ -187,6 +187,7 @@
             "name": "Output and Execution Options",
             "options": [
                 "--output",
+                "--stream",
                 "--dry-run",
                 "--dry-run-json",
                 "--run-summary-json",
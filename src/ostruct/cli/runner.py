@@ -1,20 +1,32 @@
 """Async execution engine for ostruct CLI operations."""
 
-import copy
+import asyncio
 import json
 import logging
 import os
 import re
-from pathlib import Path, Path as _Path
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 from urllib.parse import urlparse
 
 from openai import AsyncOpenAI, OpenAIError
 from openai_model_registry import ModelRegistry
 from pydantic import BaseModel
 
+from .cache_manager import get_file_cache
 from .code_interpreter import CodeInterpreterManager
-from .config import OstructConfig, get_config
+from .config import get_config
 from .cost_estimation import calculate_cost_estimate, format_cost_breakdown
 from .errors import APIErrorMapper, CLIError, SchemaValidationError
 from .exit_codes import ExitCode
@@ -26,13 +38,24 @@
     get_progress_reporter,
     report_success,
 )
+from .rate_limiter import (
+    estimate_request_tokens,
+    get_rate_limiter,
+    rate_limited,
+)
+from .schema_utils import get_strict_schema
+from .security.credential_sanitizer import CredentialSanitizer, LazyLogArg
 from .sentinel import extract_json_block
 from .serialization import LogSerializer
 from .services import ServiceContainer
+from .streaming import StreamError, StreamingOutput
 from .types import CLIParams
 from .utils.progress_utils import ProgressHandler
 from .validators import validate_security_manager
 
+if TYPE_CHECKING:
+    from .batch import BatchItem, BatchSummary
+
 
 # Error classes for API operations
 class APIResponseError(Exception):
@@ -373,10 +396,8 @@ async def process_code_interpreter_configuration(
     # Load configuration for Code Interpreter
     from typing import Union, cast
 
-    from .config import OstructConfig
-
     config_path = cast(Union[str, Path, None], args.get("config"))
-    config = OstructConfig.load(config_path)
+    config = get_config(config_path)
     ci_config = config.get_code_interpreter_config()
 
     # Apply CLI parameter overrides to config
@@ -873,6 +894,11 @@ async def create_structured_output(
         # Extract shared_upload_manager early so it does not appear in parameter validation
         shared_upload_manager = kwargs.pop("shared_upload_manager", None)
 
+        # Streaming output handler, if the caller asked for a streamed response
+        stream_output: Optional[StreamingOutput] = kwargs.pop(
+            "stream_output", None
+        )
+
         # Handle model-specific parameters
         api_kwargs = {}
         registry = ModelRegistry.get_instance()
@@ -889,10 +915,8 @@ async def create_structured_output(
                     f"Parameter {param_name} is not supported by model {model} and will be ignored"
                 )
 
-        # Prepare schema for strict mode
-        schema = output_schema.model_json_schema()
-        strict_schema = copy.deepcopy(schema)
-        make_strict(strict_schema)
+        # Prepare schema for strict mode (cached per output model)
+        strict_schema = get_strict_schema(output_schema)
 
         # Validate schema for Code Interpreter downloads
         _validate_schema_for_ci_downloads(strict_schema, tools or [])
@@ -920,14 +944,16 @@ async def create_structured_output(
                     "strict": True,
                 }
             },
-            "stream": False,
+            "stream": stream_output is not None,
             **api_kwargs,
         }
 
         # Add tools if provided
         if tools:
             api_params["tools"] = tools
-            logger.debug("Tools: %s", json.dumps(tools, indent=2))
+            logger.debug(
+                "Tools: %s", LazyLogArg(tools, as_json=True, sanitize=False)
+            )
 
         # Apply tool_choice override if provided
         if tool_choice and tool_choice.lower() != "auto":
@@ -956,37 +982,39 @@ async def create_structured_output(
                     "tool_choice applied: %s", api_params["tool_choice"]
                 )
 
-        # Log the API request details with credential sanitization
-        from .security.credential_sanitizer import CredentialSanitizer
-
+        # Log the API request details with credential sanitization. The
+        # payloads are only sanitized and formatted if a handler emits them.
         logger.debug("Making OpenAI Responses API request with:")
         logger.debug("Model: %s", model)
+        logger.debug("Message content: %s", LazyLogArg(message_content))
+        logger.debug("Parameters: %s", LazyLogArg(api_kwargs, as_json=True))
         logger.debug(
-            "Message content: %s",
-            CredentialSanitizer.sanitize_string(message_content),
-        )
-        logger.debug(
-            "Parameters: %s",
-            json.dumps(
-                CredentialSanitizer.sanitize_dict(api_kwargs), indent=2
-            ),
+            "Schema: %s",
+            LazyLogArg(strict_schema, as_json=True, sanitize=False),
         )
-        logger.debug("Schema: %s", json.dumps(strict_schema, indent=2))
+        logger.debug("Tools being passed to API: %s", LazyLogArg(tools))
         logger.debug(
-            "Tools being passed to API: %s",
-            CredentialSanitizer.sanitize_for_logging(tools),
-        )
-        logger.debug(
-            "Complete API params: %s",
-            json.dumps(
-                CredentialSanitizer.sanitize_dict(api_params),
-                indent=2,
-                default=str,
-            ),
+            "Complete API params: %s", LazyLogArg(api_params, as_json=True)
         )
 
         # Use the Responses API
-        api_response = await client.responses.create(**api_params)
+        request_tokens = estimate_request_tokens(
+            system_prompt,
+            user_prompt,
+            max_output_tokens=api_kwargs.get("max_output_tokens"),
+        )
+        async with rate_limited("responses", model, request_tokens):
+            if stream_output is None:
+                api_response = await client.responses.create(**api_params)
+            else:
+                try:
+                    api_response = await stream_output.consume(
+                        await client.responses.create(**api_params)
+                    )
+                except StreamError as e:
+                    raise APIResponseError(
+                        CredentialSanitizer.sanitize_exception(e)
+                    )
 
         if on_log:
             on_log(logging.DEBUG, f"Received response: {api_response.id}", {})
@@ -1194,12 +1222,16 @@ async def _execute_two_pass_sentinel(
 
     # ---- pass 1 (raw) ----
     logger.debug("Starting two-pass execution: Pass 1 (raw mode)")
-    raw_resp = await client.responses.create(
-        model=args["model"],
-        input=f"{system_prompt}\n\n{user_prompt}",
-        tools=tools,  # type: ignore[arg-type]
-        # No text format - this allows annotations
-    )
+    raw_input = f"{system_prompt}\n\n{user_prompt}"
+    async with rate_limited(
+        "responses", args["model"], estimate_request_tokens(raw_input)
+    ):
+        raw_resp = await client.responses.create(
+            model=args["model"],
+            input=raw_input,
+            tools=tools,  # type: ignore[arg-type]
+            # No text format - this allows annotations
+        )
 
     logger.debug(f"Raw response structure: {type(raw_resp)}")
     logger.debug(
@@ -1256,26 +1288,28 @@ async def _execute_two_pass_sentinel(
         + json.dumps(data, indent=2)
     )
 
-    # Prepare schema for strict mode
-    schema = output_model.model_json_schema()
-    strict_schema = copy.deepcopy(schema)
-    make_strict(strict_schema)
+    # Prepare schema for strict mode (cached per output model)
+    strict_schema = get_strict_schema(output_model)
     schema_name = output_model.__name__.lower()
 
-    strict_resp = await client.responses.create(
-        model=args["model"],
-        input=f"{strict_sys}\n\n{user_prompt}",
-        text={
-            "format": {
-                "type": "json_schema",
-                "name": schema_name,
-                "schema": strict_schema,
-                "strict": True,
-            }
-        },
-        tools=[],  # No tools needed for formatting
-        stream=False,
-    )
+    strict_input = f"{strict_sys}\n\n{user_prompt}"
+    async with rate_limited(
+        "responses", args["model"], estimate_request_tokens(strict_input)
+    ):
+        strict_resp = await client.responses.create(
+            model=args["model"],
+            input=strict_input,
+            text={
+                "format": {
+                    "type": "json_schema",
+                    "name": schema_name,
+                    "schema": strict_schema,
+                    "strict": True,
+                }
+            },
+            tools=[],  # No tools needed for formatting
+            stream=False,
+        )
 
     # Parse and validate the structured response
     content = strict_resp.output_text
@@ -1471,6 +1505,62 @@ def _get_effective_download_strategy(
     return strategy
 
 
+_TOOL_PHASE_LABELS = {
+    "code-interpreter": "Code Interpreter",
+    "file-search": "File Search",
+    "user-data": "user-data",
+}
+
+
+async def _run_tool_preparation_phases(
+    phases: Dict[str, Awaitable[Any]],
+) -> Dict[str, Any]:
+    """Run per-tool upload preparation phases concurrently.
+
+    Every phase is allowed to finish (successfully or not) so that cleanup
+    sees all resources that were created. Per-file upload locks in the
+    shared upload manager ensure files attached to several tools are still
+    uploaded only once.
+
+    Args:
+        phases: Mapping of tool name to the awaitable preparing that tool
+
+    Returns:
+        Mapping of tool name to the phase result
+
+    Raises:
+        Exception: The original error if a single phase failed
+        UploadError: Combined error attributed per tool if several failed
+    """
+    tool_names = list(phases)
+    outcomes = await asyncio.gather(
+        *(phases[name] for name in tool_names), return_exceptions=True
+    )
+
+    results: Dict[str, Any] = {}
+    failures: List[Tuple[str, BaseException]] = []
+    for name, outcome in zip(tool_names, outcomes):
+        if isinstance(outcome, BaseException):
+            label = _TOOL_PHASE_LABELS.get(name, name)
+            logger.error(f"Failed to prepare {label} files: {outcome}")
+            failures.append((name, outcome))
+        else:
+            results[name] = outcome
+
+    if len(failures) == 1:
+        raise failures[0][1]
+    if failures:
+        from .upload_manager import UploadError
+
+        error_msg = "\n\n".join(
+            f"{_TOOL_PHASE_LABELS.get(name, name)}: {error}"
+            for name, error in failures
+        )
+        raise UploadError(error_msg)
+
+    return results
+
+
 async def execute_model(
     args: CLIParams,
     params: Dict[str, Any],
@@ -1508,9 +1598,10 @@ async def execute_model(
     services = ServiceContainer(client, args)
 
     # Initialize variables that will be used in nested functions
-    code_interpreter_info = None
-    file_search_info = None
+    code_interpreter_info: Optional[Dict[str, Any]] = None
+    file_search_info: Optional[Dict[str, Any]] = None
     shared_upload_manager = None
+    owned_upload_cache: Optional[Any] = None
 
     # Create detailed log callback
     def log_callback(level: int, message: str, extra: dict[str, Any]) -> None:
@@ -1528,10 +1619,12 @@ async def execute_main_operation() -> ExitCode:
         """Main execution operation wrapped for timeout handling."""
         # Create output buffer
         output_buffer = []
+        stream_output: Optional[StreamingOutput] = None
 
         # Process tool configurations
         tools = []
         nonlocal code_interpreter_info, file_search_info, shared_upload_manager
+        nonlocal owned_upload_cache
 
         # Get universal tool toggle overrides first
         enabled_tools: set[str] = args.get("_enabled_tools", set())  # type: ignore[assignment]
@@ -1553,36 +1646,36 @@ async def execute_main_operation() -> ExitCode:
             or "code-interpreter" in enabled_tools
         )
 
+        reuse_vector_stores = False
         if needs_upload_manager:
             logger.debug(
                 "Initializing shared upload manager for new attachment system"
             )
             from .attachment_processor import AttachmentProcessor
-            from .config import get_config
-            from .upload_cache import UploadCache
+            from .upload_cache import UploadCache, create_upload_cache
             from .upload_manager import SharedUploadManager
 
-            # Initialize persistent upload cache if enabled
+            # Reuse the cache validate_inputs opened for the template helpers
             cfg = get_config()
             up_cfg = cfg.get_upload_config()
 
-            cache_obj = None
-            if up_cfg.persistent_cache:
-                default_cache_path = (
-                    _Path.home() / ".cache" / "ostruct" / "uploads.db"
-                )
-                cache_path = (
-                    _Path(up_cfg.cache_path).expanduser().resolve()
-                    if up_cfg.cache_path
-                    else default_cache_path
-                )
+            cache_obj: Optional[UploadCache] = None
+            if "_upload_cache" in args:
+                shared_cache = args.get("_upload_cache")
+                if isinstance(shared_cache, UploadCache):
+                    cache_obj = shared_cache
+            else:
+                cache_obj = owned_upload_cache = create_upload_cache(up_cfg)
+            if cache_obj is not None:
+                reuse_vector_stores = up_cfg.reuse_vector_stores
 
-                cache_obj = UploadCache(
-                    cache_path=cache_path, hash_algo=up_cfg.hash_algorithm
-                )
+            # CLI flag takes precedence over configured concurrency
+            upload_concurrency = (
+                args.get("upload_concurrency") or up_cfg.max_concurrent_uploads
+            )
 
             shared_upload_manager = SharedUploadManager(
-                client, cache=cache_obj
+                client, cache=cache_obj, max_concurrency=upload_concurrency
             )
 
             # Get security manager for file validation
@@ -1658,28 +1751,84 @@ async def execute_main_operation() -> ExitCode:
             # Fall back to routing-based enablement
             ci_should_enable = bool(ci_enabled_by_routing)
 
-        if ci_should_enable:
-            code_interpreter_manager = None
-            file_ids = []
+        # Apply universal tool toggle overrides for file-search
+        fs_enabled_by_routing = (
+            routing_result_typed
+            and "file-search" in routing_result_typed.enabled_tools
+        )
+        fs_enabled_by_toggle = "file-search" in enabled_tools
+        fs_disabled_by_toggle = "file-search" in disabled_tools
 
-            if shared_upload_manager:
-                # Use shared upload manager for new attachment system
+        # Determine final enablement state
+        fs_should_enable = False
+        if fs_enabled_by_toggle:
+            # Universal --enable-tool takes highest precedence
+            fs_should_enable = True
+            logger.debug("File Search enabled via --enable-tool")
+        elif fs_disabled_by_toggle:
+            # Universal --disable-tool takes highest precedence
+            fs_should_enable = False
+            logger.debug("File Search disabled via --disable-tool")
+        else:
+            # Fall back to routing-based enablement
+            fs_should_enable = bool(fs_enabled_by_routing)
+
+        # Prepare Code Interpreter files, the File Search vector store and
+        # user-data uploads concurrently when using the shared upload manager
+        shared_results: Dict[str, Any] = {}
+        if shared_upload_manager:
+            phases: Dict[str, Awaitable[Any]] = {}
+
+            if ci_should_enable:
                 logger.debug(
                     "Using shared upload manager for Code Interpreter"
                 )
                 from .code_interpreter import CodeInterpreterManager
 
-                code_interpreter_manager = CodeInterpreterManager(
+                shared_ci_manager = CodeInterpreterManager(
                     client,
                     config=None,
                     upload_manager=shared_upload_manager,
                     args=args,
                 )
+                # Register for cleanup before uploading so partial
+                # uploads are cleaned up if another phase fails
+                code_interpreter_info = {"manager": shared_ci_manager}
+                phases["code-interpreter"] = (
+                    shared_ci_manager.get_files_from_shared_manager()
+                )
+
+            if fs_should_enable:
+                logger.debug("Using shared upload manager for File Search")
+                from .file_search import FileSearchManager
 
-                # Get file IDs from shared manager
-                file_ids = (
-                    await code_interpreter_manager.get_files_from_shared_manager()
+                shared_fs_manager = FileSearchManager(
+                    client,
+                    upload_manager=shared_upload_manager,
+                    reuse_vector_stores=reuse_vector_stores,
                 )
+                file_search_info = {"manager": shared_fs_manager}
+                phases["file-search"] = (
+                    shared_fs_manager.create_vector_store_from_shared_manager(
+                        "ostruct_vector_store",
+                        timeout=args.get("fs_timeout", 60.0),
+                    )
+                )
+
+            phases["user-data"] = shared_upload_manager.upload_for_tool(
+                "user-data"
+            )
+
+            shared_results = await _run_tool_preparation_phases(phases)
+
+        if ci_should_enable:
+            code_interpreter_manager = None
+            file_ids = []
+
+            if shared_upload_manager:
+                # Files were uploaded by the shared preparation phase
+                code_interpreter_manager = shared_ci_manager
+                file_ids = shared_results["code-interpreter"]
                 logger.debug(
                     f"Got {len(file_ids)} file IDs from shared manager for CI"
                 )
@@ -1746,45 +1895,14 @@ async def execute_main_operation() -> ExitCode:
                     tools.append(ci_tool_config)
 
         # Process File Search configuration if enabled
-        # Apply universal tool toggle overrides for file-search
-        fs_enabled_by_routing = (
-            routing_result_typed
-            and "file-search" in routing_result_typed.enabled_tools
-        )
-        fs_enabled_by_toggle = "file-search" in enabled_tools
-        fs_disabled_by_toggle = "file-search" in disabled_tools
-
-        # Determine final enablement state
-        fs_should_enable = False
-        if fs_enabled_by_toggle:
-            # Universal --enable-tool takes highest precedence
-            fs_should_enable = True
-            logger.debug("File Search enabled via --enable-tool")
-        elif fs_disabled_by_toggle:
-            # Universal --disable-tool takes highest precedence
-            fs_should_enable = False
-            logger.debug("File Search disabled via --disable-tool")
-        else:
-            # Fall back to routing-based enablement
-            fs_should_enable = bool(fs_enabled_by_routing)
-
         if fs_should_enable:
             file_search_manager = None
             vector_store_id = None
 
             if shared_upload_manager:
-                # Use shared upload manager for new attachment system
-                logger.debug("Using shared upload manager for File Search")
-                from .file_search import FileSearchManager
-
-                file_search_manager = FileSearchManager(
-                    client, upload_manager=shared_upload_manager
-                )
-
-                # Create vector store with files from shared manager
-                vector_store_id = await file_search_manager.create_vector_store_from_shared_manager(
-                    "ostruct_vector_store"
-                )
+                # Vector store was built by the shared preparation phase
+                file_search_manager = shared_fs_manager
+                vector_store_id = shared_results["file-search"]
                 logger.debug(
                     f"Created vector store {vector_store_id} from shared manager"
                 )
@@ -1846,21 +1964,12 @@ async def execute_main_operation() -> ExitCode:
                     }
                     tools.append(fs_tool_config)
 
-        # Process user-data uploads if we have a shared upload manager
-        if shared_upload_manager:
-            try:
-                await shared_upload_manager.upload_for_tool("user-data")
-                logger.debug("Completed user-data uploads")
-            except Exception as e:
-                logger.error(f"Failed to upload user-data files: {e}")
-                raise
-
         # Process Web Search configuration if enabled
         # Apply universal tool toggle overrides for web-search
         from typing import cast
 
         config_path = cast(Union[str, Path, None], args.get("config"))
-        config = OstructConfig.load(config_path)
+        config = get_config(config_path)
         web_search_config = config.get_web_search_config()
 
         # Determine if web search should be enabled
@@ -1951,6 +2060,11 @@ async def execute_main_operation() -> ExitCode:
             and output_model
             and code_interpreter_info
         ):
+            if args.get("stream"):
+                logger.warning(
+                    "--stream is not supported with two-pass Code Interpreter "
+                    "downloads; output will be written when the run completes"
+                )
             try:
                 logger.debug(
                     "Using two-pass sentinel mode for Code Interpreter file downloads"
@@ -1987,6 +2101,8 @@ async def execute_main_operation() -> ExitCode:
         else:
             # Create the response using the API (single-pass mode)
             logger.debug(f"Tools being passed to API: {tools}")
+            if args.get("stream"):
+                stream_output = StreamingOutput(output_model)
             response = await create_structured_output(
                 client=client,
                 model=args["model"],
@@ -2002,7 +2118,12 @@ async def execute_main_operation() -> ExitCode:
                     else None
                 ),
                 shared_upload_manager=shared_upload_manager,
+                stream_output=stream_output,
             )
+            if stream_output is not None:
+                get_progress_reporter().report_stream_summary(
+                    stream_output.stats.to_dict()
+                )
         output_buffer.append(response)
 
         # Handle final output
@@ -2024,6 +2145,9 @@ async def execute_main_operation() -> ExitCode:
         if output_file:
             with open(output_file, "w") as f:
                 f.write(json_content)
+        elif stream_output is not None:
+            # Keep stdout a single JSONL stream
+            stream_output.write_result(output_buffer[0])
         else:
             print(json_content)
 
@@ -2088,9 +2212,10 @@ async def execute_main_operation() -> ExitCode:
                                             f"      Filename: {output.filename}"
                                         )
 
-                        # Type ignore since we know this is a CodeInterpreterManager
-                        downloaded_files = await manager.download_generated_files(  # type: ignore[attr-defined]
-                            api_response, download_dir
+                        downloaded_files = (
+                            await manager.download_generated_files(
+                                api_response, download_dir
+                            )
                         )
                         if downloaded_files:
                             logger.info(
@@ -2131,8 +2256,7 @@ async def execute_main_operation() -> ExitCode:
         if code_interpreter_info and args.get("ci_cleanup", True):
             try:
                 manager = code_interpreter_info["manager"]
-                # Type ignore since we know this is a CodeInterpreterManager
-                await manager.cleanup_uploaded_files()  # type: ignore[attr-defined]
+                await manager.cleanup_uploaded_files()
                 logger.debug("Cleaned up Code Interpreter uploaded files")
             except Exception as e:
                 logger.warning(
@@ -2143,8 +2267,7 @@ async def execute_main_operation() -> ExitCode:
         if file_search_info and args.get("fs_cleanup", True):
             try:
                 manager = file_search_info["manager"]
-                # Type ignore since we know this is a FileSearchManager
-                await manager.cleanup_resources()  # type: ignore[attr-defined]
+                await manager.cleanup_resources()
                 logger.debug("Cleaned up File Search vector stores and files")
             except Exception as e:
                 logger.warning(
@@ -2155,8 +2278,6 @@ async def execute_main_operation() -> ExitCode:
         if shared_upload_manager:
             try:
                 # Get TTL configuration from config
-                from .config import get_config
-
                 config = get_config()
                 upload_config = config.get_upload_config()
 
@@ -2187,6 +2308,29 @@ async def execute_main_operation() -> ExitCode:
             except Exception as e:
                 logger.warning(f"Failed to clean up shared upload files: {e}")
 
+        # Close the upload cache if it was opened here rather than by
+        # validate_inputs
+        if owned_upload_cache is not None:
+            owned_upload_cache.close()
+
+        # Report shared file content cache activity (verbose only)
+        try:
+            get_progress_reporter().report_content_cache_summary(
+                get_file_cache().stats()
+            )
+        except Exception as e:
+            logger.debug(f"Failed to report file cache summary: {e}")
+
+        # Report client-side rate limiting (verbose only)
+        try:
+            limiter = get_rate_limiter()
+            if limiter is not None:
+                get_progress_reporter().report_rate_limit_summary(
+                    limiter.stats()
+                )
+        except Exception as e:
+            logger.debug(f"Failed to report rate limit summary: {e}")
+
         # Clean up service container
         try:
             await services.cleanup()
@@ -2265,7 +2409,6 @@ async def run_cli_async(args: CLIParams) -> ExitCode:
 
         # Fix: Determine effective download strategy before template processing
         # This ensures the template processor gets the correct strategy for sentinel injection
-        from .config import get_config
         from .model_creation import create_dynamic_model
 
         output_model = create_dynamic_model(schema) if schema else None
@@ -2302,7 +2445,7 @@ async def run_cli_async(args: CLIParams) -> ExitCode:
         (
             output_model,
             messages,
-            total_tokens,
+            token_usage,
             registry,
         ) = await validate_model_and_schema(
             args,
@@ -2311,6 +2454,7 @@ async def run_cli_async(args: CLIParams) -> ExitCode:
             user_prompt,
             template_context,
         )
+        total_tokens = token_usage.total_tokens
 
         # Report validation results
         if registry is not None:
@@ -2359,6 +2503,7 @@ async def run_cli_async(args: CLIParams) -> ExitCode:
                     output_tokens=capabilities.max_output_tokens,
                     total_cost=estimated_cost,
                     context_window=capabilities.context_window,
+                    file_tokens=token_usage.file_tokens,
                 )
             else:
                 # Fallback for test environments
@@ -2410,6 +2555,13 @@ async def run_cli_async(args: CLIParams) -> ExitCode:
             raise  # Let our custom errors propagate
         logger.exception("Unexpected error")
         raise CLIError(str(e), context={"error_type": type(e).__name__})
+    finally:
+        # Release the pooled connections of the cache validate_inputs opened
+        from .upload_cache import UploadCache
+
+        opened_cache = args.get("_upload_cache")
+        if isinstance(opened_cache, UploadCache):
+            opened_cache.close()
 
 
 class OstructRunner:
@@ -2438,6 +2590,37 @@ async def run(self) -> ExitCode:
         """
         return await run_cli_async(self.args)
 
+    async def run_many(
+        self,
+        items: Iterable["BatchItem"],
+        output_path: Union[str, Path],
+        concurrency: int = 4,
+        resume: bool = True,
+    ) -> "BatchSummary":
+        """Run the template and schema over many inputs.
+
+        The client, Jinja environment, output model and upload cache are
+        shared by all items. See run_batch() for details.
+
+        Args:
+            items: Batch items with per-item variables and files
+            output_path: JSONL file receiving one result record per item
+            concurrency: Maximum number of items in flight
+            resume: Skip items already completed in output_path
+
+        Returns:
+            Summary of succeeded, failed and skipped items
+        """
+        from .batch import run_batch
+
+        return await run_batch(
+            self.args,
+            items,
+            output_path,
+            concurrency=concurrency,
+            resume=resume,
+        )
+
     async def validate_only(self) -> ExitCode:
         """Run validation without executing the model.
 
@@ -16,7 +16,7 @@
 
 from ..ost.arg_policy import GlobalArgsPolicyEnforcer
 from ..ost.frontmatter import FrontMatterError, FrontMatterParser
-from ..ost.schema_export import export_inline_schema
+from ..ost.schema_export import export_inline_schema, parse_inline_schema
 
 
 class OSTFileType(click.ParamType):
@@ -594,8 +594,8 @@ def runx_main(argv: Optional[List[str]] = None) -> int:
             e.show()
             sys.exit(2)
 
-        # Export schema to temporary file
-        schema_path = export_inline_schema(meta["schema"])
+        # Parse the inline schema; it is handed to ostruct run in memory
+        schema = parse_inline_schema(meta["schema"])
 
         # Map template variables to ostruct flags
         template_flags = process_template_arguments(
@@ -605,45 +605,30 @@ def runx_main(argv: Optional[List[str]] = None) -> int:
         # Combine filtered baseline with template flags
         final_flags = filtered_baseline_args + template_flags
 
-        # Create temporary file for template body
         template_body = extract_template_body(tpl_path, body_start)
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".j2", delete=False
-        ) as tmp_template:
-            tmp_template.write(template_body)
-            tmp_template_path = tmp_template.name
-
-        # Build ostruct run command
-        run_cmd: List[str] = [
-            "ostruct",
-            "run",
-            tmp_template_path,
-            str(schema_path),
-        ]
-
         # Add default --progress none for OST files (cleaner UX for standalone tools)
         # unless user or template explicitly sets progress mode
+        run_flags: List[str] = []
         has_progress_flag = any(
             arg.startswith("--progress") for arg in final_flags
         )
         if not has_progress_flag:
-            run_cmd.extend(["--progress", "none"])
+            run_flags.extend(["--progress", "none"])
 
         # Add final flags
-        run_cmd.extend(final_flags)
+        run_flags.extend(final_flags)
 
-        # Execute ostruct run via execvp
-        try:
-            os.execvp("ostruct", run_cmd)
-        except OSError as e:
-            click.echo(f"Error executing ostruct: {e}", err=True)
-            # Clean up on error
-            try:
-                os.unlink(tmp_template_path)
-            except OSError:
-                pass
-            sys.exit(1)
+        if os.getenv("OSTRUCT_RUNX_EXEC", "").lower() in ("true", "1", "yes"):
+            exec_ostruct_run(template_body, meta["schema"], run_flags)
+            return 0  # Not reached: execvp replaces this process
+
+        # Run in this process: no second interpreter start-up, no temp files
+        from ..commands.run import run_inline
+
+        return run_inline(
+            template_body, schema, run_flags, template_path=str(tpl_path)
+        )
 
     except FrontMatterError as e:
         click.echo(f"Front-matter error: {e}", err=True)
@@ -652,7 +637,51 @@ def runx_main(argv: Optional[List[str]] = None) -> int:
         click.echo(f"Unexpected error: {e}", err=True)
         sys.exit(1)
 
-    return 0  # Should not reach here due to execvp
+
+def exec_ostruct_run(
+    template_body: str, schema_content: str, run_flags: List[str]
+) -> None:
+    """Replace this process with ``ostruct run`` for the template.
+
+    This is the original runx mechanism, kept for OSTRUCT_RUNX_EXEC=1. The
+    template body and schema are written to temporary files because a
+    separate ``ostruct`` process has to read them from disk.
+
+    Args:
+        template_body: Template content after the front-matter
+        schema_content: Inline schema from the front-matter
+        run_flags: ostruct run options
+    """
+    # Export schema to temporary file
+    schema_path = export_inline_schema(schema_content)
+
+    # Create temporary file for template body
+    with tempfile.NamedTemporaryFile(
+        mode="w", suffix=".j2", delete=False
+    ) as tmp_template:
+        tmp_template.write(template_body)
+        tmp_template_path = tmp_template.name
+
+    # Build ostruct run command
+    run_cmd: List[str] = [
+        "ostruct",
+        "run",
+        tmp_template_path,
+        str(schema_path),
+    ]
+    run_cmd.extend(run_flags)
+
+    # Execute ostruct run via execvp
+    try:
+        os.execvp("ostruct", run_cmd)
+    except OSError as e:
+        click.echo(f"Error executing ostruct: {e}", err=True)
+        # Clean up on error
+        try:
+            os.unlink(tmp_template_path)
+        except OSError:
+            pass
+        sys.exit(1)
 
 
 if __name__ == "__main__":
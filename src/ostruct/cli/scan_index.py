@@ -0,0 +1,238 @@
+"""Persistent directory-scan index for repeated directory collection.
+
+Collecting the same directory run after run mostly re-lists an unchanged
+tree. The scan index stores, per walked directory, its mtime and the result
+of scanning it (gitignore-filtered file names, subdirectories to descend,
+and what was excluded). A later walk with the same settings reuses the
+stored result for every directory whose mtime is unchanged and only scans
+the directories that changed.
+
+A directory's mtime changes whenever an entry is added, removed or renamed
+in it, which is exactly what can change its listing. Directories that
+contain symlinks are never stored, since a symlink target can change type
+without touching the directory. Results are keyed by the walk settings,
+including a fingerprint of the gitignore patterns, so editing the ignore
+file starts a fresh index.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .cache_utils import get_default_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Directories modified this recently are not stored: an entry added within
+# the same mtime tick as the scan would go unnoticed on the next run.
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+
+def get_default_scan_index_path() -> Path:
+    """Get default path for the directory-scan index database."""
+    return get_default_cache_dir() / "scan_index.sqlite"
+
+
+@dataclass
+class DirectoryScan:
+    """Result of scanning one directory during a walk."""
+
+    files: List[str] = field(default_factory=list)
+    subdirs: List[str] = field(default_factory=list)
+    excluded: int = 0
+    skipped_dirs: List[str] = field(default_factory=list)
+    has_symlinks: bool = False
+
+    def to_json(self) -> str:
+        return json.dumps(
+            [self.files, self.subdirs, self.excluded, self.skipped_dirs]
+        )
+
+    @classmethod
+    def from_json(cls, data: str) -> "DirectoryScan":
+        files, subdirs, excluded, skipped_dirs = json.loads(data)
+        return cls(files, subdirs, excluded, skipped_dirs)
+
+
+def walk_key(
+    abs_dir: str, recursive: bool, gitignore_fingerprint: Optional[str]
+) -> str:
+    """Identify a walk by everything that can change its result.
+
+    Args:
+        abs_dir: Absolute directory being walked
+        recursive: Whether subdirectories are descended into
+        gitignore_fingerprint: Fingerprint of the gitignore patterns in
+            effect, or None when gitignore filtering is off
+
+    Returns:
+        Hex digest used as the index key
+    """
+    payload = json.dumps([abs_dir, recursive, gitignore_fingerprint])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ScanIndex:
+    """SQLite-backed store of directory scan results."""
+
+    def __init__(self, index_path: Path) -> None:
+        """Initialize the index, creating the database if needed.
+
+        Args:
+            index_path: Path to the SQLite index database
+        """
+        self.index_path = Path(index_path)
+        self._lock = threading.Lock()
+        self._ensure_db_exists()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.index_path), timeout=30.0)
+        conn.execute("PRAGMA journal_mode = WAL")
+        return conn
+
+    def _ensure_db_exists(self) -> None:
+        """Create database and tables if they don't exist."""
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS scan_dirs (
+                        walk_key    TEXT NOT NULL,
+                        rel_dir     TEXT NOT NULL,
+                        mtime_ns    INTEGER NOT NULL,
+                        scan        TEXT NOT NULL,
+                        indexed_at  INTEGER NOT NULL,
+                        PRIMARY KEY (walk_key, rel_dir)
+                    )
+                    """
+                )
+        finally:
+            conn.close()
+
+    def load(self, key: str) -> Dict[str, Tuple[int, DirectoryScan]]:
+        """Load every stored directory of a walk.
+
+        Args:
+            key: Walk key from walk_key()
+
+        Returns:
+            Mapping of relative directory to (mtime_ns, scan result)
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    "SELECT rel_dir, mtime_ns, scan FROM scan_dirs "
+                    "WHERE walk_key = ?",
+                    (key,),
+                ).fetchall()
+            finally:
+                conn.close()
+
+        entries: Dict[str, Tuple[int, DirectoryScan]] = {}
+        for rel_dir, mtime_ns, scan in rows:
+            try:
+                entries[rel_dir] = (mtime_ns, DirectoryScan.from_json(scan))
+            except (ValueError, TypeError) as e:
+                logger.debug("Ignoring corrupt scan entry %s: %s", rel_dir, e)
+        return entries
+
+    def save(
+        self, key: str, entries: Dict[str, Tuple[int, DirectoryScan]]
+    ) -> None:
+        """Replace the stored directories of a walk.
+
+        Directories with symlinks or a very recent mtime are left out so
+        they are always rescanned.
+
+        Args:
+            key: Walk key from walk_key()
+            entries: Mapping of relative directory to (mtime_ns, scan)
+        """
+        cutoff = time.time_ns() - RACY_MTIME_WINDOW_NS
+        now = int(time.time())
+        rows = [
+            (key, rel_dir, mtime_ns, scan.to_json(), now)
+            for rel_dir, (mtime_ns, scan) in entries.items()
+            if not scan.has_symlinks and mtime_ns < cutoff
+        ]
+        with self._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute(
+                        "DELETE FROM scan_dirs WHERE walk_key = ?", (key,)
+                    )
+                    conn.executemany(
+                        "INSERT INTO scan_dirs "
+                        "(walk_key, rel_dir, mtime_ns, scan, indexed_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        rows,
+                    )
+            finally:
+                conn.close()
+
+    def clear(self) -> None:
+        """Remove all stored scan results."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute("DELETE FROM scan_dirs")
+            finally:
+                conn.close()
+
+
+_shared_index: Optional[ScanIndex] = None
+_shared_index_lock = threading.Lock()
+
+
+def get_scan_index() -> Optional[ScanIndex]:
+    """Get the scan index if enabled in the configuration.
+
+    The index is opt-in through ``file_collection.scan_index`` (or
+    OSTRUCT_SCAN_INDEX) and is opened once per process.
+
+    Returns:
+        Shared ScanIndex instance, or None when the index is disabled or
+        cannot be opened
+    """
+    global _shared_index
+    try:
+        from .config import get_config
+
+        collection_config = get_config().file_collection
+    except Exception as e:
+        logger.debug(f"Scan index disabled: {e}")
+        return None
+    if not collection_config.scan_index:
+        return None
+
+    with _shared_index_lock:
+        if _shared_index is None:
+            index_path = (
+                Path(collection_config.scan_index_path).expanduser()
+                if collection_config.scan_index_path
+                else get_default_scan_index_path()
+            )
+            try:
+                _shared_index = ScanIndex(index_path)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Cannot open scan index %s: %s", index_path, e)
+                return None
+        return _shared_index
+
+
+def reset_scan_index() -> None:
+    """Forget the shared index; the next access reopens it from config."""
+    global _shared_index
+    with _shared_index_lock:
+        _shared_index = None
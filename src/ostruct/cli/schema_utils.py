@@ -1,11 +1,17 @@
 """Schema utilities for ostruct CLI."""
 
+import copy
+import hashlib
 import json
 import logging
+import threading
+import weakref
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, MutableMapping, Optional, Set, Tuple, Type
 
 from openai_model_registry import ModelRegistry
+from pydantic import BaseModel
 
 from .errors import SchemaFileError
 
@@ -111,3 +117,124 @@ def validate_schema_file(
             schema_path=schema_path,
             context=schema_context,
         ) from e
+
+
+# ---------------------------------------------------------------------------
+# Per-process schema caches
+#
+# Batch drivers call ostruct many times with the same schema. Meta-schema
+# validation, dynamic model construction and the strict-mode schema only
+# depend on the schema content, so they are computed once per distinct
+# schema (identified by its fingerprint) and reused afterwards.
+# ---------------------------------------------------------------------------
+
+MODEL_CACHE_SIZE = 64
+
+_schema_cache_lock = threading.Lock()
+_validated_schemas: Set[str] = set()
+_model_cache: "OrderedDict[Tuple[str, str], Type[BaseModel]]" = OrderedDict()
+_strict_schemas: MutableMapping[Type[BaseModel], Dict[str, Any]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def schema_fingerprint(schema: Dict[str, Any]) -> Optional[str]:
+    """Compute a content fingerprint for a JSON schema.
+
+    Args:
+        schema: JSON schema dictionary
+
+    Returns:
+        Hex digest that is equal for equal schemas regardless of key order,
+        or None if the schema is not JSON serializable
+    """
+    try:
+        canonical = json.dumps(
+            schema, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def is_schema_validated(fingerprint: Optional[str]) -> bool:
+    """Check whether a schema with this fingerprint already passed validation."""
+    return fingerprint is not None and fingerprint in _validated_schemas
+
+
+def mark_schema_validated(fingerprint: Optional[str]) -> None:
+    """Remember that a schema with this fingerprint passed validation."""
+    if fingerprint is not None:
+        with _schema_cache_lock:
+            _validated_schemas.add(fingerprint)
+
+
+def get_cached_model(
+    fingerprint: Optional[str], base_name: str
+) -> Optional[Type[BaseModel]]:
+    """Look up a previously built output model.
+
+    Args:
+        fingerprint: Schema fingerprint from schema_fingerprint()
+        base_name: Model class name the model was built with
+
+    Returns:
+        Cached model class, or None if not cached
+    """
+    if fingerprint is None:
+        return None
+    key = (fingerprint, base_name)
+    with _schema_cache_lock:
+        model = _model_cache.get(key)
+        if model is not None:
+            _model_cache.move_to_end(key)
+        return model
+
+
+def cache_model(
+    fingerprint: Optional[str], base_name: str, model: Type[BaseModel]
+) -> None:
+    """Store a built output model, evicting the least recently used one.
+
+    Args:
+        fingerprint: Schema fingerprint from schema_fingerprint()
+        base_name: Model class name the model was built with
+        model: Model class to cache
+    """
+    if fingerprint is None:
+        return
+    with _schema_cache_lock:
+        _model_cache[(fingerprint, base_name)] = model
+        _model_cache.move_to_end((fingerprint, base_name))
+        while len(_model_cache) > MODEL_CACHE_SIZE:
+            _model_cache.popitem(last=False)
+
+
+def get_strict_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Get the strict-mode JSON schema of an output model.
+
+    The schema is generated and made strict once per model class. The
+    returned dictionary is shared between calls and must not be modified.
+
+    Args:
+        model: Pydantic output model
+
+    Returns:
+        JSON schema with ``additionalProperties: false`` on every object
+    """
+    with _schema_cache_lock:
+        strict_schema = _strict_schemas.get(model)
+    if strict_schema is None:
+        strict_schema = copy.deepcopy(model.model_json_schema())
+        make_strict(strict_schema)
+        with _schema_cache_lock:
+            _strict_schemas[model] = strict_schema
+    return strict_schema
+
+
+def clear_schema_caches() -> None:
+    """Forget all validated schemas, built models and strict schemas."""
+    with _schema_cache_lock:
+        _validated_schemas.clear()
+        _model_cache.clear()
+        _strict_schemas.clear()
@@ -9,7 +9,7 @@
 - Temporary path management
 """
 
-from .allowed_checker import is_path_in_allowed_dirs
+from .allowed_checker import AllowedDirIndex, is_path_in_allowed_dirs
 from .case_manager import CaseManager
 from .errors import (
     DirectoryNotFoundError,
@@ -25,6 +25,7 @@
     "normalize_path",
     "safe_join",
     "is_path_in_allowed_dirs",
+    "AllowedDirIndex",
     "CaseManager",
     "PathSecurityError",
     "DirectoryNotFoundError",
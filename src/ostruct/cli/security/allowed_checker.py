@@ -1,12 +1,14 @@
 """Allowed directory checker module.
 
 This module provides functionality to verify that a given path is within
-one of a set of allowed directories.
+one of a set of allowed directories, either as a one-off check or through
+a reusable prefix index.
 """
 
 import logging
+import os
 from pathlib import Path
-from typing import List, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from .normalization import normalize_path
 
@@ -45,52 +47,96 @@ def is_path_in_allowed_dirs(
     if not isinstance(path, (str, Path)):
         raise TypeError("path must be a string or Path object")
 
-    norm_path = normalize_path(path)
-    norm_allowed = [normalize_path(d) for d in allowed_dirs]
+    return AllowedDirIndex(allowed_dirs).contains(path)
+
+
+# Marks a trie node that corresponds to an allowed directory itself.
+_ALLOWED = ""
 
-    # Check with normalized paths first
-    for allowed in norm_allowed:
-        try:
-            # If path.relative_to(allowed) does not raise an error,
-            # then path is within allowed.
-            norm_path.relative_to(allowed)
-            return True
-        except ValueError:
-            continue
-
-    # If normalized comparison failed, try with resolved paths
-    # This handles the case where the input path is already resolved (e.g., from validate_file_access)
-    # but the allowed directories are not resolved
-    try:
-        # Check if the input path might already be resolved by comparing it with its own resolution
-        path_as_path = Path(path) if isinstance(path, str) else path
-
-        # If the input path is already resolved, resolve allowed dirs to match
-        # We determine this by checking if the path starts with common temp resolved prefixes
-        path_str = str(path_as_path)
-        if path_str.startswith("/var/folders/") or path_str.startswith(
-            "/private/"
-        ):
-            # This looks like an already-resolved path on macOS, resolve allowed dirs
-            resolved_allowed = [d.resolve() for d in norm_allowed]
-            for allowed in resolved_allowed:
-                try:
-                    path_as_path.relative_to(allowed)
-                    return True
-                except ValueError:
-                    continue
-        else:
-            # Try resolving both path and allowed dirs
-            resolved_path = norm_path.resolve()
-            resolved_allowed = [d.resolve() for d in norm_allowed]
-            for allowed in resolved_allowed:
-                try:
-                    resolved_path.relative_to(allowed)
-                    return True
-                except ValueError:
-                    continue
-    except (OSError, RuntimeError):
-        # If resolution fails, fall back to normalized comparison result
-        pass
 
+def _build_trie(dirs: Iterable[Path]) -> Dict[str, Any]:
+    """Build a nested-dict trie keyed by case-normalized path parts."""
+    root: Dict[str, Any] = {}
+    for directory in dirs:
+        node = root
+        for part in directory.parts:
+            node = node.setdefault(os.path.normcase(part), {})
+        node[_ALLOWED] = True
+    return root
+
+
+def _trie_contains(root: Dict[str, Any], path: Path) -> bool:
+    """Return True if any prefix of path ends at an allowed directory."""
+    node = root
+    if _ALLOWED in node:
+        return True
+    for part in path.parts:
+        child = node.get(os.path.normcase(part))
+        if child is None:
+            return False
+        if _ALLOWED in child:
+            return True
+        node = child
     return False
+
+
+class AllowedDirIndex:
+    """Prefix index over a fixed set of allowed directories.
+
+    Answers the same question as is_path_in_allowed_dirs, but the allowed
+    directories are normalized once up front and stored in a trie of path
+    components, so each lookup costs O(depth of the path) regardless of
+    how many directories are allowed. The resolved form of the allowed
+    directories is only computed the first time a lookup needs it.
+
+    Example:
+        >>> index = AllowedDirIndex([Path("/base"), Path("/tmp")])
+        >>> index.contains("/base/file.txt")
+        True
+        >>> index.contains("/etc/passwd")
+        False
+    """
+
+    def __init__(self, allowed_dirs: Iterable[Union[str, Path]]) -> None:
+        self._dirs = [normalize_path(d) for d in allowed_dirs]
+        self._trie = _build_trie(self._dirs)
+        self._resolved_trie: Optional[Dict[str, Any]] = None
+
+    def __len__(self) -> int:
+        return len(self._dirs)
+
+    def _resolved(self) -> Dict[str, Any]:
+        if self._resolved_trie is None:
+            self._resolved_trie = _build_trie(d.resolve() for d in self._dirs)
+        return self._resolved_trie
+
+    def contains(self, path: Union[str, Path]) -> bool:
+        """Check if a path is inside any of the indexed directories.
+
+        Args:
+            path: The path to check.
+
+        Returns:
+            True if path is within one of the allowed directories.
+        """
+        norm_path = normalize_path(path)
+
+        # Check with normalized paths first
+        if _trie_contains(self._trie, norm_path):
+            return True
+
+        # If normalized comparison failed, try with resolved paths. This
+        # handles inputs that are already resolved (e.g. from
+        # validate_file_access) while the allowed directories are not.
+        try:
+            path_as_path = Path(path) if isinstance(path, str) else path
+            path_str = str(path_as_path)
+            if path_str.startswith("/var/folders/") or path_str.startswith(
+                "/private/"
+            ):
+                # This looks like an already-resolved path on macOS
+                return _trie_contains(self._resolved(), path_as_path)
+            return _trie_contains(self._resolved(), norm_path.resolve())
+        except (OSError, RuntimeError):
+            # If resolution fails, fall back to normalized comparison result
+            return False
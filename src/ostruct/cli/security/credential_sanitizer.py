@@ -1,7 +1,9 @@
 """Credential sanitization utilities for preventing API key exposure."""
 
+import json
 import re
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 
 # Import safe regex patterns
 from ..safe_regex import (
@@ -11,6 +13,14 @@
 )
 
 
+@lru_cache(maxsize=None)
+def _env_var_pattern(env_var: str) -> Pattern[str]:
+    """Compile the pattern for ENV_VAR=value or ENV_VAR: value."""
+    return re.compile(
+        rf'{env_var}["\']?\s*[:=]\s*["\']?([^\s"\']+)', re.IGNORECASE
+    )
+
+
 class CredentialSanitizer:
     """Sanitizes sensitive credentials from logs, error messages, and debug output."""
 
@@ -43,12 +53,35 @@ class CredentialSanitizer:
         "REPLICATE_API_TOKEN",
     }
 
+    # Lowercase literals that every match of the corresponding entry in
+    # API_KEY_PATTERNS starts with. A pattern whose triggers are absent from
+    # the text cannot match, so its pass is skipped. Patterns without
+    # triggers (e.g. added by a subclass) are always applied.
+    API_KEY_TRIGGERS: List[Tuple[str, ...]] = [
+        ("sk-",),
+        ("api_key", "api-key", "apikey"),
+        ("bearer",),
+        ("authorization",),
+        ("http://", "https://"),
+    ]
+
+    @classmethod
+    def _triggers_for(cls, index: int) -> Tuple[str, ...]:
+        """Return the trigger literals for an API key pattern, if any."""
+        if index < len(cls.API_KEY_TRIGGERS):
+            return cls.API_KEY_TRIGGERS[index]
+        return ()
+
     @classmethod
     def sanitize_string(
         cls, text: str, replacement: str = "[REDACTED]"
     ) -> str:
         """Sanitize sensitive credentials from a string.
 
+        Patterns are applied one after another, each to the output of the
+        previous one. Passes whose trigger literals do not occur in the
+        current text are skipped.
+
         Args:
             text: Input string that may contain credentials
             replacement: Replacement text for sanitized credentials
@@ -60,16 +93,25 @@ def sanitize_string(
             return text
 
         sanitized = text
-        for pattern in cls.API_KEY_PATTERNS:
-            sanitized = pattern.sub(replacement, sanitized)
+        lowered = sanitized.lower()
+        for index, pattern in enumerate(cls.API_KEY_PATTERNS):
+            triggers = cls._triggers_for(index)
+            if triggers and not any(t in lowered for t in triggers):
+                continue
+            sanitized, count = pattern.subn(replacement, sanitized)
+            if count:
+                # A replacement can join text into a new trigger
+                lowered = sanitized.lower()
 
         # Sanitize environment variables
         for env_var in cls.SENSITIVE_ENV_VARS:
-            # Pattern: ENV_VAR=value or ENV_VAR: value
-            env_pattern = re.compile(
-                rf'{env_var}["\']?\s*[:=]\s*["\']?([^\s"\']+)', re.IGNORECASE
+            if env_var.lower() not in lowered:
+                continue
+            sanitized, count = _env_var_pattern(env_var).subn(
+                f"{env_var}={replacement}", sanitized
             )
-            sanitized = env_pattern.sub(f"{env_var}={replacement}", sanitized)
+            if count:
+                lowered = sanitized.lower()
 
         return sanitized
 
@@ -158,3 +200,39 @@ def sanitize_for_logging(
             ]
         else:
             return obj
+
+
+class LazyLogArg:
+    """Log argument that is sanitized and formatted only when emitted.
+
+    ``logging`` calls ``str()`` on its arguments only when a handler formats
+    the record, so wrapping a large payload in ``LazyLogArg`` avoids the
+    sanitization and JSON serialization cost when DEBUG logging is off.
+
+    Args:
+        obj: Object to log
+        as_json: Format the object as indented JSON instead of ``str()``
+        sanitize: Run the object through ``CredentialSanitizer`` first
+    """
+
+    __slots__ = ("_obj", "_as_json", "_sanitize", "_rendered")
+
+    def __init__(
+        self, obj: Any, as_json: bool = False, sanitize: bool = True
+    ) -> None:
+        self._obj = obj
+        self._as_json = as_json
+        self._sanitize = sanitize
+        self._rendered: Optional[str] = None
+
+    def __str__(self) -> str:
+        # Several handlers may format the same record; render once
+        if self._rendered is None:
+            obj = self._obj
+            if self._sanitize:
+                obj = CredentialSanitizer.sanitize_for_logging(obj)
+            if self._as_json:
+                self._rendered = json.dumps(obj, indent=2, default=str)
+            else:
+                self._rendered = str(obj)
+        return self._rendered
@@ -15,11 +15,11 @@
 import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator, List, Optional, Set, Tuple, Union
+from typing import Dict, Generator, List, Optional, Set, Tuple, Union
 
 from ostruct.cli.errors import OstructFileNotFoundError
 
-from .allowed_checker import is_path_in_allowed_dirs
+from .allowed_checker import AllowedDirIndex
 from .case_manager import CaseManager
 from .errors import (
     DirectoryNotFoundError,
@@ -99,6 +99,12 @@ def __init__(
                 path=str(base_dir),
             )
 
+        # Prefix index over the allowed directories (built on first use) and
+        # the per-run memo of directories that passed validation. Files
+        # directly inside a memoized directory skip the allowlist lookup.
+        self._allowed_index: Optional[AllowedDirIndex] = None
+        self._validated_dirs: Set[str] = set()
+
         # Initialize allowed directories with the base directory
         self._allowed_dirs: List[Path] = [self._base_dir]
         if allowed_dirs:
@@ -132,6 +138,7 @@ def __init__(
 
                 if should_inherit_dirs:
                     self._allowed_dirs = global_sm.allowed_dirs.copy()
+                    self._invalidate_path_caches()
                     inherited_dirs = len(self._allowed_dirs)
                 else:
                     inherited_dirs = 0
@@ -187,6 +194,51 @@ def allowed_dirs(self) -> List[Path]:
         """Return the list of allowed directories."""
         return self._allowed_dirs.copy()
 
+    @property
+    def _allowed_dir_index(self) -> AllowedDirIndex:
+        """Return the prefix index for the current allowed directories."""
+        if self._allowed_index is None:
+            self._allowed_index = AllowedDirIndex(self._allowed_dirs)
+        return self._allowed_index
+
+    def _invalidate_path_caches(self) -> None:
+        """Drop the allowed-directory index and the validated-directory memo.
+
+        Must be called whenever the allowed directories change.
+        """
+        self._allowed_index = None
+        self._validated_dirs.clear()
+
+    def _in_validated_dir(self, path: Path) -> bool:
+        """Check if a non-symlink path lives directly in a validated directory.
+
+        Only the immediate parent is consulted: an intermediate directory
+        below a validated one could itself be a symlink leading elsewhere.
+        """
+        return str(path.parent) in self._validated_dirs
+
+    def _trusted_directory(self, directory: Path) -> Optional[Path]:
+        """Resolve a directory and check it against the directory allowlist.
+
+        Args:
+            directory: Normalized directory path
+
+        Returns:
+            The resolved directory if it exists and is allowed by the
+            allowed directories (or temp path rules), otherwise None.
+        """
+        try:
+            resolved = directory.resolve(strict=True)
+        except (OSError, RuntimeError):
+            return None
+        key = str(resolved)
+        if key in self._validated_dirs:
+            return resolved
+        if not resolved.is_dir() or not self.is_path_allowed(resolved):
+            return None
+        self._validated_dirs.add(key)
+        return resolved
+
     def _should_warn_about_path(self, path: str) -> bool:
         """Check if we should warn about this path (once per session).
 
@@ -311,6 +363,7 @@ def add_allowed_directory(self, directory: Union[str, Path]) -> None:
             )
         if norm_dir not in self._allowed_dirs:
             self._allowed_dirs.append(norm_dir)
+            self._invalidate_path_caches()
 
     def configure_security_mode(
         self,
@@ -684,7 +737,9 @@ def validate_file_access(
 
         # Apply enhanced security validation on the resolved path
         # For symlinks, this ensures we validate the target, not just the symlink itself
-        if not self.is_path_allowed_enhanced(resolved_path):
+        if self._in_validated_dir(resolved_path):
+            pass
+        elif not self.is_path_allowed_enhanced(resolved_path):
             # is_path_allowed_enhanced() handles mode-specific behavior (warn vs strict)
             # If we get here in STRICT mode, it means an exception was already raised
             # In WARN/PERMISSIVE modes, we continue with a warning already logged
@@ -706,6 +761,13 @@ def validate_batch_access(
     ) -> List[Path]:
         """Validate multiple paths efficiently.
 
+        Intended for whole directory walks: each distinct parent directory
+        is resolved and checked against the allowlist once, and regular
+        files inside an allowed parent are accepted with a single lstat.
+        Symlinks, missing files and anything outside the allowed
+        directories go through validate_file_access() as usual, so the
+        results, warnings and errors match validating each path alone.
+
         Args:
             paths: List of paths to validate
             context: Description of the access context
@@ -718,10 +780,14 @@ def validate_batch_access(
         """
         validated = []
         errors = []
+        parents: Dict[str, Optional[Path]] = {}
 
         for path in paths:
             try:
-                validated.append(self.validate_file_access(path, context))
+                resolved = self._fast_validate(path, parents)
+                if resolved is None:
+                    resolved = self.validate_file_access(path, context)
+                validated.append(resolved)
             except (OstructFileNotFoundError, PathSecurityError) as e:
                 error_msg = f"{path}: {e}"
                 errors.append(error_msg)
@@ -750,6 +816,41 @@ def validate_batch_access(
         )
         return validated
 
+    def _fast_validate(
+        self,
+        path: Union[str, Path],
+        parents: Dict[str, Optional[Path]],
+    ) -> Optional[Path]:
+        """Validate a path through its already-checked parent directory.
+
+        Args:
+            path: Path to validate
+            parents: Trusted resolved parent per normalized parent directory
+                (None for parents that are not trusted), filled as we go
+
+        Returns:
+            The resolved path, or None if the full validation is needed.
+        """
+        try:
+            norm_path = normalize_path(path)
+        except PathSecurityError:
+            return None
+
+        parent_key = str(norm_path.parent)
+        if parent_key not in parents:
+            parents[parent_key] = self._trusted_directory(norm_path.parent)
+        resolved_parent = parents[parent_key]
+        if resolved_parent is None:
+            return None
+
+        try:
+            mode = os.lstat(norm_path).st_mode
+        except OSError:
+            return None
+        if stat.S_ISLNK(mode):
+            return None
+        return resolved_parent / norm_path.name
+
     @contextmanager
     def security_context(
         self,
@@ -799,6 +900,7 @@ def security_context(
             # Restore original state
             self.security_mode = old_mode
             self._allowed_dirs = old_dirs
+            self._invalidate_path_caches()
             self._allow_inodes = old_inodes
             logger.debug("Restored security context: mode=%s", old_mode)
 
@@ -840,7 +942,7 @@ def is_path_allowed(self, path: Union[str, Path]) -> bool:
             return False
 
         # Check if the path is within one of the allowed directories
-        if is_path_in_allowed_dirs(norm_path, self._allowed_dirs):
+        if self._allowed_dir_index.contains(norm_path):
             return True
 
         # Allow temp paths if configured
@@ -992,7 +1094,9 @@ def validate_path(self, path: Union[str, Path]) -> Path:
 
         # For non-symlinks, check if the normalized path is allowed
         logger.debug("Checking if path is allowed: %s", norm_path)
-        if not self.is_path_allowed(norm_path):
+        if not self._in_validated_dir(norm_path) and not self.is_path_allowed(
+            norm_path
+        ):
             logger.error(
                 "Path outside allowed directories: %s (base_dir=%s, allowed_dirs=%s)",
                 path,
@@ -1011,9 +1115,13 @@ def validate_path(self, path: Union[str, Path]) -> Path:
 
         # Only check existence after security validation passes
         logger.debug("Checking if path exists: %s", norm_path)
-        if not norm_path.exists():
+        try:
+            mode = norm_path.stat().st_mode
+        except (OSError, ValueError):
             logger.debug("Path allowed but not found: %s", norm_path)
             raise OstructFileNotFoundError(str(path))
+        if stat.S_ISDIR(mode):
+            self._validated_dirs.add(str(norm_path))
 
         logger.debug("Path validation successful: %s", norm_path)
         return norm_path
@@ -1067,15 +1175,22 @@ def resolve_path(self, path: Union[str, Path]) -> Path:
                     raise
 
             # For non-symlinks, check if the normalized path is allowed using enhanced security
-            if not self.is_path_allowed_enhanced(norm_path):
+            trusted = self._in_validated_dir(
+                norm_path
+            ) or self.is_path_allowed(norm_path)
+            if not trusted and not self.is_path_allowed_enhanced(norm_path):
                 # is_path_allowed_enhanced() handles mode-specific behavior (warn vs strict)
                 # If we get here in STRICT mode, it means an exception was already raised
                 # In WARN/PERMISSIVE modes, we continue with a warning already logged
                 pass
 
             # Only check existence after security validation
-            if not norm_path.exists():
+            try:
+                mode = norm_path.stat().st_mode
+            except (OSError, ValueError):
                 raise OstructFileNotFoundError(f"File not found: {path}")
+            if trusted and stat.S_ISDIR(mode):
+                self._validated_dirs.add(str(norm_path))
 
             return norm_path
 
@@ -1,39 +1,43 @@
 """Sentinel JSON extraction utility for two-pass Code Interpreter workaround."""
 
-import json
 from typing import Any, Dict, Optional
 
-from .safe_regex import (
-    SAFE_SENTINEL_PATTERN,
-    RegexTimeoutError,
-    safe_regex_search,
-)
+from .json_extract import find_outside_json_strings
+from .json_limits import parse_json_secure
 
-_SENT_RE = SAFE_SENTINEL_PATTERN
+BEGIN_MARKER = "===BEGIN_JSON==="
+END_MARKER = "===END_JSON==="
 
 
 def extract_json_block(text: str) -> Optional[Dict[str, Any]]:
     """Extract JSON block from sentinel markers in text.
 
+    The first marker pair enclosing a JSON object wins. Markers that appear
+    inside JSON string values do not end the block.
+
     Args:
         text: Response text that may contain sentinel-wrapped JSON
 
     Returns:
         Parsed JSON dict if found, None otherwise
     """
-    try:
-        m = safe_regex_search(_SENT_RE, text, timeout=2.0)
-        if not m:
+    begin = text.find(BEGIN_MARKER)
+    while begin != -1:
+        content_start = begin + len(BEGIN_MARKER)
+        end = find_outside_json_strings(text, END_MARKER, content_start)
+        if end == -1:
             return None
 
-        from .json_limits import parse_json_secure
-
-        result = parse_json_secure(m.group(1))
-        # Ensure we return a dict, not other JSON types
-        if isinstance(result, dict):
-            return result
-        return None
-    except (RegexTimeoutError, json.JSONDecodeError, ValueError):
-        # ValueError includes JSONSizeError, JSONDepthError, JSONComplexityError
-        # RegexTimeoutError indicates potential ReDoS attack
-        return None
+        payload = text[content_start:end].strip()
+        if payload.startswith("{"):
+            try:
+                result = parse_json_secure(payload)
+            except ValueError:
+                # ValueError includes JSONDecodeError, JSONSizeError,
+                # JSONDepthError and JSONComplexityError
+                result = None
+            # Ensure we return a dict, not other JSON types
+            if isinstance(result, dict):
+                return result
+        begin = text.find(BEGIN_MARKER, end + len(END_MARKER))
+    return None
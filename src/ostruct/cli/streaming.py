@@ -0,0 +1,341 @@
+"""Streaming Responses API output with incremental JSON emission.
+
+With ``--stream`` the structured output request is made with
+``stream=True``. Text deltas are fed to an incremental JSON parser (ijson)
+as they arrive, and each completed top-level field of the output object is
+written to stdout as a JSONL record once it validates against that field's
+schema. Fields holding arrays are emitted item by item, so consumers can
+start on the first items while the model is still generating the rest.
+
+Records look like::
+
+    {"type": "item", "field": "findings", "index": 0, "value": {...}}
+    {"type": "field", "field": "summary", "value": "..."}
+    {"type": "result", "value": {...}}
+
+The ``result`` record carries the complete output after the full
+``model_validate``; it is only written when no output file is given.
+Early records are a preview: if the full output later fails validation the
+run still fails, and records already written are not retracted.
+"""
+
+import json
+import logging
+import sys
+import time
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterable,
+    Dict,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+import ijson  # type: ignore[import-untyped]
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio used when the API reports no usage
+CHARS_PER_TOKEN = 4
+
+_SCALAR_EVENTS = frozenset(
+    ("null", "boolean", "integer", "double", "number", "string")
+)
+
+
+class StreamError(Exception):
+    """Raised when a streamed response fails or ends without a response."""
+
+
+@dataclass
+class StreamStats:
+    """Timing and throughput of a streamed response."""
+
+    started: float = 0.0
+    first_token: Optional[float] = None
+    finished: Optional[float] = None
+    output_tokens: int = 0
+    records_emitted: int = 0
+
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        """Seconds from sending the request to the first text delta."""
+        if self.first_token is None:
+            return None
+        return self.first_token - self.started
+
+    @property
+    def tokens_per_second(self) -> Optional[float]:
+        """Output tokens per second after the first token arrived."""
+        if self.first_token is None or self.finished is None:
+            return None
+        elapsed = self.finished - self.first_token
+        if elapsed <= 0:
+            return None
+        return self.output_tokens / elapsed
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the stats as a dictionary for reporting."""
+        return {
+            "time_to_first_token": self.time_to_first_token,
+            "tokens_per_second": self.tokens_per_second,
+            "output_tokens": self.output_tokens,
+            "records_emitted": self.records_emitted,
+        }
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    """Strip ``Optional[...]`` from a type annotation."""
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+class IncrementalJSONEmitter:
+    """Parse a JSON object incrementally and emit its top-level values.
+
+    Text is fed in chunks. Completed top-level fields, and the items of
+    top-level array fields, are validated against the output model's field
+    types and written as JSONL records. Anything that is not a JSON object,
+    or that fails to parse, stops emission; the caller still parses and
+    validates the complete text.
+    """
+
+    def __init__(self, output_schema: Type[BaseModel], out: TextIO) -> None:
+        """Initialize the emitter.
+
+        Args:
+            output_schema: Pydantic model the complete output must match
+            out: Stream JSONL records are written to
+        """
+        self._out = out
+        # Field adapter, plus an item adapter for fields holding lists
+        self._adapters: Dict[
+            str, Tuple[TypeAdapter[Any], Optional[TypeAdapter[Any]]]
+        ] = {}
+        for name, field in output_schema.model_fields.items():
+            annotation = _unwrap_optional(field.annotation)
+            item_adapter: Optional[TypeAdapter[Any]] = None
+            if get_origin(annotation) in (list, List) and get_args(annotation):
+                item_adapter = TypeAdapter(get_args(annotation)[0])
+            self._adapters[field.alias or name] = (
+                TypeAdapter(field.annotation),
+                item_adapter,
+            )
+        self.records_emitted = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Start over with a fresh parser, e.g. for a new message item."""
+        self._events: List[Tuple[str, Any]] = ijson.sendable_list()
+        self._parser = ijson.basic_parse_coro(self._events, use_float=True)
+        self._active = True
+        self._depth = 0
+        self._key: Optional[str] = None
+        self._in_array = False
+        self._index = 0
+        self._builder: Optional[Any] = None
+
+    def stop(self) -> None:
+        """Stop emitting records for the rest of the response."""
+        self._active = False
+
+    def feed(self, text: str) -> None:
+        """Parse the next chunk of text and emit any completed values.
+
+        Args:
+            text: Next chunk of the response text
+        """
+        if not self._active or not text:
+            return
+        error: Optional[Exception] = None
+        try:
+            self._parser.send(text.encode("utf-8"))
+        except ijson.JSONError as e:
+            error = e
+        # Values completed before a syntax error are still emitted
+        events = list(self._events)
+        del self._events[:]
+        for event, value in events:
+            if not self._active:
+                break
+            self._handle(event, value)
+        if error is not None:
+            logger.debug("Stopping incremental JSON emission: %s", error)
+            self._active = False
+
+    def _handle(self, event: str, value: Any) -> None:
+        """Advance the state machine by one parser event."""
+        if self._builder is not None:
+            self._builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                self._depth += 1
+            elif event in ("end_map", "end_array"):
+                self._depth -= 1
+            if self._depth == (2 if self._in_array else 1):
+                built = self._builder.value
+                self._builder = None
+                self._complete(built)
+            return
+
+        if self._depth == 0:
+            if event == "start_map":
+                self._depth = 1
+            else:
+                # Not an object at the root; nothing to emit field by field
+                self._active = False
+            return
+
+        if self._depth == 1 and not self._in_array:
+            if event == "map_key":
+                self._key = value
+            elif event == "start_array" and self._is_list_field():
+                self._in_array = True
+                self._index = 0
+                self._depth = 2
+            elif event in ("start_map", "start_array"):
+                self._start_builder(event, value)
+            elif event in _SCALAR_EVENTS:
+                self._complete(value)
+            elif event == "end_map":
+                self._depth = 0
+                self._active = False
+            return
+
+        # Inside a top-level array field
+        if event == "end_array":
+            self._in_array = False
+            self._depth = 1
+        elif event in ("start_map", "start_array"):
+            self._start_builder(event, value)
+        elif event in _SCALAR_EVENTS:
+            self._complete(value)
+
+    def _is_list_field(self) -> bool:
+        entry = self._adapters.get(self._key or "")
+        return entry is not None and entry[1] is not None
+
+    def _start_builder(self, event: str, value: Any) -> None:
+        self._builder = ijson.ObjectBuilder()
+        self._builder.event(event, value)
+        self._depth += 1
+
+    def _complete(self, value: Any) -> None:
+        """Validate a completed value and write its record."""
+        key = self._key or ""
+        entry = self._adapters.get(key)
+        if entry is None:
+            return
+        field_adapter, item_adapter = entry
+        record: Dict[str, Any]
+        if self._in_array and item_adapter is not None:
+            adapter = item_adapter
+            record = {"type": "item", "field": key, "index": self._index}
+            self._index += 1
+        else:
+            adapter = field_adapter
+            record = {"type": "field", "field": key}
+        try:
+            adapter.validate_python(value)
+        except ValidationError as e:
+            logger.debug("Not emitting %s early: %s", key, e)
+            return
+        record["value"] = value
+        self.write(record)
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Write one JSONL record and flush it."""
+        self._out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._out.flush()
+        self.records_emitted += 1
+
+
+class StreamingOutput:
+    """Consume a streamed Responses API call and emit output early."""
+
+    def __init__(
+        self, output_schema: Type[BaseModel], out: Optional[TextIO] = None
+    ) -> None:
+        """Initialize streaming output.
+
+        Args:
+            output_schema: Pydantic model the complete output must match
+            out: Stream JSONL records are written to (default: stdout)
+        """
+        self.emitter = IncrementalJSONEmitter(output_schema, out or sys.stdout)
+        self.stats = StreamStats()
+
+    async def consume(self, stream: AsyncIterable[Any]) -> Any:
+        """Read response events until the response completes.
+
+        Args:
+            stream: Event stream returned by ``responses.create(stream=True)``
+
+        Returns:
+            The final response object
+
+        Raises:
+            StreamError: If the response fails or the stream ends early
+        """
+        self.stats.started = time.perf_counter()
+        final_response = None
+        text_length = 0
+        current_item: Optional[str] = None
+
+        async for event in stream:
+            event_type = getattr(event, "type", "")
+            if event_type == "response.output_text.delta":
+                if self.stats.first_token is None:
+                    self.stats.first_token = time.perf_counter()
+                item_id = getattr(event, "item_id", None)
+                if item_id != current_item:
+                    # A later message supersedes commentary from an earlier
+                    # one, unless the earlier one was already emitted
+                    if current_item is not None:
+                        if self.emitter.records_emitted:
+                            self.emitter.stop()
+                        else:
+                            self.emitter.reset()
+                    current_item = item_id
+                text_length += len(event.delta)
+                self.emitter.feed(event.delta)
+            elif event_type in ("response.completed", "response.incomplete"):
+                final_response = event.response
+            elif event_type == "response.failed":
+                error = getattr(event.response, "error", None)
+                message = getattr(error, "message", None) or "unknown error"
+                raise StreamError(f"Streamed response failed: {message}")
+            elif event_type == "error":
+                raise StreamError(
+                    f"Streamed response failed: {getattr(event, 'message', '')}"
+                )
+
+        self.stats.finished = time.perf_counter()
+        if final_response is None:
+            raise StreamError("Response stream ended before completion")
+
+        usage = getattr(final_response, "usage", None)
+        output_tokens = getattr(usage, "output_tokens", None)
+        self.stats.output_tokens = (
+            output_tokens
+            if isinstance(output_tokens, int)
+            else text_length // CHARS_PER_TOKEN
+        )
+        self.stats.records_emitted = self.emitter.records_emitted
+        return final_response
+
+    def write_result(self, result: BaseModel) -> None:
+        """Write the fully validated output as the final record."""
+        self.emitter.write(
+            {"type": "result", "value": result.model_dump(mode="json")}
+        )
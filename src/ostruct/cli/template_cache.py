@@ -0,0 +1,275 @@
+"""Persistent compiled-template cache for Jinja environments.
+
+Compiling a large template (lexing, parsing, generating Python source and
+compiling it) costs far more than rendering it, and every CLI invocation
+used to compile the same template twice: once for validation and once for
+rendering. ``TemplateBytecodeCache`` stores the compiled code of each
+template in the ostruct cache directory, keyed by a hash of the template
+source, its name, the ostruct and Jinja versions and the environment
+settings that affect code generation. The validation and rendering
+environments share those settings, so they share cache entries, and a
+template is compiled at most once per change.
+
+The cache is attached to every environment built by ``create_jinja_env``
+and covers templates loaded through a loader as well as templates compiled
+from strings with ``compile_template``. Compiled code is also kept in
+memory for the rest of the process. Disable it with
+``template.bytecode_cache: false`` (or ``OSTRUCT_TEMPLATE_CACHE=false``).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from types import CodeType
+from typing import Dict, Optional
+
+import jinja2
+from jinja2.bccache import Bucket, BytecodeCache
+from jinja2.utils import _PassArg
+
+from .cache_utils import ensure_cache_dir_exists, get_default_cache_dir
+
+logger = logging.getLogger(__name__)
+
+
+def get_default_template_cache_dir() -> Path:
+    """Get default directory for compiled template bytecode."""
+    return get_default_cache_dir() / "templates"
+
+
+def _ostruct_version() -> str:
+    try:
+        from .. import __version__
+
+        return str(__version__)
+    except ImportError:
+        return "unknown"
+
+
+def environment_fingerprint(environment: jinja2.Environment) -> str:
+    """Describe the environment settings that change generated code.
+
+    Args:
+        environment: Jinja environment templates are compiled for
+
+    Returns:
+        JSON string of the relevant settings
+    """
+    autoescape = environment.autoescape
+    finalize = environment.finalize
+    # Filters and tests that take the context, eval context or environment
+    # as first argument are called differently by the generated code
+    pass_args = [
+        sorted(
+            (name, pass_arg.name)
+            for name, func in functions.items()
+            if (pass_arg := _PassArg.from_obj(func))  # type: ignore[type-var]
+            is not None
+        )
+        for functions in (environment.filters, environment.tests)
+    ]
+    return json.dumps(
+        [
+            type(environment).__module__,
+            type(environment).__qualname__,
+            environment.block_start_string,
+            environment.block_end_string,
+            environment.variable_start_string,
+            environment.variable_end_string,
+            environment.comment_start_string,
+            environment.comment_end_string,
+            environment.line_statement_prefix,
+            environment.line_comment_prefix,
+            environment.trim_blocks,
+            environment.lstrip_blocks,
+            environment.newline_sequence,
+            environment.keep_trailing_newline,
+            environment.optimized,
+            environment.is_async,
+            autoescape if isinstance(autoescape, bool) else repr(autoescape),
+            None if finalize is None else getattr(finalize, "__name__", ""),
+            sorted(environment.extensions),
+            pass_args,
+        ]
+    )
+
+
+class TemplateBytecodeCache(BytecodeCache):
+    """Jinja bytecode cache keyed by template content.
+
+    Entries are written atomically, one file per compiled template. Read
+    and write failures are logged and otherwise ignored, so a broken or
+    read-only cache directory only costs a recompile.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding the compiled templates
+        """
+        self.directory = Path(directory)
+        self._memory: Dict[str, CodeType] = {}
+        self._lock = threading.Lock()
+        self._directory_ready = False
+
+    def get_bucket(
+        self,
+        environment: jinja2.Environment,
+        name: Optional[str],
+        filename: Optional[str],
+        source: str,
+    ) -> Bucket:
+        """Return the bucket for a template, filled in if it is cached."""
+        payload = json.dumps(
+            [
+                _ostruct_version(),
+                jinja2.__version__,
+                environment_fingerprint(environment),
+                name,
+                filename,
+            ]
+        )
+        key = hashlib.sha256(
+            payload.encode("utf-8") + b"\0" + source.encode("utf-8")
+        ).hexdigest()
+        bucket = Bucket(environment, key, key)
+        self.load_bytecode(bucket)
+        return bucket
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.jbc"
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        """Fill a bucket from memory or disk."""
+        with self._lock:
+            code = self._memory.get(bucket.key)
+        if code is not None:
+            bucket.code = code
+            return
+        try:
+            with open(self._path(bucket.key), "rb") as f:
+                bucket.load_bytecode(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.debug("Ignoring unreadable template cache entry: %s", e)
+            bucket.reset()
+            return
+        if bucket.code is not None:
+            with self._lock:
+                self._memory[bucket.key] = bucket.code
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        """Store a freshly compiled bucket in memory and on disk."""
+        if bucket.code is None:
+            return
+        with self._lock:
+            self._memory[bucket.key] = bucket.code
+        try:
+            if not self._directory_ready:
+                ensure_cache_dir_exists(self.directory)
+                self._directory_ready = True
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    bucket.write_bytecode(f)
+                os.replace(tmp_name, self._path(bucket.key))
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except Exception as e:
+            logger.debug("Could not write template cache entry: %s", e)
+
+    def clear(self) -> None:
+        """Remove all cached templates from memory and disk."""
+        with self._lock:
+            self._memory.clear()
+        try:
+            entries = list(self.directory.glob("*.jbc"))
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+
+
+_shared_cache: Optional[TemplateBytecodeCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_template_cache() -> Optional[TemplateBytecodeCache]:
+    """Get the shared template bytecode cache if enabled.
+
+    The cache is on by default and controlled by ``template.bytecode_cache``
+    (or OSTRUCT_TEMPLATE_CACHE). It is created once per process.
+
+    Returns:
+        Shared TemplateBytecodeCache, or None when disabled
+    """
+    global _shared_cache
+    try:
+        from .config import get_config
+
+        template_config = get_config().template
+    except Exception as e:
+        logger.debug(f"Template cache disabled: {e}")
+        return None
+    if not template_config.bytecode_cache:
+        return None
+
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            cache_dir = (
+                Path(template_config.bytecode_cache_dir).expanduser()
+                if template_config.bytecode_cache_dir
+                else get_default_template_cache_dir()
+            )
+            _shared_cache = TemplateBytecodeCache(cache_dir)
+        return _shared_cache
+
+
+def reset_template_cache() -> None:
+    """Forget the shared cache; the next access recreates it from config."""
+    global _shared_cache
+    with _shared_cache_lock:
+        _shared_cache = None
+
+
+def compile_template(
+    environment: jinja2.Environment, source: str
+) -> jinja2.Template:
+    """Create a template from a string, like ``Environment.from_string``.
+
+    Jinja only consults the bytecode cache for templates loaded through a
+    loader; this routes string templates through it as well.
+
+    Args:
+        environment: Environment to compile the template for
+        source: Template source
+
+    Returns:
+        Template bound to ``environment``
+
+    Raises:
+        jinja2.TemplateSyntaxError: If the template is invalid
+    """
+    cache = environment.bytecode_cache
+    if not isinstance(cache, TemplateBytecodeCache):
+        return environment.from_string(source)
+
+    bucket = cache.get_bucket(environment, None, None, source)
+    code = bucket.code
+    if code is None:
+        code = environment.compile(source)
+        bucket.code = code
+        cache.set_bucket(bucket)
+    return environment.template_class.from_code(
+        environment, code, environment.make_globals(None), None
+    )
@@ -13,6 +13,7 @@
 from jinja2.ext import Extension
 from jinja2.sandbox import SandboxedEnvironment
 
+from .template_cache import get_template_cache
 from .template_extensions import CommentExtension
 from .template_filters import (
     AliasManager,
@@ -33,7 +34,8 @@ def create_jinja_env(
     """Create a consistently configured Jinja2 environment.
 
     Args:
-        undefined: Custom undefined class to use. Defaults to StrictUndefined.
+        undefined: Custom undefined class to use. Defaults to TrackingUndefined,
+            which is StrictUndefined unless undefined uses are being collected.
         loader: Template loader to use. Defaults to None.
         validation_mode: Whether to configure the environment for validation (uses SafeUndefined).
         debug_mode: Whether to enable debug features like undefined variable detection.
@@ -48,7 +50,9 @@ def create_jinja_env(
 
         undefined = SafeUndefined
     elif undefined is None:
-        undefined = jinja2.StrictUndefined
+        from .template_validation import TrackingUndefined
+
+        undefined = TrackingUndefined
 
         # Configure extensions based on debug mode
     extensions: List[Union[str, Type[Extension]]] = [
@@ -69,6 +73,7 @@ def create_jinja_env(
         lstrip_blocks=True,
         keep_trailing_newline=True,
         extensions=extensions,
+        bytecode_cache=get_template_cache(),
     )
 
     # Register all template filters
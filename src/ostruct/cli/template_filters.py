@@ -20,13 +20,14 @@
     Union,
 )
 
-import tiktoken
 from jinja2 import Environment, TemplateRuntimeError, pass_context
 from pygments import highlight
 from pygments.formatters import HtmlFormatter, NullFormatter, TerminalFormatter
 from pygments.lexers import TextLexer, get_lexer_by_name, guess_lexer
 from pygments.util import ClassNotFound
 
+from .token_utils import get_encoder
+
 if TYPE_CHECKING:
     from .upload_cache import UploadCache
 
@@ -48,6 +49,16 @@ def __init__(self, message: str, suggestions: Optional[List[str]] = None):
         self.suggestions = suggestions or []
 
 
+def _has_attributes(value: Any) -> bool:
+    """Check whether a value is an object with attribute fields.
+
+    Slotted classes such as FileInfo have no ``__dict__``.
+    """
+    return hasattr(value, "__dict__") or bool(
+        getattr(type(value), "__slots__", None)
+    )
+
+
 def format_tses_error(error: TemplateStructureError) -> str:
     """Format TSES error with suggestions."""
     lines = [f"Template Structure Error: {error}"]
@@ -618,7 +629,7 @@ def safe_get(context: Any, *args: Any) -> Any:
             suggestions.append(
                 "For collections, iterate first: {% for item in collection %}"
             )
-        elif hasattr(path, "__dict__"):
+        elif _has_attributes(path):
             suggestions.append(
                 "For objects, use dot notation in quotes: safe_get('object.attribute', 'default')"
             )
@@ -695,8 +706,7 @@ def estimate_tokens(context: Any, text: str) -> int:
     """Estimate number of tokens in text."""
     try:
         # Use o200k_base encoding for token estimation
-        encoding = tiktoken.get_encoding("o200k_base")
-        return len(encoding.encode(str(text)))
+        return len(get_encoder("gpt-4o").encode(str(text)))
     except Exception as e:
         logger.warning(f"Failed to estimate tokens: {e}")
         return len(str(text).split())
@@ -876,7 +886,7 @@ def summarize(
         return {"total_records": 0, "fields": {}}
 
     # Validate data type
-    if not isinstance(data[0], dict) and not hasattr(data[0], "__dict__"):
+    if not isinstance(data[0], dict) and not _has_attributes(data[0]):
         raise TypeError("Data items must be dictionaries or objects")
 
     def get_field_value(item: Any, field: str) -> Any:
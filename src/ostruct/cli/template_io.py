@@ -59,16 +59,13 @@
 
 from jinja2 import Environment
 
-from .cache_manager import FileCache
+from .cache_manager import get_file_cache
 from .file_utils import FileInfo
 from .progress import ProgressContext
 from .security import SecurityManager
 
 logger = logging.getLogger(__name__)
 
-# Global cache instance
-_file_cache = FileCache()
-
 
 def read_file(
     file_path: str,
@@ -136,7 +133,7 @@ def read_file(
             size = stats.st_size
 
             # Check if file is in cache and up to date
-            cache_entry = _file_cache.get(abs_path, mtime_ns, size)
+            cache_entry = get_file_cache().get(abs_path, mtime_ns, size)
 
             if cache_entry is not None:
                 logger.debug(
@@ -172,7 +169,7 @@ def read_file(
                 file_info.encoding,
                 file_info.hash,
             )
-            _file_cache.put(
+            get_file_cache().put(
                 abs_path,
                 file_info.content,
                 file_info.encoding,
@@ -25,6 +25,7 @@
 from .file_utils import FileInfoList
 from .path_utils import validate_path_mapping
 from .security import SecurityManager
+from .template_cache import compile_template
 from .template_debug import (
     TDCap,
     is_capacity_active,
@@ -58,7 +59,7 @@ def _render_template_with_debug(
         Rendered template string
     """
     # Simple template rendering without optimization
-    template = env.from_string(template_content)
+    template = compile_template(env, template_content)
     return template.render(**context)
 
 
@@ -133,7 +134,7 @@ def process_system_prompt(
             raise SystemPromptError(f"Invalid system prompt file: {e}") from e
 
         try:
-            template = env.from_string(cli_system_prompt)
+            template = compile_template(env, cli_system_prompt)
             base_prompt = template.render(**template_context).strip()
         except jinja2.TemplateError as e:
             raise SystemPromptError(f"Error rendering system prompt: {e}")
@@ -143,7 +144,7 @@ def process_system_prompt(
 
     elif system_prompt is not None:
         try:
-            template = env.from_string(system_prompt)
+            template = compile_template(env, system_prompt)
             base_prompt = template.render(**template_context).strip()
         except jinja2.TemplateError as e:
             raise SystemPromptError(f"Error rendering system prompt: {e}")
@@ -187,8 +188,8 @@ def process_system_prompt(
                                         metadata["system_prompt"]
                                     )
                                     try:
-                                        template = env.from_string(
-                                            template_system_prompt
+                                        template = compile_template(
+                                            env, template_system_prompt
                                         )
                                         message_parts.append(
                                             template.render(
@@ -621,13 +622,13 @@ def _build_tool_context(
     Returns:
         Dictionary with tool enablement and configuration context
     """
-    from .config import OstructConfig
+    from .config import get_config
 
     context: Dict[str, Any] = {}
 
     # Load configuration
     config_path = args.get("config")
-    config = OstructConfig.load(config_path)  # type: ignore[arg-type]
+    config = get_config(config_path)  # type: ignore[arg-type]
 
     # Universal tool toggle overrides
     enabled_tools: set[str] = args.get("_enabled_tools", set())  # type: ignore[assignment]
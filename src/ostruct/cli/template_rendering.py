@@ -65,8 +65,14 @@
 from .errors import TaskTemplateVariableError, TemplateValidationError
 from .file_utils import FileInfo
 from .progress import ProgressContext
+from .template_cache import compile_template
 from .template_env import create_jinja_env
 from .template_schema import DotDict, StdinProxy
+from .template_validation import (
+    TrackingUndefined,
+    collect_undefined,
+    undefined_variable_error,
+)
 
 __all__ = [
     "create_jinja_env",
@@ -130,6 +136,17 @@ def _extract_variable_name_from_jinja_error(error_message: str) -> str:
     return "unknown_variable"
 
 
+def _template_source(template_str: str) -> str:
+    """Return the template source for a template string or file name."""
+    if template_str.endswith((".j2", ".jinja2", ".md")):
+        try:
+            with open(template_str, "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return ""
+    return template_str
+
+
 def render_template(
     template_str: str,
     context: Dict[str, Any],
@@ -224,7 +241,7 @@ def render_template(
                     template_str,
                 )
                 try:
-                    template = env.from_string(template_str)
+                    template = compile_template(env, template_str)
 
                     # Add debug log for loop rendering
                     def debug_file_render(f: FileInfo) -> Any:
@@ -319,7 +336,20 @@ def debug_file_render(f: FileInfo) -> Any:
                         f"Template size validation failed: {e}"
                     ) from e
 
-                result = template.render(**wrapped_context)
+                # With a tracking environment, the real render also collects
+                # every undefined use, so all missing variables are reported
+                # from this single pass
+                if issubclass(env.undefined, TrackingUndefined):
+                    with collect_undefined() as undefined_uses:
+                        result = template.render(**wrapped_context)
+                    if undefined_uses:
+                        raise undefined_variable_error(
+                            _template_source(template_str),
+                            undefined_uses,
+                            set(context.keys()),
+                        )
+                else:
+                    result = template.render(**wrapped_context)
                 if not isinstance(result, str):
                     raise TemplateValidationError(
                         f"Template rendered to non-string type: {type(result)}"
@@ -344,6 +374,8 @@ def debug_file_render(f: FileInfo) -> Any:
                 if progress:
                     progress.update(1)
                 return result
+            except TaskTemplateVariableError:
+                raise
             except jinja2.UndefinedError as e:
                 # Extract variable name from error message
                 var_name = _extract_variable_name_from_jinja_error(str(e))
@@ -26,6 +26,11 @@
     TaskTemplateVariableError,
 )
 from .file_utils import FileInfo
+from .schema_utils import (
+    is_schema_validated,
+    mark_schema_validated,
+    schema_fingerprint,
+)
 from .template_io import extract_metadata, extract_template_metadata, read_file
 from .template_rendering import DotDict, render_template
 from .template_schema import (
@@ -55,6 +60,14 @@ def validate_json_schema(schema: Dict[str, Any]) -> None:
     Raises:
         SchemaValidationError: If the schema is invalid
     """
+    # Schemas that already passed validation in this process are not
+    # checked against the meta-schema again
+    fingerprint = (
+        schema_fingerprint(schema) if isinstance(schema, dict) else None
+    )
+    if is_schema_validated(fingerprint):
+        return
+
     try:
         # 1. Quick structural validation
         if not isinstance(schema, dict):
@@ -231,6 +244,8 @@ def check_refs(
             },
         )
 
+    mark_schema_validated(fingerprint)
+
 
 def validate_response(
     response: Dict[str, Any], schema: Dict[str, Any]
@@ -7,7 +7,9 @@
 
 Key Components:
     - SafeUndefined: Custom undefined type for validation
-    - validate_template_placeholders: Main validation function
+    - TrackingUndefined: Strict undefined type that records uses while rendering
+    - validate_template_placeholders: Main validation function (dry run, no real
+      context required)
 
 Examples:
     Basic template validation:
@@ -52,10 +54,13 @@
 
 import logging
 import re
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import (
     Any,
     Callable,
     Dict,
+    Iterator,
     List,
     Optional,
     Set,
@@ -67,8 +72,10 @@
 import jinja2
 from jinja2 import meta
 from jinja2.nodes import For, Name, Node
+from jinja2.utils import missing as jinja_missing
 
 from .errors import TaskTemplateVariableError, TemplateValidationError
+from .template_cache import compile_template
 from .template_env import create_jinja_env
 from .template_error_analysis import TemplateErrorAnalyzer
 from .template_filters import (
@@ -97,6 +104,9 @@
     "TemplateValidationError",
     "validate_template_placeholders",
     "validate_template_file",
+    "TrackingUndefined",
+    "collect_undefined",
+    "undefined_variable_error",
 ]
 
 
@@ -118,6 +128,163 @@ def __getitem__(self, key: Any) -> Any:
         )
 
 
+# Undefined values used during the current render, keyed by error message
+_undefined_collector: ContextVar[Optional[Dict[str, "TrackingUndefined"]]] = (
+    ContextVar("ostruct_undefined_collector", default=None)
+)
+
+
+def _tracked(fallback: Callable[["TrackingUndefined"], Any]) -> Any:
+    """Build an Undefined method that records the use instead of failing."""
+
+    def method(self: "TrackingUndefined", *args: Any, **kwargs: Any) -> Any:
+        if self._record():
+            return fallback(self)
+        return self._fail_with_undefined_error()
+
+    return method
+
+
+class TrackingUndefined(jinja2.StrictUndefined):
+    """A strict Undefined class that can report every missing variable.
+
+    Outside ``collect_undefined`` it behaves exactly like StrictUndefined.
+    Inside it, each use that StrictUndefined would reject is recorded and the
+    value acts as empty, so one render with the real context finds all
+    missing variables. The caller discards the output if anything was
+    recorded.
+    """
+
+    __slots__ = ()
+
+    def _record(self) -> bool:
+        collector = _undefined_collector.get()
+        if collector is None:
+            return False
+        collector.setdefault(self._undefined_message, self)
+        return True
+
+    def __getattr__(self, name: str) -> Any:
+        if name[:2] == "__":
+            raise AttributeError(name)
+        if self._record():
+            return self
+        return self._fail_with_undefined_error()
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        if self._record():
+            return id(type(self))
+        return self._fail_with_undefined_error()
+
+    __str__ = _tracked(lambda self: "")
+    __iter__ = _tracked(lambda self: iter(()))
+    __len__ = _tracked(lambda self: 0)
+    __bool__ = _tracked(lambda self: False)
+    __contains__ = _tracked(lambda self: False)
+    __eq__ = _tracked(lambda self: False)
+    __ne__ = _tracked(lambda self: True)
+    __lt__ = __le__ = __gt__ = __ge__ = _tracked(lambda self: False)
+    __int__ = _tracked(lambda self: 0)
+    __float__ = _tracked(lambda self: 0.0)
+    __complex__ = _tracked(lambda self: 0j)
+    __getitem__ = __call__ = _tracked(lambda self: self)
+    __add__ = __radd__ = __sub__ = __rsub__ = _tracked(lambda self: self)
+    __mul__ = __rmul__ = __div__ = __rdiv__ = _tracked(lambda self: self)
+    __truediv__ = __rtruediv__ = _tracked(lambda self: self)
+    __floordiv__ = __rfloordiv__ = _tracked(lambda self: self)
+    __mod__ = __rmod__ = __pow__ = __rpow__ = _tracked(lambda self: self)
+    __pos__ = __neg__ = _tracked(lambda self: self)
+
+
+@contextmanager
+def collect_undefined() -> Iterator[Dict[str, TrackingUndefined]]:
+    """Record TrackingUndefined uses instead of raising on the first one.
+
+    Yields:
+        Dictionary of recorded undefined values keyed by error message,
+        filled in while the block runs
+    """
+    collected: Dict[str, TrackingUndefined] = {}
+    token = _undefined_collector.set(collected)
+    try:
+        yield collected
+    finally:
+        _undefined_collector.reset(token)
+
+
+def _missing_variables_message(
+    template: str, missing: Set[str], available_vars: Set[str]
+) -> str:
+    """Describe missing top-level variables with enhanced analysis."""
+    analyzer = TemplateErrorAnalyzer()
+
+    # Handle the first missing variable with enhanced analysis
+    primary_missing = sorted(missing)[0]
+    error_context = analyzer.analyze_missing_variable_error(
+        template, primary_missing, available_vars
+    )
+
+    enhanced_message = analyzer.generate_enhanced_error_message(error_context)
+
+    # If there are multiple missing variables, add them to the message
+    if len(missing) > 1:
+        other_missing = sorted(missing)[1:]
+        enhanced_message += (
+            f"\n\nAdditional missing variables: {', '.join(other_missing)}"
+        )
+    return enhanced_message
+
+
+def undefined_variable_error(
+    template: str,
+    undefined: Dict[str, TrackingUndefined],
+    available_vars: Set[str],
+) -> TaskTemplateVariableError:
+    """Build the error for undefined values recorded during a render.
+
+    Args:
+        template: Template source, used to locate references
+        undefined: Values recorded by ``collect_undefined``
+        available_vars: Names defined in the render context
+
+    Returns:
+        TaskTemplateVariableError describing every recorded problem
+    """
+    missing = set()
+    other_problems = []
+    for message, value in undefined.items():
+        if (
+            value._undefined_hint is None
+            and value._undefined_obj is jinja_missing
+            and value._undefined_name is not None
+        ):
+            missing.add(value._undefined_name)
+        else:
+            other_problems.append(message)
+
+    if missing:
+        primary = sorted(missing)[0]
+        error_msg = (
+            f"Missing required template variable: {primary}\n\n"
+            + _missing_variables_message(template, missing, available_vars)
+        )
+    else:
+        var_name = _extract_variable_name_from_jinja_error(other_problems[0])
+        error_msg = (
+            f"Missing required template variable: {var_name}\n"
+            f"Available variables: {', '.join(sorted(available_vars))}\n"
+            "To fix this, please provide the variable using:\n"
+            f"  -V {var_name}='value'"
+        )
+        other_problems = other_problems[1:]
+
+    if other_problems:
+        error_msg += "\n\nOther undefined values:\n" + "\n".join(
+            f"  - {problem}" for problem in other_problems
+        )
+    return TaskTemplateVariableError(error_msg)
+
+
 def safe_filter(func: FilterFunc) -> FilterWrapper:
     """Wrap a filter function to handle None and proxy values safely."""
 
@@ -364,23 +531,9 @@ def validate_template_placeholders(
 
         if missing:
             # Use enhanced error analysis for better error messages
-            analyzer = TemplateErrorAnalyzer()
-
-            # For now, handle the first missing variable with enhanced analysis
-            primary_missing = sorted(missing)[0]
-            error_context = analyzer.analyze_missing_variable_error(
-                template, primary_missing, available_vars
-            )
-
-            enhanced_message = analyzer.generate_enhanced_error_message(
-                error_context
+            enhanced_message = _missing_variables_message(
+                template, missing, available_vars
             )
-
-            # If there are multiple missing variables, add them to the message
-            if len(missing) > 1:
-                other_missing = sorted(missing)[1:]
-                enhanced_message += f"\n\nAdditional missing variables: {', '.join(other_missing)}"
-
             raise TaskTemplateVariableError(enhanced_message)
 
         logger.debug(
@@ -403,7 +556,7 @@ def validate_template_placeholders(
 
         # 4) Try to render with validation context
         try:
-            env.from_string(template).render(validation_context)
+            compile_template(env, template).render(validation_context)
         except jinja2.UndefinedError as e:
             # Convert Jinja2 undefined errors to TaskTemplateVariableError with helpful message
             var_name = _extract_variable_name_from_jinja_error(str(e))
@@ -1,10 +1,56 @@
 """Token estimation utilities."""
 
+from functools import lru_cache
 from typing import Any, Dict, List, Union
 
 import tiktoken
 
 
+def get_encoding_name(model: str) -> str:
+    """Get the tiktoken encoding name used for a model.
+
+    Args:
+        model: Model name
+
+    Returns:
+        Encoding name (o200k_base for gpt-4o and o-series, else cl100k_base)
+    """
+    if model.startswith(("gpt-4o", "o1", "o3")):
+        return "o200k_base"
+    return "cl100k_base"
+
+
+@lru_cache(maxsize=None)
+def _load_encoding(name: str) -> tiktoken.Encoding:
+    """Load a tiktoken encoding once per process."""
+    return tiktoken.get_encoding(name)
+
+
+def get_encoder(model: str) -> tiktoken.Encoding:
+    """Get the process-wide tiktoken encoder for a model.
+
+    Args:
+        model: Model name
+
+    Returns:
+        Cached tiktoken encoding
+    """
+    return _load_encoding(get_encoding_name(model))
+
+
+def count_tokens(text: str, model: str) -> int:
+    """Count tokens in text using the model's cached encoder.
+
+    Args:
+        text: Text to encode
+        model: Model name
+
+    Returns:
+        Number of tokens
+    """
+    return len(get_encoder(model).encode(text))
+
+
 def estimate_tokens_with_encoding(
     messages: Union[str, Dict[str, str], List[Dict[str, str]]],
     model: str,
@@ -21,11 +67,7 @@ def estimate_tokens_with_encoding(
         int: Estimated token count
     """
     if encoder is None:
-        # Use o200k_base for gpt-4o and o1 models
-        if model.startswith(("gpt-4o", "o1", "o3")):
-            encoder = tiktoken.get_encoding("o200k_base")
-        else:
-            encoder = tiktoken.get_encoding("cl100k_base")
+        encoder = get_encoder(model)
 
     if isinstance(messages, str):
         return len(encoder.encode(messages))
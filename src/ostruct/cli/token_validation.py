@@ -2,12 +2,43 @@
 
 import logging
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
 
 import tiktoken
 
 from .errors import PromptTooLargeError
+from .token_utils import get_encoder
+
+# Files above this many tokens get explicit routing guidance
+OVERSIZED_FILE_TOKENS = 5000
+
+
+@dataclass
+class TokenUsage:
+    """Token count of a rendered prompt with per-file attribution.
+
+    Attributes:
+        total_tokens: Tokens in the rendered prompt
+        file_tokens: Tokens contributed by each template file, by path
+    """
+
+    total_tokens: int
+    file_tokens: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def oversized_files(self) -> List[Tuple[str, int]]:
+        """Files above OVERSIZED_FILE_TOKENS, largest first."""
+        return sorted(
+            (
+                (path, tokens)
+                for path, tokens in self.file_tokens.items()
+                if tokens > OVERSIZED_FILE_TOKENS
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )
 
 
 class TokenLimitValidator:
@@ -26,23 +57,113 @@ def __init__(self, model: str = "gpt-4o"):
 
     def _get_encoder(self, model: str) -> tiktoken.Encoding:
         """Get appropriate tiktoken encoder for model."""
-        if model.startswith(("gpt-4o", "o1", "o3")):
-            return tiktoken.get_encoding("o200k_base")
-        else:
-            return tiktoken.get_encoding("cl100k_base")
+        return get_encoder(model)
+
+    def count_prompt_tokens(
+        self,
+        template_content: str,
+        template_files: List[str],
+        file_contents: Optional[Mapping[str, Optional[str]]] = None,
+    ) -> TokenUsage:
+        """Count prompt tokens once and attribute them to template files.
+
+        The rendered content already embeds whatever file content the
+        template used, so only it contributes to the total. File counts are
+        attribution for routing guidance and reporting.
+
+        Args:
+            template_content: Rendered template content
+            template_files: List of file paths included in template
+            file_contents: Already-loaded content by path. When given, it is
+                authoritative: a path mapped to None (or missing) was not
+                embedded and counts as zero. When omitted, files are read.
+
+        Returns:
+            TokenUsage with the total and per-file breakdown
+        """
+        if file_contents is not None:
+            return self._count_embedded_tokens(
+                template_content, template_files, file_contents
+            )
+
+        usage = TokenUsage(self._count_template_tokens(template_content))
+        for file_path in template_files:
+            try:
+                usage.file_tokens[file_path] = self._count_file_tokens(
+                    file_path
+                )
+            except (OSError, IOError):
+                # Skip files that can't be read for token counting
+                continue
+
+        return usage
+
+    def _count_embedded_tokens(
+        self,
+        template_content: str,
+        template_files: List[str],
+        file_contents: Mapping[str, Optional[str]],
+    ) -> TokenUsage:
+        """Encode the prompt once, split at the file content it embeds.
+
+        Each file found verbatim in the prompt is encoded as its own segment
+        of it, so its count comes out of the prompt's single pass. Only
+        content the template changed before embedding (or that overlaps
+        another file's segment) is encoded separately. Merges across a
+        segment boundary are lost, so the total can differ from an unsplit
+        encode by about a token per embedded file.
+        """
+        counts: Dict[str, int] = {}
+        spans: List[Tuple[int, int, str]] = []
+        for file_path in template_files:
+            content = file_contents.get(file_path)
+            if not content:
+                counts[file_path] = 0
+                continue
+            start = template_content.find(content)
+            if start < 0:
+                counts[file_path] = self._count_template_tokens(content)
+            else:
+                spans.append((start, start + len(content), file_path))
+
+        total = 0
+        position = 0
+        for start, end, file_path in sorted(spans):
+            if start < position:
+                content = template_content[start:end]
+                counts[file_path] = self._count_template_tokens(content)
+                continue
+            gap = self._count_template_tokens(template_content[position:start])
+            counts[file_path] = self._count_template_tokens(
+                template_content[start:end]
+            )
+            total += gap + counts[file_path]
+            position = end
+        total += self._count_template_tokens(template_content[position:])
+
+        return TokenUsage(
+            total,
+            {file_path: counts[file_path] for file_path in template_files},
+        )
 
     def validate_prompt_size(
         self,
         template_content: str,
         template_files: List[str],
         context_limit: Optional[int] = None,
-    ) -> None:
+        file_contents: Optional[Mapping[str, Optional[str]]] = None,
+    ) -> TokenUsage:
         """Check if prompt will exceed context window and provide actionable guidance.
 
         Args:
             template_content: Rendered template content
             template_files: List of file paths included in template
             context_limit: Optional custom context limit (defaults to MAX_TOKENS)
+            file_contents: Already-loaded file content by path, see
+                count_prompt_tokens
+
+        Returns:
+            TokenUsage for the prompt
 
         Raises:
             PromptTooLargeError: If prompt exceeds context window with actionable guidance
@@ -50,20 +171,10 @@ def validate_prompt_size(
         logger = logging.getLogger(__name__)
 
         limit = context_limit or self.MAX_TOKENS
-        total_tokens = self._count_template_tokens(template_content)
-
-        oversized_files = []
-        for file_path in template_files:
-            try:
-                file_tokens = self._count_file_tokens(file_path)
-                total_tokens += file_tokens
-
-                # Flag files over 5K tokens for routing guidance
-                if file_tokens > 5000:
-                    oversized_files.append((file_path, file_tokens))
-            except (OSError, IOError):
-                # Skip files that can't be read for token counting
-                continue
+        usage = self.count_prompt_tokens(
+            template_content, template_files, file_contents
+        )
+        total_tokens = usage.total_tokens
 
         # Add 90% warning threshold
         if total_tokens > limit * 0.9:
@@ -75,7 +186,11 @@ def validate_prompt_size(
             )
 
         if total_tokens > limit:
-            self._raise_actionable_error(total_tokens, limit, oversized_files)
+            self._raise_actionable_error(
+                total_tokens, limit, usage.oversized_files
+            )
+
+        return usage
 
     def _count_template_tokens(self, content: str) -> int:
         """Count tokens in template content."""
@@ -288,7 +403,8 @@ def validate_token_limits(
     template_files: List[str],
     model: str,
     context_limit: Optional[int] = None,
-) -> None:
+    file_contents: Optional[Mapping[str, Optional[str]]] = None,
+) -> TokenUsage:
     """Convenience function for token limit validation.
 
     Args:
@@ -296,11 +412,15 @@ def validate_token_limits(
         template_files: List of file paths included in template
         model: Model name for encoding selection
         context_limit: Optional custom context limit
+        file_contents: Already-loaded file content by path
+
+    Returns:
+        TokenUsage for the prompt
 
     Raises:
         PromptTooLargeError: If prompt exceeds context window
     """
     validator = TokenLimitValidator(model)
-    validator.validate_prompt_size(
-        template_content, template_files, context_limit
+    return validator.validate_prompt_size(
+        template_content, template_files, context_limit, file_contents
     )
@@ -31,6 +31,7 @@ class CLIParams(TypedDict, total=False):
     model: str
     timeout: float
     output_file: Optional[str]
+    stream: bool
     dry_run: bool
     api_key: Optional[str]
     verbose: bool
@@ -45,7 +46,10 @@ class CLIParams(TypedDict, total=False):
     progress: str
     task_file: Optional[str]
     task: Optional[str]
-    schema_file: str
+    schema_file: Optional[str]
+    schema: Optional[
+        Dict[str, Any]
+    ]  # Inline schema, used instead of schema_file
     mcp_servers: List[str]
 
     # New attachment system (T3.0)
@@ -94,5 +98,8 @@ class CLIParams(TypedDict, total=False):
     # Template processing configuration
     max_file_size: Optional[int]
 
+    # Upload configuration
+    upload_concurrency: Optional[int]
+
     # Internal fields (set during execution)
     _effective_download_strategy: str
@@ -1,18 +1,59 @@
 """Upload cache for persistent file upload tracking."""
 
+import asyncio
 import hashlib
 import json
 import logging
+import os
 import sqlite3
 import threading
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from .config import UploadConfig
 
 logger = logging.getLogger(__name__)
 
+# Files modified this recently are not added to the stat index: a write
+# landing within the same mtime tick as the index entry would go unnoticed.
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+# An upsert rather than INSERT OR REPLACE: replacing deletes the old row,
+# which would cascade to the file's vector store mappings
+_INSERT_FILE_SQL = """
+    INSERT INTO files
+    (hash, file_id, algo, size, mtime, created_at, last_accessed, metadata, path)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(hash) DO UPDATE SET
+        file_id = excluded.file_id,
+        algo = excluded.algo,
+        size = excluded.size,
+        mtime = excluded.mtime,
+        created_at = excluded.created_at,
+        last_accessed = excluded.last_accessed,
+        metadata = excluded.metadata,
+        path = excluded.path
+"""
+
+_INSERT_STAT_SQL = """
+    INSERT OR REPLACE INTO file_stats
+    (path, algo, dev, inode, size, mtime_ns, hash, indexed_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 @dataclass
 class CachedFileInfo:
@@ -26,6 +67,18 @@ class CachedFileInfo:
     metadata: Optional[Dict[str, Any]] = None
 
 
+@dataclass
+class CacheEntry:
+    """A file upload record to be written to the cache."""
+
+    file_hash: str
+    file_id: str
+    size: int
+    mtime: int
+    metadata: Optional[Dict[str, Any]] = None
+    file_path: Optional[str] = None
+
+
 def generate_label(file_hash: str, label_style: str = "alpha") -> str:
     """Generate deterministic label for a file hash.
 
@@ -55,16 +108,37 @@ def generate_label(file_hash: str, label_style: str = "alpha") -> str:
 class UploadCache:
     """Persistent cache for tracking uploaded files by content hash."""
 
-    def __init__(self, cache_path: Path, hash_algo: str = "sha256") -> None:
-        """Initialize cache with database path and hash algorithm."""
+    def __init__(
+        self,
+        cache_path: Path,
+        hash_algo: str = "sha256",
+        paranoid: bool = False,
+    ) -> None:
+        """Initialize cache with database path and hash algorithm.
+
+        Args:
+            cache_path: Path to the SQLite cache database
+            hash_algo: Hash algorithm used to identify file content
+            paranoid: Always hash file content instead of trusting the
+                stat-keyed index for unchanged files
+        """
         self.cache_path = Path(cache_path)
         self.hash_algo = hash_algo
-        self._ensure_db_exists()
+        self.paranoid = paranoid
 
         # Add thread-safe locking for cache operations
         self._lock = threading.RLock()
         self._file_locks: Dict[str, threading.RLock] = {}
 
+        # Per-run hash memo keyed by (device, inode, mtime_ns, size)
+        self._hash_memo: Dict[Tuple[int, int, int, int], str] = {}
+
+        # One long-lived connection per thread, opened lazily
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+
+        self._ensure_db_exists()
+
     def _get_file_lock(self, file_hash: str) -> threading.RLock:
         """Get or create a per-file lock to prevent race conditions."""
         with self._lock:
@@ -79,9 +153,6 @@ def _ensure_db_exists(self) -> None:
 
         try:
             with self._get_connection() as conn:
-                conn.execute("PRAGMA journal_mode = WAL")
-                conn.execute("PRAGMA foreign_keys = ON")
-
                 # Create base table with all columns for new databases
                 conn.execute(
                     """
@@ -133,14 +204,12 @@ def _ensure_db_exists(self) -> None:
                 logger.warning(f"[cache] Database corruption detected: {e}")
                 logger.info("[cache] Recreating corrupted database")
 
-                # Remove corrupted database file
+                # Drop pooled connections and remove corrupted database file
+                self.close()
                 self.cache_path.unlink()
 
                 # Recreate database
                 with self._get_connection() as conn:
-                    conn.execute("PRAGMA journal_mode = WAL")
-                    conn.execute("PRAGMA foreign_keys = ON")
-
                     conn.execute(
                         """
                         CREATE TABLE files (
@@ -172,22 +241,89 @@ def _ensure_db_exists(self) -> None:
         # Add new tables for vector store support (automatic migration)
         self._add_vector_store_tables()
 
+        # Add stat index table for hash-free lookups (automatic migration)
+        self._add_stat_index_table()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's pooled connection, opening it on first use."""
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is None:
+            # check_same_thread=False only so close() can run from any
+            # thread; each connection is otherwise used by its own thread
+            conn = sqlite3.connect(
+                str(self.cache_path),
+                timeout=30.0,
+                check_same_thread=False,
+                cached_statements=256,
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA foreign_keys = ON")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
     @contextmanager
     def _get_connection(self) -> Any:
-        """Get database connection with proper transaction handling."""
-        conn = sqlite3.connect(str(self.cache_path), timeout=30.0)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode = WAL")
+        """Get database connection with proper transaction handling.
+
+        The connection is reused across calls on the same thread, so its
+        prepared statement cache stays warm. Uncommitted work is rolled
+        back on exit, as it was when each call closed its own connection.
+        """
+        conn = self._connect()
         try:
             yield conn
         except Exception:
             conn.rollback()
             raise
         finally:
-            conn.close()
+            if conn.in_transaction:
+                conn.rollback()
+
+    def close(self) -> None:
+        """Close all pooled database connections."""
+        with self._lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections.clear()
+            self._local = threading.local()
 
     def compute_file_hash(self, file_path: Path) -> str:
-        """Compute hash of file contents with optimized buffering."""
+        """Compute hash of file contents, memoized for the life of the cache.
+
+        The memo is keyed by (device, inode, mtime_ns, size), so each file is
+        read at most once per run however many callers need its hash.
+        Paranoid mode bypasses the memo.
+        """
+        if self.paranoid:
+            return self._hash_contents(file_path)
+
+        key = self._memo_key(file_path)
+        file_hash = self._hash_memo.get(key)
+        if file_hash is None:
+            file_hash = self._hash_contents(file_path)
+            # Only memoize if the file did not change while being read
+            if self._memo_key(file_path) == key:
+                self._hash_memo[key] = file_hash
+        return file_hash
+
+    async def compute_file_hash_async(self, file_path: Path) -> str:
+        """Compute a file hash on a worker thread, off the event loop."""
+        return await asyncio.to_thread(self.compute_file_hash, file_path)
+
+    @staticmethod
+    def _memo_key(file_path: Path) -> Tuple[int, int, int, int]:
+        """Build the hash memo key (device, inode, mtime_ns, size)."""
+        st = os.stat(file_path)
+        return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _hash_contents(self, file_path: Path) -> str:
+        """Hash file contents with optimized buffering."""
         hasher = hashlib.new(self.hash_algo)
 
         # Use larger buffer for better I/O performance
@@ -203,6 +339,139 @@ def compute_file_hash(self, file_path: Path) -> str:
 
         return hasher.hexdigest()
 
+    @staticmethod
+    def _stat_key(file_path: Path) -> Tuple[str, int, int, int, int]:
+        """Build the stat index key (path, device, inode, size, mtime_ns)."""
+        resolved = Path(file_path).resolve()
+        st = os.stat(resolved)
+        return (
+            str(resolved),
+            st.st_dev,
+            st.st_ino,
+            st.st_size,
+            st.st_mtime_ns,
+        )
+
+    def lookup_by_stat(self, file_path: Path) -> Optional[Tuple[str, str]]:
+        """Look up (hash, file_id) for an unchanged file without reading it.
+
+        The stat index only maps a file's identity to a content hash; the
+        hash-keyed ``files`` table stays the source of truth, so entries whose
+        upload was invalidated no longer match. Always returns None in
+        paranoid mode.
+
+        Args:
+            file_path: Path to the local file
+
+        Returns:
+            Tuple of (file hash, file_id) or None if not indexed/changed
+        """
+        if self.paranoid:
+            return None
+
+        try:
+            path_str, dev, inode, size, mtime_ns = self._stat_key(file_path)
+            with self._get_connection() as conn:
+                result = conn.execute(
+                    """
+                    SELECT s.hash, f.file_id FROM file_stats s
+                    JOIN files f ON f.hash = s.hash AND f.algo = s.algo
+                    WHERE s.path = ? AND s.algo = ? AND s.dev = ?
+                      AND s.inode = ? AND s.size = ? AND s.mtime_ns = ?
+                    """,
+                    (path_str, self.hash_algo, dev, inode, size, mtime_ns),
+                ).fetchone()
+
+                if result:
+                    logger.debug(
+                        f"[cache] Stat hit: {file_path} -> {result['file_id']}"
+                    )
+                    return (str(result["hash"]), str(result["file_id"]))
+
+                logger.debug(f"[cache] Stat miss: {file_path}")
+                return None
+        except Exception as e:
+            logger.debug(f"[cache] Stat lookup failed for {file_path}: {e}")
+            return None
+
+    def record_stat(self, file_path: Path, file_hash: str) -> None:
+        """Index a file's stat identity against its content hash.
+
+        Files modified within the last couple of seconds are skipped, since
+        a further write in the same mtime tick would not change the key.
+
+        Args:
+            file_path: Path to the local file
+            file_hash: Content hash of the file as currently on disk
+        """
+        try:
+            row = self._stat_row(file_path, file_hash)
+            if row is None:
+                return
+
+            with self._get_connection() as conn:
+                conn.execute(_INSERT_STAT_SQL, row)
+                conn.commit()
+                logger.debug(
+                    f"[cache] Indexed stat: {file_path} -> {file_hash[:8]}..."
+                )
+        except Exception as e:
+            logger.debug(f"[cache] Failed to index stat for {file_path}: {e}")
+
+    def _stat_row(
+        self, file_path: Path, file_hash: str
+    ) -> Optional[Tuple[Any, ...]]:
+        """Build a file_stats row, or None if the file is too fresh to index."""
+        path_str, dev, inode, size, mtime_ns = self._stat_key(file_path)
+        if time.time_ns() - mtime_ns < RACY_MTIME_WINDOW_NS:
+            logger.debug(
+                f"[cache] Not indexing recently modified file {file_path}"
+            )
+            return None
+        return (
+            path_str,
+            self.hash_algo,
+            dev,
+            inode,
+            size,
+            mtime_ns,
+            file_hash,
+            int(time.time()),
+        )
+
+    def lookup_file(self, file_path: Path) -> Tuple[str, Optional[str]]:
+        """Resolve a local file to its content hash and cached file_id.
+
+        Uses the stat index to skip hashing unchanged files, falling back to
+        a full content hash plus :meth:`lookup_with_validation`.
+
+        Args:
+            file_path: Path to the local file
+
+        Returns:
+            Tuple of (file hash, cached file_id or None on cache miss)
+        """
+        stat_hit = self.lookup_by_stat(file_path)
+        if stat_hit:
+            return stat_hit
+
+        file_hash = self.compute_file_hash(file_path)
+        file_id = self.lookup_with_validation(file_path, file_hash)
+        if file_id:
+            # Index validated hits so the next run skips hashing
+            self.record_stat(file_path, file_hash)
+        return file_hash, file_id
+
+    async def lookup_file_async(
+        self, file_path: Path
+    ) -> Tuple[str, Optional[str]]:
+        """Run :meth:`lookup_file` on a worker thread, off the event loop.
+
+        hashlib releases the GIL while hashing, so several files can be
+        hashed in parallel by concurrent uploads.
+        """
+        return await asyncio.to_thread(self.lookup_file, file_path)
+
     def lookup(self, file_hash: str) -> Optional[str]:
         """Look up file_id by hash. Returns None if not found."""
         try:
@@ -236,68 +505,112 @@ def store(
         label_style: str = "alpha",
     ) -> None:
         """Store file upload record in cache with label generation (thread-safe)."""
-        # Use per-file locking to prevent race conditions
-        file_lock = self._get_file_lock(file_hash)
+        self.store_many(
+            [
+                CacheEntry(
+                    file_hash=file_hash,
+                    file_id=file_id,
+                    size=size,
+                    mtime=mtime,
+                    metadata=metadata,
+                    file_path=file_path,
+                )
+            ],
+            label_style=label_style,
+        )
 
-        with file_lock:
-            try:
-                if metadata is None:
-                    metadata = {}
+    def store_many(
+        self, entries: Sequence[CacheEntry], label_style: str = "alpha"
+    ) -> None:
+        """Store several upload records in a single transaction (thread-safe).
 
-                # Normalize file path to absolute path for consistent storage
-                normalized_path = ""
-                if file_path:
-                    try:
-                        normalized_path = str(Path(file_path).resolve())
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to resolve path {file_path}: {e}"
-                        )
-                        normalized_path = file_path
-
-                # Generate label if not already present
-                if "label" not in metadata:
-                    if label_style == "filename" and file_path:
-                        base_label = Path(file_path).stem
-                        # Handle collisions by checking existing labels
-                        existing_labels = self._get_existing_labels()
-                        final_label = base_label
-                        collision_count = 0
-                        while final_label in existing_labels:
-                            collision_count += 1
-                            final_label = f"{base_label}-{collision_count}"
-                        metadata["label"] = final_label
-                    else:
-                        metadata["label"] = generate_label(
-                            file_hash, label_style
-                        )
+        Args:
+            entries: Upload records to store
+            label_style: "alpha" or "filename" label generation
+        """
+        if not entries:
+            return
 
-                    metadata["label_style"] = label_style
+        with self._lock:
+            try:
+                current_time = int(time.time())
+                existing_labels: Optional[Set[str]] = None
+                file_rows = []
+                stat_rows = []
 
-                with self._get_connection() as conn:
-                    conn.execute("BEGIN IMMEDIATE")
-                    current_time = int(time.time())
-                    conn.execute(
-                        """
-                        INSERT OR REPLACE INTO files
-                        (hash, file_id, algo, size, mtime, created_at, last_accessed, metadata, path)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+                for entry in entries:
+                    metadata = dict(entry.metadata) if entry.metadata else {}
+
+                    # Normalize file path to absolute path for consistent storage
+                    normalized_path = ""
+                    if entry.file_path:
+                        try:
+                            normalized_path = str(
+                                Path(entry.file_path).resolve()
+                            )
+                        except Exception as e:
+                            logger.warning(
+                                f"Failed to resolve path {entry.file_path}: {e}"
+                            )
+                            normalized_path = entry.file_path
+
+                    # Generate label if not already present
+                    if "label" not in metadata:
+                        if label_style == "filename" and entry.file_path:
+                            if existing_labels is None:
+                                existing_labels = self._get_existing_labels()
+                            base_label = Path(entry.file_path).stem
+                            # Handle collisions by checking existing labels
+                            final_label = base_label
+                            collision_count = 0
+                            while final_label in existing_labels:
+                                collision_count += 1
+                                final_label = f"{base_label}-{collision_count}"
+                            existing_labels.add(final_label)
+                            metadata["label"] = final_label
+                        else:
+                            metadata["label"] = generate_label(
+                                entry.file_hash, label_style
+                            )
+
+                        metadata["label_style"] = label_style
+
+                    file_rows.append(
                         (
-                            file_hash,
-                            file_id,
+                            entry.file_hash,
+                            entry.file_id,
                             self.hash_algo,
-                            size,
-                            mtime,
+                            entry.size,
+                            entry.mtime,
                             current_time,
                             current_time,  # Set last_accessed to creation time
                             json.dumps(metadata) if metadata else None,
                             normalized_path,  # Store the normalized absolute path
-                        ),
+                        )
                     )
+
+                    if entry.file_path:
+                        try:
+                            stat_row = self._stat_row(
+                                Path(entry.file_path), entry.file_hash
+                            )
+                            if stat_row is not None:
+                                stat_rows.append(stat_row)
+                        except OSError as e:
+                            logger.debug(
+                                f"[cache] Cannot index stat for {entry.file_path}: {e}"
+                            )
+
+                with self._get_connection() as conn:
+                    conn.execute("BEGIN IMMEDIATE")
+                    conn.executemany(_INSERT_FILE_SQL, file_rows)
+                    if stat_rows:
+                        conn.executemany(_INSERT_STAT_SQL, stat_rows)
                     conn.commit()
+
+                for entry in entries:
                     logger.debug(
-                        f"[cache] Stored: {file_hash[:8]}... -> {file_id}"
+                        f"[cache] Stored: {entry.file_hash[:8]}... -> {entry.file_id}"
                     )
             except Exception as e:
                 logger.warning(f"[cache] Failed to store cache entry: {e}")
@@ -464,20 +777,29 @@ def invalidate_by_file_id(self, file_id: str) -> None:
 
     def update_last_accessed(self, file_id: str) -> None:
         """Update last accessed timestamp for LRU behavior."""
+        self.touch_many([file_id])
+
+    def touch_many(self, file_ids: Sequence[str]) -> None:
+        """Update last accessed timestamps for several files in one transaction."""
+        if not file_ids:
+            return
+
         try:
             with self._get_connection() as conn:
                 conn.execute("BEGIN IMMEDIATE")
                 # Use higher precision timestamp to avoid test timing issues
                 current_timestamp = time.time()
-                conn.execute(
+                conn.executemany(
                     "UPDATE files SET last_accessed = ? WHERE file_id = ?",
-                    (current_timestamp, file_id),
+                    [(current_timestamp, file_id) for file_id in file_ids],
                 )
                 conn.commit()
-                logger.debug(f"[cache] Updated last_accessed for {file_id}")
+                logger.debug(
+                    f"[cache] Updated last_accessed for {len(file_ids)} file(s)"
+                )
         except Exception as e:
             logger.warning(
-                f"[cache] Failed to update last_accessed for {file_id}: {e}"
+                f"[cache] Failed to update last_accessed for {len(file_ids)} file(s): {e}"
             )
 
     def get_stats(self) -> Dict[str, Any]:
@@ -618,6 +940,7 @@ def _add_vector_store_tables(self) -> None:
                         file_hash TEXT NOT NULL,
                         vector_store_id TEXT NOT NULL,
                         added_at INTEGER NOT NULL,
+                        file_id TEXT,
                         PRIMARY KEY (file_hash, vector_store_id),
                         FOREIGN KEY (file_hash) REFERENCES files(hash) ON DELETE CASCADE,
                         FOREIGN KEY (vector_store_id) REFERENCES vector_stores(vector_store_id) ON DELETE CASCADE
@@ -625,6 +948,18 @@ def _add_vector_store_tables(self) -> None:
                     """
                 )
 
+                # Add file_id column if it doesn't exist (proper migration)
+                try:
+                    conn.execute(
+                        "ALTER TABLE file_vector_store_mappings ADD COLUMN file_id TEXT"
+                    )
+                    logger.debug(
+                        "[cache] Added file_id column to vector store mappings"
+                    )
+                except sqlite3.OperationalError:
+                    # Column already exists, which is expected
+                    pass
+
                 # Create indexes (using IF NOT EXISTS for safety)
                 conn.execute(
                     "CREATE INDEX IF NOT EXISTS idx_vector_stores_name ON vector_stores(name)"
@@ -656,6 +991,33 @@ def _add_vector_store_tables(self) -> None:
             # Continue without vector store support - graceful degradation
             logger.info("[cache] Vector store features will be disabled")
 
+    def _add_stat_index_table(self) -> None:
+        """Add the stat-keyed hash index for automatic migration."""
+        try:
+            with self._get_connection() as conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS file_stats (
+                        path        TEXT NOT NULL,
+                        algo        TEXT NOT NULL,
+                        dev         INTEGER NOT NULL,
+                        inode       INTEGER NOT NULL,
+                        size        INTEGER NOT NULL,
+                        mtime_ns    INTEGER NOT NULL,
+                        hash        TEXT NOT NULL,
+                        indexed_at  INTEGER NOT NULL,
+                        PRIMARY KEY (path, algo)
+                    )
+                    """
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_file_stats_hash ON file_stats(hash)"
+                )
+                logger.debug("[cache] Stat index table created/verified")
+        except sqlite3.Error as e:
+            logger.warning(f"[cache] Failed to create stat index table: {e}")
+            # Continue without stat index - lookups fall back to hashing
+
     def _get_existing_labels(self) -> Set[str]:
         """Get all existing labels to detect collisions."""
         try:
@@ -793,15 +1155,23 @@ def register_vector_store(
         name: str,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
-        """Register a vector store in the cache."""
+        """Register a vector store in the cache.
+
+        Re-registering a known store updates it in place, keeping its file
+        mappings.
+        """
         try:
             with self._get_connection() as conn:
                 current_time = int(time.time())
                 conn.execute(
                     """
-                    INSERT OR REPLACE INTO vector_stores
+                    INSERT INTO vector_stores
                     (vector_store_id, name, created_at, last_used, metadata)
                     VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(vector_store_id) DO UPDATE SET
+                        name = excluded.name,
+                        last_used = excluded.last_used,
+                        metadata = excluded.metadata
                     """,
                     (
                         vector_store_id,
@@ -834,19 +1204,29 @@ def get_vector_store_by_name(self, name: str) -> Optional[str]:
             return None
 
     def add_file_to_vector_store(
-        self, file_hash: str, vector_store_id: str
+        self,
+        file_hash: str,
+        vector_store_id: str,
+        file_id: Optional[str] = None,
     ) -> None:
-        """Add a file to a vector store mapping."""
+        """Add a file to a vector store mapping.
+
+        Args:
+            file_hash: Content hash of the file
+            vector_store_id: Vector store holding the file
+            file_id: OpenAI file ID attached to the store, kept so the file
+                can be detached after its upload entry has expired
+        """
         try:
             with self._get_connection() as conn:
                 current_time = int(time.time())
                 conn.execute(
                     """
                     INSERT OR IGNORE INTO file_vector_store_mappings
-                    (file_hash, vector_store_id, added_at)
-                    VALUES (?, ?, ?)
+                    (file_hash, vector_store_id, added_at, file_id)
+                    VALUES (?, ?, ?, ?)
                     """,
-                    (file_hash, vector_store_id, current_time),
+                    (file_hash, vector_store_id, current_time, file_id),
                 )
                 # Update vector store last_used timestamp
                 conn.execute(
@@ -860,6 +1240,45 @@ def add_file_to_vector_store(
         except Exception as e:
             logger.warning(f"[cache] Failed to add file to vector store: {e}")
 
+    def remove_file_from_vector_store(
+        self, file_hash: str, vector_store_id: str
+    ) -> None:
+        """Remove a file from a vector store mapping."""
+        try:
+            with self._get_connection() as conn:
+                conn.execute(
+                    "DELETE FROM file_vector_store_mappings WHERE file_hash = ? AND vector_store_id = ?",
+                    (file_hash, vector_store_id),
+                )
+                conn.commit()
+                logger.debug(
+                    f"[cache] Removed file {file_hash[:8]}... from vector store {vector_store_id}"
+                )
+        except Exception as e:
+            logger.warning(
+                f"[cache] Failed to remove file from vector store: {e}"
+            )
+
+    def unregister_vector_store(self, vector_store_id: str) -> None:
+        """Forget a vector store and its file mappings."""
+        try:
+            with self._get_connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute(
+                    "DELETE FROM file_vector_store_mappings WHERE vector_store_id = ?",
+                    (vector_store_id,),
+                )
+                conn.execute(
+                    "DELETE FROM vector_stores WHERE vector_store_id = ?",
+                    (vector_store_id,),
+                )
+                conn.commit()
+                logger.debug(
+                    f"[cache] Unregistered vector store: {vector_store_id}"
+                )
+        except Exception as e:
+            logger.warning(f"[cache] Failed to unregister vector store: {e}")
+
     def get_files_in_vector_store(self, vector_store_id: str) -> List[str]:
         """Get all file hashes in a vector store."""
         try:
@@ -873,6 +1292,26 @@ def get_files_in_vector_store(self, vector_store_id: str) -> List[str]:
             logger.warning(f"[cache] Failed to get files in vector store: {e}")
             return []
 
+    def get_vector_store_file_ids(
+        self, vector_store_id: str
+    ) -> Dict[str, Optional[str]]:
+        """Get the attached file ID of each file hash in a vector store.
+
+        The file ID is None for mappings recorded without one.
+        """
+        try:
+            with self._get_connection() as conn:
+                results = conn.execute(
+                    "SELECT file_hash, file_id FROM file_vector_store_mappings WHERE vector_store_id = ?",
+                    (vector_store_id,),
+                ).fetchall()
+                return {row["file_hash"]: row["file_id"] for row in results}
+        except Exception as e:
+            logger.warning(
+                f"[cache] Failed to get file IDs in vector store: {e}"
+            )
+            return {}
+
     def list_vector_stores(self) -> List[Dict[str, Any]]:
         """List all vector stores with their metadata."""
         try:
@@ -907,3 +1346,29 @@ def list_vector_stores(self) -> List[Dict[str, Any]]:
         except Exception as e:
             logger.warning(f"[cache] Failed to list vector stores: {e}")
             return []
+
+
+def create_upload_cache(
+    upload_config: "UploadConfig",
+) -> Optional[UploadCache]:
+    """Open the upload cache described by the ``uploads`` configuration.
+
+    Args:
+        upload_config: Upload configuration section
+
+    Returns:
+        The configured cache, or None when the persistent cache is disabled
+    """
+    if not upload_config.persistent_cache:
+        return None
+
+    cache_path = (
+        Path(upload_config.cache_path).expanduser().resolve()
+        if upload_config.cache_path
+        else Path.home() / ".cache" / "ostruct" / "uploads.db"
+    )
+    return UploadCache(
+        cache_path=cache_path,
+        hash_algo=upload_config.hash_algorithm,
+        paranoid=upload_config.paranoid_hashing,
+    )
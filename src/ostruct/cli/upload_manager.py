@@ -30,6 +30,8 @@
 # Centralized constants
 from .constants import DefaultConfig
 from .errors import CLIError
+from .rate_limiter import rate_limited
+from .upload_cache import CacheEntry
 
 if TYPE_CHECKING:
     from .upload_cache import UploadCache
@@ -92,16 +94,26 @@ class SharedUploadManager:
     """
 
     def __init__(
-        self, client: AsyncOpenAI, cache: Optional["UploadCache"] = None
+        self,
+        client: AsyncOpenAI,
+        cache: Optional["UploadCache"] = None,
+        max_concurrency: int = DefaultConfig.UPLOAD_MAX_CONCURRENCY,
     ):
         """Initialize the shared upload manager.
 
         Args:
             client: AsyncOpenAI client for file operations
             cache: Optional upload cache for deduplication
+            max_concurrency: Maximum number of uploads in flight at once
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
         self.client = client
 
+        # Bound on concurrent uploads per upload_for_tool() call
+        self._max_concurrency = max_concurrency
+
         # Map file identity -> upload record
         self._uploads: Dict[Tuple[int, int], UploadRecord] = {}
 
@@ -118,6 +130,12 @@ def __init__(
         # Upload cache for deduplication (None = no caching)
         self._cache = cache
 
+        # Content hash for each upload ID (known when caching is enabled)
+        self._upload_hashes: Dict[str, str] = {}
+
+        # New uploads waiting to be written to the cache in one batch
+        self._pending_cache_entries: List[CacheEntry] = []
+
         # Cache statistics
         self._cache_hits: int = 0  # Number of times a cached file was reused
         self._cache_misses: int = (
@@ -339,6 +357,10 @@ def _register_remote_url(self, url: str, targets: Set[str]) -> None:
     async def upload_for_tool(self, tool: str) -> Dict[str, str]:
         """Upload all queued files for a specific tool.
 
+        Files are uploaded concurrently, with at most ``max_concurrency``
+        uploads in flight at once. Per-file locks still guarantee that a
+        file shared between tools is uploaded only once.
+
         Args:
             tool: Tool name ("code-interpreter" or "file-search")
 
@@ -351,55 +373,52 @@ async def upload_for_tool(self, tool: str) -> Dict[str, str]:
         if tool not in self._upload_queue:
             raise ValueError(f"Unknown tool: {tool}")
 
-        logger.debug(f"Processing uploads for {tool}")
-        uploaded = {}
+        logger.debug(
+            f"Processing uploads for {tool} "
+            f"(max concurrency: {self._max_concurrency})"
+        )
+        uploaded: Dict[str, str] = {}
         failed_uploads = []
 
-        for file_id in self._upload_queue[tool]:
-            record = self._uploads[file_id]
+        # Create locks up front so concurrent tasks never race on creation
+        queued_ids = list(self._upload_queue[tool])
+        for file_id in queued_ids:
+            if file_id not in self._upload_locks:
+                self._upload_locks[file_id] = asyncio.Lock()
 
-            try:
-                # Ensure we have a lock for this file
-                if file_id not in self._upload_locks:
-                    self._upload_locks[file_id] = asyncio.Lock()
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        tasks = [
+            asyncio.create_task(
+                self._upload_file_for_tool(file_id, tool, semaphore)
+            )
+            for file_id in queued_ids
+        ]
 
-                # Check if we need to clean up locks to prevent memory exhaustion
-                if len(self._upload_locks) > self._lock_cleanup_threshold:
-                    await self._cleanup_unused_locks()
+        completed = 0
+        for next_done in asyncio.as_completed(tasks):
+            record, error = await next_done
+            completed += 1
 
-                # Use per-file lock to prevent concurrent uploads
-                async with self._upload_locks[file_id]:
-                    if record.upload_id is None:
-                        # Determine purpose based on tool and whether it's user-data
-                        purpose: Literal["assistants", "user_data"] = (
-                            "user_data"
-                            if tool == "user-data"
-                            else "assistants"
-                        )
+            if error is not None or record.upload_id is None:
+                failed_uploads.append(
+                    (record.path, error or f"No upload ID for {record.path}")
+                )
+                continue
 
-                        # First upload for this file
-                        record.upload_id = await self._perform_upload(
-                            record.path, purpose=purpose
-                        )
-                        self._all_uploaded_ids.add(record.upload_id)
-                        logger.info(
-                            f"Uploaded {record.path} -> {record.upload_id}"
-                        )
-                    else:
-                        logger.debug(
-                            f"Reusing upload {record.upload_id} for {record.path}"
-                        )
+            uploaded[str(record.path)] = record.upload_id
+            record.tools_completed.add(tool)
+            record.tools_pending.discard(tool)
+            logger.debug(
+                f"[upload] {tool}: {completed}/{len(tasks)} done "
+                f"({record.path})"
+            )
 
-                uploaded[str(record.path)] = record.upload_id
-                record.tools_completed.add(tool)
-                record.tools_pending.discard(tool)
+        # Record successful uploads even if some others failed
+        await self.flush_cache_writes()
 
-            except UploadError as e:
-                # UploadError already has user-friendly message, don't duplicate logging
-                failed_uploads.append((record.path, str(e)))
-            except Exception as e:
-                logger.error(f"Failed to upload {record.path} for {tool}: {e}")
-                failed_uploads.append((record.path, str(e)))
+        # Check if we need to clean up locks to prevent memory exhaustion
+        if len(self._upload_locks) > self._lock_cleanup_threshold:
+            await self._cleanup_unused_locks()
 
         if failed_uploads:
             # If we have user-friendly error messages, present them cleanly
@@ -428,6 +447,61 @@ async def upload_for_tool(self, tool: str) -> Dict[str, str]:
         logger.debug(f"Completed {len(uploaded)} uploads for {tool}")
         return uploaded
 
+    async def _upload_file_for_tool(
+        self,
+        file_id: Tuple[int, int],
+        tool: str,
+        semaphore: asyncio.Semaphore,
+    ) -> Tuple[UploadRecord, Optional[str]]:
+        """Upload a single queued file for a tool, bounded by a semaphore.
+
+        Args:
+            file_id: File identity tuple of the queued file
+            tool: Tool name the file is being uploaded for
+            semaphore: Semaphore bounding concurrent uploads
+
+        Returns:
+            Tuple of (upload record, error message or None on success)
+        """
+        record = self._uploads[file_id]
+
+        try:
+            async with semaphore:
+                # Use per-file lock to prevent concurrent uploads
+                lock = self._upload_locks.setdefault(file_id, asyncio.Lock())
+                async with lock:
+                    if record.upload_id is None:
+                        # Determine purpose based on tool and whether it's user-data
+                        purpose: Literal["assistants", "user_data"] = (
+                            "user_data"
+                            if tool == "user-data"
+                            else "assistants"
+                        )
+
+                        # First upload for this file
+                        record.upload_id = await self._perform_upload(
+                            record.path, purpose=purpose
+                        )
+                        record.file_hash = self._upload_hashes.get(
+                            record.upload_id
+                        )
+                        self._all_uploaded_ids.add(record.upload_id)
+                        logger.info(
+                            f"Uploaded {record.path} -> {record.upload_id}"
+                        )
+                    else:
+                        logger.debug(
+                            f"Reusing upload {record.upload_id} for {record.path}"
+                        )
+            return record, None
+
+        except UploadError as e:
+            # UploadError already has user-friendly message, don't duplicate logging
+            return record, str(e)
+        except Exception as e:
+            logger.error(f"Failed to upload {record.path} for {tool}: {e}")
+            return record, str(e)
+
     async def _perform_upload(
         self,
         file_path: Union[str, Path],
@@ -504,11 +578,9 @@ async def _perform_upload(
             # Check cache first if available
             if self._cache:
                 try:
-                    file_hash = self._cache.compute_file_hash(
-                        Path(file_path)
-                    )  # Only once
-                    cached_file_id = self._cache.lookup_with_validation(
-                        Path(file_path), file_hash
+                    # Stat index skips hashing for unchanged files
+                    file_hash, cached_file_id = (
+                        await self._cache.lookup_file_async(Path(file_path))
                     )
                     if cached_file_id:
                         # Report cache hit to the user via progress reporter
@@ -562,6 +634,7 @@ async def _perform_upload(
 
                         # Update cache statistics
                         self._cache_hits += 1
+                        self._upload_hashes[cached_file_id] = file_hash
 
                         logger.debug(
                             f"[upload] Using cached file: {file_path} -> {cached_file_id}"
@@ -577,31 +650,34 @@ async def _perform_upload(
 
             # Upload file with specified purpose
             with open(file_path, "rb") as f:
-                file_obj = await self.client.files.create(
-                    file=f, purpose=purpose
-                )
+                async with rate_limited("files"):
+                    file_obj = await self.client.files.create(
+                        file=f, purpose=purpose
+                    )
                 logger.debug(
                     f"[upload] Successfully uploaded {file_path} as {file_obj.id}"
                 )
+            self._report_upload_complete(file_path, file_obj.id)
 
-            # Store in cache if available (reuse computed hash)
+            # Queue for the cache (reuse computed hash); written in one
+            # transaction by flush_cache_writes()
             if self._cache and file_hash:  # Reuse existing hash
+                self._upload_hashes[file_obj.id] = file_hash
                 try:
                     file_stat = Path(file_path).stat()
-                    self._cache.store(
-                        file_hash,  # Use previously computed hash
-                        file_obj.id,
-                        file_size,
-                        int(file_stat.st_mtime),
-                        {"purpose": "assistants"},
-                        file_path=str(file_path),  # Pass file path for storage
-                    )
-                    logger.debug(
-                        f"[upload] Stored in cache: {file_path} -> {file_obj.id}"
+                    self._pending_cache_entries.append(
+                        CacheEntry(
+                            file_hash=file_hash,  # Use previously computed hash
+                            file_id=file_obj.id,
+                            size=file_size,
+                            mtime=int(file_stat.st_mtime),
+                            metadata={"purpose": purpose},
+                            file_path=str(file_path),
+                        )
                     )
                 except Exception as cache_err:
                     logger.debug(
-                        f"[upload] Failed to store file in cache: {cache_err}"
+                        f"[upload] Failed to queue file for cache: {cache_err}"
                     )
 
             return file_obj.id
@@ -612,6 +688,51 @@ async def _perform_upload(
             user_friendly_error = self._parse_upload_error(Path(file_path), e)
             raise UploadError(user_friendly_error)
 
+    async def flush_cache_writes(self) -> None:
+        """Write queued upload records to the cache in a single transaction.
+
+        Called automatically at the end of ``upload_for_tool``. Callers that
+        use ``_perform_upload`` directly must call it before relying on the
+        cache entries (e.g. to update their metadata).
+        """
+        if not self._cache or not self._pending_cache_entries:
+            return
+
+        entries, self._pending_cache_entries = (
+            self._pending_cache_entries,
+            [],
+        )
+        self._cache.store_many(entries)
+        logger.debug(f"[upload] Stored {len(entries)} uploads in cache")
+
+    def _report_upload_complete(
+        self, file_path: Union[str, Path], upload_id: str
+    ) -> None:
+        """Report a finished upload to the user via the progress reporter.
+
+        Args:
+            file_path: Path of the uploaded file
+            upload_id: OpenAI file ID assigned to the upload
+        """
+        try:
+            import click
+
+            from .progress_reporting import get_progress_reporter
+
+            reporter = get_progress_reporter()
+            if reporter.should_report:  # pragma: no cover
+                if reporter.detailed:
+                    click.echo(
+                        f"⬆️  Uploaded {file_path} ({upload_id})", err=True
+                    )
+                else:
+                    click.echo(
+                        f"✔ {Path(file_path).name} (uploaded)", err=True
+                    )
+        except Exception:  # pragma: no cover
+            # Never fail upload because of progress reporting
+            pass
+
     def _parse_upload_error(self, file_path: Path, error: Exception) -> str:
         """Parse OpenAI upload errors into user-friendly messages.
 
@@ -731,7 +852,8 @@ async def cleanup_uploads(self, ttl_days: Optional[int] = None) -> None:
             for file_id in self._all_uploaded_ids:
                 try:
                     logger.debug(f"[upload] Deleting file: {file_id}")
-                    await self.client.files.delete(file_id)
+                    async with rate_limited("files"):
+                        await self.client.files.delete(file_id)
                     logger.debug(f"[upload] Successfully deleted: {file_id}")
                 except Exception as e:
                     logger.warning(f"[upload] Failed to delete {file_id}: {e}")
@@ -751,13 +873,12 @@ async def cleanup_uploads(self, ttl_days: Optional[int] = None) -> None:
                             f"[upload] Preserving cached file: {file_id}"
                         )
                         preserved_files.add(file_id)
-                        # Update last accessed for LRU behavior
-                        self._cache.update_last_accessed(file_id)
                         continue
 
                     # Delete the file
                     logger.debug(f"[upload] Deleting file: {file_id}")
-                    await self.client.files.delete(file_id)
+                    async with rate_limited("files"):
+                        await self.client.files.delete(file_id)
                     logger.debug(f"[upload] Successfully deleted: {file_id}")
 
                 except Exception as e:
@@ -772,6 +893,9 @@ async def cleanup_uploads(self, ttl_days: Optional[int] = None) -> None:
                             f"[upload] Failed to delete {file_id}: {e}"
                         )
 
+            # Update last accessed for LRU behavior in one transaction
+            self._cache.touch_many(sorted(preserved_files))
+
         # Only clear deleted files, keep preserved ones for future cleanup
         self._all_uploaded_ids = preserved_files
 
@@ -815,6 +939,23 @@ def get_files_for_tool(self, tool: str) -> List[str]:
 
         return file_ids
 
+    def get_file_hashes_for_tool(self, tool: str) -> Dict[str, str]:
+        """Get content hashes of the files uploaded for a tool.
+
+        Args:
+            tool: Tool name ("code-interpreter" or "file-search")
+
+        Returns:
+            Mapping of OpenAI file ID to content hash. Files whose hash is
+            unknown (no upload cache) are omitted.
+        """
+        hashes = {}
+        for file_id in self._upload_queue.get(tool, set()):
+            record = self._uploads[file_id]
+            if record.upload_id and record.file_hash:
+                hashes[record.upload_id] = record.file_hash
+        return hashes
+
     async def _cleanup_unused_locks(self) -> None:
         """Clean up unused upload locks to prevent memory leaks."""
         logger.debug(
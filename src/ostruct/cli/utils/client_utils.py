@@ -4,10 +4,11 @@
 import os
 from typing import Optional
 
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from ..errors import CLIError
 from ..exit_codes import ExitCode
+from ..rate_limiter import rate_limit_event_hooks
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +45,9 @@ def create_openai_client(
 ) -> AsyncOpenAI:
     """Create and validate an AsyncOpenAI client instance.
 
+    The client's responses are reported to the shared rate limiter so it
+    can adapt to the ``x-ratelimit-*`` headers and 429 responses.
+
     Args:
         api_key: Optional API key (falls back to OPENAI_API_KEY env var).
         timeout: Requested timeout in seconds.
@@ -61,7 +65,13 @@ def create_openai_client(
     # We know the key exists now, so get it again
     effective_key = _get_effective_api_key(api_key)
     effective_timeout = min(timeout, max_timeout)
-    return AsyncOpenAI(api_key=effective_key, timeout=effective_timeout)
+    return AsyncOpenAI(
+        api_key=effective_key,
+        timeout=effective_timeout,
+        http_client=DefaultAsyncHttpxClient(
+            event_hooks=rate_limit_event_hooks()
+        ),
+    )
 
 
 def validate_api_key_availability(
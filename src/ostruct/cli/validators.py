@@ -318,6 +318,51 @@ def validate_variable_mapping(
         raise
 
 
+def validate_schema_data(
+    schema_data: Any, source: str = "<inline>"
+) -> Dict[str, Any]:
+    """Validate the structure of a loaded schema.
+
+    Args:
+        schema_data: Parsed schema, either wrapped in a "schema" key or direct
+        source: Where the schema came from, for error messages
+
+    Returns:
+        Dictionary containing the schema data
+
+    Raises:
+        SchemaFileError: If the schema structure is invalid
+    """
+    if not isinstance(schema_data, dict):
+        raise SchemaFileError(
+            f"Schema file must contain a JSON object, got {type(schema_data).__name__}",
+            schema_path=source,
+        )
+
+    # Must have either "schema" key or be a direct schema
+    if "schema" in schema_data:
+        # Wrapped schema format
+        actual_schema = schema_data["schema"]
+    else:
+        # Direct schema format
+        actual_schema = schema_data
+
+    if not isinstance(actual_schema, dict):
+        raise SchemaFileError(
+            f"Schema must be a JSON object, got {type(actual_schema).__name__}",
+            schema_path=source,
+        )
+
+    # Validate that root type is object for structured output
+    if actual_schema.get("type") != "object":
+        raise SchemaFileError(
+            f"Schema root type must be 'object', got '{actual_schema.get('type')}'",
+            schema_path=source,
+        )
+
+    return schema_data
+
+
 def validate_schema_file(
     path: str,
     verbose: bool = False,
@@ -338,35 +383,7 @@ def validate_schema_file(
         with Path(path).open("r") as f:
             schema_data = json.load(f)
 
-        # Validate basic schema structure
-        if not isinstance(schema_data, dict):
-            raise SchemaFileError(
-                f"Schema file must contain a JSON object, got {type(schema_data).__name__}",
-                schema_path=path,
-            )
-
-        # Must have either "schema" key or be a direct schema
-        if "schema" in schema_data:
-            # Wrapped schema format
-            actual_schema = schema_data["schema"]
-        else:
-            # Direct schema format
-            actual_schema = schema_data
-
-        if not isinstance(actual_schema, dict):
-            raise SchemaFileError(
-                f"Schema must be a JSON object, got {type(actual_schema).__name__}",
-                schema_path=path,
-            )
-
-        # Validate that root type is object for structured output
-        if actual_schema.get("type") != "object":
-            raise SchemaFileError(
-                f"Schema root type must be 'object', got '{actual_schema.get('type')}'",
-                schema_path=path,
-            )
-
-        return schema_data
+        return validate_schema_data(schema_data, path)
 
     except json.JSONDecodeError as e:
         raise InvalidJSONError(
@@ -500,10 +517,10 @@ def validate_download_configuration(args: CLIParams) -> None:
     # Get resolved download directory using same logic as runner.py
     from typing import Union, cast
 
-    from .config import OstructConfig
+    from .config import get_config
 
     config_path = cast(Union[str, Path, None], args.get("config"))
-    config = OstructConfig.load(config_path)
+    config = get_config(config_path)
     ci_config = config.get_code_interpreter_config()
 
     download_dir = (
@@ -571,7 +588,7 @@ async def validate_inputs(
     Dict[str, Any],
     jinja2.Environment,
     Optional[str],
-    "UploadCache",
+    Optional["UploadCache"],
 ]:
     """Validate all input parameters and return validated components.
 
@@ -586,6 +603,7 @@ async def validate_inputs(
         - Template context dictionary
         - Jinja2 environment
         - Template file path (if from file)
+        - Upload cache (None when the persistent cache is disabled)
 
     Raises:
         CLIError: For various validation errors
@@ -641,11 +659,19 @@ async def validate_inputs(
     )
 
     # Load and validate schema
-    logger.debug("Validating schema from %s", args["schema_file"])
     try:
-        schema = validate_schema_file(
-            args["schema_file"], args.get("verbose", False)
-        )
+        inline_schema = args.get("schema")
+        schema_file = args.get("schema_file")
+        if inline_schema is not None:
+            logger.debug("Validating inline schema")
+            schema = validate_schema_data(inline_schema)
+        elif schema_file is not None:
+            logger.debug("Validating schema from %s", schema_file)
+            schema = validate_schema_file(
+                schema_file, args.get("verbose", False)
+            )
+        else:
+            raise SchemaFileError("No schema file or inline schema given")
 
         # Validate schema structure before any model creation
         validate_json_schema(
@@ -673,11 +699,13 @@ async def validate_inputs(
             except (TypeError, AttributeError):
                 continue
 
-    # Create upload cache for template helpers
-    from .cache_utils import get_default_cache_path
-    from .upload_cache import UploadCache
+    # Open the configured upload cache once; the template helpers and the
+    # upload manager must share it to agree on hashes and labels
+    from .config import get_config
+    from .upload_cache import create_upload_cache
 
-    upload_cache = UploadCache(get_default_cache_path())
+    upload_cache = create_upload_cache(get_config().get_upload_config())
+    args["_upload_cache"] = upload_cache  # type: ignore[typeddict-unknown-key]
 
     # Create environment with file reference support
     env, alias_manager = create_jinja_env(
@@ -165,8 +165,8 @@ class TestFilesRmCommand:
     """Tests for files rm command."""
 
     @patch("ostruct.cli.utils.client_utils.create_openai_client")
-    @patch("ostruct.cli.upload_cache.UploadCache")
-    @patch("ostruct.cli.cache_utils.get_default_cache_path")
+    @patch("ostruct.cli.commands.files.UploadCache")
+    @patch("ostruct.cli.commands.files.get_default_cache_path")
     def test_rm_file_success(
         self,
         mock_cache_path,
@@ -194,9 +194,12 @@ def test_rm_file_success(
             "file-123"
         )
 
+        # The cache's connections are released when the command ends
+        mock_upload_cache.close.assert_called_once()
+
     @patch("ostruct.cli.utils.client_utils.create_openai_client")
-    @patch("ostruct.cli.upload_cache.UploadCache")
-    @patch("ostruct.cli.cache_utils.get_default_cache_path")
+    @patch("ostruct.cli.commands.files.UploadCache")
+    @patch("ostruct.cli.commands.files.get_default_cache_path")
     def test_rm_file_json_output(
         self,
         mock_cache_path,
@@ -219,8 +222,8 @@ def test_rm_file_json_output(
         assert output_data["file_id"] == "file-123"
 
     @patch("ostruct.cli.utils.client_utils.create_openai_client")
-    @patch("ostruct.cli.upload_cache.UploadCache")
-    @patch("ostruct.cli.cache_utils.get_default_cache_path")
+    @patch("ostruct.cli.commands.files.UploadCache")
+    @patch("ostruct.cli.commands.files.get_default_cache_path")
     def test_rm_file_openai_404_ignored(
         self,
         mock_cache_path,
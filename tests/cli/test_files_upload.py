@@ -57,8 +57,9 @@ def mock_upload_manager():
 def mock_cache():
     """Mock UploadCache."""
     cache = Mock()
-    cache.compute_file_hash = Mock(return_value="hash123")
-    cache.lookup_with_validation = Mock(return_value=None)  # No cache hit
+    cache.lookup_file_async = AsyncMock(
+        return_value=("hash123", None)
+    )  # No cache hit
     cache.store = Mock()
     cache.update_metadata = Mock()
     cache.get_vector_store_by_name = Mock(return_value=None)
@@ -98,8 +99,9 @@ def test_single_file_upload(
         mock_client.return_value = AsyncMock()  # Mock AsyncOpenAI client
 
         mock_cache = Mock()
-        mock_cache.compute_file_hash.return_value = "hash123"
-        mock_cache.lookup_with_validation.return_value = None
+        mock_cache.lookup_file_async = AsyncMock(
+            return_value=("hash123", None)
+        )
         mock_cache_cls.return_value = mock_cache
 
         mock_manager = AsyncMock()
@@ -139,8 +141,9 @@ def test_cached_file_upload(
         mock_client.return_value = AsyncMock()  # Mock AsyncOpenAI client
 
         mock_cache = Mock()
-        mock_cache.compute_file_hash.return_value = "hash123"
-        mock_cache.lookup_with_validation.return_value = "cached-file-123"
+        mock_cache.lookup_file_async = AsyncMock(
+            return_value=("hash123", "cached-file-123")
+        )
         mock_cache_cls.return_value = mock_cache
 
         mock_manager = AsyncMock()
@@ -180,8 +183,9 @@ def test_multiple_files_upload(
         """Test uploading multiple files."""
         # Setup mocks
         mock_cache = Mock()
-        mock_cache.compute_file_hash.return_value = "hash123"
-        mock_cache.lookup_with_validation.return_value = None
+        mock_cache.lookup_file_async = AsyncMock(
+            return_value=("hash123", None)
+        )
         mock_cache_cls.return_value = mock_cache
 
         mock_manager = AsyncMock()
@@ -218,8 +222,9 @@ def test_directory_upload(
         """Test uploading a directory recursively."""
         # Setup mocks
         mock_cache = Mock()
-        mock_cache.compute_file_hash.return_value = "hash123"
-        mock_cache.lookup_with_validation.return_value = None
+        mock_cache.lookup_file_async = AsyncMock(
+            return_value=("hash123", None)
+        )
         mock_cache_cls.return_value = mock_cache
 
         mock_manager = AsyncMock()
@@ -248,8 +253,9 @@ def test_collection_upload(
         """Test uploading files from a collection file."""
         # Setup mocks
         mock_cache = Mock()
-        mock_cache.compute_file_hash.return_value = "hash123"
-        mock_cache.lookup_with_validation.return_value = None
+        mock_cache.lookup_file_async = AsyncMock(
+            return_value=("hash123", None)
+        )
         mock_cache_cls.return_value = mock_cache
 
         mock_manager = AsyncMock()
@@ -289,8 +295,9 @@ def test_file_glob_pattern(
         """Test glob pattern for files."""
         # Setup mocks
         mock_cache = Mock()
-        mock_cache.compute_file_hash.return_value = "hash123"
-        mock_cache.lookup_with_validation.return_value = None
+        mock_cache.lookup_file_async = AsyncMock(
+            return_value=("hash123", None)
+        )
         mock_cache_cls.return_value = mock_cache
 
         mock_manager = AsyncMock()
@@ -329,8 +336,9 @@ def test_global_pattern_filter(
         mock_client.return_value = AsyncMock()  # Mock AsyncOpenAI client
 
         mock_cache = Mock()
-        mock_cache.compute_file_hash.return_value = "hash123"
-        mock_cache.lookup_with_validation.return_value = None
+        mock_cache.lookup_file_async = AsyncMock(
+            return_value=("hash123", None)
+        )
         mock_cache_cls.return_value = mock_cache
 
         mock_manager = AsyncMock()
@@ -429,8 +437,9 @@ def test_interactive_file_selection(
         mock_client.return_value = AsyncMock()  # Mock AsyncOpenAI client
 
         mock_cache = Mock()
-        mock_cache.compute_file_hash.return_value = "hash123"
-        mock_cache.lookup_with_validation.return_value = None
+        mock_cache.lookup_file_async = AsyncMock(
+            return_value=("hash123", None)
+        )
         mock_cache_cls.return_value = mock_cache
 
         mock_manager = AsyncMock()
@@ -541,8 +550,9 @@ def test_upload_error_handling(
         """Test handling of individual file upload errors."""
         # Setup mocks
         mock_cache = Mock()
-        mock_cache.compute_file_hash.return_value = "hash123"
-        mock_cache.lookup_with_validation.return_value = None
+        mock_cache.lookup_file_async = AsyncMock(
+            return_value=("hash123", None)
+        )
         mock_cache_cls.return_value = mock_cache
 
         mock_manager = AsyncMock()
@@ -592,8 +602,9 @@ def test_file_search_binding(
         """Test file-search tool binding."""
         # Setup mocks
         mock_cache = Mock()
-        mock_cache.compute_file_hash.return_value = "hash123"
-        mock_cache.lookup_with_validation.return_value = None
+        mock_cache.lookup_file_async = AsyncMock(
+            return_value=("hash123", None)
+        )
         mock_cache.get_vector_store_by_name.return_value = None
         mock_cache_cls.return_value = mock_cache
 
@@ -637,8 +648,9 @@ def test_multiple_tool_bindings(
         """Test binding to multiple tools."""
         # Setup mocks
         mock_cache = Mock()
-        mock_cache.compute_file_hash.return_value = "hash123"
-        mock_cache.lookup_with_validation.return_value = None
+        mock_cache.lookup_file_async = AsyncMock(
+            return_value=("hash123", None)
+        )
         mock_cache_cls.return_value = mock_cache
 
         mock_manager = AsyncMock()
@@ -708,8 +720,9 @@ def test_multiple_tags(
         """Test multiple tags application."""
         # Setup mocks
         mock_cache = Mock()
-        mock_cache.compute_file_hash.return_value = "hash123"
-        mock_cache.lookup_with_validation.return_value = None
+        mock_cache.lookup_file_async = AsyncMock(
+            return_value=("hash123", None)
+        )
         mock_cache_cls.return_value = mock_cache
 
         mock_manager = AsyncMock()
@@ -748,3 +761,194 @@ def test_multiple_tags(
             "version": "1.0",
         }
         assert metadata["tags"] == expected_tags
+
+
+@pytest.mark.no_fs
+class TestFilesUploadConcurrency:
+    """Test parallel uploads and batched vector store attachment."""
+
+    @staticmethod
+    def _make_files(tmp_path, count):
+        paths = []
+        for i in range(count):
+            path = tmp_path / f"doc{i}.txt"
+            path.write_text(f"document {i}")
+            paths.append(path)
+        return paths
+
+    @staticmethod
+    def _file_args(paths):
+        args = []
+        for path in paths:
+            args.extend(["--file", str(path)])
+        return args
+
+    @patch.object(FILES_MODULE, "SharedUploadManager")
+    @patch.object(FILES_MODULE, "UploadCache")
+    @patch("ostruct.cli.utils.client_utils.create_openai_client")
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
+    def test_jobs_bounds_parallel_uploads(
+        self, mock_client, mock_cache_cls, mock_upload_manager_cls, tmp_path
+    ):
+        """--jobs caps how many uploads are in flight at once."""
+        import asyncio
+
+        mock_cache = Mock()
+        mock_cache.lookup_file_async = AsyncMock(
+            return_value=("hash123", None)
+        )
+        mock_cache_cls.return_value = mock_cache
+
+        in_flight = 0
+        peak = 0
+
+        async def perform_upload(file_path, purpose):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return f"file-{file_path.stem}"
+
+        mock_manager = AsyncMock()
+        mock_manager._perform_upload = AsyncMock(side_effect=perform_upload)
+        mock_upload_manager_cls.return_value = mock_manager
+
+        paths = self._make_files(tmp_path, 8)
+        result = CliRunner().invoke(
+            files,
+            ["upload", *self._file_args(paths), "--jobs", "3", "--json"],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert 1 < peak <= 3
+        output = json.loads(result.output)
+        # Results keep input order despite completing out of order
+        assert [item["file_id"] for item in output["uploaded"]] == [
+            f"file-doc{i}" for i in range(8)
+        ]
+        summary = output["summary"]
+        assert summary["uploaded"] == 8
+        assert summary["jobs"] == 3
+        assert set(summary["throughput"]) == {
+            "files_per_second",
+            "mb_per_second",
+        }
+
+    @patch.object(FILES_MODULE, "SharedUploadManager")
+    @patch.object(FILES_MODULE, "UploadCache")
+    @patch.object(FILES_MODULE, "FileSearchManager")
+    @patch("ostruct.cli.utils.client_utils.create_openai_client")
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
+    def test_vector_store_attached_in_batches(
+        self,
+        mock_client,
+        mock_fs_manager_cls,
+        mock_cache_cls,
+        mock_upload_manager_cls,
+        tmp_path,
+    ):
+        """Files are added to the vector store in file_batches chunks."""
+        mock_cache = Mock()
+        mock_cache.lookup_file_async = AsyncMock(
+            return_value=("hash123", None)
+        )
+        mock_cache.get_vector_store_by_name.return_value = None
+        mock_cache_cls.return_value = mock_cache
+
+        mock_manager = AsyncMock()
+        mock_manager._perform_upload = AsyncMock(
+            side_effect=lambda path, purpose: f"file-{path.stem}"
+        )
+        mock_upload_manager_cls.return_value = mock_manager
+
+        mock_fs_manager = Mock()
+        mock_fs_manager.create_vector_store_with_retry = AsyncMock(
+            return_value="vs-123"
+        )
+        mock_fs_manager._add_files_to_vector_store_with_retry = AsyncMock()
+        mock_fs_manager_cls.return_value = mock_fs_manager
+
+        paths = self._make_files(tmp_path, 5)
+        with patch.object(
+            FILES_MODULE.DefaultConfig, "VECTOR_STORE_FILE_BATCH_SIZE", 2
+        ):
+            result = CliRunner().invoke(
+                files,
+                ["upload", *self._file_args(paths), "--tools", "file-search"],
+            )
+
+        assert result.exit_code == 0, result.output
+        mock_fs_manager.create_vector_store_with_retry.assert_called_once()
+        batches = [
+            call.args[1]
+            for call in mock_fs_manager._add_files_to_vector_store_with_retry.call_args_list
+        ]
+        assert batches == [
+            ["file-doc0", "file-doc1"],
+            ["file-doc2", "file-doc3"],
+            ["file-doc4"],
+        ]
+        assert mock_cache.add_file_to_vector_store.call_count == 5
+
+    @patch.object(FILES_MODULE, "SharedUploadManager")
+    @patch.object(FILES_MODULE, "UploadCache")
+    @patch.object(FILES_MODULE, "FileSearchManager")
+    @patch("ostruct.cli.utils.client_utils.create_openai_client")
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
+    def test_failed_vector_store_batch_keeps_uploads(
+        self,
+        mock_client,
+        mock_fs_manager_cls,
+        mock_cache_cls,
+        mock_upload_manager_cls,
+        tmp_path,
+    ):
+        """Files of a failed file_batches chunk stay uploaded, unbound."""
+        mock_cache = Mock()
+        mock_cache.lookup_file_async = AsyncMock(
+            return_value=("hash123", None)
+        )
+        mock_cache.get_vector_store_by_name.return_value = "vs-123"
+        mock_cache_cls.return_value = mock_cache
+
+        mock_manager = AsyncMock()
+        mock_manager._perform_upload = AsyncMock(
+            side_effect=lambda path, purpose: f"file-{path.stem}"
+        )
+        mock_upload_manager_cls.return_value = mock_manager
+
+        mock_fs_manager = Mock()
+        mock_fs_manager._add_files_to_vector_store_with_retry = AsyncMock(
+            side_effect=[None, RuntimeError("batch failed")]
+        )
+        mock_fs_manager_cls.return_value = mock_fs_manager
+
+        paths = self._make_files(tmp_path, 3)
+        with patch.object(
+            FILES_MODULE.DefaultConfig, "VECTOR_STORE_FILE_BATCH_SIZE", 2
+        ):
+            result = CliRunner().invoke(
+                files,
+                [
+                    "upload",
+                    *self._file_args(paths),
+                    "--tools",
+                    "file-search",
+                    "--json",
+                ],
+            )
+
+        output = json.loads(result.output)
+        uploaded = {
+            item["file_id"]: item["bindings"]["file_search"]
+            for item in output["uploaded"]
+        }
+        assert uploaded == {
+            "file-doc0": True,
+            "file-doc1": True,
+            "file-doc2": False,
+        }
+        assert output["summary"]["errors"] == 1
+        assert "batch failed" in json.dumps(output["errors"])
+        assert mock_cache.add_file_to_vector_store.call_count == 2
@@ -16,6 +16,12 @@
 from pyfakefs.fake_filesystem import FakeFilesystem
 
 
+@pytest.fixture(autouse=True)
+def runx_exec(monkeypatch):
+    """Use the exec-based runx path, whose ostruct command line is inspected."""
+    monkeypatch.setenv("OSTRUCT_RUNX_EXEC", "1")
+
+
 def create_test_ost_file(
     fs: FakeFilesystem, content: str, filename: str = "test.ost"
 ) -> str:
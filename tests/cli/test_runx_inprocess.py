@@ -0,0 +1,128 @@
+"""Tests for running .ost templates in the runx process."""
+
+import importlib
+import sys
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from ostruct.cli.errors import SchemaFileError
+from ostruct.cli.exit_codes import ExitCode
+from ostruct.cli.runx.runx_main import runx_main
+from ostruct.cli.validators import validate_schema_data
+from pyfakefs.fake_filesystem import FakeFilesystem
+
+# The commands package exports the run command under the module's name
+run_command = importlib.import_module("ostruct.cli.commands.run")
+
+OST_CONTENT = """---
+cli:
+  name: inprocess-test
+  description: Test in-process execution
+  options:
+    text:
+      names: ["--text", "-t"]
+      default: "hello"
+global_args:
+  model:
+    mode: pass-through
+schema: |
+  {
+    "type": "object",
+    "properties": {"output": {"type": "string"}},
+    "required": ["output"]
+  }
+---
+Text: {{ text }}
+"""
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"output": {"type": "string"}},
+    "required": ["output"],
+}
+
+
+@pytest.fixture
+def ost_path(fs: FakeFilesystem, monkeypatch) -> str:
+    monkeypatch.delenv("OSTRUCT_RUNX_EXEC", raising=False)
+    path = "/test_workspace/base/inprocess.ost"
+    fs.create_file(path, contents=OST_CONTENT)
+    return path
+
+
+def test_runx_dispatches_in_process(ost_path: str) -> None:
+    """runx hands the template, schema and flags to run_inline."""
+    with (
+        patch.object(run_command, "run_inline", return_value=0) as run_inline,
+        patch.object(
+            sys.modules["ostruct.cli.runx.runx_main"].os, "execvp"
+        ) as mock_execvp,
+    ):
+        exit_code = runx_main([ost_path, "--text", "world", "--model", "o3"])
+
+    assert exit_code == 0
+    assert not mock_execvp.called
+    task, schema, flags = run_inline.call_args.args
+    assert task.strip() == "Text: {{ text }}"
+    assert schema == SCHEMA
+    assert flags[:2] == ["--progress", "none"]
+    assert flags[flags.index("--model") + 1] == "o3"
+    assert flags[flags.index("--var") + 1] == "text=world"
+    assert run_inline.call_args.kwargs["template_path"] == ost_path
+
+
+def test_runx_exec_fallback(ost_path: str, monkeypatch) -> None:
+    """OSTRUCT_RUNX_EXEC=1 keeps the exec-based path."""
+    monkeypatch.setenv("OSTRUCT_RUNX_EXEC", "1")
+    with (
+        patch.object(run_command, "run_inline") as run_inline,
+        patch.object(
+            sys.modules["ostruct.cli.runx.runx_main"].os, "execvp"
+        ) as mock_execvp,
+    ):
+        runx_main([ost_path])
+
+    assert not run_inline.called
+    cmd = mock_execvp.call_args.args[1]
+    assert cmd[:2] == ["ostruct", "run"]
+    assert cmd[3].endswith(".json")
+
+
+class TestRunInline:
+    """Test running the run command on in-memory inputs."""
+
+    def test_passes_inline_template_and_schema(self, fs: FakeFilesystem):
+        run_cli_async = AsyncMock(return_value=ExitCode.SUCCESS)
+        with patch.object(run_command, "run_cli_async", run_cli_async):
+            exit_code = run_command.run_inline(
+                "Text: {{ text }}",
+                SCHEMA,
+                ["--model", "gpt-4o", "--var", "text=world"],
+                template_path="/tool.ost",
+            )
+
+        assert exit_code == ExitCode.SUCCESS
+        params = run_cli_async.call_args.args[0]
+        assert params["task"] == "Text: {{ text }}"
+        assert params["task_file"] is None
+        assert params["schema"] == SCHEMA
+        assert params["schema_file"] is None
+        assert params["model"] == "gpt-4o"
+        assert list(params["var"]) == [("text", "world")]
+
+    def test_returns_run_exit_code(self, fs: FakeFilesystem):
+        run_cli_async = AsyncMock(return_value=ExitCode.API_ERROR)
+        with patch.object(run_command, "run_cli_async", run_cli_async):
+            exit_code = run_command.run_inline("x", SCHEMA, [])
+
+        assert exit_code == ExitCode.API_ERROR
+
+    def test_invalid_option_is_usage_error(self, fs: FakeFilesystem):
+        exit_code = run_command.run_inline("x", SCHEMA, ["--no-such-flag"])
+
+        assert exit_code == ExitCode.USAGE_ERROR
+
+
+def test_validate_schema_data_rejects_non_object_root() -> None:
+    with pytest.raises(SchemaFileError, match="root type must be 'object'"):
+        validate_schema_data({"type": "array"})
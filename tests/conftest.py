@@ -170,6 +170,31 @@ def env_setup(
             monkeypatch.setenv("OPENAI_API_KEY", "test-key")
 
 
+@pytest.fixture(autouse=True)
+def reset_process_caches() -> Generator[None, None, None]:
+    """Keep process-wide caches from leaking between tests."""
+    from ostruct.cli.cache_manager import reset_file_cache
+    from ostruct.cli.config import clear_config_cache
+    from ostruct.cli.rate_limiter import reset_rate_limiter
+    from ostruct.cli.scan_index import reset_scan_index
+    from ostruct.cli.schema_utils import clear_schema_caches
+    from ostruct.cli.template_cache import reset_template_cache
+
+    clear_config_cache()
+    reset_file_cache()
+    reset_scan_index()
+    reset_rate_limiter()
+    clear_schema_caches()
+    reset_template_cache()
+    yield
+    clear_config_cache()
+    reset_file_cache()
+    reset_scan_index()
+    reset_rate_limiter()
+    clear_schema_caches()
+    reset_template_cache()
+
+
 @pytest.fixture
 def fs(
     fs: FakeFilesystem, request: pytest.FixtureRequest
@@ -839,10 +864,15 @@ def encode(self, text: str) -> list[int]:
 def mock_tiktoken(monkeypatch):
     """Mock tiktoken to avoid filesystem/network access."""
 
+    from ostruct.cli.token_utils import _load_encoding
+
     def mock_get_encoding(name: str) -> DummyEncoder:
         return DummyEncoder()
 
     monkeypatch.setattr(tiktoken, "get_encoding", mock_get_encoding)
+    _load_encoding.cache_clear()
+    yield
+    _load_encoding.cache_clear()
 
 
 @pytest.fixture(autouse=True)
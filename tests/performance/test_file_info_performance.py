@@ -0,0 +1,124 @@
+"""Performance benchmarks for FileInfo with large directory attachments."""
+
+import logging
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from ostruct.cli.file_info import FileInfo, FileRoutingIntent
+
+logger = logging.getLogger(__name__)
+
+INSTANCE_COUNT = 100_000
+
+
+class _ResolvedPath:
+    """Resolved path stub that is always a regular file."""
+
+    __slots__ = ("path",)
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def is_file(self) -> bool:
+        return True
+
+    def __str__(self) -> str:
+        return self.path
+
+
+class _StubSecurityManager:
+    """Security manager stub so the benchmark measures FileInfo itself."""
+
+    base_dir = Path("/bench")
+    allowed_dirs: list = []
+
+    def resolve_path(self, path: str) -> _ResolvedPath:
+        return _ResolvedPath(path)
+
+
+def _build(count: int) -> list:
+    security_manager = _StubSecurityManager()
+    return [
+        FileInfo(
+            f"/bench/dir/file_{i}.txt",
+            security_manager,  # type: ignore[arg-type]
+            routing_type="template",
+            routing_intent=FileRoutingIntent.TEMPLATE_ONLY,
+            max_size=1024 * 1024,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def quiet_file_info_logger():
+    """Measure FileInfo rather than debug logging left on by other tests."""
+    file_info_logger = logging.getLogger("ostruct.cli.file_info")
+    previous = file_info_logger.level
+    file_info_logger.setLevel(logging.WARNING)
+    yield
+    file_info_logger.setLevel(previous)
+
+
+@pytest.mark.slow
+class TestFileInfoPerformance:
+    """Construction and attribute-access cost for 100k FileInfo instances."""
+
+    def test_construction(self):
+        """Building 100k instances stays cheap and allocates no __dict__."""
+        start = time.perf_counter()
+        files = _build(INSTANCE_COUNT)
+        duration = time.perf_counter() - start
+
+        logger.info(
+            "FileInfo construction: %d instances in %.3fs "
+            "(%.2fus each, %d bytes each)",
+            INSTANCE_COUNT,
+            duration,
+            duration / INSTANCE_COUNT * 1e6,
+            sys.getsizeof(files[0]),
+        )
+        assert not hasattr(files[0], "__dict__")
+        assert duration < 5.0, f"Construction took {duration:.3f}s"
+
+    def test_attribute_access_and_cache_updates(self):
+        """Reads and internal state writes avoid frame introspection."""
+        files = _build(INSTANCE_COUNT)
+
+        start = time.perf_counter()
+        for file_info in files:
+            file_info.routing_intent
+            file_info.routing_type
+            file_info.parent_alias
+            file_info.extension
+        read_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for file_info in files:
+            file_info.update_cache(content="x", encoding="utf-8")
+            file_info.parent_alias = "docs"
+        write_duration = time.perf_counter() - start
+
+        logger.info(
+            "FileInfo access: reads %.3fs, cache updates %.3fs for %d",
+            read_duration,
+            write_duration,
+            INSTANCE_COUNT,
+        )
+        assert files[-1].loaded_content == "x"
+        assert read_duration < 2.0, f"Reads took {read_duration:.3f}s"
+        assert write_duration < 2.0, f"Writes took {write_duration:.3f}s"
+
+    def test_read_only_api_is_preserved(self):
+        """Public read-only attributes and unknown names cannot be set."""
+        file_info = _build(1)[0]
+
+        for name in ("path", "content", "routing_type", "routing_intent"):
+            with pytest.raises(AttributeError):
+                setattr(file_info, name, None)
+        with pytest.raises(AttributeError):
+            file_info.__content = "modified"  # type: ignore[attr-defined]
+        with pytest.raises(AttributeError):
+            file_info.arbitrary = 1  # type: ignore[attr-defined]
@@ -0,0 +1,81 @@
+"""Performance benchmarks for fenced JSON and sentinel extraction."""
+
+import json
+import logging
+import time
+
+import pytest
+from ostruct.cli.json_extract import split_json_and_text
+from ostruct.cli.sentinel import extract_json_block
+
+logger = logging.getLogger(__name__)
+
+# Roughly 3MB of JSON with a fence-like sequence in every string value,
+# split into groups to stay within the parser's array length limit
+GROUP_COUNT = 8
+GROUP_SIZE = 5_000
+
+
+def _payload() -> dict:
+    return {
+        f"group_{g}": [
+            {
+                "id": i,
+                "snippet": f'```python\\nprint({i})\\n``` and \\"quotes\\"',
+            }
+            for i in range(GROUP_SIZE)
+        ]
+        for g in range(GROUP_COUNT)
+    }
+
+
+@pytest.mark.slow
+class TestJsonExtractPerformance:
+    """Extraction time on multi-MB responses."""
+
+    def test_fenced_block(self):
+        """The closing fence is found in one pass, however many strings."""
+        payload = _payload()
+        body = json.dumps(payload)
+        content = f"```json\n{body}\n```\n\n[Download](sandbox:/mnt/data/x)"
+
+        start = time.perf_counter()
+        data, markdown_text = split_json_and_text(content)
+        duration = time.perf_counter() - start
+
+        logger.info(
+            "split_json_and_text: %.1fMB in %.3fs",
+            len(content) / 1e6,
+            duration,
+        )
+        assert data == payload
+        assert markdown_text == "[Download](sandbox:/mnt/data/x)"
+        assert duration < 2.0, f"Extraction took {duration:.3f}s"
+
+    def test_invalid_block_is_rejected_quickly(self):
+        """Invalid JSON is parsed once rather than once per fence."""
+        body = json.dumps(_payload())[:-1]
+        content = f"```json\n{body}\n```\n" + "```\n" * 1000
+
+        start = time.perf_counter()
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            split_json_and_text(content)
+        duration = time.perf_counter() - start
+
+        logger.info("Invalid fenced block rejected in %.3fs", duration)
+        assert duration < 2.0, f"Rejection took {duration:.3f}s"
+
+    def test_sentinel_block(self):
+        """Sentinel extraction handles multi-MB payloads."""
+        payload = _payload()
+        text = f"===BEGIN_JSON===\n{json.dumps(payload)}\n===END_JSON==="
+
+        start = time.perf_counter()
+        result = extract_json_block(text)
+        duration = time.perf_counter() - start
+
+        logger.info(
+            "extract_json_block: %.1fMB in %.3fs", len(text) / 1e6, duration
+        )
+        assert result == payload
+        assert duration < 2.0, f"Extraction took {duration:.3f}s"
@@ -0,0 +1,95 @@
+"""Performance benchmarks for the secure JSON parser."""
+
+import json
+import logging
+import time
+from typing import Any, Callable
+
+import pytest
+from ostruct.cli.json_limits import (
+    DEFAULT_MAX_JSON_DEPTH,
+    DEFAULT_MAX_JSON_KEYS,
+    SecureJSONParser,
+)
+
+logger = logging.getLogger(__name__)
+
+RUNS = 5
+
+
+def _recursive_parse(content: str) -> Any:
+    """The original json.loads plus recursive per-value validation."""
+
+    def validate(obj: Any, depth: int) -> None:
+        if depth > DEFAULT_MAX_JSON_DEPTH:
+            raise ValueError("too deep")
+        if isinstance(obj, dict):
+            if len(obj) > DEFAULT_MAX_JSON_KEYS:
+                raise ValueError("too many keys")
+            for value in obj.values():
+                validate(value, depth + 1)
+        elif isinstance(obj, list):
+            if len(obj) > DEFAULT_MAX_JSON_KEYS:
+                raise ValueError("too long")
+            for item in obj:
+                validate(item, depth + 1)
+
+    parsed = json.loads(content)
+    validate(parsed, 0)
+    return parsed
+
+
+def _best_of(func: Callable[[str], Any], content: str) -> float:
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        func(content)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _payload(groups: int) -> str:
+    # Records of mixed scalars, split into groups to stay within the
+    # parser's array length limit
+    return json.dumps(
+        {
+            f"group_{g}": [
+                {
+                    "id": i,
+                    "name": f"item {i}",
+                    "score": i / 7,
+                    "tags": ["a", "b", "c"],
+                    "active": i % 2 == 0,
+                    "parent": None,
+                }
+                for i in range(5_000)
+            ]
+            for g in range(groups)
+        }
+    )
+
+
+@pytest.mark.slow
+class TestJsonLimitsPerformance:
+    """Validation cost on multi-MB valid payloads."""
+
+    @pytest.mark.parametrize("groups", [1, 3])
+    def test_not_slower_than_recursive_validation(self, groups):
+        """Limit checks cost no more than the original recursive walk."""
+        content = _payload(groups)
+        parser = SecureJSONParser()
+        assert parser.parse(content) == _recursive_parse(content)
+
+        baseline = _best_of(_recursive_parse, content)
+        secure = _best_of(parser.parse, content)
+
+        logger.info(
+            "secure parse %.1fMB: %.3fs (recursive: %.3fs)",
+            len(content) / 1e6,
+            secure,
+            baseline,
+        )
+        assert secure <= baseline * 1.1, (
+            f"Secure parse took {secure:.3f}s, "
+            f"recursive validation {baseline:.3f}s"
+        )
@@ -0,0 +1,81 @@
+"""Start-up time of .ost templates: in-process runx versus exec."""
+
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+OST_CONTENT = """#!/usr/bin/env -S ostruct runx
+---
+cli:
+  name: startup-benchmark
+  description: Start-up benchmark
+  options:
+    text:
+      names: ["--text"]
+      default: "hello"
+schema: |
+  {
+    "type": "object",
+    "properties": {"result": {"type": "string"}},
+    "required": ["result"]
+  }
+defaults:
+  dry_run: true
+---
+Text: {{ text }}
+"""
+
+RUNS = 3
+
+
+def _best_time(ost_path, cwd, exec_mode: bool) -> float:
+    env = dict(os.environ)
+    env.pop("OSTRUCT_RUNX_EXEC", None)
+    if exec_mode:
+        env["OSTRUCT_RUNX_EXEC"] = "1"
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-m", "ostruct.cli.runx", str(ost_path)],
+            capture_output=True,
+            text=True,
+            cwd=str(cwd),
+            env=env,
+            stdin=subprocess.DEVNULL,
+        )
+        best = min(best, time.perf_counter() - start)
+        assert result.returncode == 0, result.stderr
+    return best
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    shutil.which("ostruct") is None,
+    reason="exec path needs the ostruct executable on PATH",
+)
+class TestRunxStartupPerformance:
+    """Wall-clock time of a dry run through both runx paths."""
+
+    def test_in_process_faster_than_exec(self, tmp_path):
+        """Running in-process skips the second interpreter start-up."""
+        ost_path = tmp_path / "benchmark.ost"
+        ost_path.write_text(OST_CONTENT)
+
+        in_process = _best_time(ost_path, tmp_path, exec_mode=False)
+        exec_based = _best_time(ost_path, tmp_path, exec_mode=True)
+
+        logger.info(
+            "runx start-up (best of %d): in-process %.2fs, exec %.2fs",
+            RUNS,
+            in_process,
+            exec_based,
+        )
+        assert in_process < exec_based
@@ -0,0 +1,230 @@
+"""Tests for batch execution over a JSONL manifest."""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from ostruct.cli.batch import (
+    BatchItem,
+    load_checkpoint,
+    load_manifest,
+    run_batch,
+)
+from ostruct.cli.errors import CLIError
+from ostruct.cli.runner import OstructRunner
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"summary": {"type": "string"}},
+    "required": ["summary"],
+}
+
+
+@pytest.fixture
+def workspace(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OSTRUCT_CACHE_DIR", str(tmp_path / "cache"))
+    (tmp_path / "task.j2").write_text("{{ doc.content }} in {{ lang }}")
+    (tmp_path / "schema.json").write_text(json.dumps(SCHEMA))
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.md").write_text(f"doc {name}")
+    return tmp_path
+
+
+@pytest.fixture
+def api():
+    """Shared client and a structured-output call echoing the prompt."""
+    client = AsyncMock()
+
+    async def respond(**kwargs):
+        return kwargs["output_schema"](summary=kwargs["user_prompt"])
+
+    with (
+        patch(
+            "ostruct.cli.utils.client_utils.create_openai_client",
+            return_value=client,
+        ) as create_client,
+        patch(
+            "ostruct.cli.runner.create_structured_output", side_effect=respond
+        ) as create_output,
+    ):
+        yield create_client, create_output, client
+
+
+def _args() -> dict:
+    return {
+        "task_file": "task.j2",
+        "task": None,
+        "schema_file": "schema.json",
+        "model": "gpt-4o",
+        "path_security": "permissive",
+    }
+
+
+def _items(*names: str) -> list:
+    return [BatchItem(n, {"lang": "en"}, {"doc": f"{n}.md"}) for n in names]
+
+
+def _records(path: Path) -> dict:
+    lines = path.read_text().splitlines()
+    return {r["id"]: r for r in map(json.loads, lines)}
+
+
+class TestManifest:
+    """Test manifest parsing."""
+
+    def test_load_manifest(self, tmp_path):
+        manifest = tmp_path / "items.jsonl"
+        manifest.write_text(
+            '{"id": "x", "vars": {"lang": "en"}, "files": {"doc": "a.md"}}\n'
+            "\n"
+            '{"vars": {"lang": "fr"}}\n'
+        )
+
+        items = load_manifest(manifest)
+
+        assert items == [
+            BatchItem("x", {"lang": "en"}, {"doc": "a.md"}),
+            BatchItem("3", {"lang": "fr"}, {}),
+        ]
+
+    @pytest.mark.parametrize(
+        "line, message",
+        [
+            ("not json", "line 1"),
+            ("[1]", "JSON object"),
+            ('{"vars": {}, "extra": 1}', "unknown keys: extra"),
+            ('{"files": {"doc": 1}}', "'files'"),
+            ('{"vars": {"not-valid": 1}}', "invalid variable names"),
+        ],
+    )
+    def test_invalid_entries(self, tmp_path, line, message):
+        manifest = tmp_path / "items.jsonl"
+        manifest.write_text(line + "\n")
+
+        with pytest.raises(CLIError, match=message):
+            load_manifest(manifest)
+
+    def test_duplicate_ids(self, tmp_path):
+        manifest = tmp_path / "items.jsonl"
+        manifest.write_text('{"id": "a"}\n{"id": "a"}\n')
+
+        with pytest.raises(CLIError, match="duplicate id 'a'"):
+            load_manifest(manifest)
+
+
+def test_checkpoint_ignores_failures_and_truncated_lines(tmp_path):
+    results = tmp_path / "results.jsonl"
+    results.write_text(
+        '{"id": "1", "status": "ok"}\n'
+        '{"id": "2", "status": "error"}\n'
+        '{"id": "3", "sta'
+    )
+
+    assert load_checkpoint(results) == {"1"}
+    assert load_checkpoint(tmp_path / "missing.jsonl") == set()
+
+
+@pytest.mark.asyncio
+class TestRunBatch:
+    """Test running items against a mocked API."""
+
+    async def test_items_share_one_client(self, workspace, api):
+        create_client, create_output, client = api
+        output = workspace / "results.jsonl"
+
+        summary = await run_batch(
+            _args(), _items("a", "b", "c"), output, concurrency=2
+        )
+
+        assert (summary.succeeded, summary.failed) == (3, 0)
+        assert create_client.call_count == 1
+        client.close.assert_awaited_once()
+        records = _records(output)
+        assert records["b"] == {
+            "id": "b",
+            "status": "ok",
+            "result": {"summary": "doc b in en"},
+        }
+        models = {c.kwargs["output_schema"] for c in create_output.mock_calls}
+        assert len(models) == 1
+
+    async def test_failures_are_recorded_per_item(self, workspace, api):
+        output = workspace / "results.jsonl"
+        items = _items("a") + [BatchItem("x", {}, {"doc": "missing.md"})]
+
+        summary = await run_batch(_args(), items, output)
+
+        assert (summary.succeeded, summary.failed) == (1, 1)
+        assert summary.exit_code != 0
+        record = _records(output)["x"]
+        assert record["status"] == "error"
+        assert "missing.md" in record["error"]
+
+    async def test_resume_skips_completed_items(self, workspace, api):
+        _, create_output, _ = api
+        output = workspace / "results.jsonl"
+        output.write_text(
+            '{"id": "a", "status": "ok", "result": {}}\n'
+            '{"id": "b", "status": "error", "error": "boom"}\n'
+            '{"id": "c", "sta'
+        )
+
+        summary = await run_batch(_args(), _items("a", "b", "c"), output)
+
+        assert (summary.succeeded, summary.skipped) == (2, 1)
+        assert create_output.call_count == 2
+        assert load_checkpoint(output) == {"a", "b", "c"}
+
+    async def test_no_resume_replaces_results(self, workspace, api):
+        output = workspace / "results.jsonl"
+        output.write_text('{"id": "a", "status": "ok", "result": {}}\n')
+
+        await run_batch(_args(), _items("a"), output, resume=False)
+
+        assert _records(output)["a"]["result"] == {"summary": "doc a in en"}
+        assert len(output.read_text().splitlines()) == 1
+
+    async def test_tools_are_rejected(self, workspace, api):
+        args = _args()
+        args["_enabled_tools"] = {"web-search"}
+
+        with pytest.raises(CLIError, match="web-search"):
+            await run_batch(args, _items("a"), workspace / "out.jsonl")
+
+    async def test_runner_run_many(self, workspace, api):
+        output = workspace / "results.jsonl"
+
+        summary = await OstructRunner(_args()).run_many(_items("a"), output)
+
+        assert summary.succeeded == 1
+
+
+def test_batch_command(workspace, api):
+    from click.testing import CliRunner
+    from ostruct.cli.commands.batch import batch
+
+    (workspace / "items.jsonl").write_text(
+        '{"id": "a", "vars": {"lang": "en"}, "files": {"doc": "a.md"}}\n'
+        '{"id": "b", "vars": {"lang": "de"}, "files": {"doc": "b.md"}}\n'
+    )
+
+    result = CliRunner().invoke(
+        batch,
+        [
+            "task.j2",
+            "schema.json",
+            "items.jsonl",
+            "-o",
+            "results.jsonl",
+            "-m",
+            "gpt-4o",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "2 succeeded, 0 failed" in result.output
+    assert _records(workspace / "results.jsonl")["b"]["result"] == {
+        "summary": "doc b in de"
+    }
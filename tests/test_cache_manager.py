@@ -259,3 +259,120 @@ def test_cache_key_collisions() -> None:
         entry = cache.get(path, mtime_ns, size)
         assert entry is not None
         assert entry.content == content
+
+
+def _write_old(path, content: str) -> None:
+    """Write a file with an mtime outside the racy-write window."""
+    path.write_text(content)
+    past = time.time_ns() - 60 * 1_000_000_000
+    os.utime(path, ns=(past, past))
+
+
+def test_cache_stats_counters() -> None:
+    """Hits, misses, evictions and invalidations are counted."""
+    cache = FileCache(max_size_bytes=10)
+    cache.put("/a", "aaaaaa", "utf-8", None, 1, 6)
+    assert cache.get("/a", 1, 6) is not None
+    assert cache.get("/missing", 1, 1) is None
+    cache.put("/b", "bbbbbb", "utf-8", None, 1, 6)  # evicts /a
+    assert cache.get("/b", 2, 6) is None  # stale mtime
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["evictions"] == 1
+    assert stats["invalidations"] == 1
+    assert stats["entries"] == 0
+    assert stats["size_bytes"] == 0
+
+
+def test_cache_not_limited_by_entry_count() -> None:
+    """Only the byte budget bounds the number of cached files."""
+    cache = FileCache(max_size_bytes=10_000)
+    for i in range(2000):
+        cache.put(f"/f{i}", "x", "utf-8", None, 1, 1)
+
+    assert cache.stats()["entries"] == 2000
+    assert cache.stats()["size_bytes"] == 2000
+
+
+@pytest.mark.no_fs
+def test_load_reads_once(tmp_path) -> None:
+    """load() serves repeated reads of an unchanged file from memory."""
+    path = tmp_path / "data.txt"
+    _write_old(path, "héllo")
+    cache = FileCache()
+
+    first = cache.load(str(path))
+    second = cache.load(str(path))
+
+    assert first.content == second.content == "héllo"
+    assert first.encoding == "utf-8"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+    _write_old(path, "changed!")
+    assert cache.load(str(path)).content == "changed!"
+
+
+@pytest.mark.no_fs
+def test_load_skips_recently_modified_files(tmp_path) -> None:
+    """Files written within the racy window are read but not cached."""
+    path = tmp_path / "fresh.txt"
+    path.write_text("fresh")
+    cache = FileCache()
+
+    assert cache.load(str(path)).content == "fresh"
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.no_fs
+def test_file_info_shares_cache(tmp_path) -> None:
+    """FileInfo instances for the same file reuse one read."""
+    from ostruct.cli.cache_manager import get_file_cache
+    from ostruct.cli.file_info import FileInfo
+    from ostruct.cli.security import SecurityManager
+
+    _write_old(tmp_path / "doc.md", "# Title")
+    security_manager = SecurityManager(base_dir=str(tmp_path))
+
+    contents = [
+        FileInfo(str(tmp_path / "doc.md"), security_manager).content
+        for _ in range(3)
+    ]
+
+    assert contents == ["# Title"] * 3
+    stats = get_file_cache().stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
+
+
+@pytest.mark.no_fs
+def test_shared_cache_uses_configured_budget(tmp_path, monkeypatch) -> None:
+    """The byte budget comes from ostruct.yaml."""
+    from ostruct.cli.cache_manager import get_file_cache, reset_file_cache
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "ostruct.yaml").write_text(
+        "template:\n  content_cache_size: 1024\n"
+    )
+    reset_file_cache()
+
+    cache = get_file_cache()
+    assert cache.max_size == 1024
+    assert get_file_cache() is cache
+
+
+def test_verbose_reports_cache_summary(capsys) -> None:
+    """Counters are shown only in verbose mode."""
+    from ostruct.cli.progress_reporting import EnhancedProgressReporter
+
+    stats = FileCache().stats()
+    stats.update(hits=3, misses=1, evictions=2, entries=1)
+
+    EnhancedProgressReporter(verbose=False).report_content_cache_summary(stats)
+    assert capsys.readouterr().err == ""
+
+    EnhancedProgressReporter(verbose=True).report_content_cache_summary(stats)
+    err = capsys.readouterr().err
+    assert "File cache: 3 hits, 1 misses, 2 evictions" in err
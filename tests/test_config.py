@@ -6,7 +6,12 @@
 
 import pytest
 import yaml
-from ostruct.cli.config import OstructConfig, get_config
+from ostruct.cli.config import (
+    OstructConfig,
+    clear_config_cache,
+    get_config,
+    reload_config,
+)
 
 
 class TestOstructConfig:
@@ -210,6 +215,72 @@ def test_get_config_returns_instance(self):
         assert config.models.default == "gpt-4.1"
 
 
+@pytest.mark.no_fs
+class TestConfigCache:
+    """Test the process-wide configuration cache behind get_config."""
+
+    @pytest.fixture
+    def config_dir(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "ostruct.yaml").write_text(
+            yaml.dump({"models": {"default": "gpt-4o-mini"}})
+        )
+        return tmp_path
+
+    def test_repeated_calls_load_once(self, config_dir):
+        """Unchanged configuration is parsed only once."""
+        with patch.object(
+            OstructConfig, "load", wraps=OstructConfig.load
+        ) as load:
+            first = get_config()
+            second = get_config()
+
+        assert first is second
+        assert first.models.default == "gpt-4o-mini"
+        load.assert_called_once()
+
+    def test_file_change_invalidates(self, config_dir):
+        """Editing the config file is picked up on the next call."""
+        first = get_config()
+        config_file = config_dir / "ostruct.yaml"
+        config_file.write_text(yaml.dump({"models": {"default": "gpt-4o"}}))
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        second = get_config()
+
+        assert second is not first
+        assert second.models.default == "gpt-4o"
+
+    def test_env_change_invalidates(self, config_dir, monkeypatch):
+        """Changing an OSTRUCT_* variable reapplies env overrides."""
+        assert get_config().json_parsing_strategy == "robust"
+
+        monkeypatch.setenv("OSTRUCT_JSON_PARSING_STRATEGY", "strict")
+
+        assert get_config().json_parsing_strategy == "strict"
+
+    def test_explicit_paths_cached_separately(self, config_dir):
+        """Explicit config paths do not share an entry with the default."""
+        other = config_dir / "other.yaml"
+        other.write_text(yaml.dump({"models": {"default": "gpt-4o"}}))
+
+        assert get_config().models.default == "gpt-4o-mini"
+        assert get_config(other).models.default == "gpt-4o"
+        assert get_config(other) is get_config(other)
+
+    def test_reload_and_clear(self, config_dir):
+        """reload_config and clear_config_cache force a fresh load."""
+        first = get_config()
+
+        reloaded = reload_config()
+        assert reloaded is not first
+        assert get_config() is reloaded
+
+        clear_config_cache()
+        assert get_config() is not reloaded
+
+
 class TestConfigurationIntegration:
     """Test configuration integration with CLI."""
 
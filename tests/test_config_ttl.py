@@ -20,6 +20,7 @@ def test_default_values(self):
         assert config.cache_max_age_days == 14
         assert config.cache_path is None
         assert config.hash_algorithm == "sha256"
+        assert config.reuse_vector_stores is False
 
     def test_custom_values(self):
         """Test custom configuration values."""
@@ -0,0 +1,201 @@
+"""Tests for adaptive vector store readiness polling."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from ostruct.cli.file_search import FileSearchManager
+
+
+def _batch(status, completed, total, failed=0):
+    """Build a fake vector store file batch."""
+    return SimpleNamespace(
+        id="vsfb_1",
+        status=status,
+        file_counts=SimpleNamespace(
+            completed=completed,
+            failed=failed,
+            cancelled=0,
+            in_progress=total - completed - failed,
+            total=total,
+        ),
+    )
+
+
+def _client(batches=None, store_statuses=None):
+    """Build a fake client returning the given statuses in order."""
+    client = SimpleNamespace(
+        vector_stores=SimpleNamespace(
+            retrieve=AsyncMock(
+                side_effect=[
+                    SimpleNamespace(status=s) for s in store_statuses or []
+                ]
+            ),
+            file_batches=SimpleNamespace(
+                create=AsyncMock(return_value=SimpleNamespace(id="vsfb_1")),
+                retrieve=AsyncMock(side_effect=batches or []),
+            ),
+        )
+    )
+    return client
+
+
+@pytest.mark.asyncio
+class TestVectorStoreReadiness:
+    """Test FileSearchManager.wait_for_vector_store_ready."""
+
+    async def test_ready_on_first_check_does_not_sleep(self):
+        """A store that is already indexed returns without waiting."""
+        client = _client(store_statuses=["completed"])
+        manager = FileSearchManager(client)  # type: ignore[arg-type]
+
+        with patch("asyncio.sleep", new=AsyncMock()) as sleep:
+            assert await manager.wait_for_vector_store_ready("vs_1")
+
+        sleep.assert_not_called()
+        info = manager.get_performance_info()
+        assert info["readiness_polls"] == 1
+        assert info["time_to_ready_seconds"] is not None
+
+    async def test_backoff_grows_to_cap(self):
+        """Delays between checks double up to poll_interval."""
+        client = _client(store_statuses=["in_progress"] * 5 + ["completed"])
+        manager = FileSearchManager(client)  # type: ignore[arg-type]
+
+        with patch("asyncio.sleep", new=AsyncMock()) as sleep:
+            assert await manager.wait_for_vector_store_ready(
+                "vs_1", poll_interval=1.0, initial_interval=0.25
+            )
+
+        delays = [call.args[0] for call in sleep.call_args_list]
+        assert delays == [0.25, 0.5, 1.0, 1.0, 1.0]
+        assert manager.get_performance_info()["readiness_polls"] == 6
+
+    async def test_uses_file_batch_counts(self):
+        """Batches added through the manager drive readiness."""
+        client = _client(
+            batches=[
+                _batch("in_progress", 1, 3),
+                _batch("in_progress", 2, 3),
+                _batch("completed", 3, 3),
+            ]
+        )
+        manager = FileSearchManager(client)  # type: ignore[arg-type]
+        await manager._add_files_to_vector_store_with_retry(
+            "vs_1", ["f1", "f2", "f3"], max_retries=0, retry_delay=0
+        )
+
+        with (
+            patch("asyncio.sleep", new=AsyncMock()),
+            patch.object(
+                manager,
+                "_report_indexing_progress",
+                wraps=manager._report_indexing_progress,
+            ) as progress,
+        ):
+            assert await manager.wait_for_vector_store_ready("vs_1")
+
+        client.vector_stores.file_batches.retrieve.assert_called_with(
+            "vsfb_1", vector_store_id="vs_1"
+        )
+        assert [call.args[1:] for call in progress.call_args_list] == [
+            (1, 3),
+            (2, 3),
+        ]
+
+    async def test_failed_batch_stops_waiting(self):
+        """A failed batch returns False immediately."""
+        client = _client(batches=[_batch("failed", 0, 2, failed=2)])
+        manager = FileSearchManager(client)  # type: ignore[arg-type]
+        manager._file_batches["vs_1"] = ["vsfb_1"]
+
+        assert not await manager.wait_for_vector_store_ready("vs_1")
+        assert manager.get_performance_info()["time_to_ready_seconds"] is None
+
+    async def test_deadline_is_respected(self):
+        """Polling stops once the timeout has elapsed."""
+        client = SimpleNamespace(
+            vector_stores=SimpleNamespace(
+                retrieve=AsyncMock(
+                    return_value=SimpleNamespace(status="in_progress")
+                )
+            )
+        )
+        manager = FileSearchManager(client)  # type: ignore[arg-type]
+
+        assert not await manager.wait_for_vector_store_ready(
+            "vs_1", timeout=0.05, poll_interval=0.01, initial_interval=0.01
+        )
+        assert manager.get_performance_info()["readiness_polls"] >= 2
+
+    async def test_polls_go_through_rate_limiter(self):
+        """Every readiness poll is made under the shared rate limiter."""
+        from contextlib import asynccontextmanager
+
+        endpoints = []
+
+        @asynccontextmanager
+        async def record(endpoint, model=None, tokens=0):
+            endpoints.append(endpoint)
+            yield
+
+        client = _client(
+            batches=[_batch("in_progress", 1, 2), _batch("completed", 2, 2)]
+        )
+        manager = FileSearchManager(client)  # type: ignore[arg-type]
+        manager._file_batches["vs_1"] = ["vsfb_1"]
+
+        with (
+            patch("asyncio.sleep", new=AsyncMock()),
+            patch("ostruct.cli.file_search.rate_limited", new=record),
+        ):
+            assert await manager.wait_for_vector_store_ready("vs_1")
+
+        assert endpoints == ["vector_stores", "vector_stores"]
+
+    async def test_completed_batches_are_not_polled_again(self):
+        """Only batches still indexing are retrieved on later polls."""
+        client = _client(
+            batches=[
+                _batch("completed", 2, 2),
+                _batch("in_progress", 0, 1),
+                _batch("completed", 1, 1),
+            ]
+        )
+        manager = FileSearchManager(client)  # type: ignore[arg-type]
+        manager._file_batches["vs_1"] = ["vsfb_1", "vsfb_2"]
+
+        with patch("asyncio.sleep", new=AsyncMock()):
+            assert await manager.wait_for_vector_store_ready("vs_1")
+
+        retrieved = [
+            call.args[0]
+            for call in client.vector_stores.file_batches.retrieve.call_args_list
+        ]
+        assert retrieved == ["vsfb_1", "vsfb_2", "vsfb_2"]
+
+    async def test_shared_manager_path_waits_for_indexing(self):
+        """Stores built from the shared upload manager are waited on."""
+        client = _client(
+            batches=[_batch("in_progress", 0, 1), _batch("completed", 1, 1)]
+        )
+        client.vector_stores.create = AsyncMock(
+            return_value=SimpleNamespace(id="vs_1")
+        )
+        upload_manager = SimpleNamespace(
+            upload_for_tool=AsyncMock(),
+            get_files_for_tool=lambda tool: ["file-1"],
+        )
+        manager = FileSearchManager(
+            client, upload_manager=upload_manager  # type: ignore[arg-type]
+        )
+
+        with patch("asyncio.sleep", new=AsyncMock()):
+            vector_store_id = (
+                await manager.create_vector_store_from_shared_manager()
+            )
+
+        assert vector_store_id == "vs_1"
+        info = manager.get_performance_info()
+        assert info["readiness_polls"] == 2
+        assert info["time_to_ready_seconds"] is not None
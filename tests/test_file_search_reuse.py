@@ -0,0 +1,225 @@
+"""Tests for content-addressed vector store reuse across runs."""
+
+import hashlib
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from ostruct.cli.file_search import FileSearchManager, vector_store_fingerprint
+from ostruct.cli.upload_cache import UploadCache
+
+
+class _FakeVectorStores:
+    """In-memory stand-in for client.vector_stores."""
+
+    def __init__(self):
+        self.stores = {}
+        self.created = 0
+        self.create = AsyncMock(side_effect=self._create)
+        self.retrieve = AsyncMock(side_effect=self._retrieve)
+        self.delete = AsyncMock()
+        self.file_batches = SimpleNamespace(
+            create=AsyncMock(side_effect=self._add_batch),
+            retrieve=AsyncMock(side_effect=self._retrieve_batch),
+        )
+        self.files = SimpleNamespace(
+            delete=AsyncMock(side_effect=self._remove)
+        )
+
+    async def _create(self, name, expires_after):
+        self.created += 1
+        store_id = f"vs_{self.created}"
+        self.stores[store_id] = set()
+        return SimpleNamespace(id=store_id)
+
+    async def _retrieve(self, store_id):
+        if store_id not in self.stores:
+            raise RuntimeError("404 not found")
+        return SimpleNamespace(
+            status="completed",
+            file_counts=SimpleNamespace(
+                total=len(self.stores[store_id]), failed=0, cancelled=0
+            ),
+        )
+
+    async def _add_batch(self, vector_store_id, file_ids):
+        self.stores[vector_store_id].update(file_ids)
+        return SimpleNamespace(id=f"vsfb_{vector_store_id}")
+
+    async def _retrieve_batch(self, batch_id, vector_store_id):
+        total = len(self.stores[vector_store_id])
+        return SimpleNamespace(
+            status="completed",
+            file_counts=SimpleNamespace(
+                completed=total, failed=0, cancelled=0, total=total
+            ),
+        )
+
+    async def _remove(self, file_id, vector_store_id):
+        self.stores[vector_store_id].discard(file_id)
+
+
+def _upload_manager(cache, file_hashes):
+    """Fake shared upload manager exposing the given file-search files."""
+    return SimpleNamespace(
+        _cache=cache,
+        upload_for_tool=AsyncMock(),
+        get_files_for_tool=lambda tool: list(file_hashes),
+        get_file_hashes_for_tool=lambda tool: dict(file_hashes),
+    )
+
+
+def _files(cache, names):
+    """Register cached uploads and return {file_id: hash}."""
+    hashes = {}
+    for name in names:
+        file_hash = hashlib.sha256(name.encode()).hexdigest()
+        cache.store(file_hash, f"file-{name}", 1, 0)
+        hashes[f"file-{name}"] = file_hash
+    return hashes
+
+
+async def _run(client, cache, file_hashes):
+    """Build the vector store for one run and clean up as the runner does."""
+    manager = FileSearchManager(
+        client,  # type: ignore[arg-type]
+        upload_manager=_upload_manager(cache, file_hashes),  # type: ignore[arg-type]
+        reuse_vector_stores=True,
+    )
+    vector_store_id = await manager.create_vector_store_from_shared_manager(
+        "ostruct_vector_store"
+    )
+    await manager._cleanup_vector_stores(manager.created_vector_stores)
+    return manager, vector_store_id
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return UploadCache(tmp_path / "cache.db")
+
+
+@pytest.fixture
+def client():
+    return SimpleNamespace(vector_stores=_FakeVectorStores())
+
+
+def test_fingerprint_ignores_order_and_duplicates():
+    """The fingerprint depends only on the set of hashes."""
+    assert vector_store_fingerprint(["b", "a", "a"]) == (
+        vector_store_fingerprint(["a", "b"])
+    )
+    assert vector_store_fingerprint(["a"]) != vector_store_fingerprint(["b"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_fs
+class TestVectorStoreReuse:
+    """Test FileSearchManager reuse of cached vector stores."""
+
+    async def test_same_files_reuse_store(self, client, cache):
+        """A second run with the same files reuses the first run's store."""
+        file_hashes = _files(cache, ["a", "b", "c"])
+
+        first, vs_first = await _run(client, cache, file_hashes)
+        second, vs_second = await _run(client, cache, file_hashes)
+
+        assert vs_first == vs_second
+        assert client.vector_stores.created == 1
+        client.vector_stores.delete.assert_not_called()
+        assert first.get_performance_info()["vector_store_reuse"] == "new"
+        assert second.get_performance_info()["vector_store_reuse"] == "exact"
+
+    async def test_near_match_is_patched(self, client, cache):
+        """A mostly identical file set only adds and removes the difference."""
+        names = [str(i) for i in range(10)]
+        _, vs_id = await _run(client, cache, _files(cache, names))
+
+        changed = _files(cache, names[1:] + ["new"])
+        client.vector_stores.file_batches.create.reset_mock()
+        manager, patched_id = await _run(client, cache, changed)
+
+        assert patched_id == vs_id
+        assert client.vector_stores.created == 1
+        client.vector_stores.files.delete.assert_called_once_with(
+            "file-0", vector_store_id=vs_id
+        )
+        client.vector_stores.file_batches.create.assert_called_once_with(
+            vector_store_id=vs_id, file_ids=["file-new"]
+        )
+        assert client.vector_stores.stores[vs_id] == set(changed)
+        assert set(cache.get_files_in_vector_store(vs_id)) == set(
+            changed.values()
+        )
+        assert manager.get_performance_info()["vector_store_reuse"] == (
+            "patched"
+        )
+
+    async def test_different_files_build_new_store(self, client, cache):
+        """Unrelated file sets get their own store."""
+        await _run(client, cache, _files(cache, ["a", "b"]))
+        await _run(client, cache, _files(cache, ["x", "y"]))
+
+        assert client.vector_stores.created == 2
+
+    async def test_dead_store_is_replaced(self, client, cache):
+        """A store that no longer exists is forgotten and rebuilt."""
+        file_hashes = _files(cache, ["a", "b"])
+        _, vs_id = await _run(client, cache, file_hashes)
+        del client.vector_stores.stores[vs_id]
+
+        _, new_id = await _run(client, cache, file_hashes)
+
+        assert new_id != vs_id
+        assert cache.get_files_in_vector_store(vs_id) == []
+        client.vector_stores.delete.assert_not_called()
+
+    async def test_incomplete_store_is_deleted(self, client, cache):
+        """A cached store that fails the file count check is deleted."""
+        file_hashes = _files(cache, ["a", "b"])
+        _, vs_id = await _run(client, cache, file_hashes)
+        client.vector_stores.stores[vs_id].discard("file-a")
+
+        _, new_id = await _run(client, cache, file_hashes)
+
+        assert new_id != vs_id
+        client.vector_stores.delete.assert_called_once_with(vs_id)
+        assert cache.get_files_in_vector_store(vs_id) == []
+
+    async def test_failed_patch_deletes_store(self, client, cache):
+        """A near match that cannot be patched is deleted and rebuilt."""
+        names = [str(i) for i in range(10)]
+        _, vs_id = await _run(client, cache, _files(cache, names))
+        client.vector_stores.files.delete.side_effect = RuntimeError("boom")
+
+        _, new_id = await _run(client, cache, _files(cache, names[1:]))
+
+        assert new_id != vs_id
+        client.vector_stores.delete.assert_called_once_with(vs_id)
+
+    async def test_patch_detaches_files_without_upload_entry(
+        self, client, cache
+    ):
+        """Stale files are detached by the file ID recorded in the mapping."""
+        names = [str(i) for i in range(10)]
+        _, vs_id = await _run(client, cache, _files(cache, names))
+        changed = _files(cache, names[1:])
+
+        with patch.object(cache, "lookup", return_value=None):
+            _, patched_id = await _run(client, cache, changed)
+
+        assert patched_id == vs_id
+        client.vector_stores.files.delete.assert_called_once_with(
+            "file-0", vector_store_id=vs_id
+        )
+        assert client.vector_stores.stores[vs_id] == set(changed)
+
+    async def test_reuse_disabled_keeps_per_run_store(self, client, cache):
+        """Without reuse the store is created per run and cleaned up."""
+        manager = FileSearchManager(
+            client,  # type: ignore[arg-type]
+            upload_manager=_upload_manager(cache, _files(cache, ["a"])),  # type: ignore[arg-type]
+        )
+        vs_id = await manager.create_vector_store_from_shared_manager()
+
+        assert manager.created_vector_stores == [vs_id]
+        assert cache.list_vector_stores() == []
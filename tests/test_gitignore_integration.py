@@ -224,6 +224,103 @@ def test_collect_files_performance_with_many_files(self) -> None:
                     or file_info.name == ".gitignore"
                 )
 
+    def test_non_recursive_collection_scans_only_top_directory(self) -> None:
+        """Subdirectories are not listed at all when not recursive."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_dir = Path(tmpdir)
+            (test_dir / "top.py").write_text("# top")
+            for i in range(3):
+                (test_dir / f"sub{i}" / "deep").mkdir(parents=True)
+                (test_dir / f"sub{i}" / "deep" / "x.py").write_text("# x")
+
+            security_manager = SecurityManager(base_dir=str(test_dir))
+
+            with patch(
+                "ostruct.cli.file_utils.os.scandir", wraps=os.scandir
+            ) as scandir:
+                files = collect_files_from_directory(
+                    directory=str(test_dir),
+                    security_manager=security_manager,
+                    recursive=False,
+                )
+
+            assert [f.name for f in files] == ["top.py"]
+            assert scandir.call_count == 1
+
+    def test_ignored_directories_are_not_descended_into(self) -> None:
+        """Directories matched by .gitignore are pruned from the walk."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_dir = Path(tmpdir)
+            (test_dir / "src").mkdir()
+            (test_dir / "src" / "app.py").write_text("# app")
+            modules = test_dir / "web" / "node_modules" / "pkg"
+            modules.mkdir(parents=True)
+            (modules / "index.js").write_text("// dep")
+            (test_dir / ".gitignore").write_text("node_modules/\n")
+
+            security_manager = SecurityManager(base_dir=str(test_dir))
+
+            with (
+                patch(
+                    "ostruct.cli.file_utils.os.scandir", wraps=os.scandir
+                ) as scandir,
+                patch("ostruct.cli.file_utils.logger") as mock_logger,
+            ):
+                files = collect_files_from_directory(
+                    directory=str(test_dir),
+                    security_manager=security_manager,
+                    recursive=True,
+                )
+
+            scanned = [str(c.args[0]) for c in scandir.call_args_list]
+            assert not any("node_modules" in path for path in scanned)
+            assert sorted(f.name for f in files) == [".gitignore", "app.py"]
+            mock_logger.info.assert_any_call(
+                "Skipped %d directories based on .gitignore patterns", 1
+            )
+
+    def test_negated_patterns_keep_walking_ignored_directories(self) -> None:
+        """Files re-included by a negation are still collected."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_dir = Path(tmpdir)
+            (test_dir / "vendor").mkdir()
+            (test_dir / "vendor" / "keep.txt").write_text("keep")
+            (test_dir / "vendor" / "drop.txt").write_text("drop")
+            (test_dir / ".gitignore").write_text(
+                "vendor/*\n!vendor/keep.txt\n"
+            )
+
+            security_manager = SecurityManager(base_dir=str(test_dir))
+            files = collect_files_from_directory(
+                directory=str(test_dir),
+                security_manager=security_manager,
+                recursive=True,
+            )
+
+            file_names = [f.name for f in files]
+            assert "keep.txt" in file_names
+            assert "drop.txt" not in file_names
+
+    def test_symlinked_directories_are_not_followed(self) -> None:
+        """Recursive walks do not follow directory symlinks."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_dir = Path(tmpdir)
+            (test_dir / "real").mkdir()
+            (test_dir / "real" / "a.txt").write_text("a")
+            os.symlink(test_dir / "real", test_dir / "alias")
+
+            security_manager = SecurityManager(base_dir=str(test_dir))
+            files = collect_files_from_directory(
+                directory=str(test_dir),
+                security_manager=security_manager,
+                recursive=True,
+                ignore_gitignore=True,
+            )
+
+            assert [f.path for f in files] == [
+                os.path.relpath(test_dir / "real" / "a.txt", test_dir)
+            ]
+
 
 class TestGitignoreConfiguration:
     """Test gitignore configuration support."""
@@ -466,3 +466,29 @@ def test_nested_directory_patterns(self) -> None:
             assert manager.should_ignore("src/main/generated/Parser.java")
             assert manager.should_ignore("src/test/generated/Lexer.java")
             assert not manager.should_ignore("src/main/java/Main.java")
+
+    def test_should_ignore_directory(self) -> None:
+        """Test whole-directory matching used to prune directory walks."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            gitignore = Path(tmpdir) / ".gitignore"
+            gitignore.write_text("node_modules/\nbuild\nlogs/*\n")
+
+            manager = GitignoreManager(directory=tmpdir)
+
+            assert manager.should_ignore_directory("node_modules")
+            assert manager.should_ignore_directory("web/node_modules/")
+            assert manager.should_ignore_directory("build")
+            # Only the contents of logs/ are ignored, not logs/ itself
+            assert not manager.should_ignore_directory("logs")
+            assert not manager.should_ignore_directory("src")
+
+    def test_should_ignore_directory_with_negations(self) -> None:
+        """Negated patterns disable directory pruning entirely."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            gitignore = Path(tmpdir) / ".gitignore"
+            gitignore.write_text("vendor/\n!vendor/keep.txt\n")
+
+            manager = GitignoreManager(directory=tmpdir)
+
+            assert not manager.should_ignore_directory("vendor")
+            assert not GitignoreManager().should_ignore_directory("vendor")
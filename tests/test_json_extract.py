@@ -300,3 +300,32 @@ def test_json_with_special_characters():
     assert data["quotes"] == 'He said "Hello"'
     assert data["backslash"] == "C:\\Users\\file.txt"
     assert "Special characters handled" in markdown_text
+
+
+def test_fence_inside_string_is_not_closing():
+    """Fences and escaped quotes inside strings do not end the block."""
+    payload = {"a": 'say "```" then \\', "b": "```json\n{}\n```"}
+    content = f"```json\n{json.dumps(payload)}\n```\nafter ```"
+
+    data, markdown_text = split_json_and_text(content)
+    assert data == payload
+    assert markdown_text == "after ```"
+
+
+def test_unterminated_string_with_fence():
+    """A fence swallowed by an unterminated string is invalid JSON."""
+    content = '```json\n{"a": "open\n```\n'
+
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        split_json_and_text(content)
+
+
+def test_extraction_from_worker_threads():
+    """Extraction does not depend on signals and works off the main thread."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    content = '```json\n{"thread": true}\n```\ndone'
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(split_json_and_text, [content] * 8))
+
+    assert results == [({"thread": True}, "done")] * 8
@@ -0,0 +1,100 @@
+"""Tests for limit enforcement in the secure JSON parser."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from ostruct.cli import json_limits
+from ostruct.cli.json_limits import (
+    JSONComplexityError,
+    JSONDepthError,
+    JSONSizeError,
+    SecureJSONParser,
+    parse_json_secure,
+)
+
+PAYLOADS = [
+    '{"a": [1, 2.5, "x", null, true, false], "b": {"c": {}}}',
+    '[{"k": "v\\u00e9\\"}"}, [], [[-1e3]], 12345678901234567890]',
+    '"plain string"',
+    "42",
+    '{"dup": 1, "dup": 2}',
+]
+
+
+class TestParse:
+    """Parsed values match json.loads."""
+
+    @pytest.mark.parametrize("payload", PAYLOADS)
+    def test_matches_json_loads(self, payload):
+        assert SecureJSONParser().parse(payload) == json.loads(payload)
+
+    def test_malformed_json_keeps_decode_error(self):
+        """Callers rely on the stdlib error message and position."""
+        with pytest.raises(json.JSONDecodeError, match="Extra data") as e:
+            SecureJSONParser().parse('{"a": 1}{"a": 1}')
+        assert e.value.pos == 8
+
+    def test_non_standard_constants(self):
+        """Values json.loads accepts are not rejected."""
+        parser = SecureJSONParser()
+        assert parser.parse("[NaN]")[0] != parser.parse("[NaN]")[0]
+
+
+class TestLimits:
+    """Depth and complexity limits."""
+
+    def test_depth_limit(self):
+        parser = SecureJSONParser(max_depth=3)
+        assert parser.parse("[[[1]]]") == [[[1]]]
+        with pytest.raises(JSONDepthError, match="4 levels"):
+            parser.parse("[[[[1]]]]")
+
+    def test_key_limit(self):
+        parser = SecureJSONParser(max_keys=3)
+        assert parser.parse('{"a": 1, "b": 2, "c": 3}')
+        with pytest.raises(JSONComplexityError, match="too many keys: 4"):
+            parser.parse('{"a": 1, "b": 2, "c": 3, "d": 4}')
+
+    def test_array_limit(self):
+        parser = SecureJSONParser(max_keys=3)
+        assert parser.parse('{"x": [1, 2, 3]}')
+        with pytest.raises(JSONComplexityError, match="too long: 4 items"):
+            parser.parse('{"x": [1, 2, 3, 4]}')
+
+    def test_size_limit(self):
+        with pytest.raises(JSONSizeError):
+            SecureJSONParser(max_size=4).parse("[1, 2]")
+
+    def test_deep_payload_does_not_recurse(self):
+        """Validation does not depend on the interpreter recursion limit."""
+        parser = SecureJSONParser(max_depth=5000)
+        nested = _nest(2000)
+        with patch.object(json_limits.json, "loads", return_value=nested):
+            assert parser.parse("[]") is nested
+
+    def test_depth_limit_on_scalars(self):
+        """A scalar one level below the limit counts toward the depth."""
+        parser = SecureJSONParser(max_depth=2)
+        assert parser.parse('{"a": {"b": []}}') == {"a": {"b": []}}
+        with pytest.raises(JSONDepthError, match="3 levels"):
+            parser.parse('{"a": {"b": [1]}}')
+
+
+def _nest(depth):
+    value: list = []
+    for _ in range(depth - 1):
+        value = [value]
+    return value
+
+
+def test_parse_json_secure_reuses_parsers():
+    """Repeated calls with the same limits share one parser."""
+    json_limits._get_parser.cache_clear()
+    for _ in range(3):
+        parse_json_secure("[1]", max_depth=10)
+        parse_json_secure("[1]", max_keys=10)
+
+    info = json_limits._get_parser.cache_info()
+    assert info.misses == 2
+    assert info.hits == 4
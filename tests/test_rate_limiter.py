@@ -0,0 +1,286 @@
+"""Tests for the client-side rate limiter."""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+from ostruct.cli import rate_limiter
+from ostruct.cli.rate_limiter import (
+    AdaptiveConcurrency,
+    RateLimiter,
+    TokenBucket,
+    estimate_request_tokens,
+    get_rate_limiter,
+    observe_rate_limit_headers,
+    rate_limit_event_hooks,
+    rate_limited,
+)
+
+
+class FakeClock:
+    """Monotonic clock advanced by asyncio.sleep calls."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with (
+        patch.object(rate_limiter.time, "monotonic", fake.monotonic),
+        patch.object(rate_limiter.asyncio, "sleep", fake.sleep),
+    ):
+        yield fake
+
+
+class TestTokenBucket:
+    """Test budget accounting of a single bucket."""
+
+    def test_full_bucket_does_not_wait(self, clock):
+        bucket = TokenBucket(60)
+
+        assert all(bucket.reserve(1) == 0 for _ in range(60))
+        assert bucket.reserve(1) == pytest.approx(1.0)
+
+    def test_refills_over_time(self, clock):
+        bucket = TokenBucket(60)
+        bucket.reserve(60)
+
+        clock.now += 30
+        assert bucket.reserve(30) == 0
+        assert bucket.reserve(1) == pytest.approx(1.0)
+
+    def test_oversized_reservation_is_capped(self, clock):
+        bucket = TokenBucket(100)
+        bucket.reserve(100)
+
+        assert bucket.reserve(10_000) == pytest.approx(60.0)
+
+    def test_sync_remaining_only_lowers_level(self, clock):
+        bucket = TokenBucket(60)
+        bucket.sync_remaining(0)
+        assert bucket.reserve(1) == pytest.approx(1.0)
+
+        bucket = TokenBucket(60)
+        bucket.sync_remaining(1000)
+        assert bucket.reserve(60) == 0
+
+
+class TestAdaptiveConcurrency:
+    """Test the AIMD concurrency limit."""
+
+    def test_halves_on_throttle_and_grows_back(self, clock):
+        concurrency = AdaptiveConcurrency(maximum=8, minimum=2)
+
+        concurrency.on_throttle()
+        assert concurrency.limit == 4
+        concurrency.on_throttle()  # within cooldown
+        assert concurrency.limit == 4
+
+        clock.now += 5
+        concurrency.on_throttle()
+        concurrency.on_throttle()
+        clock.now += 5
+        concurrency.on_throttle()
+        assert concurrency.limit == 2
+
+        for _ in range(2):
+            concurrency.on_success()
+        assert concurrency.limit == pytest.approx(2 + 1 / 2 + 1 / 2.5)
+
+    @pytest.mark.asyncio
+    async def test_limits_requests_in_flight(self):
+        concurrency = AdaptiveConcurrency(maximum=2)
+        active = 0
+        peak = 0
+
+        async def request() -> None:
+            nonlocal active, peak
+            await concurrency.acquire()
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            concurrency.release()
+
+        await asyncio.gather(*(request() for _ in range(6)))
+
+        assert peak == 2
+        assert concurrency.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_gives_up_its_place(self):
+        concurrency = AdaptiveConcurrency(maximum=1)
+        await concurrency.acquire()
+
+        waiter = asyncio.ensure_future(concurrency.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        concurrency.release()
+        assert concurrency.in_flight == 0
+        await asyncio.wait_for(concurrency.acquire(), timeout=1)
+
+
+class TestRateLimiter:
+    """Test per-key budgets and header feedback."""
+
+    @pytest.mark.asyncio
+    async def test_enforces_configured_budgets(self, clock):
+        limiter = RateLimiter(requests_per_minute=120, tokens_per_minute=600)
+
+        for _ in range(2):
+            async with limiter.limit("responses", "gpt-4o", tokens=600):
+                pass
+
+        assert clock.sleeps == [pytest.approx(60.0)]
+        stats = limiter.stats()["responses:gpt-4o"]
+        assert stats["requests"] == 2
+        assert stats["tokens"] == 1200
+        assert stats["wait_seconds"] == pytest.approx(60.0)
+
+    @pytest.mark.asyncio
+    async def test_keys_are_independent(self, clock):
+        limiter = RateLimiter(requests_per_minute=1)
+
+        async with limiter.limit("responses", "gpt-4o"):
+            pass
+        async with limiter.limit("responses", "gpt-4.1"):
+            pass
+        async with limiter.limit("files"):
+            pass
+
+        assert clock.sleeps == []
+        assert set(limiter.stats()) == {
+            "responses:gpt-4o",
+            "responses:gpt-4.1",
+            "files",
+        }
+
+    @pytest.mark.asyncio
+    async def test_learns_budget_from_headers(self, clock):
+        limiter = RateLimiter()
+
+        async with limiter.limit("responses", "gpt-4o", tokens=10):
+            observe_rate_limit_headers(
+                200,
+                {
+                    "x-ratelimit-limit-requests": "60",
+                    "x-ratelimit-remaining-requests": "0",
+                    "x-ratelimit-limit-tokens": "1000",
+                    "x-ratelimit-remaining-tokens": "990",
+                },
+            )
+        async with limiter.limit("responses", "gpt-4o", tokens=10):
+            pass
+
+        stats = limiter.stats()["responses:gpt-4o"]
+        assert stats["requests_per_minute"] == 60
+        assert stats["tokens_per_minute"] == 1000
+        assert clock.sleeps == [pytest.approx(1.0)]
+
+    @pytest.mark.asyncio
+    async def test_throttling_reduces_concurrency(self, clock):
+        limiter = RateLimiter(max_concurrency=8)
+
+        async with limiter.limit("files"):
+            observe_rate_limit_headers(429, {})
+
+        stats = limiter.stats()["files"]
+        assert stats["throttled"] == 1
+        assert stats["concurrency"] == 4
+
+    @pytest.mark.asyncio
+    async def test_low_headroom_holds_concurrency(self, clock):
+        limiter = RateLimiter(max_concurrency=8)
+        async with limiter.limit("files"):
+            observe_rate_limit_headers(429, {})
+        clock.now += 5
+
+        async with limiter.limit("files"):
+            observe_rate_limit_headers(
+                200,
+                {
+                    "x-ratelimit-limit-requests": "100",
+                    "x-ratelimit-remaining-requests": "2",
+                },
+            )
+        state = limiter._state("files")
+        assert state.concurrency.limit == 4
+
+        async with limiter.limit("files"):
+            pass
+        assert state.concurrency.limit == pytest.approx(4.25)
+
+    def test_headers_outside_a_slot_are_ignored(self):
+        observe_rate_limit_headers(429, {"x-ratelimit-limit-requests": "1"})
+
+    @pytest.mark.asyncio
+    async def test_httpx_hook_reports_responses(self, clock):
+        limiter = RateLimiter()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                headers={
+                    "x-ratelimit-limit-requests": "30",
+                    "x-ratelimit-remaining-requests": "29",
+                },
+            )
+
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler),
+            event_hooks=rate_limit_event_hooks(),
+        ) as client:
+            async with limiter.limit("containers"):
+                await client.get("https://api.openai.com/v1/containers")
+
+        assert limiter.stats()["containers"]["requests_per_minute"] == 30
+
+
+def test_estimate_request_tokens():
+    assert estimate_request_tokens("a" * 400) == 100
+    assert estimate_request_tokens("abcd", "efgh", max_output_tokens=50) == 52
+
+
+@pytest.mark.asyncio
+async def test_shared_limiter_follows_config(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "ostruct.yaml").write_text(
+        "rate_limits:\n  requests_per_minute: 10\n  max_concurrency: 3\n"
+    )
+    monkeypatch.setenv("OSTRUCT_RATE_LIMIT_RPM", "42")
+    monkeypatch.setenv("OSTRUCT_RATE_LIMIT_CONCURRENCY", "3")
+    limiter = get_rate_limiter()
+
+    assert limiter is not None
+    assert limiter is get_rate_limiter()
+    assert limiter.requests_per_minute == 42
+    assert limiter.max_concurrency == 3
+
+    async with rate_limited("responses", "gpt-4o"):
+        pass
+    assert limiter.stats()["responses:gpt-4o"]["requests"] == 1
+
+
+@pytest.mark.asyncio
+async def test_disabled_limiter_is_a_no_op(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "ostruct.yaml").write_text("rate_limits: {}\n")
+    monkeypatch.setenv("OSTRUCT_RATE_LIMIT", "false")
+
+    assert get_rate_limiter() is None
+    async with rate_limited("responses", "gpt-4o", tokens=10**9):
+        pass
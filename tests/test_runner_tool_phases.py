@@ -0,0 +1,78 @@
+"""Tests for concurrent tool preparation phases in the runner."""
+
+import asyncio
+
+import pytest
+from ostruct.cli.runner import _run_tool_preparation_phases
+from ostruct.cli.upload_manager import UploadError
+
+
+@pytest.mark.asyncio
+class TestToolPreparationPhases:
+    """Test the concurrent CI / FS / user-data preparation helper."""
+
+    async def test_phases_run_concurrently(self):
+        """Phases overlap instead of waiting for each other."""
+        running = 0
+        peak = 0
+
+        async def phase(result):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return result
+
+        results = await _run_tool_preparation_phases(
+            {
+                "code-interpreter": phase(["file-1"]),
+                "file-search": phase("vs_123"),
+                "user-data": phase({}),
+            }
+        )
+
+        assert peak == 3
+        assert results == {
+            "code-interpreter": ["file-1"],
+            "file-search": "vs_123",
+            "user-data": {},
+        }
+
+    async def test_single_failure_is_reraised_unchanged(self):
+        """A single failing phase raises its original error."""
+        finished = []
+
+        async def ok():
+            await asyncio.sleep(0.01)
+            finished.append("user-data")
+            return {}
+
+        async def fail():
+            raise UploadError("vector store failed")
+
+        with pytest.raises(UploadError, match="vector store failed"):
+            await _run_tool_preparation_phases(
+                {"file-search": fail(), "user-data": ok()}
+            )
+
+        # Other phases still complete so cleanup sees their resources
+        assert finished == ["user-data"]
+
+    async def test_multiple_failures_are_attributed_per_tool(self):
+        """Several failures are combined and labelled with their tool."""
+
+        async def fail(msg):
+            raise RuntimeError(msg)
+
+        with pytest.raises(UploadError) as exc_info:
+            await _run_tool_preparation_phases(
+                {
+                    "code-interpreter": fail("ci broke"),
+                    "user-data": fail("ud broke"),
+                }
+            )
+
+        message = str(exc_info.value)
+        assert "Code Interpreter: ci broke" in message
+        assert "user-data: ud broke" in message
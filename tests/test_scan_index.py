@@ -0,0 +1,170 @@
+"""Tests for the persistent directory-scan index."""
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from ostruct.cli import file_utils
+from ostruct.cli.file_utils import collect_files_from_directory
+from ostruct.cli.scan_index import (
+    DirectoryScan,
+    ScanIndex,
+    get_default_scan_index_path,
+    get_scan_index,
+    walk_key,
+)
+from ostruct.cli.security import SecurityManager
+
+OLD_MTIME_NS = time.time_ns() - 60_000_000_000
+
+
+def _age(root: Path) -> None:
+    """Move directory mtimes out of the racy window so they get indexed."""
+    for directory in [root, *(p for p in root.rglob("*") if p.is_dir())]:
+        os.utime(directory, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    root = tmp_path / "project"
+    for name in ("src", "docs", "node_modules/pkg"):
+        (root / name).mkdir(parents=True)
+    (root / "src" / "app.py").write_text("app")
+    (root / "src" / "util.py").write_text("util")
+    (root / "docs" / "guide.md").write_text("guide")
+    (root / "node_modules" / "pkg" / "index.js").write_text("dep")
+    (root / ".gitignore").write_text("node_modules/\n*.log\n")
+    _age(root)
+    return root
+
+
+@pytest.fixture
+def index(tmp_path: Path):
+    scan_index = ScanIndex(tmp_path / "cache" / "scan_index.sqlite")
+    with patch.object(file_utils, "get_scan_index", return_value=scan_index):
+        yield scan_index
+
+
+def _collect(root: Path) -> list:
+    files = collect_files_from_directory(
+        str(root),
+        security_manager=SecurityManager(root),
+        recursive=True,
+    )
+    return sorted(f.path for f in files)
+
+
+def _scans(root: Path) -> tuple:
+    """Collect and report which directories were actually listed."""
+    with patch.object(
+        file_utils, "_scan_directory", wraps=file_utils._scan_directory
+    ) as scan:
+        result = _collect(root)
+    return result, sorted(call.args[1] for call in scan.call_args_list)
+
+
+class TestScanIndex:
+    """Test reuse and invalidation of stored directory scans."""
+
+    def test_unchanged_tree_is_not_rescanned(self, project, index):
+        """A second walk of an unchanged tree lists no directories."""
+        first, first_scans = _scans(project)
+        second, second_scans = _scans(project)
+
+        assert first == second
+        assert first == [
+            ".gitignore",
+            "docs/guide.md",
+            "src/app.py",
+            "src/util.py",
+        ]
+        assert first_scans == ["", "docs", "src"]
+        assert second_scans == []
+
+    def test_only_changed_directories_are_rescanned(self, project, index):
+        """Adding a file rescans just the directory that contains it."""
+        _collect(project)
+        (project / "src" / "new.py").write_text("new")
+        (project / "src" / "debug.log").write_text("ignored")
+
+        files, scans = _scans(project)
+
+        assert scans == ["src"]
+        assert "src/new.py" in files
+        assert "src/debug.log" not in files
+
+    def test_removed_directories_are_noticed(self, project, index):
+        """Deleting a subdirectory changes its parent's mtime."""
+        _collect(project)
+        (project / "docs" / "guide.md").unlink()
+        (project / "docs").rmdir()
+
+        files, scans = _scans(project)
+
+        assert scans == [""]
+        assert "docs/guide.md" not in files
+
+    def test_gitignore_changes_invalidate_index(self, project, index):
+        """Different ignore patterns start from a fresh scan."""
+        _collect(project)
+        gitignore = project / ".gitignore"
+        gitignore.write_text("node_modules/\n*.py\n")
+        os.utime(project, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+        os.utime(gitignore, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+
+        files, scans = _scans(project)
+
+        assert scans == ["", "docs", "src"]
+        assert files == [".gitignore", "docs/guide.md"]
+
+    def test_directories_with_symlinks_are_always_rescanned(
+        self, project, index
+    ):
+        """A symlink can change type without touching its directory."""
+        os.symlink(project / "src", project / "docs" / "src_link")
+        _age(project)
+
+        _collect(project)
+        _, scans = _scans(project)
+
+        assert scans == ["docs"]
+
+    def test_recursive_setting_is_part_of_the_key(self, project, index):
+        """Recursive and non-recursive walks are stored separately."""
+        _collect(project)
+        files = collect_files_from_directory(
+            str(project),
+            security_manager=SecurityManager(project),
+            recursive=False,
+        )
+
+        assert sorted(f.path for f in files) == [".gitignore"]
+
+
+def test_directory_scan_round_trip():
+    """Stored scans keep everything a walk needs."""
+    scan = DirectoryScan(["a.py"], ["sub"], 2, ["node_modules"])
+
+    assert DirectoryScan.from_json(scan.to_json()) == scan
+    assert walk_key("/p", True, None) != walk_key("/p", False, None)
+    assert walk_key("/p", True, "abc") != walk_key("/p", True, None)
+
+
+def test_scan_index_is_opt_in(tmp_path, monkeypatch):
+    """The index is only opened when enabled in the configuration."""
+    from ostruct.cli.config import clear_config_cache
+    from ostruct.cli.scan_index import reset_scan_index
+
+    monkeypatch.setenv("OSTRUCT_CACHE_DIR", str(tmp_path))
+    assert get_scan_index() is None
+
+    monkeypatch.setenv("OSTRUCT_SCAN_INDEX", "true")
+    clear_config_cache()
+    reset_scan_index()
+    scan_index = get_scan_index()
+
+    assert scan_index is not None
+    assert scan_index.index_path == get_default_scan_index_path()
+    assert scan_index.index_path.parent == tmp_path
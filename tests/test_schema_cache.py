@@ -0,0 +1,125 @@
+"""Tests for per-process schema, model and strict-schema caches."""
+
+import copy
+from unittest.mock import patch
+
+import pytest
+from ostruct.cli import model_creation, template_utils
+from ostruct.cli.errors import SchemaValidationError
+from ostruct.cli.model_creation import create_dynamic_model
+from ostruct.cli.schema_utils import (
+    MODEL_CACHE_SIZE,
+    clear_schema_caches,
+    get_strict_schema,
+    schema_fingerprint,
+)
+from ostruct.cli.template_utils import validate_json_schema
+
+SCHEMA = {
+    "type": "object",
+    "definitions": {
+        "item": {
+            "type": "object",
+            "properties": {"name": {"type": "string"}},
+            "required": ["name"],
+        }
+    },
+    "properties": {
+        "title": {"type": "string"},
+        "items": {"type": "array", "items": {"$ref": "#/definitions/item"}},
+    },
+    "required": ["title", "items"],
+}
+
+
+def test_fingerprint_ignores_key_order():
+    reordered = dict(reversed(list(SCHEMA.items())))
+
+    assert schema_fingerprint(reordered) == schema_fingerprint(SCHEMA)
+    assert schema_fingerprint({"type": "string"}) != schema_fingerprint(SCHEMA)
+    assert schema_fingerprint({"bad": object()}) is None
+
+
+class TestModelCache:
+    """Test reuse of dynamic models built from equal schemas."""
+
+    def test_equal_schemas_share_one_model(self):
+        with patch.object(
+            model_creation,
+            "_build_dynamic_model",
+            wraps=model_creation._build_dynamic_model,
+        ) as build:
+            first = create_dynamic_model(copy.deepcopy(SCHEMA))
+            builds = build.call_count
+            second = create_dynamic_model(copy.deepcopy(SCHEMA))
+
+        assert first is second
+        assert build.call_count == builds
+        result = first.model_validate({"title": "t", "items": [{"name": "a"}]})
+        assert result.title == "t"
+
+    def test_base_name_is_part_of_the_key(self):
+        model = create_dynamic_model(SCHEMA)
+        other = create_dynamic_model(SCHEMA, base_name="DryRunModel")
+
+        assert model is not other
+        assert other.__name__ == "DryRunModel"
+
+    def test_caller_schema_is_not_modified(self):
+        schema = copy.deepcopy(SCHEMA)
+        create_dynamic_model(schema)
+
+        assert schema == SCHEMA
+
+    def test_debug_options_bypass_cache(self):
+        model = create_dynamic_model(SCHEMA)
+
+        assert create_dynamic_model(SCHEMA, show_schema=True) is not model
+        assert create_dynamic_model(SCHEMA, debug_validation=True) is not (
+            model
+        )
+
+    def test_cache_is_bounded(self):
+        first = create_dynamic_model(SCHEMA, base_name="Model0")
+        for i in range(1, MODEL_CACHE_SIZE + 1):
+            create_dynamic_model(SCHEMA, base_name=f"Model{i}")
+
+        assert create_dynamic_model(SCHEMA, base_name="Model0") is not first
+
+    def test_clear_schema_caches(self):
+        model = create_dynamic_model(SCHEMA)
+        clear_schema_caches()
+
+        assert create_dynamic_model(SCHEMA) is not model
+
+
+class TestValidationMemo:
+    """Test that a schema is checked against the meta-schema once."""
+
+    def test_valid_schema_is_checked_once(self):
+        with patch.object(
+            template_utils.jsonschema.validators, "validator_for"
+        ) as validator_for:
+            for _ in range(3):
+                validate_json_schema(copy.deepcopy(SCHEMA))
+
+        assert validator_for.call_count == 1
+
+    def test_invalid_schema_keeps_failing(self):
+        bad = {"type": "object", "properties": {}, "required": ["missing"]}
+        for _ in range(2):
+            with pytest.raises(SchemaValidationError):
+                validate_json_schema(bad)
+
+
+def test_strict_schema_is_built_once():
+    model = create_dynamic_model(SCHEMA)
+
+    with patch.object(
+        model, "model_json_schema", wraps=model.model_json_schema
+    ) as generate:
+        strict = get_strict_schema(model)
+        assert get_strict_schema(model) is strict
+
+    assert generate.call_count == 1
+    assert strict["additionalProperties"] is False
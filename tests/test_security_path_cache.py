@@ -0,0 +1,201 @@
+"""Tests for the allowed-directory index and validated-directory memo."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from ostruct.cli.security import (
+    AllowedDirIndex,
+    PathSecurity,
+    PathSecurityError,
+    SecurityManager,
+    is_path_in_allowed_dirs,
+)
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    """Base directory with a nested tree and a sibling outside it."""
+    base = tmp_path / "base"
+    (base / "src" / "pkg").mkdir(parents=True)
+    for i in range(5):
+        (base / "src" / f"file_{i}.txt").write_text(str(i))
+    (base / "src" / "pkg" / "mod.py").write_text("x = 1")
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "secret.txt").write_text("secret")
+    return tmp_path
+
+
+class TestAllowedDirIndex:
+    """Test AllowedDirIndex against the one-off checker."""
+
+    def test_matches_linear_check(self):
+        """The index agrees with is_path_in_allowed_dirs."""
+        allowed = [Path(f"/data/project_{i}") for i in range(200)]
+        allowed.append(Path("/base"))
+        index = AllowedDirIndex(allowed)
+
+        for path in [
+            "/base/file.txt",
+            "/base",
+            "/data/project_7/deep/nested/file.txt",
+            "/data/project_7x/file.txt",
+            "/data/file.txt",
+            "/base2/file.txt",
+            "/etc/passwd",
+        ]:
+            assert index.contains(path) == is_path_in_allowed_dirs(
+                path, allowed
+            ), path
+
+    def test_component_boundaries(self):
+        """Sibling directories sharing a name prefix are not allowed."""
+        index = AllowedDirIndex([Path("/srv/app")])
+
+        assert index.contains("/srv/app/config.yaml")
+        assert not index.contains("/srv/application/config.yaml")
+        assert not index.contains("/srv")
+        assert len(index) == 1
+
+
+class TestValidatedDirectoryMemo:
+    """Test SecurityManager reuse of already validated directories."""
+
+    def test_files_in_validated_dir_skip_allowlist(self, tree):
+        """Once a directory is validated its files skip is_path_allowed."""
+        manager = SecurityManager(tree / "base")
+        src = tree / "base" / "src"
+        manager.validate_path(src)
+
+        with patch.object(
+            manager, "is_path_allowed", wraps=manager.is_path_allowed
+        ) as is_allowed:
+            for i in range(5):
+                manager.validate_path(src / f"file_{i}.txt")
+                manager.resolve_path(src / f"file_{i}.txt")
+
+        is_allowed.assert_not_called()
+
+    def test_subdirectories_are_checked_individually(self, tree):
+        """Only the immediate parent counts, not any validated ancestor."""
+        manager = SecurityManager(tree / "base")
+        manager.validate_path(tree / "base" / "src")
+
+        with patch.object(
+            manager, "is_path_allowed", wraps=manager.is_path_allowed
+        ) as is_allowed:
+            manager.validate_path(tree / "base" / "src" / "pkg" / "mod.py")
+
+        is_allowed.assert_called_once()
+
+    def test_symlinks_in_validated_dir_are_still_checked(self, tree):
+        """A symlink escaping a validated directory is still rejected."""
+        manager = SecurityManager(tree / "base")
+        src = tree / "base" / "src"
+        link = src / "link.txt"
+        os.symlink(tree / "outside" / "secret.txt", link)
+        manager.validate_path(src)
+
+        with pytest.raises(PathSecurityError):
+            manager.validate_path(link)
+
+    def test_changing_allowed_dirs_clears_memo(self, tree):
+        """Temporary allowances do not outlive their security context."""
+        manager = SecurityManager(
+            tree / "base", security_mode=PathSecurity.STRICT
+        )
+        outside = tree / "outside"
+
+        with manager.security_context(
+            PathSecurity.STRICT, additional_allows=[str(outside)]
+        ):
+            manager.validate_path(outside)
+            manager.validate_path(outside / "secret.txt")
+
+        with pytest.raises(PathSecurityError):
+            manager.validate_path(outside / "secret.txt")
+        with pytest.raises(PathSecurityError):
+            manager.resolve_path(outside / "secret.txt")
+
+
+class TestBatchValidationFastPath:
+    """Test validate_batch_access on whole walk results."""
+
+    def test_matches_per_path_validation(self, tree):
+        """The fast path returns what validate_file_access would."""
+        manager = SecurityManager(tree / "base")
+        paths = [p for p in (tree / "base").rglob("*") if p.is_file()] + [
+            tree / "base" / "src"
+        ]
+
+        expected = [manager.validate_file_access(p) for p in paths]
+
+        assert (
+            SecurityManager(tree / "base").validate_batch_access(paths)
+            == expected
+        )
+
+    def test_regular_files_skip_full_validation(self, tree):
+        """Only symlinks and missing files take the slow path."""
+        manager = SecurityManager(tree / "base")
+        src = tree / "base" / "src"
+        os.symlink(src / "file_0.txt", src / "link.txt")
+        paths = [src / f"file_{i}.txt" for i in range(5)]
+        paths += [src / "link.txt", src / "missing.txt"]
+
+        with patch.object(
+            manager,
+            "validate_file_access",
+            wraps=manager.validate_file_access,
+        ) as full:
+            results = manager.validate_batch_access(paths)
+
+        assert [c.args[0] for c in full.call_args_list] == paths[5:]
+        assert results[:5] == [p.resolve() for p in paths[:5]]
+        assert results[5] == (src / "file_0.txt").resolve()
+        assert len(results) == 6
+
+    def test_strict_mode_rejects_outside_files(self, tree):
+        """Files outside the allowed directories still fail in STRICT."""
+        manager = SecurityManager(
+            tree / "base", security_mode=PathSecurity.STRICT
+        )
+        paths = [
+            tree / "base" / "src" / "file_0.txt",
+            tree / "outside" / "secret.txt",
+        ]
+
+        with pytest.raises(PathSecurityError, match="Batch validation"):
+            manager.validate_batch_access(paths)
+
+    def test_directory_walk_validates_in_batches(self, tree):
+        """collect_files_from_directory checks each directory's files once."""
+        from ostruct.cli.file_utils import collect_files_from_directory
+
+        manager = SecurityManager(tree / "base")
+        src = tree / "base" / "src"
+        os.symlink(src / "file_0.txt", src / "link.txt")
+
+        with (
+            patch.object(
+                manager,
+                "validate_batch_access",
+                wraps=manager.validate_batch_access,
+            ) as batch,
+            patch.object(
+                manager, "validate_path", wraps=manager.validate_path
+            ) as per_path,
+        ):
+            files = collect_files_from_directory(
+                str(src), security_manager=manager, recursive=True
+            )
+
+        assert len(files) == 7
+        batched = sorted(
+            Path(p).name for c in batch.call_args_list for p in c.args[0]
+        )
+        assert batched == [f"file_{i}.txt" for i in range(5)] + ["mod.py"]
+        validated = {Path(c.args[0]).name for c in per_path.call_args_list}
+        assert validated == {"src", "pkg", "link.txt"}
@@ -48,3 +48,31 @@ def test_extract_json_block_non_dict():
     """Test extraction when JSON is not a dict."""
     result = extract_json_block("===BEGIN_JSON===[1, 2, 3]===END_JSON===")
     assert result is None
+
+
+def test_extract_json_block_marker_inside_string():
+    """An end marker inside a string value does not end the block."""
+    text = (
+        '===BEGIN_JSON==={"note": "ends with ===END_JSON===", "n": 1}'
+        "===END_JSON==="
+    )
+    result = extract_json_block(text)
+    assert result == {"note": "ends with ===END_JSON===", "n": 1}
+
+
+def test_extract_json_block_skips_non_json_pair():
+    """A marker pair without a JSON object is skipped for a later one."""
+    text = (
+        "Use ===BEGIN_JSON=== ... ===END_JSON=== markers.\n"
+        '===BEGIN_JSON==={"ok": true}===END_JSON==='
+    )
+    assert extract_json_block(text) == {"ok": True}
+
+
+def test_extract_json_block_large_payload():
+    """Payloads are not limited by pattern repetition bounds."""
+    import json
+
+    payload = {"items": [{"id": i, "text": "x" * 50} for i in range(2000)]}
+    text = f"===BEGIN_JSON===\n{json.dumps(payload)}\n===END_JSON==="
+    assert extract_json_block(text) == payload
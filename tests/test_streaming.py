@@ -0,0 +1,262 @@
+"""Tests for streamed Responses API output and incremental JSON emission."""
+
+import io
+import json
+from types import SimpleNamespace
+from typing import List, Optional
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from ostruct.cli.runner import APIResponseError, create_structured_output
+from ostruct.cli.streaming import (
+    IncrementalJSONEmitter,
+    StreamError,
+    StreamingOutput,
+)
+from pydantic import BaseModel
+
+
+class Finding(BaseModel):
+    title: str
+    severity: int
+
+
+class Report(BaseModel):
+    summary: str
+    findings: List[Finding]
+    meta: dict
+    notes: Optional[List[str]] = None
+
+
+REPORT = {
+    "findings": [
+        {"title": "a", "severity": 1},
+        {"title": "b", "severity": 2},
+    ],
+    "summary": "two findings",
+    "meta": {"nested": {"x": [1, 2]}},
+    "notes": None,
+}
+
+
+def _records(out: io.StringIO) -> list:
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def _chunks(text: str, size: int) -> List[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class TestIncrementalJSONEmitter:
+    """Test field and array item emission from partial JSON."""
+
+    @pytest.mark.parametrize("size", [1, 7, 10_000])
+    def test_emits_fields_and_items(self, size):
+        out = io.StringIO()
+        emitter = IncrementalJSONEmitter(Report, out)
+
+        for chunk in _chunks(json.dumps(REPORT), size):
+            emitter.feed(chunk)
+
+        assert _records(out) == [
+            {
+                "type": "item",
+                "field": "findings",
+                "index": 0,
+                "value": REPORT["findings"][0],
+            },
+            {
+                "type": "item",
+                "field": "findings",
+                "index": 1,
+                "value": REPORT["findings"][1],
+            },
+            {"type": "field", "field": "summary", "value": "two findings"},
+            {"type": "field", "field": "meta", "value": REPORT["meta"]},
+            {"type": "field", "field": "notes", "value": None},
+        ]
+
+    def test_item_emitted_before_array_closes(self):
+        out = io.StringIO()
+        emitter = IncrementalJSONEmitter(Report, out)
+
+        emitter.feed('{"findings": [{"title": "a", "severity": 1}, {"ti')
+
+        assert _records(out) == [
+            {
+                "type": "item",
+                "field": "findings",
+                "index": 0,
+                "value": {"title": "a", "severity": 1},
+            }
+        ]
+
+    def test_invalid_item_is_skipped(self):
+        out = io.StringIO()
+        emitter = IncrementalJSONEmitter(Report, out)
+
+        emitter.feed(
+            '{"findings": [{"title": "a"}, {"title": "b", "severity": 2}]}'
+        )
+
+        assert _records(out) == [
+            {
+                "type": "item",
+                "field": "findings",
+                "index": 1,
+                "value": {"title": "b", "severity": 2},
+            }
+        ]
+
+    def test_malformed_json_stops_emission(self):
+        out = io.StringIO()
+        emitter = IncrementalJSONEmitter(Report, out)
+
+        emitter.feed('{"summary": "ok", "findings": [}')
+        emitter.feed('"more"')
+
+        assert _records(out) == [
+            {"type": "field", "field": "summary", "value": "ok"}
+        ]
+
+    def test_non_object_root_emits_nothing(self):
+        out = io.StringIO()
+        emitter = IncrementalJSONEmitter(Report, out)
+
+        emitter.feed('[{"summary": "ok"}]')
+
+        assert out.getvalue() == ""
+
+
+def _delta(text, item_id="msg_1"):
+    return SimpleNamespace(
+        type="response.output_text.delta", delta=text, item_id=item_id
+    )
+
+
+def _completed(text, output_tokens=42):
+    response = SimpleNamespace(
+        id="resp_1",
+        output_text=text,
+        output=[],
+        usage=SimpleNamespace(output_tokens=output_tokens),
+    )
+    return SimpleNamespace(type="response.completed", response=response)
+
+
+async def _stream(events):
+    for event in events:
+        yield event
+
+
+class TestStreamingOutput:
+    """Test consumption of Responses API stream events."""
+
+    @pytest.mark.asyncio
+    async def test_consume_returns_final_response(self):
+        text = json.dumps(REPORT)
+        out = io.StringIO()
+        streaming = StreamingOutput(Report, out)
+
+        events = [_delta(chunk) for chunk in _chunks(text, 16)]
+        response = await streaming.consume(
+            _stream(events + [_completed(text)])
+        )
+
+        assert response.output_text == text
+        assert len(_records(out)) == 5
+        stats = streaming.stats.to_dict()
+        assert stats["output_tokens"] == 42
+        assert stats["records_emitted"] == 5
+        assert stats["time_to_first_token"] is not None
+
+    @pytest.mark.asyncio
+    async def test_later_message_replaces_commentary(self):
+        text = json.dumps(REPORT)
+        out = io.StringIO()
+        streaming = StreamingOutput(Report, out)
+
+        events = [_delta("Let me think.", "msg_0"), _delta(text, "msg_1")]
+        await streaming.consume(_stream(events + [_completed(text)]))
+
+        assert len(_records(out)) == 5
+
+    @pytest.mark.asyncio
+    async def test_failed_response_raises(self):
+        failed = SimpleNamespace(
+            type="response.failed",
+            response=SimpleNamespace(error=SimpleNamespace(message="boom")),
+        )
+        streaming = StreamingOutput(Report, io.StringIO())
+
+        with pytest.raises(StreamError, match="boom"):
+            await streaming.consume(_stream([_delta("{"), failed]))
+
+    @pytest.mark.asyncio
+    async def test_incomplete_stream_raises(self):
+        streaming = StreamingOutput(Report, io.StringIO())
+
+        with pytest.raises(StreamError, match="before completion"):
+            await streaming.consume(_stream([_delta("{")]))
+
+    def test_write_result(self):
+        out = io.StringIO()
+        streaming = StreamingOutput(Report, out)
+
+        streaming.write_result(Report.model_validate(REPORT))
+
+        assert _records(out) == [{"type": "result", "value": REPORT}]
+
+
+@pytest.fixture
+def model_registry(monkeypatch):
+    registry = Mock()
+    registry.get_instance.return_value.get_capabilities.return_value = Mock(
+        supported_parameters=[]
+    )
+    monkeypatch.setattr("ostruct.cli.runner.ModelRegistry", registry)
+
+
+@pytest.mark.usefixtures("model_registry")
+class TestCreateStructuredOutputStreaming:
+    """Test the streamed path of create_structured_output."""
+
+    @pytest.mark.asyncio
+    async def test_streams_and_validates(self):
+        text = json.dumps(REPORT)
+        client = Mock()
+        client.responses.create = AsyncMock(
+            return_value=_stream(
+                [_delta(chunk) for chunk in _chunks(text, 32)]
+                + [_completed(text)]
+            )
+        )
+        out = io.StringIO()
+
+        result = await create_structured_output(
+            client=client,
+            model="gpt-4o",
+            system_prompt="system",
+            user_prompt="user",
+            output_schema=Report,
+            stream_output=StreamingOutput(Report, out),
+        )
+
+        assert result.model_dump() == REPORT
+        assert client.responses.create.call_args.kwargs["stream"] is True
+        assert len(_records(out)) == 5
+
+    @pytest.mark.asyncio
+    async def test_stream_failure_maps_to_api_error(self):
+        client = Mock()
+        client.responses.create = AsyncMock(return_value=_stream([]))
+
+        with pytest.raises(APIResponseError, match="before completion"):
+            await create_structured_output(
+                client=client,
+                model="gpt-4o",
+                system_prompt="system",
+                user_prompt="user",
+                output_schema=Report,
+                stream_output=StreamingOutput(Report, io.StringIO()),
+            )
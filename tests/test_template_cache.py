@@ -0,0 +1,163 @@
+"""Tests for the persistent compiled-template cache."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import jinja2
+import pytest
+from ostruct.cli import template_cache
+from ostruct.cli.template_cache import (
+    TemplateBytecodeCache,
+    compile_template,
+    get_default_template_cache_dir,
+    get_template_cache,
+)
+from ostruct.cli.template_env import create_jinja_env
+
+TEMPLATE = "{% for item in items %}{{ item | upper }}{% endfor %}"
+
+
+@pytest.fixture
+def cache(tmp_path: Path):
+    bytecode_cache = TemplateBytecodeCache(tmp_path / "templates")
+    with patch.object(
+        template_cache, "get_template_cache", return_value=bytecode_cache
+    ):
+        # create_jinja_env resolves the cache through template_env
+        with patch(
+            "ostruct.cli.template_env.get_template_cache",
+            return_value=bytecode_cache,
+        ):
+            yield bytecode_cache
+
+
+def _count_compiles():
+    return patch.object(
+        jinja2.Environment,
+        "_compile",
+        autospec=True,
+        side_effect=jinja2.Environment._compile,
+    )
+
+
+class TestCompileTemplate:
+    """Test compiling string templates through the bytecode cache."""
+
+    def test_renders_like_from_string(self, cache):
+        env, _ = create_jinja_env()
+
+        template = compile_template(env, TEMPLATE)
+
+        assert template.render(items=["a", "b"]) == "AB"
+        assert env.from_string(TEMPLATE).render(items=["a"]) == "A"
+
+    def test_validation_and_render_envs_share_entry(self, cache):
+        render_env, _ = create_jinja_env()
+        validation_env, _ = create_jinja_env(validation_mode=True)
+
+        with _count_compiles() as compiled:
+            compile_template(validation_env, TEMPLATE)
+            compile_template(render_env, TEMPLATE)
+            compile_template(render_env, TEMPLATE)
+
+        assert compiled.call_count == 1
+        assert len(list(cache.directory.glob("*.jbc"))) == 1
+
+    def test_persists_across_processes(self, cache):
+        env, _ = create_jinja_env()
+        compile_template(env, TEMPLATE)
+
+        fresh = TemplateBytecodeCache(cache.directory)
+        with patch(
+            "ostruct.cli.template_env.get_template_cache", return_value=fresh
+        ):
+            env, _ = create_jinja_env()
+            with _count_compiles() as compiled:
+                template = compile_template(env, TEMPLATE)
+
+        assert compiled.call_count == 0
+        assert template.render(items=["x"]) == "X"
+
+    def test_changed_template_recompiles(self, cache):
+        env, _ = create_jinja_env()
+        compile_template(env, TEMPLATE)
+
+        with _count_compiles() as compiled:
+            template = compile_template(env, TEMPLATE + "!")
+
+        assert compiled.call_count == 1
+        assert template.render(items=["a"]) == "A!"
+
+    def test_environment_settings_are_part_of_key(self, cache):
+        sandboxed, _ = create_jinja_env()
+        plain = jinja2.Environment(bytecode_cache=cache)
+
+        with _count_compiles() as compiled:
+            compile_template(sandboxed, "  {% if x %}y{% endif %}\n")
+            template = compile_template(plain, "  {% if x %}y{% endif %}\n")
+
+        assert compiled.call_count == 2
+        assert template.render(x=True) == "  y"
+
+    def test_corrupt_entry_is_recompiled(self, cache):
+        env, _ = create_jinja_env()
+        compile_template(env, TEMPLATE)
+        for entry in cache.directory.glob("*.jbc"):
+            entry.write_bytes(b"garbage")
+
+        fresh = TemplateBytecodeCache(cache.directory)
+        env = jinja2.Environment(bytecode_cache=fresh)
+        template = compile_template(env, TEMPLATE)
+
+        assert template.render(items=["a"]) == "A"
+
+    def test_unwritable_directory_still_compiles(self, tmp_path):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        env = jinja2.Environment(
+            bytecode_cache=TemplateBytecodeCache(blocker / "templates")
+        )
+
+        assert compile_template(env, TEMPLATE).render(items=["a"]) == "A"
+
+    def test_syntax_errors_are_raised(self, cache):
+        env, _ = create_jinja_env()
+
+        with pytest.raises(jinja2.TemplateSyntaxError):
+            compile_template(env, "{% if %}")
+
+    def test_loader_templates_use_cache(self, cache, tmp_path):
+        (tmp_path / "task.j2").write_text(TEMPLATE)
+        env, _ = create_jinja_env(
+            loader=jinja2.FileSystemLoader(str(tmp_path))
+        )
+        env.get_template("task.j2")
+
+        env, _ = create_jinja_env(
+            loader=jinja2.FileSystemLoader(str(tmp_path))
+        )
+        with _count_compiles() as compiled:
+            env.get_template("task.j2")
+
+        assert compiled.call_count == 0
+
+
+class TestTemplateCacheConfig:
+    """Test enabling the shared cache from configuration."""
+
+    def test_enabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("OSTRUCT_TEMPLATE_CACHE", raising=False)
+
+        cache = get_template_cache()
+
+        assert cache is not None
+        assert cache.directory == get_default_template_cache_dir()
+        assert get_template_cache() is cache
+
+    def test_disabled_by_env(self, monkeypatch):
+        monkeypatch.setenv("OSTRUCT_TEMPLATE_CACHE", "false")
+
+        assert get_template_cache() is None
+        env, _ = create_jinja_env()
+        assert env.bytecode_cache is None
+        assert compile_template(env, TEMPLATE).render(items=["a"]) == "A"
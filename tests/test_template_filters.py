@@ -10,6 +10,7 @@
     files_filter,
     is_fileish,
     single_filter,
+    summarize,
 )
 from pyfakefs.fake_filesystem import FakeFilesystem
 
@@ -414,6 +415,28 @@ def test_is_fileish_with_non_iterable() -> None:
     assert is_fileish(None) is False
 
 
+def test_summarize_with_file_info(
+    fs: FakeFilesystem, security_manager: SecurityManager
+) -> None:
+    """Test summarize with slotted FileInfo objects."""
+    fs.makedirs("/test_workspace/base", exist_ok=True)
+    fs.create_file("/test_workspace/base/a.txt", contents="abc")
+    fs.create_file("/test_workspace/base/b.txt", contents="abcdef")
+
+    files = [
+        FileInfo.from_path(
+            f"/test_workspace/base/{name}", security_manager=security_manager
+        )
+        for name in ("a.txt", "b.txt")
+    ]
+
+    result = summarize(files, keys=["name", "size"])
+    assert result["total_records"] == 2
+    assert result["fields"]["name"]["unique"] == 2
+    assert result["fields"]["size"]["min"] == 3
+    assert result["fields"]["size"]["max"] == 6
+
+
 class TestSafeGetFunction:
     """Test the safe_get global function."""
 
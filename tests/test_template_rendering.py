@@ -4,7 +4,7 @@
 from typing import Any, Dict
 
 import pytest
-from jinja2 import Environment, StrictUndefined
+from jinja2 import Environment, StrictUndefined, UndefinedError
 from ostruct.cli.errors import TaskTemplateError
 from ostruct.cli.file_utils import FileInfo
 from ostruct.cli.security import SecurityManager
@@ -12,7 +12,11 @@
 from ostruct.cli.template_io import read_file
 from ostruct.cli.template_rendering import render_template
 from ostruct.cli.template_schema import DotDict
-from ostruct.cli.template_validation import validate_template_placeholders
+from ostruct.cli.template_validation import (
+    TrackingUndefined,
+    collect_undefined,
+    validate_template_placeholders,
+)
 from pyfakefs.fake_filesystem import FakeFilesystem
 
 
@@ -22,7 +26,7 @@ def test_create_jinja_env() -> None:
 
     # Test that environment is properly configured
     assert isinstance(env, Environment)
-    assert env.undefined == StrictUndefined
+    assert issubclass(env.undefined, StrictUndefined)
     assert not env.autoescape  # HTML escaping should be disabled by default
 
     # Test that custom filters are registered
@@ -125,6 +129,55 @@ def test_render_template_error_handling() -> None:
     assert "can only concatenate str" in str(exc.value)
 
 
+def test_render_template_reports_all_missing_variables() -> None:
+    """Test that one render reports every missing variable."""
+    template = (
+        "{{ title }}\n"
+        "{% for item in items %}{{ item }}{% endfor %}\n"
+        "{{ config.mode }}\n"
+        "{{ note | default('none') }}{% if extra is defined %}x{% endif %}"
+    )
+    with pytest.raises(TaskTemplateError) as exc:
+        render_template(template, {"config": {}})
+
+    message = str(exc.value)
+    assert "Missing required template variable: items" in message
+    assert "Variable 'items' is not available" in message
+    assert "Additional missing variables: title" in message
+    assert "has no attribute 'mode'" in message
+    assert "note" not in message
+    assert "extra" not in message
+
+
+def test_render_template_matches_validation_diagnostics() -> None:
+    """Test that rendering and dry-run validation list the same variables."""
+    template = "{{ a }} {{ b | upper }} {{ c + 1 }}"
+    with pytest.raises(TaskTemplateError) as rendered:
+        render_template(template, {})
+    with pytest.raises(TaskTemplateError) as validated:
+        validate_template_placeholders(template, {})
+
+    expected = "Additional missing variables: b, c"
+    assert expected in str(rendered.value)
+    assert expected in str(validated.value)
+
+
+def test_tracking_undefined_is_strict_outside_collection() -> None:
+    """Test that TrackingUndefined raises unless uses are being collected."""
+    env = Environment(undefined=TrackingUndefined)
+    template = env.from_string("{{ missing }}{{ other.attr }}")
+
+    with pytest.raises(UndefinedError):
+        template.render()
+
+    with collect_undefined() as collected:
+        assert template.render() == ""
+    assert sorted(value._undefined_name for value in collected.values()) == [
+        "missing",
+        "other",
+    ]
+
+
 def test_dot_dict() -> None:
     """Test DotDict functionality."""
     data: Dict[str, Any] = {"a": 1, "b": {"c": 2, "d": {"e": 3}}}
@@ -362,3 +362,46 @@ async def test_missing_files_key(
         assert combined_content == "System promptUser prompt"
         assert len(file_paths) == 0
         assert model == "gpt-4o"
+
+    @pytest.mark.asyncio
+    @patch("ostruct.cli.model_validation.validate_token_limits")
+    @patch("ostruct.cli.model_validation.create_dynamic_model")
+    @patch("ostruct.cli.model_validation.supports_structured_output")
+    @patch("ostruct.cli.model_validation.ModelRegistry")
+    async def test_loaded_content_passed_for_attribution(
+        self,
+        mock_registry,
+        mock_supports_structured,
+        mock_create_model,
+        mock_validate_token_limits,
+        sample_cli_args,
+        sample_schema,
+    ):
+        """Already-loaded content is handed over instead of file re-reads."""
+        mock_supports_structured.return_value = True
+        mock_create_model.return_value = Mock()
+        mock_registry.get_instance.return_value = Mock()
+
+        loaded = self.create_mock_file_info(
+            "loaded.txt", FileRoutingIntent.TEMPLATE_ONLY
+        )
+        loaded.loaded_content = "file body"
+        unread = self.create_mock_file_info(
+            "unread.txt", FileRoutingIntent.TEMPLATE_ONLY
+        )
+        unread.loaded_content = None
+
+        _, _, token_usage, _ = await validate_model_and_schema(
+            sample_cli_args,
+            sample_schema,
+            "System prompt",
+            "User prompt",
+            {"files": [loaded, unread]},
+        )
+
+        call_kwargs = mock_validate_token_limits.call_args.kwargs
+        assert call_kwargs["file_contents"] == {
+            "loaded.txt": "file body",
+            "unread.txt": None,
+        }
+        assert token_usage is mock_validate_token_limits.return_value
@@ -11,6 +11,7 @@
 """
 
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 from ostruct.cli.token_validation import validate_token_limits
@@ -80,3 +81,100 @@ def test_validate_token_limits_insufficient_room(self) -> None:
         with pytest.raises(PromptTooLargeError) as exc_info:
             validate_token_limits(large_template, [], "gpt-4o")
         assert "exceed" in str(exc_info.value)
+
+
+class TestTokenAccounting:
+    """Test single-pass token accounting with per-file attribution."""
+
+    def test_loaded_content_is_attributed_without_reading(self) -> None:
+        """Supplied content is counted; the file itself is never opened."""
+        usage = validate_token_limits(
+            "prompt with embedded data",
+            ["/nonexistent/data.csv", "/nonexistent/unused.txt"],
+            "gpt-4o",
+            file_contents={"/nonexistent/data.csv": "embedded data"},
+        )
+
+        # The prompt already contains the file content, so only it counts
+        assert usage.total_tokens == len("prompt with embedded data")
+        assert usage.file_tokens == {
+            "/nonexistent/data.csv": len("embedded data"),
+            "/nonexistent/unused.txt": 0,
+        }
+
+    def test_embedded_content_is_encoded_once(self) -> None:
+        """File counts come from the prompt's own encode, not a second pass."""
+        from ostruct.cli.token_validation import TokenLimitValidator
+
+        validator = TokenLimitValidator("gpt-4o")
+        encoded = []
+        encode = validator.encoder.encode
+
+        def tracking(text: str) -> Any:
+            encoded.append(text)
+            return encode(text)
+
+        prompt = "a: first file\nb: second file\nend"
+        with patch.object(validator.encoder, "encode", tracking):
+            usage = validator.count_prompt_tokens(
+                prompt,
+                ["b.txt", "a.txt", "c.txt"],
+                {
+                    "a.txt": "first file",
+                    "b.txt": "second file",
+                    "c.txt": "other",
+                },
+            )
+
+        assert usage.total_tokens == len(prompt)
+        assert usage.file_tokens == {
+            "b.txt": len("second file"),
+            "a.txt": len("first file"),
+            "c.txt": len("other"),
+        }
+        # Only content missing from the prompt is encoded on its own
+        assert sum(map(len, encoded)) == len(prompt) + len("other")
+
+    def test_oversized_files_feed_routing_guidance(self) -> None:
+        """Files above 5K tokens are suggested for tool routing."""
+        from ostruct.cli.errors import PromptTooLargeError
+
+        big = "x" * 6000
+        with pytest.raises(PromptTooLargeError) as exc_info:
+            validate_token_limits(
+                big + "y" * 200,
+                ["big.csv", "small.txt"],
+                "gpt-4o",
+                context_limit=1000,
+                file_contents={"big.csv": big, "small.txt": "y" * 200},
+            )
+
+        assert exc_info.value.context["oversized_files"] == [("big.csv", 6000)]
+        assert "ci:data big.csv" in str(exc_info.value)
+
+    def test_encoder_is_cached(self) -> None:
+        """The tiktoken encoder is created once per encoding."""
+        from ostruct.cli.token_utils import get_encoder
+
+        assert get_encoder("gpt-4o") is get_encoder("o1")
+        assert get_encoder("gpt-4o") is not get_encoder("gpt-4")
+
+    def test_cost_breakdown_lists_largest_files(self) -> None:
+        """The dry-run breakdown reuses per-file token counts."""
+        from ostruct.cli.cost_estimation import format_cost_breakdown
+
+        text = format_cost_breakdown(
+            model="gpt-4o",
+            input_tokens=1500,
+            output_tokens=100,
+            total_cost=0.01,
+            context_window=128000,
+            file_tokens={"a.txt": 1000, "b.txt": 400, "c.txt": 0},
+        )
+
+        lines = text.splitlines()
+        assert "     - a.txt: 1,000 tokens" in lines
+        assert lines.index("     - a.txt: 1,000 tokens") < lines.index(
+            "     - b.txt: 400 tokens"
+        )
+        assert "c.txt" not in text
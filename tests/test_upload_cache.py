@@ -1,15 +1,22 @@
 """Tests for upload cache functionality."""
 
 import hashlib
+import os
 import tempfile
 import threading
 import time
 from pathlib import Path
+import sqlite3
 from unittest.mock import patch
 
 import pytest
 
-from src.ostruct.cli.upload_cache import UploadCache
+from src.ostruct.cli.config import UploadConfig
+from src.ostruct.cli.upload_cache import (
+    CacheEntry,
+    UploadCache,
+    create_upload_cache,
+)
 
 
 def make_test_hash(pattern: str) -> str:
@@ -370,3 +377,355 @@ def test_cache_corruption_handling(self, temp_cache):
             # Should not raise exception, just return None
             result = temp_cache.lookup(make_test_hash("any"))
             assert result is None
+
+
+@pytest.mark.no_fs
+class TestUploadCacheStatIndex:
+    """Test the stat-keyed fast path that skips content hashing."""
+
+    @pytest.fixture
+    def cache_dir(self):
+        """Create a temporary directory for the cache and test files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield Path(temp_dir)
+
+    def _make_file(self, cache_dir: Path, content: bytes) -> Path:
+        """Create a file whose mtime is outside the racy window."""
+        file_path = cache_dir / "data.bin"
+        file_path.write_bytes(content)
+        old = time.time() - 60
+        os.utime(file_path, (old, old))
+        return file_path
+
+    def test_stat_hit_skips_hashing(self, cache_dir):
+        """An unchanged file is resolved without reading its content."""
+        cache = UploadCache(cache_dir / "cache.db")
+        file_path = self._make_file(cache_dir, b"stat index content")
+        file_hash = cache.compute_file_hash(file_path)
+        stat = file_path.stat()
+        cache.store(
+            file_hash,
+            "file-stat",
+            stat.st_size,
+            int(stat.st_mtime),
+            file_path=str(file_path),
+        )
+
+        with patch.object(
+            cache, "compute_file_hash", side_effect=AssertionError("hashed")
+        ):
+            assert cache.lookup_file(file_path) == (file_hash, "file-stat")
+
+    def test_changed_file_falls_back_to_hash(self, cache_dir):
+        """A modified file misses the stat index and is re-hashed."""
+        cache = UploadCache(cache_dir / "cache.db")
+        file_path = self._make_file(cache_dir, b"original")
+        file_hash = cache.compute_file_hash(file_path)
+        stat = file_path.stat()
+        cache.store(
+            file_hash,
+            "file-old",
+            stat.st_size,
+            int(stat.st_mtime),
+            file_path=str(file_path),
+        )
+
+        file_path.write_bytes(b"changed content")
+        new_hash, file_id = cache.lookup_file(file_path)
+
+        assert new_hash == cache.compute_file_hash(file_path)
+        assert new_hash != file_hash
+        assert file_id is None
+
+    def test_hash_table_remains_source_of_truth(self, cache_dir):
+        """Invalidating the upload makes the stat entry stop matching."""
+        cache = UploadCache(cache_dir / "cache.db")
+        file_path = self._make_file(cache_dir, b"content")
+        file_hash = cache.compute_file_hash(file_path)
+        stat = file_path.stat()
+        cache.store(
+            file_hash,
+            "file-gone",
+            stat.st_size,
+            int(stat.st_mtime),
+            file_path=str(file_path),
+        )
+
+        cache.invalidate_by_file_id("file-gone")
+
+        assert cache.lookup_by_stat(file_path) is None
+
+    def test_paranoid_mode_always_hashes(self, cache_dir):
+        """Paranoid mode never trusts the stat index."""
+        cache = UploadCache(cache_dir / "cache.db", paranoid=True)
+        file_path = self._make_file(cache_dir, b"paranoid")
+        file_hash = cache.compute_file_hash(file_path)
+        stat = file_path.stat()
+        cache.store(
+            file_hash,
+            "file-paranoid",
+            stat.st_size,
+            int(stat.st_mtime),
+            file_path=str(file_path),
+        )
+
+        assert cache.lookup_by_stat(file_path) is None
+        with patch.object(
+            cache, "compute_file_hash", wraps=cache.compute_file_hash
+        ) as hasher:
+            assert cache.lookup_file(file_path) == (
+                file_hash,
+                "file-paranoid",
+            )
+            hasher.assert_called_once()
+
+    def test_recently_modified_file_not_indexed(self, cache_dir):
+        """Files modified within the racy window are not indexed."""
+        cache = UploadCache(cache_dir / "cache.db")
+        file_path = cache_dir / "fresh.bin"
+        file_path.write_bytes(b"fresh")
+
+        cache.record_stat(file_path, make_test_hash("fresh"))
+        cache.store(make_test_hash("fresh"), "file-fresh", 5, int(time.time()))
+
+        assert cache.lookup_by_stat(file_path) is None
+
+
+@pytest.mark.no_fs
+class TestUploadCacheConnections:
+    """Test pooled connections and batched writes."""
+
+    @pytest.fixture
+    def cache_dir(self):
+        """Create a temporary directory for the cache."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield Path(temp_dir)
+
+    def test_connection_reused_across_calls(self, cache_dir):
+        """One connection serves every operation on the same thread."""
+        with patch(
+            "src.ostruct.cli.upload_cache.sqlite3.connect",
+            wraps=sqlite3.connect,
+        ) as connect:
+            cache = UploadCache(cache_dir / "cache.db")
+            for i in range(5):
+                cache.store(make_test_hash(f"f{i}"), f"file-{i}", 1, 0)
+                cache.lookup(make_test_hash(f"f{i}"))
+            cache.get_stats()
+
+        assert connect.call_count == 1
+
+    def test_each_thread_gets_its_own_connection(self, cache_dir):
+        """Worker threads open their own connection to the same database."""
+        cache = UploadCache(cache_dir / "cache.db")
+        cache.store(make_test_hash("main"), "file-main", 1, 0)
+
+        def worker():
+            cache.store(make_test_hash("worker"), "file-worker", 1, 0)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert len(cache._connections) == 2
+        assert cache.lookup(make_test_hash("worker")) == "file-worker"
+
+    def test_uncommitted_work_is_rolled_back(self, cache_dir):
+        """Leaving the connection context discards uncommitted changes."""
+        cache = UploadCache(cache_dir / "cache.db")
+        with cache._get_connection() as conn:
+            conn.execute(
+                "INSERT INTO files (hash, file_id, algo, size, mtime, "
+                "created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (make_test_hash("x"), "file-x", "sha256", 1, 0, 0),
+            )
+
+        assert cache.lookup(make_test_hash("x")) is None
+
+    def test_close_reopens_on_next_use(self, cache_dir):
+        """Closing the pool does not make the cache unusable."""
+        cache = UploadCache(cache_dir / "cache.db")
+        cache.store(make_test_hash("a"), "file-a", 1, 0)
+        cache.close()
+
+        assert cache._connections == []
+        assert cache.lookup(make_test_hash("a")) == "file-a"
+
+    def test_foreign_keys_enforced(self, cache_dir):
+        """Pooled connections enforce the schema's foreign keys."""
+        cache = UploadCache(cache_dir / "cache.db")
+
+        with cache._get_connection() as conn:
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    def test_vector_store_mappings_survive_updates(self, cache_dir):
+        """Re-recording a file or a store keeps its vector store mappings."""
+        cache = UploadCache(cache_dir / "cache.db")
+        file_hash = make_test_hash("a")
+        cache.store(file_hash, "file-a", 1, 0)
+        cache.register_vector_store("vs_1", "store")
+        cache.add_file_to_vector_store(file_hash, "vs_1", "file-a")
+
+        cache.store(file_hash, "file-a2", 1, 0)
+        cache.register_vector_store("vs_1", "store", {"fingerprint": "f"})
+
+        assert cache.get_vector_store_file_ids("vs_1") == {file_hash: "file-a"}
+
+        cache.invalidate(file_hash)
+        assert cache.get_files_in_vector_store("vs_1") == []
+
+    def test_store_many(self, cache_dir):
+        """Batched entries are stored with labels and stat index rows."""
+        cache = UploadCache(cache_dir / "cache.db")
+        entries = []
+        for i in range(3):
+            file_path = cache_dir / f"doc{i}.txt"
+            file_path.write_text(f"doc {i}")
+            old = time.time() - 60
+            os.utime(file_path, (old, old))
+            entries.append(
+                CacheEntry(
+                    file_hash=cache.compute_file_hash(file_path),
+                    file_id=f"file-{i}",
+                    size=file_path.stat().st_size,
+                    mtime=int(old),
+                    metadata={"purpose": "assistants"},
+                    file_path=str(file_path),
+                )
+            )
+
+        cache.store_many(entries, label_style="filename")
+
+        for i, entry in enumerate(entries):
+            assert cache.lookup(entry.file_hash) == f"file-{i}"
+            assert cache.lookup_by_stat(Path(entry.file_path)) == (
+                entry.file_hash,
+                f"file-{i}",
+            )
+            info = cache.get_by_file_id(f"file-{i}")
+            assert info.metadata["label"] == f"doc{i}"
+            assert info.metadata["purpose"] == "assistants"
+
+    def test_touch_many(self, cache_dir):
+        """Access times for several files are updated together."""
+        cache = UploadCache(cache_dir / "cache.db")
+        for i in range(3):
+            cache.store(make_test_hash(f"t{i}"), f"file-{i}", 1, 0)
+        with cache._get_connection() as conn:
+            conn.execute("UPDATE files SET last_accessed = 0")
+            conn.commit()
+
+        cache.touch_many(["file-0", "file-2"])
+
+        with cache._get_connection() as conn:
+            rows = dict(
+                conn.execute(
+                    "SELECT file_id, last_accessed FROM files"
+                ).fetchall()
+            )
+        assert rows["file-0"] > 0
+        assert rows["file-1"] == 0
+        assert rows["file-2"] > 0
+
+
+@pytest.mark.no_fs
+class TestUploadCacheHashing:
+    """Test the per-run hash memo and off-loop hashing."""
+
+    @pytest.fixture
+    def cache_dir(self):
+        """Create a temporary directory for the cache and test files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield Path(temp_dir)
+
+    def test_file_hashed_once_per_run(self, cache_dir):
+        """Repeated hash requests for an unchanged file read it once."""
+        cache = UploadCache(cache_dir / "cache.db")
+        file_path = cache_dir / "data.txt"
+        file_path.write_text("memo me")
+
+        with patch.object(
+            cache, "_hash_contents", wraps=cache._hash_contents
+        ) as hasher:
+            first = cache.compute_file_hash(file_path)
+            cache.lookup_file(file_path)
+            assert cache.compute_file_hash(file_path) == first
+
+        hasher.assert_called_once()
+
+    def test_changed_file_is_rehashed(self, cache_dir):
+        """A change in size or mtime produces a fresh hash."""
+        cache = UploadCache(cache_dir / "cache.db")
+        file_path = cache_dir / "data.txt"
+        file_path.write_text("before")
+        before = cache.compute_file_hash(file_path)
+
+        file_path.write_text("after, and longer")
+
+        assert cache.compute_file_hash(file_path) != before
+
+    def test_paranoid_mode_bypasses_memo(self, cache_dir):
+        """Paranoid mode reads the file every time."""
+        cache = UploadCache(cache_dir / "cache.db", paranoid=True)
+        file_path = cache_dir / "data.txt"
+        file_path.write_text("paranoid")
+
+        with patch.object(
+            cache, "_hash_contents", wraps=cache._hash_contents
+        ) as hasher:
+            cache.compute_file_hash(file_path)
+            cache.compute_file_hash(file_path)
+
+        assert hasher.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_lookup_hashes_off_event_loop(self, cache_dir):
+        """Async lookups hash on a worker thread."""
+        cache = UploadCache(cache_dir / "cache.db")
+        file_path = cache_dir / "data.txt"
+        file_path.write_text("threaded")
+        threads = []
+        original = cache._hash_contents
+
+        def record_thread(path):
+            threads.append(threading.get_ident())
+            return original(path)
+
+        with patch.object(cache, "_hash_contents", side_effect=record_thread):
+            file_hash, file_id = await cache.lookup_file_async(file_path)
+
+        assert file_hash == hashlib.sha256(b"threaded").hexdigest()
+        assert file_id is None
+        assert threads and threads[0] != threading.get_ident()
+
+    def test_blake2b_algorithm(self, cache_dir):
+        """BLAKE2b can be selected as the hash algorithm."""
+        cache = UploadCache(cache_dir / "cache.db", hash_algo="blake2b")
+        file_path = cache_dir / "data.txt"
+        file_path.write_text("blake")
+
+        assert (
+            cache.compute_file_hash(file_path)
+            == hashlib.blake2b(b"blake").hexdigest()
+        )
+
+    def test_create_upload_cache_uses_configuration(self, cache_dir):
+        """The factory applies the configured path and hash settings."""
+        cache = create_upload_cache(
+            UploadConfig(
+                cache_path=str(cache_dir / "configured.db"),
+                hash_algorithm="blake2b",
+                paranoid_hashing=True,
+            )
+        )
+
+        assert cache is not None
+        assert cache.cache_path == (cache_dir / "configured.db").resolve()
+        assert cache.hash_algo == "blake2b"
+        assert cache.paranoid is True
+
+    def test_create_upload_cache_disabled(self):
+        """No cache is opened when the persistent cache is disabled."""
+        assert (
+            create_upload_cache(UploadConfig(persistent_cache=False)) is None
+        )
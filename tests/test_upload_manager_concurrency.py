@@ -0,0 +1,135 @@
+"""Tests for concurrent uploads in SharedUploadManager."""
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from ostruct.cli.upload_manager import (
+    SharedUploadManager,
+    UploadError,
+    UploadRecord,
+)
+
+
+def _make_files(tmp_path: Path, count: int) -> list[Path]:
+    """Create ``count`` small text files under ``tmp_path``."""
+    files = []
+    for i in range(count):
+        path = tmp_path / f"file_{i}.txt"
+        path.write_text(f"content {i}")
+        files.append(path)
+    return files
+
+
+def _register(manager: SharedUploadManager, files: list[Path], tool: str):
+    """Register files with the manager for a single tool."""
+    for path in files:
+        file_id = manager._get_file_identity(path)
+        manager._uploads.setdefault(file_id, UploadRecord(path=path))
+        manager._register_file_for_targets(file_id, {tool})
+
+
+class _TrackingClient:
+    """Fake client that records how many uploads run concurrently."""
+
+    def __init__(self, fail_names: set[str] | None = None):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+        self.fail_names = fail_names or set()
+        self.files = SimpleNamespace(create=self._create, delete=AsyncMock())
+
+    async def _create(self, file, purpose):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            name = Path(file.name).name
+            if name in self.fail_names:
+                raise RuntimeError(f"boom {name}")
+            return SimpleNamespace(id=f"file-{name}")
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_fs
+class TestConcurrentUploads:
+    """Test bounded-parallel uploads for a tool."""
+
+    async def test_uploads_respect_concurrency_limit(self, tmp_path):
+        """No more than max_concurrency uploads run at once."""
+        client = _TrackingClient()
+        manager = SharedUploadManager(client, max_concurrency=3)  # type: ignore[arg-type]
+        files = _make_files(tmp_path, 10)
+        _register(manager, files, "code-interpreter")
+
+        uploaded = await manager.upload_for_tool("code-interpreter")
+
+        assert len(uploaded) == 10
+        assert client.calls == 10
+        assert 1 < client.max_in_flight <= 3
+        assert uploaded[str(files[0])] == "file-file_0.txt"
+
+    async def test_shared_file_uploaded_once_across_tools(self, tmp_path):
+        """Concurrent tool uploads still share a single upload per file."""
+        client = _TrackingClient()
+        manager = SharedUploadManager(client, max_concurrency=4)  # type: ignore[arg-type]
+        files = _make_files(tmp_path, 5)
+        _register(manager, files, "code-interpreter")
+        _register(manager, files, "file-search")
+
+        ci, fs = await asyncio.gather(
+            manager.upload_for_tool("code-interpreter"),
+            manager.upload_for_tool("file-search"),
+        )
+
+        assert client.calls == 5
+        assert ci == fs
+
+    async def test_failures_are_aggregated(self, tmp_path):
+        """All failed files are reported together after the pool drains."""
+        client = _TrackingClient(fail_names={"file_1.txt", "file_3.txt"})
+        manager = SharedUploadManager(client, max_concurrency=2)  # type: ignore[arg-type]
+        files = _make_files(tmp_path, 5)
+        _register(manager, files, "code-interpreter")
+
+        with pytest.raises(UploadError) as exc_info:
+            await manager.upload_for_tool("code-interpreter")
+
+        assert "Failed to upload 2 files" in str(exc_info.value)
+        # Successful uploads are still attempted and recorded
+        assert client.calls == 5
+        assert len(manager.get_files_for_tool("code-interpreter")) == 3
+
+
+def test_invalid_concurrency_rejected():
+    """A concurrency limit below one is rejected."""
+    with pytest.raises(ValueError):
+        SharedUploadManager(AsyncMock(), max_concurrency=0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_fs
+async def test_new_uploads_written_to_cache_in_one_batch(tmp_path):
+    """Uploads for a tool are recorded with a single batched cache write."""
+    from ostruct.cli.upload_cache import UploadCache
+
+    cache = UploadCache(tmp_path / "cache.db")
+    client = _TrackingClient()
+    manager = SharedUploadManager(client, cache=cache, max_concurrency=2)  # type: ignore[arg-type]
+    files = _make_files(tmp_path, 4)
+    _register(manager, files, "code-interpreter")
+
+    with patch.object(cache, "store_many", wraps=cache.store_many) as batch:
+        await manager.upload_for_tool("code-interpreter")
+
+    batch.assert_called_once()
+    assert len(batch.call_args[0][0]) == 4
+    assert cache.lookup_file(files[0])[1] == "file-file_0.txt"
+    assert manager.get_file_hashes_for_tool("code-interpreter") == {
+        f"file-{path.name}": cache.compute_file_hash(path) for path in files
+    }